@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for span attribute redaction throughput.
+
+Compares the original per-pattern implementation (every pattern's sub() run
+in turn over each string, key sensitivity recomputed per key) with the
+prefiltered RedactionEngine, and prints bytes per second for each.
+
+Usage:
+    python scripts/benchmark_redaction.py [--spans N] [--payload-kb K]
+"""
+
+import argparse
+import time
+from typing import Any
+
+from strands_cli.telemetry.redaction import RedactionEngine
+
+
+class SequentialRedactionEngine(RedactionEngine):
+    """Baseline: the pre-optimization per-pattern redaction loop."""
+
+    def _is_sensitive_key(self, key: str) -> bool:
+        key_lower = key.lower()
+        sensitive_terms = ["key", "token", "secret", "password", "credential"]
+        return any(term in key_lower for term in sensitive_terms)
+
+    def _redact_string(self, text: str, is_sensitive_context: bool = True) -> str:
+        original = text
+        for pattern in self.patterns:
+            if is_sensitive_context or pattern is not self.API_KEY_PATTERN:
+                text = pattern.sub(self.REDACTED_PLACEHOLDER, text)
+        if text != original:
+            self.redaction_count += 1
+        return text
+
+
+def _make_spans(count: int, payload_kb: int) -> list[dict[str, Any]]:
+    """Build span attribute dicts resembling agent/tool spans."""
+    prose = "The agent reviewed the quarterly report and summarised the key findings. "
+    payload = (prose * (payload_kb * 1024 // len(prose) + 1))[: payload_kb * 1024]
+    spans = []
+    for i in range(count):
+        attrs: dict[str, Any] = {
+            "gen_ai.operation.name": "invoke_agent",
+            "agent.id": "research_specialist_agent_v2",
+            "trace_id": f"{i:032x}",
+            "tool.input.query": payload,
+            "tool.output.result": payload
+            + f" Contact ops-{i}@example.com or 555-123-{i % 10000:04d}.",
+            "api_token": "ghp_abcdefghijklmnopqrstuvwxyz",
+            "gen_ai.usage.input_tokens": 1200 + i,
+        }
+        spans.append(attrs)
+    return spans
+
+
+def _bytes(spans: list[dict[str, Any]]) -> int:
+    return sum(
+        len(value.encode("utf-8"))
+        for attrs in spans
+        for value in attrs.values()
+        if isinstance(value, str)
+    )
+
+
+def _measure(engine: RedactionEngine, spans: list[dict[str, Any]], repeat: int) -> float:
+    """Return the best wall time over `repeat` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for attrs in spans:
+            engine.redact_span_attributes(attrs, redact_tool_inputs=True, redact_tool_outputs=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=2000)
+    parser.add_argument("--payload-kb", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spans = _make_spans(args.spans, args.payload_kb)
+    total = _bytes(spans)
+
+    baseline = _measure(SequentialRedactionEngine(), spans, args.repeat)
+    prefiltered = _measure(RedactionEngine(), spans, args.repeat)
+
+    print(f"Redacted {args.spans} spans, {total / 1e6:.1f} MB of string attributes per pass")
+    print(f"  sequential : {total / baseline / 1e6:8.1f} MB/s")
+    print(f"  prefiltered: {total / prefiltered / 1e6:8.1f} MB/s ({baseline / prefiltered:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""Generate the native tool manifest (src/strands_cli/tools/manifest.json).
+
+Run after adding, removing, or changing a tool's TOOL_SPEC. The test suite
+fails if the committed manifest drifts from the tool sources.
+"""
+
+from strands_cli.tools.registry import build_manifest, write_manifest
+
+
+def main() -> None:
+    """Write the manifest and print a summary."""
+    path = write_manifest()
+    manifest = build_manifest()
+    print(f"Generated tool manifest: {path}")
+    print(f"  - {len(manifest['tools'])} tools from {len(manifest['modules'])} modules")
+
+
+if __name__ == "__main__":
+    main()
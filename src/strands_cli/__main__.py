@@ -13,6 +13,8 @@ Phase 3-6 Performance Updates:
 
 Commands:
     run: Execute a workflow from YAML/JSON spec
+    serve: Run a resident daemon that keeps clients, specs and tools warm
+    loadtest: Run a workflow many times concurrently and report throughput
     validate: Validate a spec against JSON Schema
     plan: Show execution plan for a workflow
     explain: Show unsupported features and migration hints
@@ -80,8 +82,10 @@ from strands_cli.session import (
     SessionNotFoundError,
     SessionState,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.telemetry import add_otel_context, configure_telemetry, shutdown_telemetry
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.telemetry.profiler import profile_phase, start_profiling, stop_profiling
 from strands_cli.types import PatternType, RunResult, Spec
 
 # Load config to determine log format
@@ -279,7 +283,7 @@ def _route_to_executor(
     spec: Spec,
     variables: dict[str, str] | None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
 ) -> RunResult:
     """Route to appropriate executor based on pattern type.
 
@@ -351,7 +355,7 @@ def _dispatch_executor(
     variables: dict[str, str] | None,
     verbose: bool,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
 ) -> RunResult:
     """Route to appropriate executor based on pattern type.
 
@@ -375,7 +379,10 @@ def _dispatch_executor(
         console.print(f"[dim]Pattern: {spec.pattern.type}[/dim]")
 
     try:
-        return _route_to_executor(spec, variables, session_state, session_repo)
+        with get_metrics().track_run(spec.pattern.type.value) as run:
+            result = _route_to_executor(spec, variables, session_state, session_repo)
+            run.set_result(result)
+        return result
     except ExecutionError as e:
         console.print(f"\n[red]Execution failed:[/red] {e}")
         if verbose:
@@ -443,16 +450,17 @@ def _write_and_report_artifacts(
             has_router=("router" in merged_vars),
         )
 
-        return write_artifacts(
-            spec.outputs.artifacts,
-            result.last_response or "",
-            out,
-            force,
-            variables=merged_vars,
-            execution_context=result.execution_context,
-            spec_name=spec.name,
-            pattern_type=spec.pattern.type if spec.pattern else None,
-        )
+        with profile_phase("artifact.write"):
+            return write_artifacts(
+                spec.outputs.artifacts,
+                result.last_response or "",
+                out,
+                force,
+                variables=merged_vars,
+                execution_context=result.execution_context,
+                spec_name=spec.name,
+                pattern_type=spec.pattern.type if spec.pattern else None,
+            )
     except ArtifactError as e:
         console.print(f"\n[red]Failed to write artifacts:[/red] {e}")
         sys.exit(EX_IO)
@@ -522,6 +530,267 @@ def _write_trace_artifact(spec: Spec, out: str, force: bool) -> str | None:
         sys.exit(EX_IO)
 
 
+def _write_profile_artifacts(spec: Spec, out: str, force: bool) -> list[str]:
+    """Stop the run profiler and write its reports next to the trace artifact.
+
+    Writes <spec-name>-profile.json (timing breakdown), <spec-name>-profile.folded
+    (flamegraph-ready stacks) and, with --profile-cpu, <spec-name>-profile.pstats.
+
+    Args:
+        spec: Workflow spec
+        out: Output directory
+        force: Overwrite existing files
+
+    Returns:
+        Paths of written profile files (empty if profiling was not active)
+
+    Raises:
+        SystemExit: With EX_IO on write failure
+    """
+    from strands_cli.artifacts import sanitize_filename
+
+    profiler = stop_profiling()
+    if profiler is None:
+        return []
+
+    safe_name = sanitize_filename(spec.name)
+    report_path = Path(out) / f"{safe_name}-profile.json"
+    folded_path = Path(out) / f"{safe_name}-profile.folded"
+    pstats_path = Path(out) / f"{safe_name}-profile.pstats"
+    paths = [report_path, folded_path]
+    if profiler.cpu_profile is not None:
+        paths.append(pstats_path)
+
+    existing = [path for path in paths if path.exists()]
+    if existing and not force:
+        console.print(
+            f"\n[red]Profile file already exists:[/red] {existing[0]}. Use --force to overwrite."
+        )
+        sys.exit(EX_IO)
+
+    report = profiler.report(
+        spec_name=spec.name, pattern=spec.pattern.type.value if spec.pattern else None
+    )
+    try:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        folded_path.write_text(profiler.folded_stacks(), encoding="utf-8")
+        if profiler.cpu_profile is not None:
+            profiler.cpu_profile.dump_stats(str(pstats_path))
+    except OSError as e:
+        console.print(f"\n[red]Failed to write profile artifact:[/red] {e}")
+        sys.exit(EX_IO)
+
+    summary = report["summary"]
+    console.print(
+        f"Profile: wall {report['wall_seconds']:.2f}s, "
+        f"LLM wait {summary['llm_wait_seconds']:.2f}s, "
+        f"tools {summary['tool_seconds']:.2f}s, "
+        f"self {summary['self_seconds']:.2f}s"
+    )
+    return [str(path) for path in paths]
+
+
+def _run_via_daemon(
+    spec_file: str,
+    variables: dict[str, str],
+    out: str,
+    force: bool,
+    verbose: bool,
+) -> int:
+    """Submit a run to the resident daemon and report its outcome.
+
+    Paths are resolved here because the daemon's working directory differs
+    from the caller's.
+
+    Args:
+        spec_file: Path to workflow specification file
+        variables: Variable overrides from --var flags
+        out: Output directory for artifacts
+        force: Overwrite existing artifacts
+        verbose: Enable verbose output
+
+    Returns:
+        Exit code reported by the daemon (EX_RUNTIME if it is unreachable)
+    """
+    from strands_cli.daemon import DaemonError, default_address, send_request
+
+    address = default_address()
+    request = {
+        "op": "run",
+        "spec_file": str(Path(spec_file).resolve()),
+        "variables": variables,
+        "out": str(Path(out).resolve()),
+        "force": force,
+    }
+    if verbose:
+        console.print(f"[dim]Submitting to strands daemon at {address}[/dim]")
+
+    try:
+        response = send_request(address, request)
+    except DaemonError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        console.print("\n[dim]Start the daemon with 'strands serve'[/dim]")
+        return EX_RUNTIME
+
+    exit_code = int(response.get("exit_code", EX_UNKNOWN))
+    if exit_code == EX_HITL_PAUSE:
+        console.print(
+            f"[yellow]Workflow paused for human input.[/yellow] "
+            f"Resume with: strands run --resume {response.get('session_id')}"
+        )
+    elif exit_code != EX_OK:
+        console.print(f"\n[red]Workflow failed:[/red] {response.get('error')}")
+        for issue in response.get("issues", [])[:3]:
+            console.print(f"  • {issue}")
+    else:
+        console.print(
+            "[bold green][OK] Workflow completed successfully[/bold green] [dim](daemon)[/dim]"
+        )
+        console.print(f"Duration: {response.get('duration_seconds', 0.0):.2f}s")
+        if response.get("artifacts_written"):
+            console.print("\nArtifacts written:")
+            for artifact in response["artifacts_written"]:
+                console.print(f"  • [cyan]{artifact}[/cyan]")
+    return exit_code
+
+
+@app.command()
+def serve(
+    address: Annotated[
+        str | None,
+        typer.Option(
+            "--address",
+            help="Unix socket path or host:port (default: STRANDS_DAEMON_ADDRESS or data dir socket)",
+        ),
+    ] = None,
+    max_jobs: Annotated[
+        int, typer.Option("--max-jobs", min=1, help="Maximum concurrent workflow jobs")
+    ] = 4,
+    bypass_tool_consent: Annotated[
+        bool,
+        typer.Option(
+            "--bypass-tool-consent",
+            help="Skip interactive tool confirmations (sets BYPASS_TOOL_CONSENT=true)",
+        ),
+    ] = False,
+    stop: Annotated[bool, typer.Option("--stop", help="Stop a running daemon")] = False,
+    status: Annotated[
+        bool, typer.Option("--status", help="Show statistics of a running daemon")
+    ] = False,
+) -> None:
+    """Run a resident daemon that keeps specs, clients, tools and MCP servers warm.
+
+    Jobs are submitted with 'strands run --daemon <spec>'. The daemon runs in
+    the foreground; stop it with Ctrl+C or 'strands serve --stop'.
+
+    Args:
+        address: Unix socket path or host:port to listen on / connect to
+        max_jobs: Maximum number of jobs executing concurrently
+        bypass_tool_consent: Skip interactive tool confirmations (no TTY in daemon mode)
+        stop: Ask a running daemon to shut down
+        status: Print statistics of a running daemon as JSON
+    """
+    from strands_cli.daemon import DaemonError, default_address, run_daemon, send_request
+
+    address = address or default_address()
+
+    if stop or status:
+        try:
+            response = send_request(address, {"op": "shutdown" if stop else "stats"}, timeout=10)
+        except DaemonError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(EX_RUNTIME)
+        if status:
+            console.print_json(json.dumps(response))
+        else:
+            console.print("[green]Daemon stopped[/green]")
+        sys.exit(EX_OK)
+
+    if bypass_tool_consent:
+        os.environ["BYPASS_TOOL_CONSENT"] = "true"
+
+    console.print(f"[bold green]strands daemon listening on[/bold green] {address}")
+    try:
+        run_daemon(address, max_jobs=max_jobs)
+    except KeyboardInterrupt:
+        pass
+    except DaemonError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(EX_USAGE)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot listen on {address}: {e}")
+        sys.exit(EX_IO)
+    console.print("[dim]strands daemon stopped[/dim]")
+
+
+@app.command()
+def loadtest(
+    spec_file: Annotated[str, typer.Argument(help="Path to workflow YAML/JSON file")],
+    runs: Annotated[int, typer.Option("--runs", "-n", min=1, help="Total workflow runs")] = 100,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-c", min=1, help="Maximum concurrent runs")
+    ] = 10,
+    var: Annotated[
+        list[str] | None, typer.Option("--var", help="Variable override (key=value)")
+    ] = None,
+    session_dir: Annotated[
+        str | None,
+        typer.Option("--session-dir", help="Keep run sessions here (default: temporary)"),
+    ] = None,
+    json_output: Annotated[bool, typer.Option("--json", help="Print the report as JSON")] = False,
+) -> None:
+    """Run a workflow many times concurrently and report throughput and latency.
+
+    Intended for specs using 'provider: simulated', which answers in-process
+    with configurable latency, throttling and errors, so the CLI's own
+    scaling (executors, agent cache, session checkpoints) can be measured
+    without provider quotas or cost.
+
+    Args:
+        spec_file: Path to workflow specification file
+        runs: Total number of workflow runs
+        concurrency: Maximum number of runs in flight
+        var: Variable overrides passed to every run
+        session_dir: Directory for run sessions (temporary and removed if omitted)
+        json_output: Print the report as JSON instead of a table
+    """
+    from strands_cli.loadtest import run_load_test
+
+    variables = parse_variables(var) if var else {}
+    spec, _ = _load_and_validate_spec(spec_file, variables, verbose=False)
+    report = asyncio.run(
+        run_load_test(
+            spec,
+            runs,
+            concurrency,
+            variables,
+            session_dir=Path(session_dir) if session_dir else None,
+        )
+    )
+    summary = report.to_dict()
+
+    if json_output:
+        console.print_json(json.dumps(summary))
+    else:
+        table = Table(title=f"Load test: {spec.name}")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", justify="right")
+        table.add_row("Runs (ok / failed)", f"{report.succeeded} / {report.failed}")
+        table.add_row("Concurrency", str(concurrency))
+        table.add_row("Wall time", f"{summary['wall_seconds']}s")
+        table.add_row("Throughput", f"{summary['throughput_per_second']} runs/s")
+        for name, value in summary["latency_seconds"].items():
+            table.add_row(f"Latency {name}", f"{value}s")
+        for name, value in summary["counters"].items():
+            table.add_row(name.replace("_", " ").capitalize(), str(value))
+        console.print(table)
+        for error, count in report.errors.items():
+            console.print(f"[red]{count}x[/red] {error}")
+
+    sys.exit(EX_OK if report.failed == 0 else EX_RUNTIME)
+
+
 @app.command()
 def version() -> None:
     """Show the version of strands-cli.
@@ -590,6 +859,34 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
             help="User response when resuming from HITL pause (requires --resume)",
         ),
     ] = None,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            "--daemon",
+            help="Send the job to a running 'strands serve' daemon (STRANDS_DAEMON_ADDRESS)",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Write a per-phase timing breakdown (<spec-name>-profile.json/.folded)",
+        ),
+    ] = False,
+    profile_cpu: Annotated[
+        bool,
+        typer.Option(
+            "--profile-cpu",
+            help="Also record a cProfile of the run (<spec-name>-profile.pstats); implies --profile",
+        ),
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Reuse responses of unchanged chain steps/workflow tasks from earlier sessions",
+        ),
+    ] = False,
 ) -> None:
     """Run a workflow from a YAML/JSON file or resume from saved session.
 
@@ -602,7 +899,7 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
         6. Write output artifacts using template rendering
 
     Execution flow (resume):
-        1. Load session state from FileSessionRepository
+        1. Load session state from the session repository
         2. Validate session status (can't resume COMPLETED sessions)
         3. Load spec from snapshot file and verify spec hash
         4. Route to pattern-specific executor with session state
@@ -633,6 +930,10 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
         save_session: Save session for resume capability (default: true)
         auto_resume: Auto-resume from most recent failed/paused session if spec matches
         hitl_response: User response when resuming from HITL pause (requires --resume)
+        daemon: Submit the job to a resident 'strands serve' daemon instead of running locally
+        profile: Write a per-phase timing breakdown next to the trace artifact
+        profile_cpu: Also record a cProfile of the run (implies --profile)
+        incremental: Reuse responses of steps/tasks whose content hash matches an earlier session
 
     Exit Codes:
         EX_OK (0): Successful execution
@@ -672,6 +973,34 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
             logging.basicConfig(level=logging.DEBUG)
             console.print("[dim]Debug logging enabled[/dim]")
 
+        if incremental and resume:
+            console.print("[red]Error:[/red] --incremental cannot be combined with --resume")
+            sys.exit(EX_USAGE)
+
+        # Thin client mode: the resident daemon owns loading, execution and artifacts
+        if daemon:
+            if resume or ask or trace or auto_resume or profile or profile_cpu or incremental:
+                console.print(
+                    "[red]Error:[/red] --daemon cannot be combined with "
+                    "--resume, --ask, --trace, --auto-resume, --profile or --incremental"
+                )
+                sys.exit(EX_USAGE)
+            # Process-wide settings belong to the daemon, not to a single job
+            if not save_session or bypass_tool_consent or debug:
+                console.print(
+                    "[red]Error:[/red] --daemon cannot be combined with "
+                    "--no-save-session, --bypass-tool-consent or --debug\n"
+                    "[dim]Daemon jobs always save sessions; start the daemon with "
+                    "'strands serve --bypass-tool-consent' or STRANDS_DEBUG=true instead[/dim]"
+                )
+                sys.exit(EX_USAGE)
+            variables = parse_variables(var) if var else {}
+            sys.exit(_run_via_daemon(spec_file, variables, out, force, verbose))  # type: ignore[arg-type]
+
+        # Start timing phases before the spec is loaded
+        if profile or profile_cpu:
+            start_profiling(cpu=profile_cpu)
+
         # Set environment variable for tool consent bypass if requested
         if bypass_tool_consent:
             os.environ["BYPASS_TOOL_CONSENT"] = "true"
@@ -681,10 +1010,10 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
         # Auto-resume: Check for existing failed/paused session matching spec hash
         if auto_resume and spec_file and not resume:
             from strands_cli.session import SessionStatus
-            from strands_cli.session.file_repository import FileSessionRepository
+            from strands_cli.session.repository import create_session_repository
             from strands_cli.session.utils import compute_spec_hash
 
-            repo = FileSessionRepository()
+            repo = create_session_repository()
             spec_path = Path(spec_file)
 
             if spec_path.exists():
@@ -752,6 +1081,12 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
                     if trace_file:
                         result.artifacts_written.append(trace_file)
 
+                # Write profile reports if --profile flag is set
+                if result.spec:
+                    result.artifacts_written.extend(
+                        _write_profile_artifacts(result.spec, out, force)
+                    )
+
                 # Show success summary
                 console.print("\n[bold green][OK] Workflow resumed successfully[/bold green]")
                 console.print(f"Duration: {result.duration_seconds:.2f}s")
@@ -864,7 +1199,7 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
         session_id = None
         if save_session:
             from strands_cli.session import SessionMetadata, SessionState, SessionStatus, TokenUsage
-            from strands_cli.session.file_repository import FileSessionRepository
+            from strands_cli.session.repository import create_session_repository
             from strands_cli.session.utils import (
                 compute_spec_hash,
                 generate_session_id,
@@ -872,7 +1207,7 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
             )
 
             session_id = generate_session_id()
-            repo = FileSessionRepository()
+            repo = create_session_repository()
 
             # Initialize session state
             session_state = SessionState(
@@ -902,8 +1237,26 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
             session_state = None
             repo = None  # type: ignore[assignment]
 
+        # Incremental mode: responses of earlier sessions keyed by step content hash
+        incremental_cache = None
+        if incremental:
+            from strands_cli.session.incremental import load_incremental_cache
+            from strands_cli.session.repository import create_session_repository
+
+            incremental_cache = asyncio.run(
+                load_incremental_cache(create_session_repository(), spec.name, session_id)
+            )
+            if verbose:
+                console.print(
+                    f"[dim]Incremental: {len(incremental_cache)} cached results "
+                    "from earlier sessions[/dim]"
+                )
+
         # Execute workflow (with session support if enabled)
-        result = _dispatch_executor(spec, variables, verbose, session_state, repo)
+        from strands_cli.session.incremental import incremental_scope
+
+        with incremental_scope(incremental_cache):
+            result = _dispatch_executor(spec, variables, verbose, session_state, repo)
 
         if not result.success:
             console.print(f"\n[red]Workflow failed:[/red] {result.error}")
@@ -925,9 +1278,17 @@ def run(  # noqa: C901 - Complexity acceptable for main CLI command orchestratio
             if trace_file:
                 result.artifacts_written.append(trace_file)
 
+        # Write profile reports if --profile flag is set
+        result.artifacts_written.extend(_write_profile_artifacts(spec, out, force))
+
         # Show success summary
         console.print("\n[bold green][OK] Workflow completed successfully[/bold green]")
         console.print(f"Duration: {result.duration_seconds:.2f}s")
+        if incremental_cache is not None:
+            console.print(
+                f"Incremental: reused {incremental_cache.reused}, "
+                f"ran {incremental_cache.executed} step(s)"
+            )
 
         if result.artifacts_written:
             console.print("\nArtifacts written:")
@@ -1301,9 +1662,9 @@ def sessions_list(
         strands sessions list --status completed -v
     """
     from strands_cli.session import SessionStatus
-    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.repository import create_session_repository
 
-    repo = FileSessionRepository()
+    repo = create_session_repository()
 
     # Load sessions (async call wrapped in asyncio.run)
     sessions = asyncio.run(repo.list_sessions())
@@ -1388,9 +1749,9 @@ def sessions_show(
         strands sessions show $(strands sessions list --status running | head -n 1)
     """
     from strands_cli.session import SessionStatus
-    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.repository import create_session_repository
 
-    repo = FileSessionRepository()
+    repo = create_session_repository()
 
     # Load session state
     state = asyncio.run(repo.load(session_id))
@@ -1471,9 +1832,9 @@ def sessions_delete(
         strands sessions delete abc123...
         strands sessions delete abc123... --force
     """
-    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.repository import create_session_repository
 
-    repo = FileSessionRepository()
+    repo = create_session_repository()
 
     # Check if session exists
     exists = asyncio.run(repo.exists(session_id))
@@ -1530,9 +1891,9 @@ def sessions_cleanup(
         strands sessions cleanup --force
     """
     from strands_cli.session.cleanup import cleanup_expired_sessions
-    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.repository import create_session_repository
 
-    repo = FileSessionRepository()
+    repo = create_session_repository()
 
     # Show what will be cleaned unless --force
     if not force:
@@ -1564,6 +1925,70 @@ def sessions_cleanup(
     sys.exit(EX_OK)
 
 
+@sessions_app.command("compact")
+def sessions_compact(
+    session_ids: Annotated[
+        list[str] | None,
+        typer.Argument(help="Sessions to convert (default: all sessions)"),
+    ] = None,
+    format: Annotated[
+        str,
+        typer.Option("--format", help="Target format: compact (default) or json"),
+    ] = "compact",
+) -> None:
+    """Convert stored sessions to the compact (or back to the json) format.
+
+    Rewrites session.json, the pattern state and agent message histories.
+    Sessions in either format load and resume regardless of
+    STRANDS_SESSION_FORMAT; set it to 'compact' to keep new sessions compact.
+    Compression uses zstd with the 'compact' extra (strands-cli[compact]) and
+    gzip without it. Only the file session backend is supported; S3 sessions
+    are written in STRANDS_SESSION_FORMAT when they are next saved.
+
+    Examples:
+        strands sessions compact
+        strands sessions compact abc-123 def-456
+        strands sessions compact --format json
+    """
+    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.storage_format import COMPACT_FORMAT, JSON_FORMAT
+
+    if format not in (COMPACT_FORMAT, JSON_FORMAT):
+        console.print(f"[red]Error:[/red] Unknown format '{format}' (use compact or json)")
+        sys.exit(EX_USAGE)
+
+    backend = StrandsConfig().session_backend
+    if backend != "file":
+        console.print(
+            f"[red]Error:[/red] sessions compact only converts the file session store, "
+            f"but STRANDS_SESSION_BACKEND is '{backend}'"
+        )
+        sys.exit(EX_USAGE)
+
+    repo = FileSessionRepository(session_format=format)
+
+    async def _convert_all() -> tuple[int, int, int]:
+        targets = session_ids or [m.session_id for m in await repo.list_sessions()]
+        before = after = failed = 0
+        for session_id in targets:
+            try:
+                size_before, size_after = await repo.convert(session_id)
+            except (FileNotFoundError, SessionError) as e:
+                console.print(f"[yellow]Skipped {session_id}:[/yellow] {e}")
+                failed += 1
+                continue
+            before += size_before
+            after += size_after
+        return len(targets) - failed, before, after
+
+    converted, before, after = asyncio.run(_convert_all())
+    console.print(
+        f"[green][OK][/green] Converted {converted} session(s) to {format}: "
+        f"{before:,} -> {after:,} bytes"
+    )
+    sys.exit(EX_OK)
+
+
 @app.command(name="list-tools")
 def list_tools() -> None:
     """List all available native tools from the registry.
@@ -1687,7 +2112,9 @@ def doctor() -> None:
 
         response = httpx.get("http://localhost:11434/api/tags", timeout=2.0)
         if response.status_code == 200:
-            console.print("  [green][OK][/green] Ollama server is running at http://localhost:11434")
+            console.print(
+                "  [green][OK][/green] Ollama server is running at http://localhost:11434"
+            )
             checks_passed += 1
         else:
             console.print(
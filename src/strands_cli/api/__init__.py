@@ -38,6 +38,12 @@ from strands_cli.api.builders import (
 from strands_cli.api.exceptions import BuildError
 from strands_cli.api.execution import WorkflowExecutor
 from strands_cli.api.session_manager import SessionManager
+from strands_cli.api.session_runtime import (
+    SessionAdmissionError,
+    SessionLimits,
+    SessionRuntime,
+    get_session_runtime,
+)
 from strands_cli.api.workflow_session import WorkflowSession
 from strands_cli.loader import load_spec
 from strands_cli.types import RunResult, Spec, StreamChunk
@@ -114,6 +120,8 @@ class Workflow:
     def create_session(
         self,
         session_id: str | None = None,
+        runtime: SessionRuntime | None = None,
+        limits: SessionLimits | None = None,
         **variables: Any,
     ) -> WorkflowSession:
         """Create new workflow session for pause/resume execution.
@@ -123,6 +131,8 @@ class Workflow:
 
         Args:
             session_id: Optional session ID (generates UUID if None)
+            runtime: Loop pool to run on (default: shared get_session_runtime())
+            limits: Per-session resource limits (default: the runtime's limits)
             **variables: Input variables for workflow
 
         Returns:
@@ -132,6 +142,8 @@ class Workflow:
             spec=self.spec,
             variables=variables,
             session_id=session_id,
+            runtime=runtime,
+            limits=limits,
         )
 
     def run_interactive(self, hitl_handler: Any = None, **variables: Any) -> RunResult:
@@ -257,8 +269,12 @@ __all__ = [
     "OrchestratorWorkersBuilder",
     "ParallelBuilder",
     "RoutingBuilder",
+    "SessionAdmissionError",
+    "SessionLimits",
     "SessionManager",
+    "SessionRuntime",
     "Workflow",
     "WorkflowBuilder",
     "WorkflowSession",
+    "get_session_runtime",
 ]
@@ -2317,6 +2317,7 @@ class EvaluatorOptimizerBuilder:
         self._evaluator_input: str | None = None
         self._min_score: int | None = None
         self._max_iterations: int = 3
+        self._candidates: int = 1
         self._revise_prompt: str | None = None
         self._review_gate: dict[str, Any] | None = None
 
@@ -2400,12 +2401,14 @@ class EvaluatorOptimizerBuilder:
         self,
         min_score: int,
         max_iterations: int = 3,
+        candidates: int = 1,
     ) -> EvaluatorOptimizerBuilder:
         """Configure acceptance criteria.
 
         Args:
             min_score: Minimum score (0-100) to accept output
             max_iterations: Maximum iterations (default: 3)
+            candidates: Candidate drafts generated in parallel per iteration (default: 1)
 
         Returns:
             Self for method chaining
@@ -2428,13 +2431,19 @@ class EvaluatorOptimizerBuilder:
         if max_iterations < 1:
             raise BuildError("max_iterations must be >= 1")
 
+        # Validate candidates
+        if candidates < 1:
+            raise BuildError("candidates must be >= 1")
+
         self._min_score = min_score
         self._max_iterations = max_iterations
+        self._candidates = candidates
 
         logger.debug(
             "evaluator_optimizer_accept_configured",
             min_score=min_score,
             max_iterations=max_iterations,
+            candidates=candidates,
         )
         return self
 
@@ -2604,7 +2613,11 @@ class EvaluatorOptimizerBuilder:
             evaluator_config = EvaluatorConfig(**evaluator_config_data)
 
             # Build accept config
-            accept_config = AcceptConfig(min_score=self._min_score, max_iters=self._max_iterations)
+            accept_config = AcceptConfig(
+                min_score=self._min_score,
+                max_iters=self._max_iterations,
+                candidates=self._candidates,
+            )
 
             # Build pattern config
             config_data: dict[str, Any] = {
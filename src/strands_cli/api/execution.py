@@ -24,8 +24,9 @@ from strands_cli.session import (
     SessionStatus,
     TokenUsage,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository, create_session_repository
 from strands_cli.session.utils import generate_session_id, now_iso8601
+from strands_cli.telemetry.metrics import get_metrics
 from strands_cli.types import HITLState, PatternType, RunResult, Spec, StreamChunk, StreamChunkType
 
 
@@ -44,6 +45,7 @@ class WorkflowExecutor:
         spec: Spec,
         output_dir: str | None = None,
         force_overwrite: bool = True,
+        session_repo: SessionRepository | None = None,
     ):
         """Initialize executor with workflow spec.
 
@@ -51,11 +53,14 @@ class WorkflowExecutor:
             spec: Validated workflow specification
             output_dir: Optional output directory for artifacts
             force_overwrite: Whether to overwrite existing artifact files (default: True)
+            session_repo: Repository for run sessions (default: the user's session store)
         """
         self.spec = spec
         self.output_dir = output_dir
         self.force_overwrite = force_overwrite
+        self.session_repo = session_repo
         self.event_bus = EventBus()
+        self.last_result: RunResult | None = None
         self._agent_cache: AgentCache | None = None
 
     async def __aenter__(self) -> "WorkflowExecutor":
@@ -138,12 +143,12 @@ class WorkflowExecutor:
             hitl_handler = terminal_hitl_handler
 
         # Serialize spec for session storage
-        spec_dict = self.spec.model_dump(mode="json")
+        spec_dict = self.spec.model_dump(mode="json", by_alias=True, exclude_unset=True)
         spec_content = json.dumps(spec_dict, sort_keys=True, indent=2)
         spec_hash = hashlib.sha256(spec_content.encode("utf-8")).hexdigest()
 
         # Create session for HITL tracking
-        session_repo = FileSessionRepository()
+        session_repo = self.session_repo or create_session_repository()
         session_id = generate_session_id()
         session_state = SessionState(
             metadata=SessionMetadata(
@@ -271,6 +276,7 @@ class WorkflowExecutor:
     async def run_async(
         self,
         variables: dict[str, Any],
+        session_id: str | None = None,
     ) -> RunResult:
         """Run workflow asynchronously without interactive mode.
 
@@ -278,34 +284,39 @@ class WorkflowExecutor:
 
         Args:
             variables: Runtime variable overrides
+            session_id: Session ID to use (default: newly generated)
 
         Returns:
             RunResult with execution details (may indicate HITL pause)
         """
-        return await self.run(variables)
+        return await self.run(variables, session_id)
 
     async def run(
         self,
         variables: dict[str, Any],
+        session_id: str | None = None,
     ) -> RunResult:
         """Run workflow without interactive mode (session-based HITL).
 
         Standard execution mode that saves session and exits at HITL steps.
+        The result is also kept in ``last_result``.
 
         Args:
             variables: Runtime variable overrides
+            session_id: Session ID to use, e.g. one handed out before a queued
+                job starts (default: newly generated)
 
         Returns:
             RunResult with execution details (may indicate HITL pause)
         """
         # Serialize spec for session storage
-        spec_dict = self.spec.model_dump(mode="json")
+        spec_dict = self.spec.model_dump(mode="json", by_alias=True, exclude_unset=True)
         spec_content = json.dumps(spec_dict, sort_keys=True, indent=2)
         spec_hash = hashlib.sha256(spec_content.encode("utf-8")).hexdigest()
 
         # Create session for HITL tracking
-        session_repo = FileSessionRepository()
-        session_id = generate_session_id()
+        session_repo = self.session_repo or create_session_repository()
+        session_id = session_id or generate_session_id()
         session_state = SessionState(
             metadata=SessionMetadata(
                 session_id=session_id,
@@ -365,6 +376,7 @@ class WorkflowExecutor:
                     result.artifacts_written = written_files
 
             await session_repo.save(session_state, spec_content)
+            self.last_result = result
             return result
 
         except Exception as exc:
@@ -378,14 +390,17 @@ class WorkflowExecutor:
     async def stream_async(
         self,
         variables: dict[str, Any] | None = None,
+        session_id: str | None = None,
     ) -> AsyncGenerator[StreamChunk, None]:
         """Stream workflow execution events as they occur.
 
         Note: Token-by-token streaming not yet implemented in Phase 3.
-        Returns complete responses as chunks for now.
+        Returns complete responses as chunks for now. The final RunResult is
+        available as ``last_result`` once the stream is exhausted.
 
         Args:
             variables: Runtime variable overrides as dict
+            session_id: Session ID to use (default: newly generated)
 
         Yields:
             StreamChunk objects with execution progress
@@ -441,7 +456,7 @@ class WorkflowExecutor:
         # Execute workflow in background
         async def execute() -> None:
             try:
-                await self.run_async(variables)
+                await self.run_async(variables, session_id)
             except Exception as exc:
                 await chunks.put(exc)
                 return
@@ -485,7 +500,32 @@ class WorkflowExecutor:
         self,
         variables: dict[str, Any],
         session_state: SessionState,
-        session_repo: FileSessionRepository,
+        session_repo: SessionRepository,
+        hitl_response: str | None = None,
+    ) -> RunResult:
+        """Run the pattern's executor and record workflow run metrics.
+
+        Args:
+            variables: Runtime variable overrides
+            session_state: Current session state
+            session_repo: Session repository
+            hitl_response: HITL response for resume (if any)
+
+        Returns:
+            RunResult from executor
+        """
+        with get_metrics().track_run(self.spec.pattern.type.value) as run:
+            result = await self._route_pattern(
+                variables, session_state, session_repo, hitl_response
+            )
+            run.set_result(result)
+        return result
+
+    async def _route_pattern(
+        self,
+        variables: dict[str, Any],
+        session_state: SessionState,
+        session_repo: SessionRepository,
         hitl_response: str | None = None,
     ) -> RunResult:
         """Route to appropriate executor based on pattern type.
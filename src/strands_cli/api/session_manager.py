@@ -1,8 +1,8 @@
 """Session management API with pagination and caching.
 
 Provides a high-level API for session lifecycle management: listing,
-retrieving, resuming, and cleaning up workflow sessions. Wraps
-FileSessionRepository with LRU caching for improved performance.
+retrieving, resuming, and cleaning up workflow sessions. Wraps the
+configured SessionRepository with LRU caching for improved performance.
 
 Example:
     >>> manager = SessionManager()
@@ -29,7 +29,7 @@ from strands_cli.session import (
     SessionState,
     SessionStatus,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import create_session_repository
 from strands_cli.session.resume import run_resume
 from strands_cli.types import RunResult
 
@@ -39,7 +39,7 @@ logger = structlog.get_logger(__name__)
 class SessionManager:
     """High-level session management API with caching.
 
-    Wraps FileSessionRepository with pagination, filtering, and LRU cache
+    Wraps the session repository with pagination, filtering, and LRU cache
     for improved performance. Provides convenient methods for common session
     operations without exposing low-level repository details.
 
@@ -58,16 +58,16 @@ class SessionManager:
         """Initialize session manager.
 
         Args:
-            storage_dir: Base directory for sessions
-                (default: {data_dir}/sessions from platformdirs)
+            storage_dir: Base directory for file sessions
+                (default: the configured backend, STRANDS_SESSION_BACKEND)
         """
-        self.repo = FileSessionRepository(storage_dir)
+        self.repo = create_session_repository(storage_dir)
         self._cache: OrderedDict[str, tuple[SessionState, datetime]] = OrderedDict()
         self._cache_ttl = timedelta(minutes=5)
         self._max_cache_size = 100
         logger.debug(
             "session_manager_init",
-            storage_dir=str(self.repo.storage_dir),
+            repository=type(self.repo).__name__,
             cache_ttl_minutes=5,
             max_cache_size=100,
         )
@@ -301,6 +301,7 @@ class SessionManager:
                 debug=debug,
                 verbose=verbose,
                 trace=trace,
+                session_repo=self.repo,
             )
 
             logger.info(
@@ -0,0 +1,317 @@
+"""Multiplexed event-loop runtime for WorkflowSession.
+
+UI hosts (Streamlit, Gradio, notebooks) drive ``WorkflowSession`` from
+request threads while executions run in the background. ``SessionRuntime``
+runs them on a pool of event-loop threads instead of one shared loop:
+
+    - affinity: a session is assigned to the least-loaded loop when it
+      starts and stays there; its executor, agents and HITL channel only
+      ever run on that loop
+    - admission control: ``max_sessions`` bounds live sessions (``start``
+      raises SessionAdmissionError beyond it) and ``max_running_per_loop``
+      bounds sessions executing at once on a loop; sessions paused at a
+      HITL gate hold no slot, the rest queue for one
+    - HITL channels: responses are handed to the owning loop with
+      ``call_soon_threadsafe``, so ``resume`` is safe from any thread
+    - limits: ``SessionLimits`` caps execution time, HITL wait and the
+      number of HITL rounds per session
+    - ``stats()``: aggregate counts across loops, also exported as
+      ``strands_session_runtime_sessions{state}`` and
+      ``strands_session_runtime_rejected_total``
+
+``get_session_runtime()`` returns the process-wide default runtime used by
+sessions created without an explicit one.
+
+Example:
+    >>> runtime = SessionRuntime(loops=8, max_sessions=500, max_running_per_loop=16)
+    >>> session = workflow.create_session(runtime=runtime, topic="AI")
+    >>> session.start()
+    >>> runtime.stats().running
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import structlog
+
+from strands_cli.telemetry.metrics import get_metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_LOOPS = 4
+DEFAULT_HITL_ROUNDS = 100
+
+SESSION_STATES = ("running", "queued", "paused")
+
+
+class SessionAdmissionError(RuntimeError):
+    """Raised when a session cannot be admitted to a runtime.
+
+    Occurs when the runtime is at ``max_sessions`` live sessions, or when a
+    session with the same ID is already live.
+    """
+
+
+@dataclass(frozen=True)
+class SessionLimits:
+    """Per-session resource limits (None = unlimited)."""
+
+    max_run_seconds: float | None = None
+    """Execution time across all rounds, excluding HITL waits and queueing."""
+
+    max_hitl_wait_seconds: float | None = None
+    """Time to wait for a HITL response; the session is then saved as paused."""
+
+    max_hitl_rounds: int = DEFAULT_HITL_ROUNDS
+    """HITL pauses before the session fails."""
+
+
+@dataclass
+class RuntimeStats:
+    """Aggregate state of a SessionRuntime."""
+
+    loops: int
+    live: int
+    running: int
+    queued: int
+    paused: int
+    started_total: int = 0
+    rejected_total: int = 0
+    completed_total: int = 0
+    failed_total: int = 0
+    cancelled_total: int = 0
+    live_per_loop: list[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Stats as a plain dict."""
+        return asdict(self)
+
+
+class HITLChannel:
+    """HITL response queue owned by one event loop and fed from any thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the channel.
+
+        Args:
+            loop: Event loop of the session that consumes responses
+        """
+        self._loop = loop
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+    def put(self, response: str) -> None:
+        """Deliver a response from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._queue.put_nowait(response)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, response)
+
+    async def get(self) -> str:
+        """Wait for the next response on the owning loop."""
+        return await self._queue.get()
+
+
+class _LoopWorker:
+    """One event loop running forever in a daemon thread."""
+
+    def __init__(self, index: int, max_running: int | None) -> None:
+        self.index = index
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, daemon=True, name=f"strands-session-loop-{index}"
+        )
+        # Only ever awaited on self.loop
+        self.slots = asyncio.Semaphore(max_running) if max_running else None
+        self.live = 0
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        if not self.loop.is_running():
+            self.loop.close()
+
+
+class SessionRuntime:
+    """Pool of event-loop threads that WorkflowSessions are multiplexed onto.
+
+    Thread-safe: sessions are admitted, resumed and cancelled from any
+    thread. Loop threads start on first use.
+    """
+
+    def __init__(
+        self,
+        loops: int = DEFAULT_LOOPS,
+        max_sessions: int | None = None,
+        max_running_per_loop: int | None = None,
+        limits: SessionLimits | None = None,
+    ):
+        """Initialize the runtime.
+
+        Args:
+            loops: Number of event-loop threads
+            max_sessions: Live (started, unfinished) sessions admitted at once
+            max_running_per_loop: Sessions executing at once on each loop
+            limits: Default limits for sessions that don't set their own
+
+        Raises:
+            ValueError: If a size is less than 1
+        """
+        for name, value in (
+            ("loops", loops),
+            ("max_sessions", max_sessions),
+            ("max_running_per_loop", max_running_per_loop),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        self.loops = loops
+        self.max_sessions = max_sessions
+        self.max_running_per_loop = max_running_per_loop
+        self.limits = limits or SessionLimits()
+        self._lock = threading.Lock()
+        self._workers: list[_LoopWorker] = []
+        self._assignments: dict[str, _LoopWorker] = {}
+        self._states = dict.fromkeys(SESSION_STATES, 0)
+        self._totals = {"started": 0, "rejected": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def admit(self, session_id: str) -> asyncio.AbstractEventLoop:
+        """Admit a session and assign it to the least-loaded loop.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Event loop the session must run on
+
+        Raises:
+            SessionAdmissionError: If the runtime is full or the session is live
+        """
+        with self._lock:
+            if not self._workers:
+                self._workers = [
+                    _LoopWorker(index, self.max_running_per_loop) for index in range(self.loops)
+                ]
+            reason = None
+            if session_id in self._assignments:
+                reason = f"Session {session_id} is already running"
+            elif self.max_sessions is not None and len(self._assignments) >= self.max_sessions:
+                reason = f"Session runtime is full ({self.max_sessions} live sessions)"
+            if reason:
+                self._totals["rejected"] += 1
+                get_metrics().inc("strands_session_runtime_rejected_total")
+                raise SessionAdmissionError(reason)
+
+            worker = min(self._workers, key=lambda w: (w.live, w.index))
+            worker.live += 1
+            self._assignments[session_id] = worker
+            self._totals["started"] += 1
+        logger.debug("session_admitted", session_id=session_id, loop=worker.index)
+        return worker.loop
+
+    def submit(
+        self, session_id: str, coro: Coroutine[Any, Any, None]
+    ) -> concurrent.futures.Future[None]:
+        """Run an admitted session's coroutine on its loop.
+
+        The session is released when the coroutine finishes or is cancelled.
+        """
+        worker = self._assignments[session_id]
+        future = asyncio.run_coroutine_threadsafe(coro, worker.loop)
+        future.add_done_callback(lambda f: self._release(session_id, f.cancelled()))
+        return future
+
+    def _release(self, session_id: str, cancelled: bool) -> None:
+        with self._lock:
+            worker = self._assignments.pop(session_id, None)
+            if worker is not None:
+                worker.live -= 1
+            if cancelled:
+                self._totals["cancelled"] += 1
+
+    def record(self, outcome: str) -> None:
+        """Count a finished session ("completed" or "failed")."""
+        with self._lock:
+            self._totals[outcome] += 1
+
+    def _adjust(self, state: str, delta: int) -> None:
+        with self._lock:
+            self._states[state] += delta
+        get_metrics().inc("strands_session_runtime_sessions", delta, state=state)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, loop: asyncio.AbstractEventLoop) -> AsyncIterator[None]:
+        """Hold one of the loop's execution slots (queueing for it if needed)."""
+        slots = next((w.slots for w in self._workers if w.loop is loop), None)
+        self._adjust("queued", 1)
+        try:
+            if slots is not None:
+                await slots.acquire()
+        finally:
+            self._adjust("queued", -1)
+        self._adjust("running", 1)
+        try:
+            yield
+        finally:
+            self._adjust("running", -1)
+            if slots is not None:
+                slots.release()
+
+    @contextlib.contextmanager
+    def paused(self) -> Iterator[None]:
+        """Count a session as paused at a HITL gate for the duration of the block."""
+        self._adjust("paused", 1)
+        try:
+            yield
+        finally:
+            self._adjust("paused", -1)
+
+    def stats(self) -> RuntimeStats:
+        """Aggregate counts across loops."""
+        with self._lock:
+            return RuntimeStats(
+                loops=self.loops,
+                live=len(self._assignments),
+                running=self._states["running"],
+                queued=self._states["queued"],
+                paused=self._states["paused"],
+                started_total=self._totals["started"],
+                rejected_total=self._totals["rejected"],
+                completed_total=self._totals["completed"],
+                failed_total=self._totals["failed"],
+                cancelled_total=self._totals["cancelled"],
+                live_per_loop=[worker.live for worker in self._workers],
+            )
+
+    def shutdown(self) -> None:
+        """Stop the loop threads; running sessions are abandoned.
+
+        The runtime can be used again afterwards (loops restart on demand).
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._assignments.clear()
+        for worker in workers:
+            worker.stop()
+
+
+_default_runtime: SessionRuntime | None = None
+_default_lock = threading.Lock()
+
+
+def get_session_runtime() -> SessionRuntime:
+    """Process-wide default runtime (DEFAULT_LOOPS loops, no admission limits)."""
+    global _default_runtime
+    with _default_lock:
+        if _default_runtime is None:
+            _default_runtime = SessionRuntime()
+        return _default_runtime
@@ -1,10 +1,12 @@
 """Stateful workflow session for UI frameworks.
 
 Provides a pause/resume execution model compatible with request/response
-frameworks like Streamlit, FastAPI, and Gradio.
+frameworks like Streamlit, FastAPI, and Gradio. Sessions run on the event
+loops of a SessionRuntime (see api.session_runtime).
 """
 
 import asyncio
+import concurrent.futures
 import threading
 import uuid
 from collections.abc import Callable
@@ -12,8 +14,14 @@ from enum import Enum
 from typing import Any
 
 from strands_cli.api.execution import WorkflowExecutor
+from strands_cli.api.session_runtime import (
+    HITLChannel,
+    SessionLimits,
+    SessionRuntime,
+    get_session_runtime,
+)
 from strands_cli.session import SessionState, SessionStatus
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository, create_session_repository
 from strands_cli.types import HITLState, RunResult, Spec
 
 
@@ -28,29 +36,6 @@ class SessionStateEnum(str, Enum):
     CANCELLED = "cancelled"  # User cancelled
 
 
-# Global shared event loop for background tasks
-_global_loop: asyncio.AbstractEventLoop | None = None
-_global_loop_thread: threading.Thread | None = None
-_loop_lock = threading.Lock()
-
-
-def _ensure_event_loop() -> asyncio.AbstractEventLoop:
-    """Ensure global event loop is running in a background thread."""
-    global _global_loop, _global_loop_thread
-
-    with _loop_lock:
-        if _global_loop is None or not _global_loop.is_running():
-            _global_loop = asyncio.new_event_loop()
-            _global_loop_thread = threading.Thread(
-                target=_global_loop.run_forever,
-                daemon=True,
-                name="strands-session-loop",
-            )
-            _global_loop_thread.start()
-
-    return _global_loop
-
-
 class WorkflowSession:
     """Stateful workflow execution session.
 
@@ -63,7 +48,9 @@ class WorkflowSession:
         spec: Spec,
         variables: dict[str, Any],
         session_id: str | None = None,
-        repository: FileSessionRepository | None = None,
+        repository: SessionRepository | None = None,
+        runtime: SessionRuntime | None = None,
+        limits: SessionLimits | None = None,
     ):
         """Initialize session.
 
@@ -71,12 +58,16 @@ class WorkflowSession:
             spec: Workflow specification
             variables: Input variables
             session_id: Optional session ID (generates UUID if None)
-            repository: Optional session repository (defaults to FileSessionRepository)
+            repository: Optional session repository (defaults to the configured backend)
+            runtime: Loop pool to run on (defaults to get_session_runtime())
+            limits: Resource limits (defaults to the runtime's limits)
         """
         self.spec = spec
         self.variables = variables
         self.session_id = session_id or uuid.uuid4().hex
-        self.repo = repository or FileSessionRepository()
+        self.repo = repository or create_session_repository()
+        self.runtime = runtime or get_session_runtime()
+        self.limits = limits or self.runtime.limits
         
         self.state = SessionStateEnum.READY
         self.hitl_state: HITLState | None = None
@@ -84,8 +75,9 @@ class WorkflowSession:
         self.progress: list[dict[str, Any]] = []
         self._result: RunResult | None = None
         
-        self._background_task: asyncio.Task | None = None
-        self._hitl_response_queue: asyncio.Queue = asyncio.Queue()
+        self._background_task: concurrent.futures.Future[None] | None = None
+        self._hitl_channel: HITLChannel | None = None
+        self._state_lock = threading.Lock()
         self._event_callbacks: dict[str, list[Callable]] = {}
         
         # Initialize executor
@@ -99,20 +91,16 @@ class WorkflowSession:
 
         Raises:
             RuntimeError: If session already started
+            SessionAdmissionError: If the runtime is full
         """
         if self.state != SessionStateEnum.READY:
             raise RuntimeError(f"Session already started (state={self.state})")
 
+        # Assign a loop first so a rejected session can be started again later
+        loop = self.runtime.admit(self.session_id)
         self.state = SessionStateEnum.RUNNING
-        
-        # Get shared event loop and run in background
-        loop = _ensure_event_loop()
-        self._hitl_response_queue = asyncio.Queue()  # Re-init for new loop
-        
-        self._background_task = asyncio.run_coroutine_threadsafe(
-            self._run_async(),
-            loop
-        )
+        self._hitl_channel = HITLChannel(loop)
+        self._background_task = self.runtime.submit(self.session_id, self._run_async())
 
     async def _run_async(self) -> None:
         """Internal async execution loop."""
@@ -160,21 +148,36 @@ class WorkflowSession:
 
             # 2. Execution Loop
             hitl_response = None
-            max_iterations = 100
+            limits = self.limits
+            budget = limits.max_run_seconds
+            loop = asyncio.get_running_loop()
             iteration = 0
 
-            while iteration < max_iterations:
+            while iteration <= limits.max_hitl_rounds:
                 iteration += 1
 
-                # Execute workflow pattern
+                # Execute workflow pattern in one of the loop's execution slots
                 # Accessing protected method _execute_pattern from WorkflowExecutor
                 # This is necessary because run_interactive is not async-pause compatible
-                result = await self._executor._execute_pattern(
-                    self.variables,
-                    session_state,
-                    self.repo,
-                    hitl_response,
-                )
+                async with self.runtime.slot(loop):
+                    started = loop.time()
+                    deadline = asyncio.timeout(budget)
+                    try:
+                        async with deadline:
+                            result = await self._executor._execute_pattern(
+                                self.variables,
+                                session_state,
+                                self.repo,
+                                hitl_response,
+                            )
+                    except TimeoutError as e:
+                        if not deadline.expired():
+                            raise
+                        raise TimeoutError(
+                            f"Session exceeded max_run_seconds={limits.max_run_seconds}"
+                        ) from e
+                    if budget is not None:
+                        budget -= loop.time() - started
                 result.session_id = self.session_id
                 self._result = result
 
@@ -185,15 +188,27 @@ class WorkflowSession:
                     if not hitl_state_data:
                         raise RuntimeError("HITL pause detected but no hitl_state in session")
                     
-                    self.hitl_state = HITLState(**hitl_state_data)
-                    self.state = SessionStateEnum.PAUSED_HITL
-                    
-                    # Wait for resume() to be called (async wait)
-                    hitl_response = await self._hitl_response_queue.get()
-                    
-                    # Resume
-                    self.state = SessionStateEnum.RUNNING
-                    self.hitl_state = None
+                    with self._state_lock:
+                        self.hitl_state = HITLState(**hitl_state_data)
+                        self.state = SessionStateEnum.PAUSED_HITL
+
+                    # Wait for resume() to be called (async wait, holding no slot)
+                    with self.runtime.paused():
+                        try:
+                            async with asyncio.timeout(limits.max_hitl_wait_seconds):
+                                hitl_response = await self._hitl_channel.get()
+                        except TimeoutError:
+                            # Keep the session resumable via SessionManager / --resume
+                            session_state.metadata.status = SessionStatus.PAUSED
+                            session_state.metadata.updated_at = now_iso8601()
+                            await self.repo.save(session_state, spec_content)
+                            self.error = TimeoutError(
+                                f"No HITL response within {limits.max_hitl_wait_seconds}s; "
+                                "session saved as paused"
+                            )
+                            self.state = SessionStateEnum.FAILED
+                            self.runtime.record("failed")
+                            return
                     continue
                 
                 else:
@@ -202,9 +217,12 @@ class WorkflowSession:
                     session_state.metadata.updated_at = now_iso8601()
                     await self.repo.save(session_state, spec_content)
                     self.state = SessionStateEnum.COMPLETE
+                    self.runtime.record("completed")
                     return
 
-            raise RuntimeError("HITL loop exceeded maximum iterations")
+            raise RuntimeError(
+                f"HITL loop exceeded max_hitl_rounds={limits.max_hitl_rounds}"
+            )
 
         except asyncio.CancelledError:
             self.state = SessionStateEnum.CANCELLED
@@ -218,6 +236,7 @@ class WorkflowSession:
         except Exception as e:
             self.error = e
             self.state = SessionStateEnum.FAILED
+            self.runtime.record("failed")
             if 'session_state' in locals():
                 session_state.metadata.status = SessionStatus.FAILED
                 session_state.metadata.error = str(e)
@@ -253,17 +272,14 @@ class WorkflowSession:
 
     def resume(self, hitl_response: str) -> None:
         """Resume from HITL pause with user response."""
-        if not self.is_paused():
-            raise RuntimeError(f"Cannot resume - session not paused (state={self.state})")
-
-        # Send response to waiting workflow thread
-        # We use call_soon_threadsafe to put into queue which is thread safe?
-        # Queue.put_nowait is not thread safe across loops?
-        # Actually asyncio.Queue is not thread safe.
-        # We need to use loop.call_soon_threadsafe(queue.put_nowait, item)
-        
-        loop = _ensure_event_loop()
-        loop.call_soon_threadsafe(self._hitl_response_queue.put_nowait, hitl_response)
+        with self._state_lock:
+            if not self.is_paused() or self._hitl_channel is None:
+                raise RuntimeError(f"Cannot resume - session not paused (state={self.state})")
+            self.state = SessionStateEnum.RUNNING
+            self.hitl_state = None
+
+        # The channel hands the response to the session's own loop
+        self._hitl_channel.put(hitl_response)
 
     def cancel(self) -> None:
         """Cancel running workflow execution."""
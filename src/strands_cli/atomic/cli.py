@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from jsonschema import Draft202012Validator
+from platformdirs import user_cache_dir
 from ruamel.yaml import YAML
 
 from strands_cli.atomic.core import (
@@ -21,10 +23,12 @@ from strands_cli.atomic.core import (
     find_atomic_specs,
     resolve_atomic_spec,
 )
+from strands_cli.config import StrandsConfig
 from strands_cli.exit_codes import EX_IO, EX_OK, EX_RUNTIME, EX_SCHEMA, EX_USAGE
 from strands_cli.loader import LoadError, load_spec
 from strands_cli.schema import SchemaValidationError
 from strands_cli.exec.single_agent import run_single_agent
+from strands_cli.exec.utils import AgentCache, AgentPool
 from strands_cli.types import Spec
 
 console = Console()
@@ -456,11 +460,175 @@ def _apply_checks(payload: Any, checks: list[dict[str, Any]]) -> list[str]:
     return errors
 
 
+def _result_cache_path(name: str) -> Path | None:
+    """Location of the pass-result cache for an atomic agent (None when caching is off)."""
+    config = StrandsConfig()
+    if not config.cache_enabled:
+        return None
+    cache_dir = config.cache_dir or Path(user_cache_dir("strands", appauthor=False))
+    return cache_dir / "atomic-tests" / f"{Path(name).stem}.json"
+
+
+def _load_result_cache(path: Path | None) -> dict[str, str]:
+    """Load case name -> key of the last passing run (empty if missing or unreadable)."""
+    if path is None or not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_result_cache(path: Path | None, passed: dict[str, str]) -> None:
+    """Persist the keys of passing cases; failures are never cached."""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(passed, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError as e:
+        console.print(f"[yellow]Could not write test result cache {path}: {e}[/yellow]")
+
+
+def _case_cache_key(
+    manifest_text: str,
+    input_text: str,
+    agent: Any,
+    manifest_path: Path,
+    expect: Any,
+    output_schema_override: str | None,
+) -> str:
+    """Hash everything a case's outcome depends on: manifest, input, schemas and expectations."""
+    schemas = [
+        _load_schema(ref, manifest_path) if ref else None
+        for ref in (agent.input_schema, output_schema_override or agent.output_schema)
+    ]
+    digest = hashlib.sha256()
+    for part in (manifest_text, input_text, json.dumps([schemas, expect], sort_keys=True)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def _run_test_case(
+    case: dict[str, Any],
+    spec: Spec,
+    manifest_path: Path,
+    manifest_text: str,
+    test_path: Path,
+    pool: AgentPool,
+    cached_keys: dict[str, str],
+) -> tuple[dict[str, Any], str | None]:
+    """Run one test case.
+
+    Returns:
+        The case result and its cache key (None if the key could not be computed)
+    """
+    case_name = case.get("name", "unnamed")
+    status = "pass"
+    message = ""
+    key: str | None = None
+
+    try:
+        input_ref = case.get("input")
+        if not input_ref:
+            raise LoadError(f"Test '{case_name}' missing input")
+        input_path = (test_path.parent / input_ref).resolve()
+        if not input_path.exists():
+            raise LoadError(f"Input file not found: {input_path}")
+        input_text = input_path.read_text(encoding="utf-8")
+        raw_input = json.loads(input_text)
+        if not isinstance(raw_input, dict):
+            raise LoadError("Input must be a JSON object")
+
+        agent = next(iter(spec.agents.values()))
+
+        output_schema_override = None
+        expect = case.get("expect", {}) or {}
+        if isinstance(expect, dict):
+            output_schema_override = expect.get("output_schema")
+            checks = expect.get("checks") or []
+        else:
+            checks = []
+
+        if isinstance(output_schema_override, str):
+            schema_path = Path(output_schema_override)
+            if not schema_path.is_absolute():
+                schema_path = (test_path.parent / schema_path).resolve()
+            output_schema_override = str(schema_path)
+
+        key = _case_cache_key(
+            manifest_text, input_text, agent, manifest_path, expect, output_schema_override
+        )
+        if cached_keys.get(case_name) == key:
+            return {"name": case_name, "status": "pass", "message": "cached"}, key
+
+        input_errors = _validate_input_schema(agent, manifest_path, raw_input)
+        if input_errors:
+            raise LoadError("; ".join(input_errors))
+
+        result = await run_single_agent(spec, variables=raw_input, agent_pool=pool)
+
+        _, output_payload, output_errors = _validate_output_schema(
+            agent, manifest_path, result.last_response, override_schema=output_schema_override
+        )
+        if output_errors:
+            raise LoadError("; ".join(output_errors))
+
+        if checks:
+            check_errors = _apply_checks(output_payload if output_payload is not None else {}, checks)
+            if check_errors:
+                raise LoadError("; ".join(check_errors))
+
+    except (LoadError, SchemaValidationError) as e:
+        status = "fail"
+        message = str(e)
+    except Exception as e:  # pragma: no cover - defensive
+        status = "fail"
+        message = str(e)
+
+    return {"name": case_name, "status": status, "message": message}, key
+
+
+async def _run_test_cases(
+    cases: list[dict[str, Any]],
+    spec: Spec,
+    manifest_path: Path,
+    manifest_text: str,
+    test_path: Path,
+    jobs: int,
+    cached_keys: dict[str, str],
+) -> list[tuple[dict[str, Any], str | None]]:
+    """Run test cases on one event loop, at most ``jobs`` agent invocations at a time.
+
+    Cases lease agents from a pool backed by one shared AgentCache, so at most
+    ``jobs`` agents are built for the whole run and each is reset between cases.
+    """
+    cache = AgentCache()
+    pool = AgentPool(cache, size=jobs)
+    try:
+        return await asyncio.gather(
+            *(
+                _run_test_case(
+                    case, spec, manifest_path, manifest_text, test_path, pool, cached_keys
+                )
+                for case in cases
+            )
+        )
+    finally:
+        await cache.close()
+
+
 @atomic_app.command("test")
 def test_atomic(
     name: str,
     filter_pattern: str | None = typer.Option(None, "--filter", help="Only run cases containing substring"),
     json_output: bool = typer.Option(False, "--json", help="Emit JSON results"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Run up to N cases concurrently"),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Skip cases that passed with unchanged manifest, input and schemas"
+    ),
 ) -> None:
     """Run atomic agent tests from <name>_tests.yaml."""
     manifest_path = _resolve_manifest(name)
@@ -471,82 +639,48 @@ def test_atomic(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(EX_IO)
 
-    results: list[dict[str, Any]] = []
-    any_fail = False
+    selected = [
+        case
+        for case in cases
+        if not filter_pattern or filter_pattern in case.get("name", "unnamed")
+    ]
 
-    for case in cases:
-        case_name = case.get("name", "unnamed")
-        if filter_pattern and filter_pattern not in case_name:
-            continue
+    # The spec is loaded once; each case's input is passed to the executor as variables
+    spec_error: str | None = None
+    try:
+        spec = load_spec(str(manifest_path))
+        manifest_text = manifest_path.read_text(encoding="utf-8")
+        invariant_errors = check_atomic_invariants(spec)
+        if invariant_errors:
+            spec_error = "; ".join(invariant_errors)
+    except (LoadError, SchemaValidationError) as e:
+        spec_error = str(e)
+
+    cache_path = _result_cache_path(name)
+    if spec_error is not None:
+        outcomes = [
+            ({"name": case.get("name", "unnamed"), "status": "fail", "message": spec_error}, None)
+            for case in selected
+        ]
+    else:
+        cached_keys = _load_result_cache(cache_path) if use_cache else {}
+        outcomes = asyncio.run(
+            _run_test_cases(
+                selected, spec, manifest_path, manifest_text, test_path, jobs, cached_keys
+            )
+        )
 
-        status = "pass"
-        message = ""
+    results = [result for result, _ in outcomes]
+    any_fail = any(result["status"] != "pass" for result in results)
 
-        try:
-            input_ref = case.get("input")
-            if not input_ref:
-                raise LoadError(f"Test '{case_name}' missing input")
-            input_path = (test_path.parent / input_ref).resolve()
-            if not input_path.exists():
-                raise LoadError(f"Input file not found: {input_path}")
-            raw_input = json.loads(input_path.read_text(encoding="utf-8"))
-            if not isinstance(raw_input, dict):
-                raise LoadError("Input must be a JSON object")
-
-            spec = load_spec(str(manifest_path), variables=raw_input)
-            agent = next(iter(spec.agents.values()))
-
-            invariant_errors = check_atomic_invariants(spec)
-            if invariant_errors:
-                raise LoadError("; ".join(invariant_errors))
-
-            input_errors = _validate_input_schema(agent, manifest_path, raw_input)
-            if input_errors:
-                raise LoadError("; ".join(input_errors))
-
-            result = asyncio.run(run_single_agent(spec, variables=raw_input))
-
-            output_schema_override = None
-            expect = case.get("expect", {}) or {}
-            if isinstance(expect, dict):
-                output_schema_override = expect.get("output_schema")
-                checks = expect.get("checks") or []
+    if spec_error is None:
+        passed = _load_result_cache(cache_path)
+        for result, key in outcomes:
+            if result["status"] == "pass" and key is not None:
+                passed[result["name"]] = key
             else:
-                checks = []
-
-            if isinstance(output_schema_override, str):
-                schema_path = Path(output_schema_override)
-                if not schema_path.is_absolute():
-                    schema_path = (test_path.parent / schema_path).resolve()
-                output_schema_override = str(schema_path)
-
-            output_valid, output_payload, output_errors = _validate_output_schema(
-                agent, manifest_path, result.last_response, override_schema=output_schema_override
-            )
-            if output_errors:
-                raise LoadError("; ".join(output_errors))
-
-            if checks:
-                check_errors = _apply_checks(output_payload if output_payload is not None else {}, checks)
-                if check_errors:
-                    raise LoadError("; ".join(check_errors))
-
-        except (LoadError, SchemaValidationError) as e:
-            status = "fail"
-            message = str(e)
-        except Exception as e:  # pragma: no cover - defensive
-            status = "fail"
-            message = str(e)
-
-        results.append(
-            {
-                "name": case_name,
-                "status": status,
-                "message": message,
-            }
-        )
-        if status != "pass":
-            any_fail = True
+                passed.pop(result["name"], None)
+        _save_result_cache(cache_path, passed)
 
     if json_output:
         typer.echo(json.dumps(results, indent=2))
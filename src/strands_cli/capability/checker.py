@@ -112,19 +112,20 @@ def _validate_provider(spec: Spec, issues: list[CapabilityIssue]) -> None:
         spec: Workflow spec
         issues: List to append issues to
     """
-    # Provider must be bedrock, ollama, openai, anthropic, or gemini
+    # Provider must be bedrock, ollama, openai, anthropic, gemini, or simulated
     if spec.runtime.provider not in {
         ProviderType.BEDROCK,
         ProviderType.OLLAMA,
         ProviderType.OPENAI,
         ProviderType.ANTHROPIC,
         ProviderType.GEMINI,
+        ProviderType.SIMULATED,
     }:
         issues.append(
             CapabilityIssue(
                 pointer="/runtime/provider",
                 reason=f"Provider '{spec.runtime.provider}' not supported",
-                remediation="Use 'bedrock', 'ollama', 'openai', 'anthropic', or 'gemini'",
+                remediation="Use 'bedrock', 'ollama', 'openai', 'anthropic', 'gemini', or 'simulated'",
             )
         )
 
@@ -10,6 +10,7 @@ Example:
 """
 
 from pathlib import Path
+from typing import Literal
 
 from platformdirs import user_config_dir, user_data_dir
 from pydantic import Field
@@ -28,6 +29,7 @@ class StrandsConfig(BaseSettings):
         Workflow: Schema path for validation
         Cache: Enable/disable and directory configuration
         Observability: OTEL endpoint and logging preferences
+        Sessions: Storage backend and file format
     """
 
     model_config = SettingsConfigDict(
@@ -68,6 +70,22 @@ class StrandsConfig(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(default="console", description="Log format (json or console)")
 
+    # Session storage
+    session_format: Literal["json", "compact"] = Field(
+        default="json",
+        description="Session file format (json: indented; compact: minified and compressed)",
+    )
+    session_backend: Literal["file", "s3"] = Field(
+        default="file",
+        description="Session storage backend (file: local data dir; s3: S3-compatible bucket)",
+    )
+    session_s3_bucket: str | None = Field(default=None, description="Bucket for S3 sessions")
+    session_s3_prefix: str = Field(default="sessions/", description="Key prefix for S3 sessions")
+    session_s3_endpoint_url: str | None = Field(
+        default=None,
+        description="S3-compatible endpoint (e.g. MinIO); uses path-style addressing",
+    )
+
     # HTTP Security
     http_allowed_domains: list[str] = Field(
         default_factory=list,
@@ -0,0 +1,399 @@
+"""Resident daemon for warm workflow execution (``strands serve``).
+
+Every ``strands run`` pays process start-up, imports, tool discovery, spec
+parsing and schema validation, model client creation and MCP server boot
+before the first token is generated. The daemon keeps one process alive and
+runs jobs submitted by thin ``strands run --daemon`` clients, so that state
+survives across jobs:
+
+    - Compiled specs: cached by (path, mtime, size, variables); schema
+      validation runs once per spec revision
+    - Provider clients: the model client LRU in runtime.providers lives as long
+      as the daemon, so TCP/TLS connections are reused between jobs
+    - Tool modules: the native tool registry is discovered once
+    - MCP servers: the process-level MCP pool is enabled (STRANDS_MCP_POOL)
+
+Protocol:
+    Newline-delimited JSON over a Unix socket (default) or localhost TCP port.
+    Each connection sends one request object and receives one response object.
+    There is no authentication: the socket is created owner-only and
+    TCP is only served on loopback addresses.
+
+    {"op": "run", "spec_file": "/abs/spec.yaml", "variables": {...},
+     "out": "/abs/artifacts", "force": false}
+    {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+
+Jobs execute through the same WorkflowExecutor as the Python API, so sessions
+are saved and HITL pauses can be resumed with ``strands run --resume``.
+"""
+
+import asyncio
+import ipaddress
+import json
+import os
+import socket
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from strands_cli.config import StrandsConfig
+from strands_cli.exit_codes import (
+    EX_HITL_PAUSE,
+    EX_IO,
+    EX_OK,
+    EX_RUNTIME,
+    EX_SCHEMA,
+    EX_UNSUPPORTED,
+    EX_USAGE,
+)
+from strands_cli.types import Spec
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_JOBS = 4
+SPEC_CACHE_SIZE = 64
+_READ_LIMIT = 16 * 1024 * 1024
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or returns a malformed response."""
+
+    pass
+
+
+def default_address() -> str:
+    """Return the daemon address from STRANDS_DAEMON_ADDRESS or the default socket path."""
+    env_address = os.environ.get("STRANDS_DAEMON_ADDRESS")
+    if env_address:
+        return env_address
+    return str(StrandsConfig().data_dir / "strands.sock")
+
+
+def parse_address(address: str) -> tuple[str, Any]:
+    """Parse a daemon address into a transport and target.
+
+    Args:
+        address: Unix socket path, or ``host:port`` / ``:port`` for localhost TCP
+
+    Returns:
+        ("unix", path) or ("tcp", (host, port))
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address and "\\" not in address:
+        return "tcp", (host or "127.0.0.1", int(port))
+    return "unix", address
+
+
+def _require_loopback(host: str) -> None:
+    """Refuse to serve TCP on anything but a loopback address.
+
+    Jobs run arbitrary specs (including python_exec) with the daemon owner's
+    credentials, and the protocol is unauthenticated.
+
+    Raises:
+        DaemonError: If ``host`` is not a loopback address
+    """
+    if host == "localhost":
+        return
+    try:
+        loopback = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        raise DaemonError(
+            f"Refusing to listen on {host}: the daemon is unauthenticated, so TCP is only "
+            "served on loopback (127.0.0.1, ::1, localhost). Use a Unix socket or an SSH tunnel."
+        )
+
+
+class SpecCache:
+    """LRU cache of validated specs keyed by file revision and variables."""
+
+    def __init__(self, maxsize: int = SPEC_CACHE_SIZE) -> None:
+        """Initialize an empty cache holding at most ``maxsize`` specs."""
+        self.maxsize = maxsize
+        self._specs: OrderedDict[tuple[Any, ...], Spec] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, spec_file: str, variables: dict[str, str] | None) -> Spec:
+        """Return a private copy of the validated spec, loading it on a miss.
+
+        Raises:
+            LoadError: If the spec cannot be read or parsed
+            SchemaValidationError: If the spec fails schema validation
+        """
+        from strands_cli.loader import load_spec
+
+        path = Path(spec_file).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size, tuple(sorted((variables or {}).items())))
+
+        spec = self._specs.get(key)
+        if spec is not None:
+            self.hits += 1
+            self._specs.move_to_end(key)
+        else:
+            self.misses += 1
+            spec = load_spec(str(path), variables)
+            self._specs[key] = spec
+            if len(self._specs) > self.maxsize:
+                self._specs.popitem(last=False)
+
+        # Executors may annotate the spec; never hand out the cached instance
+        return spec.model_copy(deep=True)
+
+
+class StrandsDaemon:
+    """Long-lived job server holding warm specs, clients, tools and MCP servers."""
+
+    def __init__(self, address: str, max_jobs: int = DEFAULT_MAX_JOBS) -> None:
+        """Initialize the daemon.
+
+        Args:
+            address: Unix socket path or ``host:port`` for localhost TCP
+            max_jobs: Maximum number of workflow jobs executing concurrently
+        """
+        self.address = address
+        self.max_jobs = max_jobs
+        self.spec_cache = SpecCache()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.started_at = time.monotonic()
+        self._job_semaphore = asyncio.Semaphore(max_jobs)
+        self._stop_event = asyncio.Event()
+
+    async def serve_forever(self) -> None:
+        """Listen on the configured address until a shutdown request arrives."""
+        os.environ.setdefault("STRANDS_MCP_POOL", "true")
+        self._warm_up()
+
+        transport, target = parse_address(self.address)
+        if transport == "unix":
+            # Jobs run with the daemon owner's credentials: create the socket
+            # owner-only so there is no window in which others can connect
+            old_umask = os.umask(0o077)
+            try:
+                server = await asyncio.start_unix_server(
+                    self._handle_connection, path=target, limit=_READ_LIMIT
+                )
+            finally:
+                os.umask(old_umask)
+            os.chmod(target, 0o600)
+        else:
+            host, port = target
+            _require_loopback(host)
+            server = await asyncio.start_server(
+                self._handle_connection, host=host, port=port, limit=_READ_LIMIT
+            )
+
+        logger.info("daemon_started", address=self.address, max_jobs=self.max_jobs)
+        try:
+            async with server:
+                await self._stop_event.wait()
+        finally:
+            from strands_cli.runtime.mcp_pool import shutdown_mcp_pool
+
+            shutdown_mcp_pool()
+            logger.info("daemon_stopped", address=self.address)
+
+    def _warm_up(self) -> None:
+        """Import executors and discover native tools before the first job."""
+        import strands_cli.api.execution  # noqa: F401
+        from strands_cli.tools import get_registry
+
+        get_registry()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                response: dict[str, Any] = {"exit_code": EX_USAGE, "error": f"Bad request: {e}"}
+            else:
+                response = await self.handle_request(request)
+
+            writer.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            logger.debug("daemon_client_disconnected", error=str(e))
+        finally:
+            writer.close()
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one protocol request and return its response object."""
+        op = request.get("op")
+        if op == "ping":
+            return {"exit_code": EX_OK, "pid": os.getpid()}
+        if op == "stats":
+            return {"exit_code": EX_OK, **self.stats()}
+        if op == "shutdown":
+            self._stop_event.set()
+            return {"exit_code": EX_OK}
+        if op == "run":
+            async with self._job_semaphore:
+                response = await self.run_job(request)
+            if response["exit_code"] in (EX_OK, EX_HITL_PAUSE):
+                self.jobs_completed += 1
+            else:
+                self.jobs_failed += 1
+            return response
+        return {"exit_code": EX_USAGE, "error": f"Unknown op: {op!r}"}
+
+    async def run_job(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute one workflow job and map the outcome to a CLI exit code."""
+        from strands_cli.api.execution import WorkflowExecutor
+        from strands_cli.artifacts import ArtifactError
+        from strands_cli.capability import check_capability
+        from strands_cli.loader import LoadError
+        from strands_cli.runtime.budget_enforcer import BudgetExceededError
+        from strands_cli.schema import SchemaValidationError
+
+        spec_file = request.get("spec_file")
+        if not spec_file:
+            return {"exit_code": EX_USAGE, "error": "Missing 'spec_file'"}
+        variables: dict[str, str] = request.get("variables") or {}
+
+        try:
+            spec = self.spec_cache.get(spec_file, variables)
+        except (LoadError, SchemaValidationError, OSError) as e:
+            return {"exit_code": EX_SCHEMA, "error": str(e)}
+
+        capability_report = check_capability(spec)
+        if not capability_report.supported:
+            return {
+                "exit_code": EX_UNSUPPORTED,
+                "error": "Unsupported features detected",
+                "issues": [issue.reason for issue in capability_report.issues],
+            }
+
+        logger.info("daemon_job_started", spec_name=spec.name, pattern=spec.pattern.type.value)
+        try:
+            async with WorkflowExecutor(
+                spec,
+                output_dir=request.get("out", "./artifacts"),
+                force_overwrite=bool(request.get("force", False)),
+            ) as executor:
+                result = await executor.run(variables)
+        except ArtifactError as e:
+            return {"exit_code": EX_IO, "error": f"Failed to write artifacts: {e}"}
+        except BudgetExceededError as e:
+            return {"exit_code": e.exit_code, "error": f"Budget exceeded: {e}"}
+        except Exception as e:
+            logger.warning("daemon_job_failed", spec_name=spec.name, error=str(e))
+            return {"exit_code": EX_RUNTIME, "error": f"{type(e).__name__}: {e}"}
+
+        if not result.success:
+            exit_code = EX_RUNTIME
+        elif result.agent_id == "hitl":
+            exit_code = EX_HITL_PAUSE
+        else:
+            exit_code = EX_OK
+
+        return {
+            "exit_code": exit_code,
+            "workflow": spec.name,
+            "session_id": result.session_id,
+            "error": result.error,
+            "duration_seconds": result.duration_seconds,
+            "artifacts_written": result.artifacts_written,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return daemon, spec cache, model cache and MCP pool statistics."""
+        from strands_cli.runtime.mcp_pool import get_mcp_pool
+        from strands_cli.runtime.providers import _create_model_cached
+
+        model_cache = _create_model_cached.cache_info()
+        mcp_pool = get_mcp_pool()
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "spec_cache": {"hits": self.spec_cache.hits, "misses": self.spec_cache.misses},
+            "model_cache": {"hits": model_cache.hits, "misses": model_cache.misses},
+            "mcp_pool": mcp_pool.stats() if mcp_pool else None,
+        }
+
+
+def send_request(
+    address: str, request: dict[str, Any], timeout: float | None = None
+) -> dict[str, Any]:
+    """Send one request to a running daemon and wait for its response.
+
+    Args:
+        address: Daemon address (Unix socket path or ``host:port``)
+        request: Protocol request object
+        timeout: Optional socket timeout in seconds (None waits for the job)
+
+    Returns:
+        Decoded response object
+
+    Raises:
+        DaemonError: If the daemon is unreachable or the response is malformed
+    """
+    transport, target = parse_address(address)
+    try:
+        if transport == "unix":
+            if not hasattr(socket, "AF_UNIX"):
+                raise DaemonError("Unix sockets are not supported here; use host:port")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(target)
+        else:
+            sock = socket.create_connection(target, timeout=timeout)
+    except OSError as e:
+        raise DaemonError(f"Cannot reach strands daemon at {address}: {e}") from e
+
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+        except OSError as e:
+            raise DaemonError(f"Connection to strands daemon failed: {e}") from e
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise DaemonError(f"Malformed response from strands daemon: {line[:200]!r}") from e
+    if not isinstance(response, dict):
+        raise DaemonError("Malformed response from strands daemon")
+    return response
+
+
+def run_daemon(address: str, max_jobs: int = DEFAULT_MAX_JOBS) -> None:
+    """Run the daemon in the foreground until a shutdown request (or KeyboardInterrupt).
+
+    Raises:
+        DaemonError: If another daemon is already listening on ``address``, or
+            ``address`` is a non-loopback TCP address
+    """
+    transport, target = parse_address(address)
+    if transport == "tcp":
+        _require_loopback(target[0])
+    if transport == "unix":
+        socket_path = Path(target)
+        if socket_path.exists():
+            try:
+                send_request(address, {"op": "ping"}, timeout=1)
+            except DaemonError:
+                socket_path.unlink()  # Stale socket from a crashed daemon
+            else:
+                raise DaemonError(f"A strands daemon is already running at {address}")
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        asyncio.run(StrandsDaemon(address, max_jobs=max_jobs).serve_forever())
+    finally:
+        if transport == "unix":
+            Path(target).unlink(missing_ok=True)
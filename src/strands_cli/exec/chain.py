@@ -44,13 +44,15 @@ from strands_cli.exec.utils import (
 )
 from strands_cli.exit_codes import EX_HITL_PAUSE, EX_OK
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import fail_session
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.incremental import content_hash, get_incremental_cache, result_hash
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
 from strands_cli.types import HITLState, PatternType, RunResult, Spec
 
 
@@ -112,11 +114,12 @@ def _build_step_context(
     return context
 
 
+@with_budget_ledger
 async def run_chain(  # noqa: C901
     spec: Spec,
     variables: dict[str, Any] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -361,7 +364,11 @@ async def run_chain(  # noqa: C901
         step_counter = [len(step_history)]  # Mutable container for hook to track step count
         if spec.context_policy and spec.context_policy.notes:
             notes_format = spec.context_policy.notes.format or "markdown"
-            notes_manager = NotesManager(spec.context_policy.notes.file, format=notes_format)
+            notes_manager = NotesManager(
+                spec.context_policy.notes.file,
+                format=notes_format,
+                flush_interval_s=NOTES_FLUSH_INTERVAL_S,
+            )
 
             # Build agent_id → tools mapping for notes hook
             agent_tools: dict[str, list[str]] = {}
@@ -380,6 +387,7 @@ async def run_chain(  # noqa: C901
         # Phase 3: Support optional shared agent_cache from context manager
         # Phase 2: Pass session_id for agent session restoration
         agent_session_id = session_state.metadata.session_id if session_state else None
+        incremental = get_incremental_cache()
         cache = agent_cache or AgentCache()
         should_close = agent_cache is None
         try:
@@ -609,86 +617,103 @@ async def run_chain(  # noqa: C901
                             notes_length=len(injected_notes),
                         )
 
-                # Phase 6: Pass conversation manager, hooks, and notes for context management
-                hooks_for_agent: list[Any] | None = None
-                if compaction_threshold is not None or shared_hooks:
-                    hooks_for_agent = []
-                    if compaction_threshold is not None:
-                        hooks_for_agent.append(
-                            ProactiveCompactionHook(
-                                threshold_tokens=compaction_threshold,
-                                model_id=spec.runtime.model_id,
+                # Incremental runs reuse the response of an unchanged step
+                upstream = [result_hash(step_history[-1])] if step_history else []
+                step_hash = content_hash(
+                    spec, step_agent_id, step_input, upstream, tools_for_step, injected_notes
+                )
+                reused = incremental.lookup(step_hash, "chain") if incremental else None
+
+                if reused is not None:
+                    response_text = str(reused["response"])
+                    estimated_tokens = 0
+                    logger.info("chain_step_reused", step=step_index, hash=step_hash[:12])
+                else:
+                    # Phase 6: Pass conversation manager, hooks, and notes for context management
+                    hooks_for_agent: list[Any] | None = None
+                    if compaction_threshold is not None or shared_hooks:
+                        hooks_for_agent = []
+                        if compaction_threshold is not None:
+                            hooks_for_agent.append(
+                                ProactiveCompactionHook(
+                                    threshold_tokens=compaction_threshold,
+                                    model_id=spec.runtime.model_id,
+                                )
                             )
+                        hooks_for_agent.extend(shared_hooks)
+
+                    # Phase 2: Create session manager for agent conversation restoration on resume
+                    agent_session_manager = None
+                    if agent_session_id and session_repo and session_state:
+                        from strands_cli.session.storage_format import (
+                            CompactFileSessionManager,
                         )
-                    hooks_for_agent.extend(shared_hooks)
-
-                # Phase 2: Create session manager for agent conversation restoration on resume
-                agent_session_manager = None
-                if agent_session_id and session_repo and session_state:
-                    from strands.session.file_session_manager import FileSessionManager
-
-                    # Get agents directory for this session
-                    agents_dir = session_repo.get_agents_dir(session_state.metadata.session_id)
-
-                    # Create session manager for this specific agent
-                    # Format: {session_id}_{agent_id} to isolate per-agent conversations
-                    formatted_agent_session_id = f"{agent_session_id}_{step_agent_id}"
-                    agent_session_manager = FileSessionManager(
-                        session_id=formatted_agent_session_id,
-                        storage_dir=str(agents_dir),
-                    )
-                    logger.debug(
-                        "agent_session_restore",
-                        agent_id=step_agent_id,
-                        session_id=formatted_agent_session_id,
-                    )
 
-                agent = await cache.get_or_build_agent(
-                    spec,
-                    step_agent_id,
-                    step_agent_config,
-                    tool_overrides=tools_for_step,
-                    conversation_manager=context_manager,
-                    hooks=hooks_for_agent,
-                    injected_notes=injected_notes,
-                    worker_index=None,
-                    session_manager=agent_session_manager,
-                )
+                        # Get agents directory for this session
+                        agents_dir = session_repo.get_agents_dir(session_state.metadata.session_id)
 
-                # Phase 3: Emit step_start event before agent invocation
-                if event_bus:
-                    await event_bus.emit(
-                        WorkflowEvent(
-                            event_type="step_start",
-                            timestamp=datetime.now(UTC),
-                            session_id=session_state.metadata.session_id if session_state else None,
-                            spec_name=spec.name,
-                            pattern_type="chain",
-                            data={
-                                "step_index": step_index,
-                                "agent_id": step_agent_id,
-                                "input_preview": step_input[:200] if step_input else "",
-                            },
+                        # Create session manager for this specific agent
+                        # Format: {session_id}_{agent_id} to isolate per-agent conversations
+                        formatted_agent_session_id = f"{agent_session_id}_{step_agent_id}"
+                        agent_session_manager = CompactFileSessionManager(
+                            session_id=formatted_agent_session_id,
+                            storage_dir=str(agents_dir),
+                            compact=session_repo.compact,
                         )
-                    )
-                    logger.debug(
-                        "step_start_event_emitted",
-                        step=step_index,
-                        agent=step_agent_id,
+                        logger.debug(
+                            "agent_session_restore",
+                            agent_id=step_agent_id,
+                            session_id=formatted_agent_session_id,
+                        )
+
+                    agent = await cache.get_or_build_agent(
+                        spec,
+                        step_agent_id,
+                        step_agent_config,
+                        tool_overrides=tools_for_step,
+                        conversation_manager=context_manager,
+                        hooks=hooks_for_agent,
+                        injected_notes=injected_notes,
+                        worker_index=None,
+                        session_manager=agent_session_manager,
                     )
 
-                # Phase 4: Direct await instead of asyncio.run() per step
-                step_response = await invoke_agent_with_retry(
-                    agent, step_input, max_attempts, wait_min, wait_max
-                )
+                    # Phase 3: Emit step_start event before agent invocation
+                    if event_bus:
+                        await event_bus.emit(
+                            WorkflowEvent(
+                                event_type="step_start",
+                                timestamp=datetime.now(UTC),
+                                session_id=session_state.metadata.session_id
+                                if session_state
+                                else None,
+                                spec_name=spec.name,
+                                pattern_type="chain",
+                                data={
+                                    "step_index": step_index,
+                                    "agent_id": step_agent_id,
+                                    "input_preview": step_input[:200] if step_input else "",
+                                },
+                            )
+                        )
+                        logger.debug(
+                            "step_start_event_emitted",
+                            step=step_index,
+                            agent=step_agent_id,
+                        )
 
-                # Extract response text
-                response_text = (
-                    step_response if isinstance(step_response, str) else str(step_response)
-                )
+                    # Phase 4: Direct await instead of asyncio.run() per step
+                    step_response = await invoke_agent_with_retry(
+                        agent, step_input, max_attempts, wait_min, wait_max
+                    )
+
+                    # Extract response text
+                    response_text = (
+                        step_response if isinstance(step_response, str) else str(step_response)
+                    )
 
-                # Track token usage using shared estimator
-                estimated_tokens = estimate_tokens(step_input, response_text)
+                    # Track token usage using shared estimator
+                    estimated_tokens = estimate_tokens(step_input, response_text)
                 cumulative_tokens += estimated_tokens
 
                 # Record step result
@@ -697,6 +722,7 @@ async def run_chain(  # noqa: C901
                     "agent": step.agent,
                     "response": response_text,
                     "tokens_estimated": estimated_tokens,
+                    "hash": step_hash,
                 }
                 step_history.append(step_result)
 
@@ -802,6 +828,8 @@ async def run_chain(  # noqa: C901
             # Phase 3: Only close if we created the cache (not shared from context manager)
             if should_close:
                 await cache.close()
+            if notes_manager:
+                notes_manager.close()
 
         completed_at = datetime.now(UTC).isoformat()
         started_dt = datetime.fromisoformat(started_at)
@@ -15,9 +15,17 @@ Execution Flow:
         f. Execute producer agent with revision prompt + evaluator feedback
     4. If max_iters exhausted → FAILURE with detailed iteration history
 
+Best-of-N Mode (accept.candidates > 1):
+    - Producer generates N candidate drafts/revisions in parallel
+    - Evaluator scores all candidates concurrently (bounded by runtime.max_parallel)
+    - Highest-scoring candidate moves forward; evaluation stops early at min_score
+    - Unevaluated candidates are checkpointed as candidate_drafts for resume
+
 Evaluator Output:
     - Expected JSON: {"score": 0-100, "issues": ["..."], "fixes": ["..."]}
-    - Parsing strategies: direct JSON, extract JSON block, regex extraction
+    - Requested as native structured output (EvaluatorDecision) unless
+      runtime.structured_output is off; it then parses as direct JSON
+    - Text fallback parsing strategies: direct JSON, extract JSON block, regex extraction
     - Retry once with clarification prompt on malformed responses
 
 Template Context (Revision):
@@ -33,6 +41,7 @@ Error Handling:
     - No fallback behavior (explicit failures only)
 """
 
+import asyncio
 import json
 import re
 from datetime import UTC, datetime, timedelta
@@ -51,9 +60,12 @@ from strands_cli.exec.utils import (
     estimate_tokens,
     get_retry_config,
     invoke_agent_with_retry,
+    request_structured_output,
+    structured_output_schema,
 )
 from strands_cli.exit_codes import EX_OK
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import (
@@ -63,9 +75,10 @@ from strands_cli.session.checkpoint_utils import (
     get_cumulative_tokens,
     validate_session_params,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 from strands_cli.telemetry import get_tracer
+from strands_cli.telemetry.metrics import get_metrics
 from strands_cli.types import EvaluatorDecision, HITLState, PatternType, RunResult, Spec
 
 
@@ -79,32 +92,72 @@ logger = structlog.get_logger(__name__)
 console = Console()
 
 
-async def _run_initial_production(
-    producer_agent: Any,
-    initial_prompt: str,
+async def _invoke_with_semaphore(
+    agent: Any,
+    prompt: str,
+    semaphore: asyncio.Semaphore | None,
     max_attempts: int,
     wait_min: int,
     wait_max: int,
-) -> tuple[str, int]:
-    """Execute initial production phase.
+) -> str:
+    """Invoke an agent, holding the shared concurrency semaphore if configured.
+
+    Args:
+        agent: The agent to invoke
+        prompt: Prompt text
+        semaphore: Optional semaphore bounding concurrent LLM calls (runtime.max_parallel)
+        max_attempts: Max retry attempts
+        wait_min: Min wait time for retries
+        wait_max: Max wait time for retries
+
+    Returns:
+        Agent response as string
+    """
+    if semaphore:
+        async with semaphore:
+            response = await invoke_agent_with_retry(
+                agent, prompt, max_attempts, wait_min, wait_max
+            )
+    else:
+        response = await invoke_agent_with_retry(agent, prompt, max_attempts, wait_min, wait_max)
+    return response if isinstance(response, str) else str(response)
+
+
+async def _generate_candidates(
+    producer_agents: list[Any],
+    prompt: str,
+    semaphore: asyncio.Semaphore | None,
+    max_attempts: int,
+    wait_min: int,
+    wait_max: int,
+) -> tuple[list[str], int]:
+    """Generate one candidate draft per producer agent concurrently.
+
+    With a single producer agent this is a plain production/revision call.
+    With N producer agents (best-of-N mode) all N drafts are generated in
+    parallel from the same prompt, bounded by the shared semaphore.
 
     Args:
-        producer_agent: The producer agent
-        initial_prompt: Initial prompt for production
+        producer_agents: Isolated producer agent instances (one per candidate)
+        prompt: Production or revision prompt
+        semaphore: Optional semaphore bounding concurrent LLM calls
         max_attempts: Max retry attempts
         wait_min: Min wait time for retries
         wait_max: Max wait time for retries
 
     Returns:
-        Tuple of (draft, estimated_tokens)
+        Tuple of (candidate_drafts, estimated_tokens)
     """
-    logger.info("iteration_start", iteration=1, phase="production")
-    producer_response = await invoke_agent_with_retry(
-        producer_agent, initial_prompt, max_attempts, wait_min, wait_max
+    drafts = list(
+        await asyncio.gather(
+            *[
+                _invoke_with_semaphore(agent, prompt, semaphore, max_attempts, wait_min, wait_max)
+                for agent in producer_agents
+            ]
+        )
     )
-    draft = producer_response if isinstance(producer_response, str) else str(producer_response)
-    estimated_tokens = estimate_tokens(initial_prompt, draft)
-    return draft, estimated_tokens
+    estimated_tokens = sum(estimate_tokens(prompt, draft) for draft in drafts)
+    return drafts, estimated_tokens
 
 
 async def _run_evaluation_phase(
@@ -224,6 +277,175 @@ def _parse_evaluator_response(response: str, attempt: int) -> EvaluatorDecision:
     )
 
 
+async def _evaluate_draft(
+    evaluator_agent: Any,
+    draft: str,
+    config: Any,
+    variables: dict[str, str] | None,
+    iteration: int,
+    semaphore: asyncio.Semaphore | None,
+    max_attempts: int,
+    wait_min: int,
+    wait_max: int,
+) -> tuple[EvaluatorDecision, int]:
+    """Evaluate a single draft, retrying once with clarification on malformed JSON.
+
+    Args:
+        evaluator_agent: The evaluator agent
+        draft: Draft to evaluate
+        config: Pattern configuration
+        variables: User-provided variables
+        iteration: Current iteration number (for logging and errors)
+        semaphore: Optional semaphore bounding concurrent LLM calls
+        max_attempts: Max retry attempts
+        wait_min: Min wait time for retries
+        wait_max: Max wait time for retries
+
+    Returns:
+        Tuple of (evaluation, estimated_tokens)
+
+    Raises:
+        EvaluatorOptimizerExecutionError: If both parse attempts fail
+    """
+    if semaphore:
+        async with semaphore:
+            evaluator_response, estimated_tokens = await _run_evaluation_phase(
+                evaluator_agent, draft, config, variables, max_attempts, wait_min, wait_max
+            )
+    else:
+        evaluator_response, estimated_tokens = await _run_evaluation_phase(
+            evaluator_agent, draft, config, variables, max_attempts, wait_min, wait_max
+        )
+
+    # Parse evaluator response (retry once on malformed JSON)
+    for parse_attempt in range(1, 3):  # Try twice: initial + 1 retry
+        try:
+            return _parse_evaluator_response(evaluator_response, parse_attempt), estimated_tokens
+        except EvaluatorOptimizerExecutionError as e:
+            if parse_attempt == 2:
+                # Both attempts failed
+                raise EvaluatorOptimizerExecutionError(
+                    f"Evaluator failed to return valid JSON after 2 attempts on iteration {iteration}. "
+                    f"Last response: {evaluator_response[:200]}"
+                ) from e
+
+            # Retry with clarification
+            logger.warning(
+                "evaluator_response_malformed",
+                iteration=iteration,
+                attempt=parse_attempt,
+                error=str(e),
+            )
+            get_metrics().inc(
+                "strands_structured_output_total",
+                agent=getattr(evaluator_agent, "name", "unknown"),
+                outcome="parse_retry",
+            )
+            clarification_prompt = (
+                f"Your previous response was not valid JSON. "
+                f"Please return only valid JSON in this exact format: "
+                f'{{"score": <0-100>, "issues": ["issue1", ...], "fixes": ["fix1", ...]}}\n\n'
+                f"Evaluate this draft:\n\n{draft}"
+            )
+            evaluator_response = await _invoke_with_semaphore(
+                evaluator_agent, clarification_prompt, semaphore, max_attempts, wait_min, wait_max
+            )
+
+            # Estimate tokens for retry
+            estimated_tokens += estimate_tokens(clarification_prompt, evaluator_response)
+
+    raise EvaluatorOptimizerExecutionError(
+        f"Failed to parse evaluator response on iteration {iteration}"
+    )
+
+
+async def _evaluate_candidates(
+    evaluator_agents: list[Any],
+    drafts: list[str],
+    config: Any,
+    variables: dict[str, str] | None,
+    iteration: int,
+    min_score: int,
+    semaphore: asyncio.Semaphore | None,
+    max_attempts: int,
+    wait_min: int,
+    wait_max: int,
+) -> tuple[int, list[EvaluatorDecision | None], int]:
+    """Evaluate candidate drafts concurrently and select the best one.
+
+    Evaluations run in parallel (one evaluator agent per candidate). As soon as
+    any candidate reaches min_score, the remaining in-flight evaluations are
+    cancelled (early stop) and that candidate is selected.
+
+    Args:
+        evaluator_agents: Isolated evaluator agent instances (one per candidate)
+        drafts: Candidate drafts to evaluate
+        config: Pattern configuration
+        variables: User-provided variables
+        iteration: Current iteration number
+        min_score: Acceptance threshold used for early stop
+        semaphore: Optional semaphore bounding concurrent LLM calls
+        max_attempts: Max retry attempts
+        wait_min: Min wait time for retries
+        wait_max: Max wait time for retries
+
+    Returns:
+        Tuple of (best_index, evaluations, estimated_tokens). Evaluations that were
+        cancelled by early stop are None.
+
+    Raises:
+        EvaluatorOptimizerExecutionError: If any evaluation fails
+    """
+
+    async def _evaluate(index: int) -> tuple[int, EvaluatorDecision, int]:
+        evaluation, tokens = await _evaluate_draft(
+            evaluator_agents[index],
+            drafts[index],
+            config,
+            variables,
+            iteration,
+            semaphore,
+            max_attempts,
+            wait_min,
+            wait_max,
+        )
+        return index, evaluation, tokens
+
+    evaluations: list[EvaluatorDecision | None] = [None] * len(drafts)
+    estimated_tokens = 0
+    tasks = [asyncio.create_task(_evaluate(index)) for index in range(len(drafts))]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, evaluation, tokens = await next_done
+            evaluations[index] = evaluation
+            estimated_tokens += tokens
+            if evaluation.score >= min_score:
+                break
+    finally:
+        # Early stop (or failure): cancel evaluations still in flight
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    best_index = max(
+        (index for index, evaluation in enumerate(evaluations) if evaluation is not None),
+        key=lambda index: evaluations[index].score,  # type: ignore[union-attr]
+    )
+
+    if len(drafts) > 1:
+        logger.info(
+            "candidates_evaluated",
+            iteration=iteration,
+            candidates=len(drafts),
+            evaluated=sum(1 for evaluation in evaluations if evaluation is not None),
+            best_index=best_index,
+            best_score=evaluations[best_index].score,  # type: ignore[union-attr]
+        )
+
+    return best_index, evaluations, estimated_tokens
+
+
 def _build_revision_context(
     draft: str,
     evaluation: EvaluatorDecision,
@@ -290,11 +512,12 @@ def _validate_evaluator_optimizer_config(spec: Spec) -> None:
         )
 
 
+@with_budget_ledger
 async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for iterative refinement logic
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -363,12 +586,14 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
         span.set_attribute("evaluator_optimizer.evaluator_agent", config.evaluator.agent)
         span.set_attribute("evaluator_optimizer.optimizer_agent", config.producer)
         span.set_attribute("evaluator_optimizer.min_score", config.accept.min_score)
+        span.set_attribute("evaluator_optimizer.candidates", config.accept.candidates)
 
         # Add execution_start event
         span.add_event("execution_start")
 
         # Get retry configuration
         max_attempts, wait_min, wait_max = get_retry_config(spec)
+        evaluator_schema = structured_output_schema(spec, EvaluatorDecision)
 
         # Initialize state
         started_at = datetime.now(UTC).isoformat()
@@ -379,6 +604,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
         evaluator_agent_id = config.evaluator.agent
         min_score = config.accept.min_score
         max_iters = config.accept.max_iters
+        num_candidates = config.accept.candidates
         revise_prompt_template = config.revise_prompt or (
             "Revise the following draft based on evaluator feedback.\n\n"
             "Draft:\n{{ draft }}\n\n"
@@ -402,6 +628,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
         # Iteration tracking - restore from session state if resuming
         iteration_history: list[dict[str, Any]] = []
         current_draft = ""
+        candidate_drafts: list[str] = []
         final_score = 0
         start_iteration = 1
 
@@ -409,6 +636,10 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
             # Restore pattern state from checkpoint
             pattern_state = session_state.pattern_state
             current_draft = pattern_state.get("current_draft", "")
+            # Best-of-N: restore unevaluated candidates (single draft for older checkpoints)
+            candidate_drafts = (pattern_state.get("candidate_drafts") or [current_draft])[
+                :num_candidates
+            ]
             iteration_history = pattern_state.get("iteration_history", [])
             final_score = pattern_state.get("final_score", 0)
             start_iteration = pattern_state.get("current_iteration", 1)
@@ -637,6 +868,38 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                 worker_index=None,
             )
 
+            # Best-of-N: isolated producer/evaluator instances per extra candidate
+            # (worker_index isolates conversation state, as in orchestrator workers)
+            producer_agents = [producer_agent]
+            evaluator_agents = [evaluator_agent]
+            for candidate_index in range(1, num_candidates):
+                producer_agents.append(
+                    await cache.get_or_build_agent(
+                        spec,
+                        producer_agent_id,
+                        producer_config,
+                        conversation_manager=context_manager,
+                        hooks=hooks,
+                        worker_index=candidate_index,
+                    )
+                )
+                evaluator_agents.append(
+                    await cache.get_or_build_agent(
+                        spec,
+                        evaluator_agent_id,
+                        evaluator_config,
+                        conversation_manager=context_manager,
+                        hooks=hooks,
+                        worker_index=candidate_index,
+                    )
+                )
+
+            # Candidate fan-out shares the parallel pattern's concurrency limit
+            max_parallel = spec.runtime.max_parallel
+            semaphore = (
+                asyncio.Semaphore(max_parallel) if max_parallel and num_candidates > 1 else None
+            )
+
             # Check if resuming after HITL with pending revision
             if session_state and session_state.pattern_state.get("pending_revision"):
                 logger.info(
@@ -662,18 +925,16 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                     # Render revision prompt
                     revision_prompt = render_template(revise_prompt_template, revision_context)
 
-                    # Execute producer for revision
-                    revision_response = await invoke_agent_with_retry(
-                        producer_agent, revision_prompt, max_attempts, wait_min, wait_max
+                    # Execute producer for revision (N candidates in best-of-N mode)
+                    candidate_drafts, estimated_tokens = await _generate_candidates(
+                        producer_agents,
+                        revision_prompt,
+                        semaphore,
+                        max_attempts,
+                        wait_min,
+                        wait_max,
                     )
-                    current_draft = (
-                        revision_response
-                        if isinstance(revision_response, str)
-                        else str(revision_response)
-                    )
-
-                    # Estimate tokens for revision
-                    estimated_tokens = estimate_tokens(revision_prompt, current_draft)
+                    current_draft = candidate_drafts[0]
                     cumulative_tokens += estimated_tokens
 
                     # Clear pending_revision flag and checkpoint
@@ -684,6 +945,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                             pattern_state_updates={
                                 "current_iteration": start_iteration,
                                 "current_draft": current_draft,
+                                "candidate_drafts": candidate_drafts,
                                 "iteration_history": iteration_history,
                                 "final_score": final_score,
                                 "accepted": False,
@@ -702,9 +964,13 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
 
             # Iteration 1: Initial production (skip if resuming)
             if start_iteration == 1:
-                current_draft, estimated_tokens = await _run_initial_production(
-                    producer_agent, initial_prompt, max_attempts, wait_min, wait_max
+                logger.info(
+                    "iteration_start", iteration=1, phase="production", candidates=num_candidates
+                )
+                candidate_drafts, estimated_tokens = await _generate_candidates(
+                    producer_agents, initial_prompt, semaphore, max_attempts, wait_min, wait_max
                 )
+                current_draft = candidate_drafts[0]
                 cumulative_tokens += estimated_tokens
 
                 # Checkpoint after initial production (iteration 1)
@@ -715,6 +981,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                         pattern_state_updates={
                             "current_iteration": 1,
                             "current_draft": current_draft,
+                            "candidate_drafts": candidate_drafts,
                             "iteration_history": iteration_history,
                             "final_score": 0,
                             "accepted": False,
@@ -765,69 +1032,35 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                         optimizer=producer_agent_id,
                     )
 
-                # Execute evaluation phase
-                evaluator_response, estimated_tokens = await _run_evaluation_phase(
-                    evaluator_agent,
-                    current_draft,
-                    config,
-                    variables,
-                    max_attempts,
-                    wait_min,
-                    wait_max,
-                )
+                # Execute evaluation phase (all candidates concurrently in best-of-N mode)
+                with request_structured_output(evaluator_schema):
+                    (
+                        best_index,
+                        candidate_evaluations,
+                        estimated_tokens,
+                    ) = await _evaluate_candidates(
+                        evaluator_agents,
+                        candidate_drafts,
+                        config,
+                        variables,
+                        iteration,
+                        min_score,
+                        semaphore,
+                        max_attempts,
+                        wait_min,
+                        wait_max,
+                    )
                 cumulative_tokens += estimated_tokens
 
-                # Parse evaluator response (retry once on malformed JSON)
-                evaluation: EvaluatorDecision | None = None
-                for parse_attempt in range(1, 3):  # Try twice: initial + 1 retry
-                    try:
-                        evaluation = _parse_evaluator_response(evaluator_response, parse_attempt)
-                        break
-                    except EvaluatorOptimizerExecutionError as e:
-                        if parse_attempt == 1:
-                            # Retry with clarification
-                            logger.warning(
-                                "evaluator_response_malformed",
-                                iteration=iteration,
-                                attempt=parse_attempt,
-                                error=str(e),
-                            )
-                            clarification_prompt = (
-                                f"Your previous response was not valid JSON. "
-                                f'Please return only valid JSON in this exact format: '
-                                f'{{"score": <0-100>, "issues": ["issue1", ...], "fixes": ["fix1", ...]}}\n\n'
-                                f"Evaluate this draft:\n\n{current_draft}"
-                            )
-                            clarification_result = await invoke_agent_with_retry(
-                                evaluator_agent,
-                                clarification_prompt,
-                                max_attempts,
-                                wait_min,
-                                wait_max,
-                            )
-                            evaluator_response = (
-                                clarification_result
-                                if isinstance(clarification_result, str)
-                                else str(clarification_result)
-                            )
-
-                            # Estimate tokens for retry
-                            estimated_tokens = estimate_tokens(
-                                clarification_prompt, evaluator_response
-                            )
-                            cumulative_tokens += estimated_tokens
-                        else:
-                            # Both attempts failed
-                            raise EvaluatorOptimizerExecutionError(
-                                f"Evaluator failed to return valid JSON after 2 attempts on iteration {iteration}. "
-                                f"Last response: {evaluator_response[:200]}"
-                            ) from e
-
+                evaluation = candidate_evaluations[best_index]
                 if not evaluation:
                     raise EvaluatorOptimizerExecutionError(
                         f"Failed to parse evaluator response on iteration {iteration}"
                     )
 
+                # Best candidate moves forward
+                current_draft = candidate_drafts[best_index]
+                candidate_drafts = [current_draft]
                 final_score = evaluation.score
 
                 # Record iteration history with full evaluator feedback
@@ -849,6 +1082,13 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                         },
                     }
                 )
+                if num_candidates > 1:
+                    # Per-candidate scores (None = evaluation cancelled by early stop)
+                    iteration_history[-1]["selected_candidate"] = best_index
+                    iteration_history[-1]["candidate_scores"] = [
+                        candidate.score if candidate else None
+                        for candidate in candidate_evaluations
+                    ]
 
                 logger.info(
                     "evaluation_complete",
@@ -876,6 +1116,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                             pattern_state_updates={
                                 "current_iteration": iteration,  # iteration is already int from range()
                                 "current_draft": current_draft,
+                                "candidate_drafts": candidate_drafts,
                                 "iteration_history": iteration_history,
                                 "final_score": final_score,
                                 "accepted": True,
@@ -968,6 +1209,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                     # Save session with HITL state BEFORE displaying to user
                     session_state.pattern_state["current_iteration"] = iteration
                     session_state.pattern_state["current_draft"] = current_draft
+                    session_state.pattern_state["candidate_drafts"] = candidate_drafts
                     session_state.pattern_state["iteration_history"] = iteration_history
                     session_state.pattern_state["final_score"] = final_score
                     session_state.pattern_state["accepted"] = False
@@ -1060,18 +1302,16 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                 # Render revision prompt
                 revision_prompt = render_template(revise_prompt_template, revision_context)
 
-                # Execute producer for revision
-                revision_response = await invoke_agent_with_retry(
-                    producer_agent, revision_prompt, max_attempts, wait_min, wait_max
-                )
-                current_draft = (
-                    revision_response
-                    if isinstance(revision_response, str)
-                    else str(revision_response)
+                # Execute producer for revision (N candidates in best-of-N mode)
+                candidate_drafts, estimated_tokens = await _generate_candidates(
+                    producer_agents,
+                    revision_prompt,
+                    semaphore,
+                    max_attempts,
+                    wait_min,
+                    wait_max,
                 )
-
-                # Estimate tokens for revision
-                estimated_tokens = estimate_tokens(revision_prompt, current_draft)
+                current_draft = candidate_drafts[0]
                 cumulative_tokens += estimated_tokens
 
                 # Checkpoint after revision
@@ -1082,6 +1322,7 @@ async def run_evaluator_optimizer(  # noqa: C901 - Complexity acceptable for ite
                         pattern_state_updates={
                             "current_iteration": int(iteration + 1),
                             "current_draft": current_draft,
+                            "candidate_drafts": candidate_drafts,
                             "iteration_history": iteration_history,
                             "final_score": final_score,
                             "accepted": False,
@@ -54,6 +54,7 @@ from strands_cli.exec.utils import (
 )
 from strands_cli.exit_codes import EX_HITL_PAUSE, EX_OK
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import (
     checkpoint_pattern_state,
@@ -62,7 +63,7 @@ from strands_cli.session.checkpoint_utils import (
     get_cumulative_tokens,
     validate_session_params,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.telemetry import get_tracer
 from strands_cli.types import GraphEdge, HITLState, PatternType, RunResult, Spec
 
@@ -91,7 +92,7 @@ async def _handle_hitl_pause(
     node_config: dict[str, Any],
     node_results: dict[str, dict[str, Any]],
     session_state: SessionState | None,
-    session_repo: FileSessionRepository | None,
+    session_repo: SessionRepository | None,
     variables: dict[str, str] | None,
     cumulative_tokens: int,
     execution_path: list[str],
@@ -592,11 +593,12 @@ def _check_iteration_limit(
         )
 
 
+@with_budget_ledger
 async def run_graph(  # noqa: C901 - Complexity acceptable for graph state machine execution
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -6,18 +6,96 @@ to enable proactive context management during long-running workflows.
 Hooks:
     ProactiveCompactionHook: Triggers context compaction before token overflow
     NotesAppenderHook: Appends structured notes after each agent invocation
+    UsageTrackerHook: Accumulates provider token usage, including prompt-cache tokens
+    MetricsHook: Reports model/tool latency and token usage to the metrics registry
 """
 
+import inspect
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any
 
 import structlog
-from strands.hooks import AfterInvocationEvent, HookProvider, HookRegistry
+from strands.agent.conversation_manager import SummarizingConversationManager
+from strands.hooks import (
+    AfterInvocationEvent,
+    AfterModelCallEvent,
+    AfterToolCallEvent,
+    BeforeInvocationEvent,
+    BeforeModelCallEvent,
+    HookProvider,
+    HookRegistry,
+)
+from strands.types.content import Message
 
 from strands_cli.runtime.token_counter import TokenCounter
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.telemetry.profiler import record_phase
 from strands_cli.tools.notes_manager import NotesManager
 
 logger = structlog.get_logger(__name__)
 
+# Fraction of the compaction threshold at which background summarization starts
+DEFAULT_PRECOMPUTE_RATIO = 0.7
+
+# Summarization shares one summarization agent per conversation manager, so
+# background jobs run one at a time on a single worker thread
+_summary_executor: ThreadPoolExecutor | None = None
+_summary_executor_lock = threading.Lock()
+
+
+def _get_summary_executor() -> ThreadPoolExecutor:
+    """Return the process-wide background summarization executor."""
+    global _summary_executor
+
+    with _summary_executor_lock:
+        if _summary_executor is None:
+            _summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compaction")
+        return _summary_executor
+
+
+@dataclass
+class _PendingSummary:
+    """A background summary of an agent's oldest messages."""
+
+    future: "Future[tuple[Message, int] | None]"
+    snapshot: list[Message]
+    manager: SummarizingConversationManager
+
+
+def _summarize_snapshot(
+    manager: SummarizingConversationManager, snapshot: list[Message], preserve: int
+) -> tuple[Message, int] | None:
+    """Summarize the oldest messages of a history snapshot with the dedicated agent.
+
+    Runs the SDK's own reduction (split ratio, tool-use/result pairing) through a
+    throwaway manager on a copy of the history, so neither the live agent nor the
+    live manager is touched while the summary is generated.
+
+    Args:
+        manager: The agent's conversation manager (must have a summarization_agent)
+        snapshot: Copy of the agent's messages
+        preserve: preserve_recent_messages to apply (possibly auto-reduced)
+
+    Returns:
+        (summary message, number of leading snapshot messages it replaces), or
+        None if nothing was summarized
+    """
+    shadow = SummarizingConversationManager(
+        summary_ratio=manager.summary_ratio,
+        preserve_recent_messages=preserve,
+        summarization_agent=manager.summarization_agent,
+    )
+    history = SimpleNamespace(messages=list(snapshot))
+    shadow.reduce_context(history)  # type: ignore[arg-type]
+    count = shadow.removed_message_count
+    if count <= 0:
+        return None
+    return history.messages[0], count
+
 
 class ProactiveCompactionHook(HookProvider):
     """Proactively trigger context compaction before token overflow.
@@ -30,14 +108,28 @@ class ProactiveCompactionHook(HookProvider):
     back to TokenCounter estimation when metrics are missing or stale. This ensures
     reliable compaction triggering across all providers (Bedrock, Ollama, OpenAI).
 
-    **Single-Fire Behavior**: Compaction triggers only once per hook instance to avoid
-    repeated compaction cycles within the same workflow. For multi-session workflows
-    or workflows requiring multiple compactions, create a new hook instance.
+    **Background Summarization**: With a SummarizingConversationManager that has a
+    dedicated summarization agent (``compaction.summarization_model``), the oldest
+    messages are summarized off the critical path once usage reaches
+    ``precompute_ratio`` of the threshold. The finished summary is swapped into the
+    agent's history at the next turn boundary (before or after an invocation), so no
+    step waits on the summarization call. This repeats as often as the history grows
+    back past the trigger point. If the summarized messages were changed in the
+    meantime, the summary is discarded and recomputed.
+
+    Without a dedicated summarization agent the SDK summarizes with the agent
+    itself, which must not happen while it runs a turn, so the history is reduced
+    synchronously (``reduce_context``) once the threshold is crossed.
+
+    Other conversation managers keep the original behavior: ``apply_management`` is
+    called synchronously once the threshold is crossed, at most once per hook.
 
     Attributes:
         threshold_tokens: Token count at which to trigger compaction
         model_id: Model identifier for TokenCounter fallback
-        compacted: Flag tracking whether compaction has been triggered (single-fire)
+        precompute_ratio: Fraction of the threshold at which background summarization starts
+        compacted: Whether compaction has happened at least once
+        compaction_count: Number of summaries swapped into agent histories
         token_counter: TokenCounter instance for fallback estimation
 
     Example:
@@ -49,17 +141,30 @@ class ProactiveCompactionHook(HookProvider):
         ... )
     """
 
-    def __init__(self, threshold_tokens: int, model_id: str | None = None):
+    def __init__(
+        self,
+        threshold_tokens: int,
+        model_id: str | None = None,
+        precompute_ratio: float = DEFAULT_PRECOMPUTE_RATIO,
+    ):
         """Initialize the proactive compaction hook.
 
         Args:
             threshold_tokens: Trigger compaction when total tokens exceed this value
             model_id: Optional model identifier for TokenCounter fallback
+            precompute_ratio: Fraction of threshold_tokens at which to start
+                summarizing in the background
         """
         self.threshold_tokens = threshold_tokens
         self.model_id = model_id
-        self.compacted = False  # Track if we've already compacted
+        self.precompute_ratio = precompute_ratio
+        self.compacted = False  # Track if we've compacted at least once
+        self.compaction_count = 0
         self.token_counter: TokenCounter | None = None
+        # Hooks may be shared across agents (e.g. parallel branches), so pending
+        # summaries are tracked per agent
+        self._pending: dict[int, _PendingSummary] = {}
+        self._lock = threading.Lock()
 
         # Initialize token counter if model_id provided
         if model_id:
@@ -77,8 +182,13 @@ class ProactiveCompactionHook(HookProvider):
             registry: Hook registry from the agent
             **kwargs: Additional keyword arguments (not used)
         """
+        registry.add_callback(BeforeInvocationEvent, self._swap_in_summary_before_turn)
         registry.add_callback(AfterInvocationEvent, self._check_and_compact)
 
+    def _swap_in_summary_before_turn(self, event: BeforeInvocationEvent) -> None:
+        """Swap a finished background summary in before the agent's next turn."""
+        self._swap_in_summary(event.agent)
+
     def _check_and_compact(self, event: AfterInvocationEvent) -> None:
         """Check token usage and trigger compaction if threshold exceeded.
 
@@ -105,6 +215,11 @@ class ProactiveCompactionHook(HookProvider):
             )
             return
 
+        # A summary that finished during this turn is swapped in now; the usage
+        # figures below still describe the pre-compaction history, so stop here
+        if self._swap_in_summary(agent):
+            return
+
         # Try to extract token usage from provider metrics (preferred)
         usage = getattr(agent, "accumulated_usage", None)
         total_tokens = None
@@ -171,6 +286,15 @@ class ProactiveCompactionHook(HookProvider):
             else 0,
         )
 
+        manager = agent.conversation_manager
+        if isinstance(manager, SummarizingConversationManager):
+            if manager.summarization_agent is not None and not getattr(manager, "pin_first", None):
+                if total_tokens >= self.threshold_tokens * self.precompute_ratio:
+                    self._start_background_summary(agent, manager, total_tokens, token_source)
+            elif total_tokens >= self.threshold_tokens:
+                self._compact_now(agent, manager, total_tokens, token_source)
+            return
+
         # Trigger compaction if threshold exceeded
         if total_tokens >= self.threshold_tokens and not self.compacted:
             # Get current message count and configured preserve value
@@ -246,6 +370,196 @@ class ProactiveCompactionHook(HookProvider):
             # Mark as compacted to avoid repeated triggers
             self.compacted = True
 
+    def _preserve_for(
+        self, agent_name: str, message_count: int, manager: SummarizingConversationManager
+    ) -> int:
+        """preserve_recent_messages for this compaction, auto-reduced for short histories.
+
+        Leaves at least 5 messages to summarize and a hard minimum of 3
+        (user→assistant→user).
+        """
+        preserve = manager.preserve_recent_messages
+        minimum_required = preserve + 5
+        if message_count < minimum_required:
+            preserve = max(message_count - 5, 3)
+            logger.debug(
+                "compaction_auto_reducing_preserve",
+                agent_name=agent_name,
+                message_count=message_count,
+                preserve_recent_configured=manager.preserve_recent_messages,
+                preserve_recent_adjusted=preserve,
+                minimum_required=minimum_required,
+                reason="insufficient_messages_for_configured_value",
+            )
+        return preserve
+
+    def _compact_now(
+        self,
+        agent: Any,
+        manager: SummarizingConversationManager,
+        total_tokens: int,
+        token_source: str,
+    ) -> None:
+        """Summarize the agent's oldest messages synchronously via reduce_context.
+
+        Used when the manager has no dedicated summarization agent: the SDK then
+        summarizes with the agent itself, which is only safe between turns.
+
+        Args:
+            agent: Agent whose history should be compacted
+            manager: The agent's summarizing conversation manager
+            total_tokens: Current token usage that triggered compaction
+            token_source: Where total_tokens came from (for logging)
+        """
+        agent_name = agent.name if hasattr(agent, "name") else "unknown"
+        message_count = len(agent.messages)
+        configured_preserve = manager.preserve_recent_messages
+        manager.preserve_recent_messages = self._preserve_for(agent_name, message_count, manager)
+        removed_before = manager.removed_message_count
+
+        logger.info(
+            "compaction_triggered",
+            agent_name=agent_name,
+            total_tokens=total_tokens,
+            threshold=self.threshold_tokens,
+            token_source=token_source,
+            trigger_reason="proactive_threshold_exceeded",
+            message_count=message_count,
+        )
+        try:
+            manager.reduce_context(agent)
+        except Exception as e:
+            logger.warning("compaction_failed", agent_name=agent_name, error=str(e))
+            return
+        finally:
+            manager.preserve_recent_messages = configured_preserve
+
+        if manager.removed_message_count == removed_before and len(agent.messages) >= message_count:
+            # Newer SDKs log and swallow proactive summarization failures
+            logger.debug("compaction_skipped", reason="nothing_summarized", agent_name=agent_name)
+            return
+
+        self.compacted = True
+        self.compaction_count += 1
+        logger.info(
+            "compaction_completed",
+            agent_name=agent_name,
+            messages_after_compaction=len(agent.messages),
+            compaction_count=self.compaction_count,
+        )
+
+    def _start_background_summary(
+        self,
+        agent: Any,
+        manager: SummarizingConversationManager,
+        total_tokens: int,
+        token_source: str,
+    ) -> None:
+        """Summarize the agent's oldest messages on the background executor.
+
+        Only used with a dedicated summarization agent; the live agent never
+        runs off its own turn.
+
+        Args:
+            agent: Agent whose history should be compacted
+            manager: The agent's summarizing conversation manager
+            total_tokens: Current token usage that triggered the summary
+            token_source: Where total_tokens came from (for logging)
+        """
+        agent_name = agent.name if hasattr(agent, "name") else "unknown"
+        key = id(agent)
+        with self._lock:
+            if key in self._pending:
+                return  # One summary in flight per agent
+
+        snapshot = list(agent.messages)
+        message_count = len(snapshot)
+        preserve = self._preserve_for(agent_name, message_count, manager)
+        if min(max(1, int(message_count * manager.summary_ratio)), message_count - preserve) <= 0:
+            logger.debug(
+                "compaction_skipped",
+                reason="insufficient_messages_for_summarization",
+                agent_name=agent_name,
+                message_count=message_count,
+            )
+            return
+
+        future = _get_summary_executor().submit(_summarize_snapshot, manager, snapshot, preserve)
+        with self._lock:
+            self._pending[key] = _PendingSummary(future, snapshot, manager)
+
+        logger.info(
+            "compaction_triggered",
+            agent_name=agent_name,
+            total_tokens=total_tokens,
+            threshold=self.threshold_tokens,
+            token_source=token_source,
+            trigger_reason="proactive_precompute",
+            message_count=message_count,
+        )
+
+    def _swap_in_summary(self, agent: Any) -> bool:
+        """Replace summarized messages with a finished background summary.
+
+        Never blocks: a summary still in flight is left for a later turn boundary.
+
+        Args:
+            agent: Agent whose pending summary should be applied
+
+        Returns:
+            True if the agent's history was compacted
+        """
+        key = id(agent)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None or not pending.future.done():
+                return False
+            del self._pending[key]
+
+        agent_name = agent.name if hasattr(agent, "name") else "unknown"
+        try:
+            outcome = pending.future.result()
+        except Exception as e:
+            logger.warning("compaction_failed", agent_name=agent_name, error=str(e))
+            return False
+        if outcome is None:
+            logger.debug("compaction_skipped", reason="nothing_summarized", agent_name=agent_name)
+            return False
+        summary, count = outcome
+
+        # The summary only covers the snapshot; if that prefix was rewritten (e.g.
+        # by overflow recovery) while summarizing, drop it and let it recompute
+        messages = agent.messages
+        if len(messages) < count or any(
+            current is not summarized
+            for current, summarized in zip(messages, pending.snapshot[:count], strict=False)
+        ):
+            logger.debug("compaction_discarded", agent_name=agent_name, reason="history_changed")
+            return False
+
+        # Record the summary in the manager's session state through its public API
+        manager = pending.manager
+        state = manager.get_state()
+        removed = state["removed_message_count"] + count
+        # If there is a summary message, don't count it in the removed_message_count
+        if state.get("summary_message"):
+            removed -= 1
+        manager.restore_from_session(
+            {**state, "removed_message_count": removed, "summary_message": summary}
+        )
+        messages[:] = [summary, *messages[count:]]
+
+        self.compacted = True
+        self.compaction_count += 1
+        logger.info(
+            "compaction_completed",
+            agent_name=agent_name,
+            messages_summarized=count,
+            messages_after_compaction=len(messages),
+            compaction_count=self.compaction_count,
+        )
+        return True
+
 
 class NotesAppenderHook(HookProvider):
     """Append structured notes after each agent invocation.
@@ -446,3 +760,153 @@ class NotesAppenderHook(HookProvider):
                     return output[:500] if len(output) > 500 else output
 
         return "No output"
+
+
+class UsageTrackerHook(HookProvider):
+    """Accumulate provider-reported token usage across agent invocations.
+
+    Reads the usage of the latest invocation from the agent's event loop metrics,
+    including prompt-cache reads and writes (Anthropic, Bedrock and OpenAI report
+    these as cacheReadInputTokens / cacheWriteInputTokens). One instance is shared
+    by every agent in an AgentCache, so totals cover the whole run even when pooled
+    agents have their metrics reset between leases.
+
+    Attributes:
+        totals: Running totals keyed by usage field name
+
+    Example:
+        >>> tracker = UsageTrackerHook()
+        >>> agent.hooks.add_hook(tracker)
+        >>> tracker.totals["cacheReadInputTokens"]
+    """
+
+    USAGE_FIELDS = ("inputTokens", "outputTokens", "cacheReadInputTokens", "cacheWriteInputTokens")
+
+    def __init__(self) -> None:
+        """Initialize with zero totals."""
+        self.totals: dict[str, int] = dict.fromkeys(self.USAGE_FIELDS, 0)
+        self.invocations = 0
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        """Register hook callbacks with the agent's hook registry.
+
+        Args:
+            registry: Hook registry from the agent
+            **kwargs: Additional keyword arguments (not used)
+        """
+        registry.add_callback(AfterInvocationEvent, self._record_usage)
+
+    def _record_usage(self, event: AfterInvocationEvent) -> None:
+        """Add the latest invocation's usage to the running totals."""
+        metrics = getattr(event.agent, "event_loop_metrics", None)
+        invocation = getattr(metrics, "latest_agent_invocation", None)
+        usage = getattr(invocation, "usage", None)
+        if not isinstance(usage, dict):
+            return
+
+        self.invocations += 1
+        for field_name in self.USAGE_FIELDS:
+            self.totals[field_name] += int(usage.get(field_name, 0) or 0)
+
+    def summary(self) -> dict[str, Any]:
+        """Return totals with snake_case keys and the prompt-cache hit rate.
+
+        The hit rate is cached input tokens over all input tokens (uncached +
+        cache reads + cache writes).
+        """
+        cache_read = self.totals["cacheReadInputTokens"]
+        prompt_tokens = (
+            self.totals["inputTokens"] + cache_read + self.totals["cacheWriteInputTokens"]
+        )
+        return {
+            "invocations": self.invocations,
+            "input_tokens": self.totals["inputTokens"],
+            "output_tokens": self.totals["outputTokens"],
+            "cache_read_input_tokens": cache_read,
+            "cache_write_input_tokens": self.totals["cacheWriteInputTokens"],
+            "prompt_cache_hit_rate": round(cache_read / prompt_tokens, 3) if prompt_tokens else 0.0,
+        }
+
+
+def model_label(agent: Any) -> str:
+    """Best-effort model identifier for metric labels."""
+    model = getattr(agent, "model", None)
+    get_config = getattr(model, "get_config", None)
+    if not callable(get_config) or inspect.iscoroutinefunction(get_config):
+        return "unknown"
+    config = get_config()
+    if isinstance(config, dict) and config.get("model_id"):
+        return str(config["model_id"])
+    return "unknown"
+
+
+class MetricsHook(HookProvider):
+    """Report model-call latency, tool calls and token usage to the metrics registry.
+
+    One instance is shared by every agent in an AgentCache. Model calls of a
+    single agent are sequential, so call start times are tracked per agent.
+
+    Example:
+        >>> agent.hooks.add_hook(MetricsHook())
+        >>> get_metrics().render_prometheus()
+    """
+
+    TOKEN_TYPES = (
+        ("inputTokens", "input"),
+        ("outputTokens", "output"),
+        ("cacheReadInputTokens", "cache_read"),
+        ("cacheWriteInputTokens", "cache_write"),
+    )
+
+    def __init__(self) -> None:
+        """Initialize with no model calls in flight."""
+        self._model_call_starts: dict[int, float] = {}
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        """Register hook callbacks with the agent's hook registry.
+
+        Args:
+            registry: Hook registry from the agent
+            **kwargs: Additional keyword arguments (not used)
+        """
+        registry.add_callback(BeforeModelCallEvent, self._start_model_call)
+        registry.add_callback(AfterModelCallEvent, self._end_model_call)
+        registry.add_callback(AfterToolCallEvent, self._record_tool_call)
+        registry.add_callback(AfterInvocationEvent, self._record_tokens)
+
+    def _start_model_call(self, event: BeforeModelCallEvent) -> None:
+        """Remember when the agent's model call started."""
+        self._model_call_starts[id(event.agent)] = time.perf_counter()
+
+    def _end_model_call(self, event: AfterModelCallEvent) -> None:
+        """Observe the model call's latency."""
+        start = self._model_call_starts.pop(id(event.agent), None)
+        if start is not None:
+            elapsed = time.perf_counter() - start
+            model = model_label(event.agent)
+            get_metrics().observe("strands_model_call_duration_seconds", elapsed, model=model)
+            record_phase("model.call", elapsed, model=model)
+
+    def _record_tool_call(self, event: AfterToolCallEvent) -> None:
+        """Count the tool call by outcome and observe its duration."""
+        tool = event.tool_use.get("name", "unknown")
+        failed = event.exception is not None or event.result.get("status") == "error"
+        metrics = get_metrics()
+        metrics.inc("strands_tool_calls_total", tool=tool, status="error" if failed else "success")
+        metrics.observe("strands_tool_duration_seconds", event.duration, tool=tool)
+        record_phase("tool.call", event.duration, tool=tool)
+
+    def _record_tokens(self, event: AfterInvocationEvent) -> None:
+        """Add the latest invocation's provider usage to the token counters."""
+        loop_metrics = getattr(event.agent, "event_loop_metrics", None)
+        invocation = getattr(loop_metrics, "latest_agent_invocation", None)
+        usage = getattr(invocation, "usage", None)
+        if not isinstance(usage, dict):
+            return
+
+        model = model_label(event.agent)
+        metrics = get_metrics()
+        for field_name, token_type in self.TOKEN_TYPES:
+            tokens = int(usage.get(field_name, 0) or 0)
+            if tokens:
+                metrics.inc("strands_tokens_total", tokens, model=model, type=token_type)
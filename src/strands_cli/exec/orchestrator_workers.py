@@ -7,11 +7,13 @@ Execution Flow:
     1. Orchestrator invocation: Request JSON array of subtasks
     2. Worker execution: Execute subtasks in parallel (respecting max_workers)
     3. Track rounds: Count orchestrator delegation cycles (not worker count)
-    4. Optional reduce: Aggregate worker outputs
+    4. Optional reduce: Aggregate worker outputs (tree reduce when reduce_group_size set)
     5. Optional writeup: Final synthesis step
 
 Orchestrator Protocol:
     - Expected JSON response: [{"task": "description"}, ...]
+    - Requested as native structured output (OrchestratorPlan) unless
+      runtime.structured_output is off; text responses are parsed
     - Retry on malformed JSON (up to 2 retries with clarification)
     - Empty array [] signals "no work needed" (success)
 
@@ -20,6 +22,11 @@ Worker Execution:
     - Indexed template access: {{ workers[0].response }}, {{ workers[1].status }}
     - Fail-fast: First worker failure cancels all remaining workers
 
+Tree Reduce:
+    - reduce_group_size=k merges worker outputs in groups of k as workers complete
+    - Partial merges are reduced again until one root result remains
+    - Each reducer sees at most k responses; reduction overlaps worker execution
+
 Round Semantics:
     - Round = orchestrator delegation cycle (not individual worker executions)
     - max_rounds limits total orchestrator invocations
@@ -33,6 +40,7 @@ Budget Enforcement:
 import asyncio
 import json
 import re
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -44,19 +52,31 @@ from strands_cli.exec.hitl_utils import check_hitl_timeout, format_timeout_warni
 from strands_cli.exec.hooks import NotesAppenderHook, ProactiveCompactionHook
 from strands_cli.exec.utils import (
     AgentCache,
+    AgentPool,
     estimate_tokens,
     get_retry_config,
     invoke_agent_with_retry,
+    request_structured_output,
+    structured_output_schema,
+    structured_result,
 )
 from strands_cli.loader import render_template
+from strands_cli.runtime.batch_inference import (
+    BatchJobError,
+    batch_eligible,
+    build_batch_requests,
+    run_batch,
+)
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import fail_session
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
-from strands_cli.types import HITLState, PatternType, RunResult, Spec
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
+from strands_cli.types import HITLState, OrchestratorPlan, PatternType, RunResult, Spec
 
 try:
     from strands_agents.agent import AgentResult  # type: ignore[import-not-found]
@@ -162,6 +182,9 @@ async def _invoke_orchestrator_with_retry(
 ) -> tuple[list[dict[str, Any]], int]:
     """Invoke orchestrator agent with JSON parsing retry logic.
 
+    Subtasks are requested as native structured output when the runtime
+    allows it; the text response is parsed otherwise.
+
     Args:
         cache: AgentCache for agent reuse
         spec: Workflow spec
@@ -188,6 +211,8 @@ async def _invoke_orchestrator_with_retry(
         else None
     )
 
+    schema = structured_output_schema(spec, OrchestratorPlan)
+
     # Track retry history for diagnostics
     retry_history: list[dict[str, Any]] = []
 
@@ -208,14 +233,19 @@ async def _invoke_orchestrator_with_retry(
         )
 
         # Invoke orchestrator
-        result = await invoke_agent_with_retry(agent, prompt, max_attempts, wait_min, wait_max)
+        with request_structured_output(schema):
+            result = await invoke_agent_with_retry(agent, prompt, max_attempts, wait_min, wait_max)
 
         # Extract response text
         response_text = result if isinstance(result, str) else str(result)
         tokens_used = estimate_tokens(prompt, response_text)
 
-        # Parse JSON
-        subtasks = _parse_orchestrator_json(response_text)
+        # Use the validated plan, or parse JSON from the text
+        plan = structured_result(result, OrchestratorPlan)
+        if plan is not None:
+            subtasks: list[dict[str, Any]] | None = [t.model_dump() for t in plan.subtasks]
+        else:
+            subtasks = _parse_orchestrator_json(response_text)
 
         if subtasks is not None:
             logger.info(
@@ -242,6 +272,11 @@ async def _invoke_orchestrator_with_retry(
                 max_retries=max_json_retries + 1,
                 response_preview=response_text[:200],
             )
+            get_metrics().inc(
+                "strands_structured_output_total",
+                agent=orchestrator_agent_id,
+                outcome="parse_retry",
+            )
             prompt = f"""Your previous response was not valid JSON. Please respond with ONLY a JSON array of tasks.
 
 Expected format:
@@ -266,8 +301,115 @@ Previous response that failed to parse:
     )
 
 
+class _TreeReducer:
+    """Streaming hierarchical (tree) reducer for worker outputs.
+
+    Worker results are submitted as they complete. Every time ``group_size``
+    items accumulate at a level, a reduce invocation merges them in the
+    background and its output is submitted one level up. ``finish()`` drains
+    in-flight reducers and flushes partial groups until a single root merge
+    remains. Each reducer sees at most ``group_size`` responses, so reduce input
+    stays bounded regardless of fan-out, and reduction overlaps worker execution.
+    """
+
+    def __init__(
+        self,
+        group_size: int,
+        reduce_fn: Callable[[list[dict[str, Any]], int, int], Awaitable[tuple[str, int]]],
+    ) -> None:
+        """Initialize tree reducer.
+
+        Args:
+            group_size: Number of items merged per reduce invocation (fan-in k)
+            reduce_fn: Async callable (group, level, node_index) -> (response, tokens)
+        """
+        self.group_size = group_size
+        self._reduce_fn = reduce_fn
+        self._pending: dict[int, list[dict[str, Any]]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self.tokens = 0
+        self.nodes = 0
+        self.levels = 0
+
+    def submit(self, item: dict[str, Any], level: int = 0) -> None:
+        """Add an item at the given level, spawning a reducer when a group is full."""
+        pending = self._pending.setdefault(level, [])
+        pending.append(item)
+        if len(pending) >= self.group_size:
+            group = pending[: self.group_size]
+            del pending[: self.group_size]
+            self._spawn(group, level)
+
+    def _spawn(self, group: list[dict[str, Any]], level: int) -> None:
+        node_index = self.nodes
+        self.nodes += 1
+        self.levels = max(self.levels, level + 1)
+        self._tasks.append(asyncio.create_task(self._reduce(group, level, node_index)))
+
+    async def _reduce(self, group: list[dict[str, Any]], level: int, node_index: int) -> None:
+        response, tokens = await self._reduce_fn(group, level, node_index)
+        self.tokens += tokens
+        logger.debug(
+            "tree_reduce_node_complete", level=level, node=node_index, group_size=len(group)
+        )
+        self.submit(
+            {
+                "response": response,
+                "status": "success",
+                "tokens": tokens,
+                "task": f"reduce level {level} node {node_index}",
+            },
+            level + 1,
+        )
+
+    async def finish(self) -> str:
+        """Drain reducers and flush partial groups until one root result remains.
+
+        Returns:
+            Root reduce response ("" if nothing was submitted)
+
+        Raises:
+            Exception: First reducer failure (remaining reducers are cancelled)
+        """
+        while True:
+            if self._tasks:
+                tasks, self._tasks = self._tasks, []
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    await self.cancel()
+                    raise
+                continue
+
+            levels = sorted(level for level, items in self._pending.items() if items)
+            if not levels:
+                return ""
+
+            remaining = sum(len(self._pending[level]) for level in levels)
+            lowest = levels[0]
+            group = self._pending.pop(lowest)
+
+            if remaining == 1 and lowest > 0:
+                # Single merged result left: this is the root
+                return str(group[0]["response"])
+
+            if len(group) == 1 and remaining > 1:
+                # Lone leftover: promote instead of spending a reduce call on it
+                self.submit(group[0], lowest + 1)
+                continue
+
+            self._spawn(group, lowest)
+
+    async def cancel(self) -> None:
+        """Cancel all in-flight reducers."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def _execute_worker(
-    cache: AgentCache,
+    agent_pool: AgentPool,
     spec: Spec,
     worker_agent_id: str,
     task: dict[str, Any],
@@ -282,10 +424,10 @@ async def _execute_worker(
     event_bus: EventBus | None = None,
     session_state: SessionState | None = None,
 ) -> dict[str, Any]:
-    """Execute a single worker task.
+    """Execute a single worker task on an agent leased from the worker pool.
 
     Args:
-        cache: AgentCache for agent reuse
+        agent_pool: Worker agent pool (bounds concurrency and reuses agents)
         spec: Workflow spec
         worker_agent_id: Worker agent ID
         task: Task dictionary from orchestrator
@@ -325,50 +467,45 @@ async def _execute_worker(
         else None
     )
 
-    # Create fresh hooks for this worker
-    hooks = hook_factory()
-
-    # Build or reuse agent with tool overrides
-    # Include worker_index to ensure each worker gets isolated agent instance
-    agent = await cache.get_or_build_agent(
+    # Lease a pooled agent (built on the slot's first use with fresh hooks; history and
+    # usage counters are reset on return so the next task starts clean)
+    async with agent_pool.lease(
         spec,
         worker_agent_id,
         agent_config,
         tool_overrides=tool_overrides,
         conversation_manager=context_manager,
-        hooks=hooks,
+        hooks=hook_factory(),
         injected_notes=injected_notes,
-        worker_index=worker_index,
-    )
+    ) as agent:
+        # Phase 3: Emit worker_start event before agent invocation
+        if event_bus:
+            task_description = task.get("task", str(task))
+            await event_bus.emit(
+                WorkflowEvent(
+                    event_type="worker_start",
+                    timestamp=datetime.now(UTC),
+                    session_id=session_state.metadata.session_id if session_state else None,
+                    spec_name=spec.name,
+                    pattern_type="orchestrator_workers",
+                    data={
+                        "worker_index": worker_index,
+                        "agent_id": worker_agent_id,
+                        "assigned_task": task_description[:200],
+                    },
+                )
+            )
+            logger.debug(
+                "worker_start_event_emitted",
+                worker=worker_index,
+                agent=worker_agent_id,
+            )
 
-    # Phase 3: Emit worker_start event before agent invocation
-    if event_bus:
+        # Invoke worker with task description
         task_description = task.get("task", str(task))
-        await event_bus.emit(
-            WorkflowEvent(
-                event_type="worker_start",
-                timestamp=datetime.now(UTC),
-                session_id=session_state.metadata.session_id if session_state else None,
-                spec_name=spec.name,
-                pattern_type="orchestrator_workers",
-                data={
-                    "worker_index": worker_index,
-                    "agent_id": worker_agent_id,
-                    "assigned_task": task_description[:200],
-                },
-            )
+        result = await invoke_agent_with_retry(
+            agent, task_description, max_attempts, wait_min, wait_max
         )
-        logger.debug(
-            "worker_start_event_emitted",
-            worker=worker_index,
-            agent=worker_agent_id,
-        )
-
-    # Invoke worker with task description
-    task_description = task.get("task", str(task))
-    result = await invoke_agent_with_retry(
-        agent, task_description, max_attempts, wait_min, wait_max
-    )
 
     response_text = result if isinstance(result, str) else str(result)
     tokens_used = estimate_tokens(task_description, response_text)
@@ -388,6 +525,58 @@ async def _execute_worker(
     }
 
 
+async def _execute_workers_offline(
+    spec: Spec,
+    worker_agent_id: str,
+    subtasks: list[dict[str, Any]],
+    notes_manager: Any,
+    session_state: SessionState | None,
+    checkpoint: Callable[[], Awaitable[None]],
+) -> dict[int, dict[str, Any]]:
+    """Run worker subtasks as one provider batch job (runtime.batch).
+
+    Args:
+        spec: Workflow spec
+        worker_agent_id: Worker agent ID (must be batch eligible)
+        subtasks: List of subtask dicts from orchestrator
+        notes_manager: Notes manager instance
+        session_state: Session recording the running job (resume)
+        checkpoint: Saves the session once the job is submitted
+
+    Returns:
+        Worker index -> worker result for every subtask the batch answered; the
+        rest (or all, if the job fails) are left for live execution
+    """
+    injected_notes = (
+        notes_manager.get_last_n_for_injection(spec.context_policy.notes.include_last)
+        if notes_manager and spec.context_policy and spec.context_policy.notes
+        else None
+    )
+    prompts = {f"worker-{i}": task.get("task", str(task)) for i, task in enumerate(subtasks)}
+    requests = build_batch_requests(spec, worker_agent_id, prompts, injected_notes)
+    try:
+        results = await run_batch(spec, worker_agent_id, requests, session_state, checkpoint)
+    except BatchJobError as e:
+        logger.warning("worker_batch_failed_running_live", error=str(e))
+        return {}
+
+    completed: dict[int, dict[str, Any]] = {}
+    for i in range(len(subtasks)):
+        custom_id = f"worker-{i}"
+        result = results[custom_id]
+        if result.text is None:
+            logger.warning("batched_worker_failed_running_live", worker_index=i, error=result.error)
+            continue
+        task_description = prompts[custom_id]
+        completed[i] = {
+            "response": result.text,
+            "status": "success",
+            "tokens": result.total_tokens or estimate_tokens(task_description, result.text),
+            "task": task_description,
+        }
+    return completed
+
+
 async def _execute_workers_batch(
     cache: AgentCache,
     spec: Spec,
@@ -403,8 +592,14 @@ async def _execute_workers_batch(
     wait_max: int,
     event_bus: EventBus | None = None,
     session_state: SessionState | None = None,
+    tree_reducer: "_TreeReducer | None" = None,
+    session_repo: SessionRepository | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    """Execute all worker tasks in parallel with semaphore control.
+    """Execute all worker tasks in parallel on a bounded agent pool.
+
+    With runtime.batch set and at least min_requests subtasks for a tool-free
+    worker agent, the subtasks are first submitted as one provider batch job;
+    only those it does not answer run live.
 
     Args:
         cache: AgentCache for agent reuse
@@ -419,6 +614,8 @@ async def _execute_workers_batch(
         max_attempts: Max retry attempts
         wait_min: Min wait time (seconds)
         wait_max: Max wait time (seconds)
+        tree_reducer: Optional streaming reducer fed each result as its worker completes
+        session_repo: Repository used to checkpoint a submitted batch job
 
     Returns:
         Tuple of (worker_results_list, cumulative_tokens)
@@ -430,45 +627,53 @@ async def _execute_workers_batch(
         logger.info("No subtasks to execute (empty array from orchestrator)")
         return [], 0
 
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+    async def _checkpoint_batch_job() -> None:
+        if session_state and session_repo:
+            try:
+                await session_repo.save(session_state, "")
+            except Exception as e:
+                logger.warning("worker_batch_checkpoint_failed", error=str(e))
+
+    batched: dict[int, dict[str, Any]] = {}
+    batch_config = spec.runtime.batch
+    if (
+        batch_config
+        and len(subtasks) >= batch_config.min_requests
+        and batch_eligible(spec, worker_agent_id, tool_overrides)
+    ):
+        batched = await _execute_workers_offline(
+            spec, worker_agent_id, subtasks, notes_manager, session_state, _checkpoint_batch_job
+        )
+        if tree_reducer:
+            for result in batched.values():
+                tree_reducer.submit(result)
 
-    async def _execute_with_semaphore(task: dict[str, Any], index: int) -> dict[str, Any]:
-        if semaphore:
-            async with semaphore:
-                return await _execute_worker(
-                    cache,
-                    spec,
-                    worker_agent_id,
-                    task,
-                    index,
-                    tool_overrides,
-                    context_manager,
-                    hook_factory,
-                    notes_manager,
-                    max_attempts,
-                    wait_min,
-                    wait_max,
-                    event_bus,
-                    session_state,
-                )
-        else:
-            return await _execute_worker(
-                cache,
-                spec,
-                worker_agent_id,
-                task,
-                index,
-                tool_overrides,
-                context_manager,
-                hook_factory,
-                notes_manager,
-                max_attempts,
-                wait_min,
-                wait_max,
-                event_bus,
-                session_state,
-            )
+    # Worker agent pool bounds concurrency and reuses agents across subtasks, so agent
+    # construction scales with max_workers instead of the number of subtasks
+    agent_pool = AgentPool(cache, size=max_workers or len(subtasks))
+
+    async def _execute_with_pool(task: dict[str, Any], index: int) -> dict[str, Any]:
+        result = await _execute_worker(
+            agent_pool,
+            spec,
+            worker_agent_id,
+            task,
+            index,
+            tool_overrides,
+            context_manager,
+            hook_factory,
+            notes_manager,
+            max_attempts,
+            wait_min,
+            wait_max,
+            event_bus,
+            session_state,
+        )
+
+        # Stream result into the tree reducer so reduction overlaps remaining workers
+        if tree_reducer:
+            tree_reducer.submit(result)
+        return result
 
     logger.info(
         "Executing workers in parallel",
@@ -476,11 +681,19 @@ async def _execute_workers_batch(
         max_workers=max_workers or "unlimited",
     )
 
-    # Execute all workers in parallel (fail-fast)
-    worker_results = await asyncio.gather(
-        *[_execute_with_semaphore(task, i) for i, task in enumerate(subtasks)],
-        return_exceptions=False,  # Fail-fast: first worker error cancels remaining workers
-    )
+    # Execute remaining workers in parallel (fail-fast)
+    live = [i for i in range(len(subtasks)) if i not in batched]
+    try:
+        live_results = await asyncio.gather(
+            *[_execute_with_pool(subtasks[i], i) for i in live],
+            return_exceptions=False,  # Fail-fast: first worker error cancels remaining workers
+        )
+    except BaseException:
+        if tree_reducer:
+            await tree_reducer.cancel()
+        raise
+    results_by_index = {**batched, **dict(zip(live, live_results, strict=True))}
+    worker_results = [results_by_index[i] for i in range(len(subtasks))]
 
     # Calculate cumulative tokens
     cumulative_tokens = sum(result.get("tokens", 0) for result in worker_results)
@@ -488,17 +701,20 @@ async def _execute_workers_batch(
     logger.info(
         "Workers completed",
         num_workers=len(worker_results),
+        batched=len(batched),
         cumulative_tokens=cumulative_tokens,
+        agents_built=agent_pool.agents_built,
     )
 
     return list(worker_results), cumulative_tokens
 
 
+@with_budget_ledger
 async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for multi-phase orchestration
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -700,7 +916,9 @@ async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for mu
             step_counter: list[int] = [0]
             if spec.context_policy and spec.context_policy.notes:
                 notes_config = spec.context_policy.notes
-                notes_manager_local = NotesManager(notes_config.file)
+                notes_manager_local = NotesManager(
+                    notes_config.file, flush_interval_s=NOTES_FLUSH_INTERVAL_S
+                )
 
             # Define hook factory
             def create_hooks() -> list[Any]:
@@ -908,6 +1126,27 @@ async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for mu
                     },
                 )
 
+            # Streaming tree reduce overlaps reduction with workers (not possible when a
+            # reduce review gate must see all worker results before any reduction)
+            tree_reducer: _TreeReducer | None = None
+            if (
+                not workers_executed
+                and config.reduce
+                and config.reduce_group_size
+                and not config.reduce_review
+            ):
+                tree_reducer = _create_tree_reducer(
+                    cache,
+                    spec,
+                    config,
+                    _build_execution_context([], execution_params["user_variables"]),
+                    context_manager,
+                    hook_factory,
+                    notes_manager,
+                    execution_params["max_workers"],
+                    len(subtasks),
+                )
+
             # Execute workers (OUTSIDE decomposition review block)
             if not workers_executed:
                 worker_results, cumulative_tokens = await _execute_workers_round(
@@ -921,6 +1160,8 @@ async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for mu
                     cumulative_tokens,
                     event_bus,
                     session_state,
+                    tree_reducer,
+                    session_repo,
                 )
 
                 # Checkpoint after workers complete (before reduce/writeup)
@@ -1124,6 +1365,8 @@ async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for mu
                     hook_factory,
                     notes_manager,
                     cumulative_tokens,
+                    tree_reducer,
+                    execution_params["max_workers"],
                 )
                 reduce_executed = True
 
@@ -1262,6 +1505,8 @@ async def run_orchestrator_workers(  # noqa: C901 - Complexity acceptable for mu
             # CRITICAL: Clean up resources
             if should_close:
                 await cache.close()
+            if notes_manager:
+                notes_manager.close()
 
 
 def _setup_execution_parameters(
@@ -1321,7 +1566,9 @@ async def _setup_context_and_hooks(spec: Spec) -> tuple[Any, Any, Any, AgentCach
     if spec.context_policy and spec.context_policy.notes:
         notes_config = spec.context_policy.notes
         notes_format = notes_config.format or "markdown"
-        notes_manager = NotesManager(notes_config.file, format=notes_format)
+        notes_manager = NotesManager(
+            notes_config.file, format=notes_format, flush_interval_s=NOTES_FLUSH_INTERVAL_S
+        )
 
     # Define hook factory that creates fresh instances per agent invocation
     def create_hooks() -> list[Any]:
@@ -1436,6 +1683,8 @@ async def _execute_workers_round(
     cumulative_tokens: int,
     event_bus: EventBus | None = None,
     session_state: SessionState | None = None,
+    tree_reducer: "_TreeReducer | None" = None,
+    session_repo: SessionRepository | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
     """Execute workers and return results and updated cumulative tokens."""
     # Execute workers
@@ -1454,6 +1703,8 @@ async def _execute_workers_round(
         execution_params["wait_max"],
         event_bus,
         session_state,
+        tree_reducer,
+        session_repo,
     )
 
     cumulative_tokens += worker_tokens
@@ -1473,6 +1724,55 @@ def _build_execution_context(
     return execution_context
 
 
+def _create_tree_reducer(
+    cache: AgentCache,
+    spec: Spec,
+    config: Any,
+    base_context: dict[str, Any],
+    context_manager: Any,
+    hook_factory: Any,
+    notes_manager: Any,
+    max_concurrency: int | None,
+    worker_index_offset: int,
+) -> _TreeReducer:
+    """Create a tree reducer that merges groups with the configured reduce agent.
+
+    Each reduce node renders the reduce input template with ``workers`` bound to
+    its group (and ``reduce_level`` to its depth) and runs on an agent leased
+    from a reducer pool of ``max_concurrency`` slots. Pool slots are offset past
+    worker indices so a shared worker/reduce agent never collides with a
+    worker's cached instance.
+    """
+    reduce_agent_config = spec.agents[config.reduce.agent]
+    max_attempts, wait_min, wait_max = get_retry_config(spec)
+    agent_pool = AgentPool(cache, size=max_concurrency, index_offset=worker_index_offset)
+
+    async def _reduce_group(
+        group: list[dict[str, Any]], level: int, node_index: int
+    ) -> tuple[str, int]:
+        node_context = base_context.copy()
+        node_context.update(_build_execution_context(group, {}))
+        node_context["reduce_level"] = level
+        reduce_input = render_template(config.reduce.input or "", node_context)
+
+        async with agent_pool.lease(
+            spec,
+            config.reduce.agent,
+            reduce_agent_config,
+            tool_overrides=None,
+            conversation_manager=context_manager,
+            hooks=hook_factory(),
+            injected_notes=_get_injected_notes(notes_manager, spec.context_policy),
+        ) as reduce_agent:
+            result = await invoke_agent_with_retry(
+                reduce_agent, reduce_input, max_attempts, wait_min, wait_max
+            )
+        response = result if isinstance(result, str) else str(result)
+        return response, estimate_tokens(reduce_input, response)
+
+    return _TreeReducer(config.reduce_group_size, _reduce_group)
+
+
 async def _execute_reduce_step_if_needed(
     cache: AgentCache,
     spec: Spec,
@@ -1482,11 +1782,50 @@ async def _execute_reduce_step_if_needed(
     hook_factory: Any,
     notes_manager: Any,
     cumulative_tokens: int,
+    tree_reducer: _TreeReducer | None = None,
+    max_concurrency: int | None = None,
 ) -> tuple[str, int]:
-    """Execute reduce step if configured and return response and updated tokens."""
+    """Execute reduce step if configured and return response and updated tokens.
+
+    With ``reduce_group_size`` set, reduction runs as a tree. A streaming
+    ``tree_reducer`` already fed by workers is drained; otherwise (e.g. after a
+    reduce review gate or on resume) all worker results are fed in now.
+    """
     if not config.reduce:
         return "", cumulative_tokens
 
+    if config.reduce_group_size:
+        if tree_reducer is None:
+            tree_reducer = _create_tree_reducer(
+                cache,
+                spec,
+                config,
+                {k: v for k, v in execution_context.items() if k != "workers"},
+                context_manager,
+                hook_factory,
+                notes_manager,
+                max_concurrency,
+                len(execution_context.get("workers", [])),
+            )
+            for worker_result in execution_context.get("workers", []):
+                tree_reducer.submit(worker_result)
+
+        logger.info(
+            "Executing tree reduce step",
+            agent=config.reduce.agent,
+            group_size=config.reduce_group_size,
+        )
+        reduce_response = await tree_reducer.finish()
+        cumulative_tokens += tree_reducer.tokens
+
+        execution_context["reduce_response"] = reduce_response
+        execution_context["reduce_tree"] = {
+            "group_size": tree_reducer.group_size,
+            "nodes": tree_reducer.nodes,
+            "levels": tree_reducer.levels,
+        }
+        return reduce_response, cumulative_tokens
+
     logger.info("Executing reduce step", agent=config.reduce.agent)
 
     reduce_context = execution_context.copy()
@@ -49,13 +49,20 @@ from strands_cli.exec.utils import (
 )
 from strands_cli.exit_codes import EX_HITL_PAUSE, EX_OK
 from strands_cli.loader import render_template
+from strands_cli.runtime.batch_inference import (
+    BatchJobError,
+    batch_eligible,
+    build_batch_requests,
+    run_batch,
+)
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import fail_session
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
 from strands_cli.types import HITLState, ParallelBranch, PatternType, RunResult, Spec
 
 try:
@@ -134,7 +141,7 @@ async def _execute_branch(  # noqa: C901 - Complexity acceptable for HITL suppor
     start_step: int = 0,
     restored_step_history: list[dict[str, Any]] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
 ) -> tuple[str, int, list[dict[str, Any]]] | dict[str, Any]:
@@ -599,6 +606,101 @@ async def _execute_reduce_step(
         raise ParallelExecutionError(f"Reduce step failed: {e}") from e
 
 
+def _batchable_branches(
+    spec: Spec, branches: list[ParallelBranch]
+) -> dict[str, list[ParallelBranch]]:
+    """Group single-step, tool-free agent branches by agent for batch inference.
+
+    Returns:
+        Agent ID -> branches, only for agents with at least runtime.batch.min_requests
+        eligible branches
+    """
+    batch_config = spec.runtime.batch
+    if batch_config is None:
+        return {}
+    groups: dict[str, list[ParallelBranch]] = {}
+    for branch in branches:
+        if len(branch.steps) != 1:
+            continue
+        step = branch.steps[0]
+        if step.type == "hitl" or not step.agent or step.agent not in spec.agents:
+            continue
+        if batch_eligible(spec, step.agent, step.tool_overrides):
+            groups.setdefault(step.agent, []).append(branch)
+    return {
+        agent_id: group
+        for agent_id, group in groups.items()
+        if len(group) >= batch_config.min_requests
+    }
+
+
+async def _execute_branches_offline(
+    spec: Spec,
+    agent_id: str,
+    branches: list[ParallelBranch],
+    user_vars: dict[str, Any],
+    notes_manager: Any,
+    session_state: SessionState | None,
+    session_repo: SessionRepository | None,
+) -> dict[str, tuple[str, int, list[dict[str, Any]]]]:
+    """Run single-step branches of one agent as a provider batch job (runtime.batch).
+
+    Args:
+        spec: Workflow spec
+        agent_id: Agent of every branch's only step
+        branches: Batch-eligible branches
+        user_vars: User-provided variables
+        notes_manager: Optional notes manager
+        session_state: Session recording the running job (resume)
+        session_repo: Repository used to checkpoint the submitted job
+
+    Returns:
+        Branch ID -> (response, tokens, step_history) for every branch the batch
+        answered; the rest (or all, if the job fails) are left for live execution
+    """
+    injected_notes = None
+    if notes_manager and spec.context_policy and spec.context_policy.notes:
+        injected_notes = notes_manager.get_last_n_for_injection(
+            spec.context_policy.notes.include_last
+        )
+    prompts = {
+        branch.id: render_template(
+            branch.steps[0].input or "",
+            _build_branch_step_context(spec, 0, [], user_vars, branch.steps[0].vars),
+        )
+        for branch in branches
+    }
+
+    async def _checkpoint() -> None:
+        if session_state and session_repo:
+            try:
+                await session_repo.save(session_state, "")
+            except Exception as e:
+                logger.warning("branch_batch_checkpoint_failed", error=str(e))
+
+    requests = build_batch_requests(spec, agent_id, prompts, injected_notes)
+    try:
+        results = await run_batch(spec, agent_id, requests, session_state, _checkpoint)
+    except BatchJobError as e:
+        logger.warning("branch_batch_failed_running_live", agent=agent_id, error=str(e))
+        return {}
+
+    completed: dict[str, tuple[str, int, list[dict[str, Any]]]] = {}
+    for branch in branches:
+        result = results[branch.id]
+        if result.text is None:
+            logger.warning(
+                "batched_branch_failed_running_live", branch_id=branch.id, error=result.error
+            )
+            continue
+        tokens = result.total_tokens or estimate_tokens(prompts[branch.id], result.text)
+        step_history = [
+            {"index": 0, "agent": agent_id, "response": result.text, "tokens_estimated": tokens}
+        ]
+        completed[branch.id] = (result.text, tokens, step_history)
+    return completed
+
+
 async def _execute_all_branches_async(
     spec: Spec,
     branches: list[ParallelBranch],
@@ -614,12 +716,16 @@ async def _execute_all_branches_async(
     completed_branches: set[str] | None = None,
     branch_results_dict: dict[str, dict[str, Any]] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
 ) -> list[tuple[str, tuple[str, int, list[dict[str, Any]]] | dict[str, Any]]]:
     """Execute all branches with semaphore control, resume support, and HITL support.
 
+    With runtime.batch set, single-step branches of tool-free agents are first
+    submitted as provider batch jobs (one per agent, when at least min_requests
+    branches qualify); only branches a batch does not answer run live.
+
     Args:
         spec: Workflow spec
         branches: List of branches to execute
@@ -649,6 +755,21 @@ async def _execute_all_branches_async(
 
     semaphore = asyncio.Semaphore(max_parallel) if max_parallel else None
 
+    # Fresh runs only: a HITL resume continues paused branches live
+    batched: dict[str, tuple[str, int, list[dict[str, Any]]]] = {}
+    if hitl_response is None:
+        pending = [branch for branch in branches if branch.id not in completed_branches]
+        jobs = await asyncio.gather(
+            *[
+                _execute_branches_offline(
+                    spec, agent_id, group, user_vars, notes_manager, session_state, session_repo
+                )
+                for agent_id, group in _batchable_branches(spec, pending).items()
+            ]
+        )
+        for job_results in jobs:
+            batched.update(job_results)
+
     async def _execute_with_semaphore(
         branch: ParallelBranch,
     ) -> tuple[str, tuple[str, int, list[dict[str, Any]]] | dict[str, Any]]:
@@ -670,6 +791,9 @@ async def _execute_all_branches_async(
                 ),
             )
 
+        if branch.id in batched:
+            return (branch.id, batched[branch.id])
+
         # Execute branch (with semaphore if configured)
         if semaphore:
             async with semaphore:
@@ -720,11 +844,12 @@ async def _execute_all_branches_async(
     return results
 
 
+@with_budget_ledger
 async def run_parallel(  # noqa: C901 - Complexity acceptable for multi-branch orchestration
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -877,7 +1002,11 @@ async def run_parallel(  # noqa: C901 - Complexity acceptable for multi-branch o
         step_counter = [0]  # Mutable container for hook to track step count across all branches
         if spec.context_policy and spec.context_policy.notes:
             notes_format = spec.context_policy.notes.format or "markdown"
-            notes_manager = NotesManager(spec.context_policy.notes.file, format=notes_format)
+            notes_manager = NotesManager(
+                spec.context_policy.notes.file,
+                format=notes_format,
+                flush_interval_s=NOTES_FLUSH_INTERVAL_S,
+            )
 
             # Build agent_id → tools mapping for notes hook
             agent_tools: dict[str, list[str]] = {}
@@ -1469,3 +1598,5 @@ async def run_parallel(  # noqa: C901 - Complexity acceptable for multi-branch o
             # Clean up cached resources
             if should_close:
                 await cache.close()
+            if notes_manager:
+                notes_manager.close()
@@ -14,7 +14,9 @@ Execution Flow:
 
 Router Output:
     - Expected JSON: {"route": "<route_name>"}
-    - Parsing strategies: direct JSON, extract JSON block, regex extraction
+    - Requested as native structured output constrained to the route names
+      (unless runtime.structured_output is off)
+    - Text fallback parsing strategies: direct JSON, extract JSON block, regex extraction
     - Retry with clarification prompt on malformed responses
 
 Error Handling:
@@ -26,10 +28,10 @@ Error Handling:
 import json
 import re
 from datetime import UTC, datetime, timedelta
-from typing import Any, NoReturn
+from typing import Any, Literal, NoReturn
 
 import structlog
-from pydantic import ValidationError
+from pydantic import ValidationError, create_model
 from rich.console import Console
 from rich.panel import Panel
 
@@ -37,9 +39,16 @@ from strands_cli.events import EventBus, WorkflowEvent
 from strands_cli.exec.chain import run_chain
 from strands_cli.exec.hitl_utils import check_hitl_timeout, format_timeout_warning
 from strands_cli.exec.hooks import NotesAppenderHook, ProactiveCompactionHook
-from strands_cli.exec.utils import AgentCache
+from strands_cli.exec.utils import (
+    AgentCache,
+    invoke_agent,
+    request_structured_output,
+    structured_output_schema,
+    structured_result,
+)
 from strands_cli.exit_codes import EX_HITL_PAUSE
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus
 from strands_cli.session.checkpoint_utils import (
@@ -48,10 +57,11 @@ from strands_cli.session.checkpoint_utils import (
     finalize_session,
     validate_session_params,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
 from strands_cli.types import HITLState, PatternType, RouterDecision, RunResult, Spec
 
 
@@ -130,6 +140,18 @@ def _parse_router_response(response: str, attempt: int) -> RouterDecision:
     )
 
 
+def _router_schema(routes: dict[str, Any] | None) -> type[RouterDecision]:
+    """RouterDecision with ``route`` restricted to the configured route names."""
+    if not routes:
+        return RouterDecision
+    names = tuple(routes)
+    return create_model(
+        "RouterDecision",
+        __base__=RouterDecision,
+        route=(Literal[names], ...),  # type: ignore[valid-type]
+    )
+
+
 def _validate_route_exists(route_name: str, routes: dict[str, Any]) -> None:
     """Validate that selected route exists in routes map.
 
@@ -159,6 +181,9 @@ async def _execute_router_with_retry(
 ) -> tuple[str, str]:
     """Execute router agent with retry logic for malformed responses.
 
+    The decision is requested as native structured output when the runtime
+    allows it; the text response is parsed otherwise.
+
     Args:
         spec: Workflow spec
         router_agent_id: Router agent ID
@@ -191,6 +216,8 @@ async def _execute_router_with_retry(
         worker_index=None,
     )
 
+    schema = structured_output_schema(spec, _router_schema(spec.pattern.config.routes))
+
     # Construct router task with output format instructions
     router_task = router_input + "\n\nRespond with valid JSON: {\"route\": \"<route_name>\"}"
 
@@ -206,12 +233,14 @@ async def _execute_router_with_retry(
             # Execute router agent
             from strands_cli.utils import capture_and_display_stdout
 
-            with capture_and_display_stdout():
-                result = await agent.invoke_async(router_task)
+            with capture_and_display_stdout(), request_structured_output(schema):
+                result = await invoke_agent(agent, router_task)
             response = result if isinstance(result, str) else str(result)
 
             # Parse response
-            decision = _parse_router_response(response, attempt + 1)
+            decision = structured_result(result, RouterDecision) or _parse_router_response(
+                response, attempt + 1
+            )
 
             # Validate route exists
             if spec.pattern.config.routes:
@@ -238,6 +267,9 @@ async def _execute_router_with_retry(
                     max_attempts=max_retries + 1,
                     error=str(e),
                 )
+                get_metrics().inc(
+                    "strands_structured_output_total", agent=router_agent_id, outcome="parse_retry"
+                )
                 # Update task with clarification for next attempt
                 router_task = (
                     f"{router_input}\n\n"
@@ -306,7 +338,7 @@ async def _handle_router_review_hitl(
     chosen_route: str,
     router_response: str,
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
     variables: dict[str, str] | None,
     started_at: str,
 ) -> NoReturn:
@@ -511,11 +543,12 @@ def _create_route_spec(spec: Spec, chosen_route: str) -> Spec:
     return route_spec
 
 
+@with_budget_ledger
 async def run_routing(  # noqa: C901
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -633,7 +666,11 @@ async def run_routing(  # noqa: C901
         step_counter = [0]  # Mutable container for hook to track step count
         if spec.context_policy and spec.context_policy.notes:
             notes_format = spec.context_policy.notes.format or "markdown"
-            notes_manager = NotesManager(spec.context_policy.notes.file, format=notes_format)
+            notes_manager = NotesManager(
+                spec.context_policy.notes.file,
+                format=notes_format,
+                flush_interval_s=NOTES_FLUSH_INTERVAL_S,
+            )
 
             # Build agent_id → tools mapping for notes hook
             agent_tools: dict[str, list[str]] = {}
@@ -1007,3 +1044,5 @@ async def run_routing(  # noqa: C901
             # Clean up cached resources
             if should_close:
                 await cache.close()
+            if notes_manager:
+                notes_manager.close()
@@ -22,19 +22,28 @@ Retry Strategy:
     - Default: 3 attempts, 1s-60s backoff
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
 
 from strands_cli.exec.hooks import NotesAppenderHook
-from strands_cli.exec.utils import AgentCache, get_retry_config, invoke_agent_with_retry
+from strands_cli.exec.utils import (
+    AgentCache,
+    AgentPool,
+    get_retry_config,
+    invoke_agent_with_retry,
+)
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.session import SessionState
 from strands_cli.session.checkpoint_utils import fail_session, finalize_session
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
+from strands_cli.types import Agent as AgentConfig
 from strands_cli.types import PatternType, RunResult, Spec
 
 try:
@@ -50,11 +59,50 @@ class ExecutionError(Exception):
     pass
 
 
+@asynccontextmanager
+async def _acquire_agent(
+    spec: Spec,
+    agent_id: str,
+    agent_config: AgentConfig,
+    agent_pool: AgentPool | None,
+    hooks: list[Any] | None,
+    injected_notes: str | None,
+) -> AsyncIterator[Any]:
+    """Lease the agent from the caller's pool, or build it in a run-scoped cache.
+
+    The private AgentCache is only created without a pool, and is closed
+    (HTTP clients, MCP clients) when the context exits.
+    """
+    if agent_pool is not None:
+        # Leased agent is exclusive to this run and reset when returned
+        async with agent_pool.lease(
+            spec, agent_id, agent_config, hooks=hooks, injected_notes=injected_notes
+        ) as agent:
+            yield agent
+        return
+
+    # Phase 3: Single executor-scoped cache (cleanup on exit)
+    cache = AgentCache()
+    try:
+        yield await cache.get_or_build_agent(
+            spec,
+            agent_id,
+            agent_config,
+            hooks=hooks,
+            injected_notes=injected_notes,
+            worker_index=None,
+        )
+    finally:
+        await cache.close()
+
+
+@with_budget_ledger
 async def run_single_agent(
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
+    agent_pool: AgentPool | None = None,
 ) -> RunResult:
     """Execute a single-agent workflow asynchronously.
 
@@ -78,6 +126,9 @@ async def run_single_agent(
         variables: Optional variables from CLI (already merged into spec.inputs)
         session_state: Existing session state for resume (None = fresh start)
         session_repo: Repository for checkpointing (None = no checkpoints)
+        agent_pool: Optional pool to lease the agent from instead of building it in a
+            private AgentCache. Lets concurrent runs of the same spec share built agents
+            (e.g. ``strands atomic test --jobs``); the caller owns the pool's cache.
 
     Returns:
         RunResult with:
@@ -149,7 +200,11 @@ async def run_single_agent(
         step_counter = [0]  # Mutable container for hook to track step count
         if spec.context_policy and spec.context_policy.notes:
             notes_format = spec.context_policy.notes.format or "markdown"
-            notes_manager = NotesManager(spec.context_policy.notes.file, format=notes_format)
+            notes_manager = NotesManager(
+                spec.context_policy.notes.file,
+                format=notes_format,
+                flush_interval_s=NOTES_FLUSH_INTERVAL_S,
+            )
 
             # Build agent_id → tools mapping for notes hook
             agent_tools: dict[str, list[str]] = {}
@@ -163,9 +218,6 @@ async def run_single_agent(
                 format=notes_format,
             )
 
-        # Create agent cache for this execution
-        # Phase 3: Single executor-scoped cache (cleanup in finally)
-        cache = AgentCache()
         try:
             # Phase 6.2: Inject last N notes into agent context
             injected_notes = None
@@ -180,24 +232,25 @@ async def run_single_agent(
                     )
 
             # Get or build the agent (cache enables future multi-step reuse)
-            agent = await cache.get_or_build_agent(
+            async with _acquire_agent(
                 spec,
                 agent_id,
                 agent_config,
+                agent_pool,
                 hooks=shared_hooks if shared_hooks else None,
                 injected_notes=injected_notes,
-                worker_index=None,
-            )
-
-            # Run the agent with retry logic
-            # Phase 3: Direct await instead of asyncio.run() (no event loop churn)
-            logger.debug(
-                "agent_execution_started", agent_id=agent_id, task_input_length=len(task_input)
-            )
-            with tracer.start_as_current_span("agent_invoke"):
-                response = await invoke_agent_with_retry(
-                    agent, task_input, max_attempts, wait_min, wait_max
+            ) as agent:
+                # Run the agent with retry logic
+                # Phase 3: Direct await instead of asyncio.run() (no event loop churn)
+                logger.debug(
+                    "agent_execution_started",
+                    agent_id=agent_id,
+                    task_input_length=len(task_input),
                 )
+                with tracer.start_as_current_span("agent_invoke"):
+                    response = await invoke_agent_with_retry(
+                        agent, task_input, max_attempts, wait_min, wait_max
+                    )
         except Exception as e:
             # Fail session on error if session tracking is enabled
             if session_state and session_repo:
@@ -224,8 +277,8 @@ async def run_single_agent(
                 duration_seconds=duration,
             )
         finally:
-            # Phase 3: Cleanup HTTP clients and cached resources
-            await cache.close()
+            if notes_manager:
+                notes_manager.close()
 
         # Extract last response
         # Strands Agent.invoke_async() returns a string or Response object
@@ -9,14 +9,24 @@ consistent behavior for retry logic, budget enforcement, and error handling.
 
 Phase 2 Additions:
     - AgentCache: Executor-scoped agent caching to eliminate redundant builds
+    - AgentPool: Bounded, reusable agent slots so fan-out cost scales with concurrency
 """
 
+import asyncio
 import os
+import random
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import structlog
 from opentelemetry.trace import get_current_span
+from pydantic import BaseModel
 from strands.agent import Agent
+from strands.hooks import HookEvent, HookProvider, HookRegistry
+from strands.telemetry.metrics import EventLoopMetrics
+from strands.types.exceptions import ModelThrottledException, StructuredOutputException
 
 # Phase 9: Import MCPClient for instance checking and cleanup
 try:
@@ -35,10 +45,17 @@ from tenacity import (
     wait_exponential,
 )
 
-from strands_cli.runtime.strands_adapter import build_agent
+from strands_cli.exec.hooks import MetricsHook, UsageTrackerHook, model_label
+from strands_cli.runtime.budget_ledger import budget_reservation
+from strands_cli.runtime.cascade import invoke_with_cascade
+from strands_cli.runtime.circuit_breaker import get_circuit_breaker, retry_after_seconds
+from strands_cli.runtime.mcp_pool import get_mcp_pool
+from strands_cli.runtime.strands_adapter import build_agent, build_agent_system_prompt
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.telemetry.profiler import profile_phase
 from strands_cli.tools.http_executor_factory import close_http_executor_tool
 from strands_cli.types import Agent as AgentConfig
-from strands_cli.types import Spec
+from strands_cli.types import ProviderType, Spec
 
 logger = structlog.get_logger(__name__)
 
@@ -49,6 +66,19 @@ TOKEN_WARNING_THRESHOLD = 0.8
 TRANSIENT_ERRORS = (
     TimeoutError,
     ConnectionError,
+    ModelThrottledException,
+)
+
+
+# Provider error messages for models that cannot call tools, and so cannot
+# produce native structured output (e.g. Ollama "... does not support tools",
+# Bedrock "This model doesn't support tool use.")
+_TOOLS_UNSUPPORTED_MARKERS = (
+    "does not support tools",
+    "does not support tool",
+    "doesn't support tool",
+    "tool use is not supported",
+    "tools are not supported",
 )
 
 
@@ -119,6 +149,7 @@ def _log_retry_attempt(retry_state: RetryCallState) -> None:
             error=error,
             wait_seconds=wait_time,
         )
+        get_metrics().inc("strands_agent_retries_total")
 
         # Add OTEL span event
         span = get_current_span()
@@ -133,20 +164,40 @@ def _log_retry_attempt(retry_state: RetryCallState) -> None:
             )
 
 
+class _JitteredRetryAfterWait:
+    """Tenacity wait: jittered exponential backoff that honours Retry-After.
+
+    The exponential delay is jittered uniformly between ``wait_min`` and the
+    delay, so concurrent branches that failed together do not retry in lockstep.
+    A Retry-After hint on the failed attempt's error (throttling) sets a floor.
+    """
+
+    def __init__(self, wait_min: int, wait_max: int) -> None:
+        self.wait_min = wait_min
+        self.exponential = wait_exponential(multiplier=1, min=wait_min, max=wait_max)
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        delay = random.uniform(self.wait_min, self.exponential(retry_state))
+        outcome = retry_state.outcome
+        error = outcome.exception() if outcome is not None and outcome.failed else None
+        retry_after = retry_after_seconds(error) if error is not None else None
+        return max(delay, retry_after) if retry_after is not None else delay
+
+
 def create_retry_decorator(
     max_attempts: int,
     wait_min: int,
     wait_max: int,
 ) -> Any:
-    """Create a retry decorator with exponential backoff.
+    """Create a retry decorator with jittered exponential backoff.
 
     Centralizes retry decorator creation for consistent behavior
-    across all executors.
+    across all executors. Waits honour server Retry-After hints.
 
     Args:
         max_attempts: Maximum number of attempts
         wait_min: Minimum wait time in seconds
-        wait_max: Maximum wait time in seconds
+        wait_max: Maximum wait time in seconds (Retry-After may exceed it)
 
     Returns:
         Configured retry decorator from tenacity
@@ -154,12 +205,106 @@ def create_retry_decorator(
     return retry(
         retry=retry_if_exception_type(TRANSIENT_ERRORS),
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=wait_min, max=wait_max),
+        wait=_JitteredRetryAfterWait(wait_min, wait_max),
         before_sleep=_log_retry_attempt,
         reraise=True,
     )
 
 
+def structured_output_schema[M: BaseModel](spec: Spec, model: type[M]) -> type[M] | None:
+    """Schema to request natively from a control agent, or None to parse text.
+
+    Router, orchestrator and evaluator decisions are requested as provider-native
+    structured output unless ``runtime.structured_output`` is off. The simulated
+    provider only produces text.
+    """
+    runtime = spec.runtime
+    if not runtime.structured_output or runtime.provider == ProviderType.SIMULATED:
+        return None
+    return model
+
+
+_structured_output: ContextVar[type[BaseModel] | None] = ContextVar(
+    "strands_structured_output", default=None
+)
+
+
+@contextmanager
+def request_structured_output(model: type[BaseModel] | None) -> Iterator[None]:
+    """Request ``model`` as native structured output from invocations in the block.
+
+    Covers ``invoke_agent`` and ``invoke_agent_with_retry`` calls made in the
+    block, including tasks it spawns. None leaves responses as text.
+    """
+    token = _structured_output.set(model)
+    try:
+        yield
+    finally:
+        _structured_output.reset(token)
+
+
+def structured_result[M: BaseModel](result: Any, model: type[M]) -> M | None:
+    """Validated structured output of an agent result, if the model produced one."""
+    output = getattr(result, "structured_output", None)
+    return output if isinstance(output, model) else None
+
+
+def _tools_unsupported(error: BaseException) -> bool:
+    """Whether a provider error (or its cause) says the model cannot use tools."""
+    current: BaseException | None = error
+    while current is not None:
+        message = str(current).lower()
+        if any(marker in message for marker in _TOOLS_UNSUPPORTED_MARKERS):
+            return True
+        current = current.__cause__
+    return False
+
+
+async def invoke_agent(agent: Any, input_text: str) -> Any:
+    """Invoke an agent once, with native structured output when requested.
+
+    See ``request_structured_output``. When the model does not call the
+    structured output tool even after it is forced, or the provider rejects
+    tools for the model, the agent's history is rolled back and the same input
+    is answered as text instead, leaving the caller's JSON parsing to handle it.
+
+    Args:
+        agent: Strands Agent instance
+        input_text: Input prompt for the agent
+
+    Returns:
+        Agent response (string or AgentResult)
+    """
+    structured_output_model = _structured_output.get()
+    if structured_output_model is None:
+        return await agent.invoke_async(input_text)
+
+    agent_name = getattr(agent, "name", "unknown")
+    messages = getattr(agent, "messages", None)
+    history = list(messages) if isinstance(messages, list) else None
+    try:
+        result = await agent.invoke_async(
+            input_text, structured_output_model=structured_output_model
+        )
+    except Exception as e:
+        if not isinstance(e, StructuredOutputException) and not _tools_unsupported(e):
+            raise
+        logger.warning(
+            "structured_output_fallback",
+            agent=agent_name,
+            schema=structured_output_model.__name__,
+            error=str(e),
+        )
+        get_metrics().inc("strands_structured_output_total", agent=agent_name, outcome="fallback")
+        if history is not None:
+            # Drop the failed forced-tool exchange so the input is not sent twice
+            agent.messages[:] = history
+        return await agent.invoke_async(input_text)
+    if getattr(result, "structured_output", None) is not None:
+        get_metrics().inc("strands_structured_output_total", agent=agent_name, outcome="native")
+    return result
+
+
 async def invoke_agent_with_retry(
     agent: Any,
     input_text: str,
@@ -172,6 +317,17 @@ async def invoke_agent_with_retry(
     Wraps agent invocation with stdout capture and retry handling.
     Used across all executors for consistent agent execution.
 
+    Every attempt consults the process-wide circuit breaker of the agent's
+    provider and model: while it is open the call fails immediately with
+    CircuitOpenError instead of retrying against a failing endpoint.
+
+    When the run has a token budget, the invocation first reserves its
+    estimated tokens with the run's budget ledger and then records its actual
+    usage, so concurrent agents cannot overshoot budgets.max_tokens.
+
+    Agents built with a model cascade are first invoked on the cheaper tiers;
+    the agent's own model answers only when their output is rejected.
+
     Args:
         agent: Strands Agent instance
         input_text: Input prompt for the agent
@@ -184,6 +340,8 @@ async def invoke_agent_with_retry(
 
     Raises:
         TRANSIENT_ERRORS: After all retry attempts exhausted
+        CircuitOpenError: If the provider's circuit breaker is open (not retried)
+        BudgetExceededError: If the call would exceed, or exhausted, the run's token budget
         Exception: For non-transient errors (fail immediately)
     """
     from strands_cli.utils import capture_and_display_stdout
@@ -216,8 +374,28 @@ async def invoke_agent_with_retry(
                 input_preview=input_preview,
             )
 
-        with capture_and_display_stdout():
-            result = await agent.invoke_async(input_text)
+        # Looked up per attempt: a model cascade swaps the agent's model between tiers
+        breaker = get_circuit_breaker(type(agent.model).__name__, model_label(agent))
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            with capture_and_display_stdout():
+                result = await invoke_agent(agent, input_text)
+        except TRANSIENT_ERRORS as e:
+            if breaker is not None:
+                breaker.record_failure(retry_after_seconds(e))
+            raise
+        except Exception:
+            # The provider answered; other errors are not a provider outage
+            if breaker is not None:
+                breaker.record_success()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+        if breaker is not None:
+            breaker.record_success()
 
         if debug:
             # Extract response info
@@ -232,7 +410,19 @@ async def invoke_agent_with_retry(
 
         return result
 
-    return await _execute()
+    agent_name = getattr(agent, "name", "unknown")
+    with (
+        budget_reservation(agent, input_text) as reservation,
+        get_metrics().track(
+            "strands_agent_invocation_duration_seconds",
+            "strands_agent_invocations_in_progress",
+            agent=agent_name,
+        ),
+        profile_phase("agent.invoke", agent=agent_name),
+    ):
+        result = await invoke_with_cascade(agent, input_text, _execute)
+        reservation.response = result
+    return result
 
 
 def estimate_tokens(input_text: str, output_text: str) -> int:
@@ -301,6 +491,11 @@ class AgentCache:
         # Set of skill IDs that have been loaded during this execution
         self._loaded_skills: set[str] = set()
 
+        # Run-wide provider token usage (incl. prompt-cache reads/writes) across all agents
+        self.usage_tracker = UsageTrackerHook()
+        # Model/tool latency and token counters for the metrics registry
+        self.metrics_hook = MetricsHook()
+
         debug = os.environ.get("STRANDS_DEBUG", "").lower() == "true"
         if debug:
             logger.debug("agent_cache_initialized")
@@ -369,6 +564,7 @@ class AgentCache:
 
         # Check cache
         if cache_key in self._agents:
+            get_metrics().inc("strands_cache_requests_total", cache="agent", result="hit")
             logger.debug(
                 "agent_cache_hit",
                 agent_id=agent_id,
@@ -380,6 +576,7 @@ class AgentCache:
             return self._agents[cache_key]
 
         # Cache miss - build new agent
+        get_metrics().inc("strands_cache_requests_total", cache="agent", result="miss")
         logger.debug(
             "agent_cache_miss",
             agent_id=agent_id,
@@ -391,21 +588,29 @@ class AgentCache:
 
         # Pass self to build_agent so it can track MCP clients
         # Phase 2: Pass session_manager for agent conversation restoration
-        agent = build_agent(
-            spec,
-            agent_id,
-            agent_config,
-            tool_overrides=tool_overrides,
-            conversation_manager=conversation_manager,
-            hooks=hooks,
-            injected_notes=injected_notes,
-            agent_cache=self,  # Pass cache for MCP client tracking
-            session_manager=session_manager,  # Phase 2: session restoration
-        )
+        with profile_phase("agent.build", agent=agent_id):
+            agent = build_agent(
+                spec,
+                agent_id,
+                agent_config,
+                tool_overrides=tool_overrides,
+                conversation_manager=conversation_manager,
+                hooks=hooks,
+                injected_notes=injected_notes,
+                agent_cache=self,  # Pass cache for MCP client tracking
+                session_manager=session_manager,  # Phase 2: session restoration
+            )
 
         # Cache the agent
         self._agents[cache_key] = agent
 
+        # Track provider usage (incl. prompt-cache reads/writes) for the run summary
+        # and report latency/token metrics
+        hook_registry = getattr(agent, "hooks", None)
+        if isinstance(hook_registry, HookRegistry):
+            hook_registry.add_hook(self.usage_tracker)
+            hook_registry.add_hook(self.metrics_hook)
+
         # Track HTTP executor tool modules for cleanup (extract from agent.tools)
         # Note: MCP clients are tracked in build_agent before Agent construction
         if hasattr(agent, "tools") and agent.tools:
@@ -447,10 +652,18 @@ class AgentCache:
             mcp_clients=len(self._mcp_clients),
         )
 
+        if self.usage_tracker.invocations:
+            logger.info("token_usage_summary", **self.usage_tracker.summary())
+
         # Phase 9: Stop MCP clients FIRST (before HTTP cleanup)
         # MCP servers may use HTTP internally (streamable_http transport)
         # Closing HTTP clients first could break MCP cleanup
+        # Pooled clients stay warm for later runs; only this cache's leases are released
+        mcp_pool = get_mcp_pool()
         for server_id, mcp_client in self._mcp_clients.items():
+            if mcp_pool is not None and mcp_pool.owns(mcp_client):
+                logger.debug("mcp_client_released_to_pool", server_id=server_id)
+                continue
             try:
                 # MCPClient uses context manager protocol - call __exit__ with None args
                 if hasattr(mcp_client, "__exit__"):
@@ -467,6 +680,9 @@ class AgentCache:
                     error=str(e),
                 )
 
+        if mcp_pool is not None:
+            mcp_pool.release(self)
+
         # THEN close HTTP executor tool modules (after MCP cleanup)
         for executor_id, tool_module in self._http_executors.items():
             try:
@@ -483,3 +699,214 @@ class AgentCache:
         self._agents.clear()
         self._http_executors.clear()
         self._mcp_clients.clear()
+
+
+def reset_agent_state(agent: Any) -> None:
+    """Reset per-invocation state on a reusable agent.
+
+    Clears conversation history and usage counters so a pooled agent starts each
+    lease like a freshly built one (system prompt, tools and hooks are kept).
+
+    Args:
+        agent: Strands Agent instance
+    """
+    messages = getattr(agent, "messages", None)
+    if isinstance(messages, list):
+        messages.clear()
+    if hasattr(agent, "event_loop_metrics"):
+        agent.event_loop_metrics = EventLoopMetrics()
+
+
+class _LeaseHooks(HookProvider):
+    """Stable hook provider of a pooled agent that forwards to the current lease's hooks.
+
+    HookRegistry cannot remove callbacks, so a pooled agent is built with this
+    provider instead of the first lease's hooks. Each lease calls ``use()`` with
+    its own hook providers; events are forwarded only to those, so hook state
+    never carries over between leases. Callbacks the agent registered itself
+    (session and conversation managers, retry strategy) are not affected.
+
+    Attributes:
+        hooks: Hook providers of the current lease
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no hooks."""
+        self.hooks: list[Any] = []
+        self._callbacks: dict[type[HookEvent], list[Callable[[Any], Any]]] = {}
+        # Registries this provider is registered with, and their subscribed event types
+        self._registries: list[tuple[HookRegistry, set[type[HookEvent]]]] = []
+
+    def use(self, hooks: list[Any]) -> None:
+        """Forward events to ``hooks`` from now on, replacing the previous lease's.
+
+        Args:
+            hooks: Hook providers of the lease
+        """
+        self.hooks = hooks
+        self._callbacks = {}
+        for hook in hooks:
+            self.add_hook(hook)
+        self._subscribe()
+
+    def add_hook(self, hook: HookProvider) -> None:
+        """Collect a provider's callbacks (HookRegistry interface used by providers)."""
+        hook.register_hooks(self)  # type: ignore[arg-type]
+
+    def add_callback(
+        self,
+        event_type: type[HookEvent] | list[type[HookEvent]],
+        callback: Callable[[Any], Any],
+        **kwargs: Any,
+    ) -> None:
+        """Collect a callback (HookRegistry interface used by providers)."""
+        for resolved in event_type if isinstance(event_type, list) else [event_type]:
+            self._callbacks.setdefault(resolved, []).append(callback)
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        """Subscribe the agent's registry to the events the lease's hooks handle.
+
+        Args:
+            registry: Hook registry of the pooled agent
+            **kwargs: Additional keyword arguments (not used)
+        """
+        self._registries.append((registry, set()))
+        self._subscribe()
+
+    def attach(self, agent: Any) -> None:
+        """Register with an agent that was not built with this provider."""
+        registry = getattr(agent, "hooks", None)
+        if isinstance(registry, HookRegistry) and all(
+            registry is not known for known, _ in self._registries
+        ):
+            registry.add_hook(self)
+
+    def _subscribe(self) -> None:
+        # Event types stay subscribed; leases without callbacks for one are no-ops
+        for registry, subscribed in self._registries:
+            for event_type in self._callbacks:
+                if event_type not in subscribed:
+                    subscribed.add(event_type)
+                    registry.add_callback(event_type, self._dispatch)
+
+    def _dispatch(self, event: HookEvent) -> None:
+        callbacks = self._callbacks.get(type(event), [])
+        for callback in reversed(callbacks) if event.should_reverse_callbacks else callbacks:
+            callback(event)
+
+
+class AgentPool:
+    """Bounded pool of reusable agents for one (agent_id, tools) pair.
+
+    Fan-out executors (orchestrator workers, tree reducers) previously built one
+    agent per task via a unique ``worker_index``. The pool instead hands out
+    ``size`` slots; each slot maps to one cached agent (``worker_index=slot``)
+    that is built on first use and reused by later leases. Agent construction
+    therefore scales with concurrency rather than with the number of tasks.
+
+    The pool also bounds concurrency: ``lease()`` waits until a slot is free,
+    so it replaces a semaphore of the same size. ``size=None`` grows a new slot
+    whenever all existing slots are leased (unbounded concurrency).
+
+    Example:
+        pool = AgentPool(cache, size=max_workers)
+        async with pool.lease(spec, "worker", agent_config, hooks=hooks) as agent:
+            result = await agent.invoke_async(task)
+    """
+
+    def __init__(self, cache: AgentCache, size: int | None = None, index_offset: int = 0) -> None:
+        """Initialize agent pool.
+
+        Args:
+            cache: AgentCache that builds and owns the pooled agents
+            size: Maximum number of agents (and concurrent leases); None = unbounded
+            index_offset: Offset added to slot numbers for cache keys, so pools of the
+                same agent_id (e.g. workers and reducers) never share instances
+        """
+        self._cache = cache
+        self.size = size
+        self._index_offset = index_offset
+        self._idle: asyncio.Queue[int] = asyncio.Queue()
+        self._created = 0
+        self.leases = 0
+        # Each slot's agent is built with one stable hook provider that forwards
+        # to the current lease's hooks
+        self._slot_hooks: dict[int, _LeaseHooks] = {}
+        self._leased_agents: set[int] = set()
+
+    async def _acquire_slot(self) -> int:
+        if self._idle.empty() and (self.size is None or self._created < self.size):
+            slot = self._created
+            self._created += 1
+            return slot
+        metrics = get_metrics()
+        metrics.inc("strands_agent_pool_waiting")
+        try:
+            return await self._idle.get()
+        finally:
+            metrics.dec("strands_agent_pool_waiting")
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        spec: Spec,
+        agent_id: str,
+        agent_config: AgentConfig,
+        tool_overrides: list[str] | None = None,
+        conversation_manager: Any | None = None,
+        hooks: list[Any] | None = None,
+        injected_notes: str | None = None,
+    ) -> AsyncIterator[Agent]:
+        """Check out an agent for the duration of the context.
+
+        The agent is built on the slot's first lease. Events reach only this
+        lease's ``hooks`` (the previous lease's instances are dropped, so hook
+        state never carries over), and later leases of the same agent rebuild
+        the system prompt with ``injected_notes``. History and usage counters are reset when the agent
+        is returned to the pool.
+
+        Args:
+            spec: Full workflow spec for agent construction
+            agent_id: Agent identifier from spec.agents
+            agent_config: Agent configuration
+            tool_overrides: Optional tool ID list (overrides agent_config.tools)
+            conversation_manager: Optional conversation manager for context compaction
+            hooks: Optional fresh hooks for this lease
+            injected_notes: Optional notes for this lease's system prompt
+
+        Yields:
+            Agent instance exclusively leased to the caller
+        """
+        slot = await self._acquire_slot()
+        try:
+            slot_hooks = self._slot_hooks.setdefault(slot, _LeaseHooks())
+            slot_hooks.use(list(hooks or []))
+            agent = await self._cache.get_or_build_agent(
+                spec,
+                agent_id,
+                agent_config,
+                tool_overrides=tool_overrides,
+                conversation_manager=conversation_manager,
+                hooks=[slot_hooks],
+                injected_notes=injected_notes,
+                worker_index=self._index_offset + slot,
+            )
+            slot_hooks.attach(agent)
+            if id(agent) in self._leased_agents:
+                # Reused agent: build-time notes belong to an earlier lease
+                agent.system_prompt = build_agent_system_prompt(
+                    spec, agent_id, agent_config, injected_notes
+                )
+            self._leased_agents.add(id(agent))
+            self.leases += 1
+            try:
+                yield agent
+            finally:
+                reset_agent_state(agent)
+        finally:
+            self._idle.put_nowait(slot)
+
+    @property
+    def agents_built(self) -> int:
+        """Number of slots (and therefore agents) created so far."""
+        return self._created
@@ -45,6 +45,7 @@ from strands_cli.exec.utils import (
 )
 from strands_cli.exit_codes import EX_HITL_PAUSE, EX_OK
 from strands_cli.loader import render_template
+from strands_cli.runtime.budget_ledger import with_budget_ledger
 from strands_cli.runtime.context_manager import create_from_policy
 from strands_cli.session import SessionState, SessionStatus, TokenUsage
 from strands_cli.session.checkpoint_utils import (
@@ -55,8 +56,10 @@ from strands_cli.session.checkpoint_utils import (
     validate_session_params,
 )
 from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.incremental import content_hash, get_incremental_cache, result_hash
+from strands_cli.session.repository import SessionRepository
 from strands_cli.telemetry import get_tracer
-from strands_cli.tools.notes_manager import NotesManager
+from strands_cli.tools.notes_manager import NOTES_FLUSH_INTERVAL_S, NotesManager
 from strands_cli.types import HITLState, PatternType, RunResult, Spec
 
 try:
@@ -219,7 +222,7 @@ async def _execute_hitl_pause(
     task_results: dict[str, dict[str, Any]],
     variables: dict[str, str] | None,
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
     layer_index: int,
     completed_tasks: set[str],
 ) -> RunResult:
@@ -347,7 +350,7 @@ async def _execute_task(
     notes_manager: Any = None,
     event_bus: EventBus | None = None,
     session_state: SessionState | None = None,
-) -> tuple[str, int]:
+) -> tuple[str, int, str]:
     """Execute a single task asynchronously.
 
     Args:
@@ -365,7 +368,8 @@ async def _execute_task(
         session_state: Optional session state for session_id
 
     Returns:
-        Tuple of (response_text, estimated_tokens)
+        Tuple of (response_text, estimated_tokens, content_hash); reused tasks
+        report zero tokens
 
     Raises:
         WorkflowExecutionError: If task execution fails
@@ -386,6 +390,30 @@ async def _execute_task(
         )
     task_agent_config = spec.agents[task_agent_id]
 
+    # Use task's tool_overrides if provided, else use agent's tools
+    tools_for_task = (
+        task.tool_overrides if hasattr(task, 'tool_overrides') and task.tool_overrides else None
+    )
+
+    # Phase 6.2: Inject last N notes into agent context
+    injected_notes = None
+    if notes_manager and spec.context_policy and spec.context_policy.notes:
+        injected_notes = notes_manager.get_last_n_for_injection(
+            spec.context_policy.notes.include_last
+        )
+
+    # Incremental runs reuse the response of an unchanged task
+    completed = task_context.get("tasks", {})
+    upstream = [result_hash(completed.get(dep, {})) for dep in task.deps or []]
+    task_hash = content_hash(
+        spec, task_agent_id, task_input, upstream, tools_for_task, injected_notes
+    )
+    incremental = get_incremental_cache()
+    reused = incremental.lookup(task_hash, "workflow") if incremental else None
+    if reused is not None:
+        logger.info("workflow_task_reused", task=task.id, hash=task_hash[:12])
+        return str(reused["response"]), 0, task_hash
+
     # Emit task_start event before agent building/invocation
     if event_bus:
         await event_bus.emit(
@@ -404,18 +432,6 @@ async def _execute_task(
 
     # Phase 5: Use cached agent instead of rebuilding per task
     try:
-        # Use task's tool_overrides if provided, else use agent's tools
-        tools_for_task = (
-            task.tool_overrides if hasattr(task, 'tool_overrides') and task.tool_overrides else None
-        )
-
-        # Phase 6.2: Inject last N notes into agent context
-        injected_notes = None
-        if notes_manager and spec.context_policy and spec.context_policy.notes:
-            injected_notes = notes_manager.get_last_n_for_injection(
-                spec.context_policy.notes.include_last
-            )
-
         agent = await cache.get_or_build_agent(
             spec,
             task_agent_id,
@@ -445,7 +461,7 @@ async def _execute_task(
     # Estimate tokens using shared estimator
     estimated_tokens = estimate_tokens(task_input, response_text)
 
-    return response_text, estimated_tokens
+    return response_text, estimated_tokens, task_hash
 
 
 def _validate_workflow_config(spec: Spec) -> dict[str, Any]:
@@ -498,7 +514,7 @@ async def _execute_workflow_layer(
     notes_manager: Any = None,
     event_bus: EventBus | None = None,
     session_state: SessionState | None = None,
-) -> list[tuple[str, int]]:
+) -> list[tuple[str, int, str]]:
     """Execute all tasks in a workflow layer (potentially in parallel).
 
     Args:
@@ -518,7 +534,7 @@ async def _execute_workflow_layer(
         session_state: Optional session state for session_id
 
     Returns:
-        List of (response_text, estimated_tokens) for each task
+        List of (response_text, estimated_tokens, content_hash) for each task
 
     Raises:
         WorkflowExecutionError: If any task fails
@@ -536,13 +552,13 @@ async def _execute_workflow_layer(
 
     async def _execute_layer(
         tasks_with_context: list[tuple[str, Any, dict[str, Any]]],
-    ) -> list[tuple[str, int]]:
+    ) -> list[tuple[str, int, str]]:
         # Create semaphore for max_parallel if configured
         semaphore = asyncio.Semaphore(max_parallel) if max_parallel else None
 
         async def _execute_with_semaphore(
             task_id: str, task_obj: Any, context: dict[str, Any]
-        ) -> tuple[str, int]:
+        ) -> tuple[str, int, str]:
             if semaphore:
                 async with semaphore:
                     return await _execute_task(
@@ -585,11 +601,12 @@ async def _execute_workflow_layer(
     return await _execute_layer(tasks_to_execute)
 
 
+@with_budget_ledger
 async def run_workflow(  # noqa: C901
     spec: Spec,
     variables: dict[str, str] | None = None,
     session_state: SessionState | None = None,
-    session_repo: FileSessionRepository | None = None,
+    session_repo: SessionRepository | None = None,
     hitl_response: str | None = None,  # NEW: User's response when resuming from HITL pause
     event_bus: EventBus | None = None,
     agent_cache: AgentCache | None = None,
@@ -841,7 +858,11 @@ async def run_workflow(  # noqa: C901
         task_counter = [0]  # Mutable container for hook to track task count
         if spec.context_policy and spec.context_policy.notes:
             notes_format = spec.context_policy.notes.format or "markdown"
-            notes_manager = NotesManager(spec.context_policy.notes.file, format=notes_format)
+            notes_manager = NotesManager(
+                spec.context_policy.notes.file,
+                format=notes_format,
+                flush_interval_s=NOTES_FLUSH_INTERVAL_S,
+            )
 
             # Build agent_id → tools mapping for notes hook
             agent_tools: dict[str, list[str]] = {}
@@ -981,7 +1002,7 @@ async def run_workflow(  # noqa: C901
                             ) from e
 
                         # Store pre-HITL results
-                        for task_id, (response_text, estimated_tokens) in zip(
+                        for task_id, (response_text, estimated_tokens, task_hash) in zip(
                             pre_hitl_tasks, pre_hitl_results, strict=True
                         ):
                             cumulative_tokens += estimated_tokens
@@ -990,6 +1011,7 @@ async def run_workflow(  # noqa: C901
                                 "status": "success",
                                 "tokens_estimated": estimated_tokens,
                                 "agent": task_map[task_id].agent,
+                                "hash": task_hash,
                             }
                             completed_tasks.add(task_id)
 
@@ -1032,7 +1054,7 @@ async def run_workflow(  # noqa: C901
 
                 # Process results for pending tasks only
                 layer_tokens = 0
-                for task_id, (response_text, estimated_tokens) in zip(
+                for task_id, (response_text, estimated_tokens, task_hash) in zip(
                     pending_tasks, layer_results, strict=True
                 ):
                     cumulative_tokens += estimated_tokens
@@ -1044,6 +1066,7 @@ async def run_workflow(  # noqa: C901
                         "status": "success",
                         "tokens_estimated": estimated_tokens,
                         "agent": task_map[task_id].agent,  # Track which agent executed this task
+                        "hash": task_hash,
                     }
                     completed_tasks.add(task_id)
 
@@ -1184,3 +1207,5 @@ async def run_workflow(  # noqa: C901
             # Phase 3: Only close if we created the cache (not shared from context manager)
             if should_close:
                 await cache.close()
+            if notes_manager:
+                notes_manager.close()
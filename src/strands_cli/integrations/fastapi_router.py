@@ -12,10 +12,17 @@ Example:
     >>> workflow = Workflow.from_file("workflow.yaml")
     >>> router = create_workflow_router(workflow)
     >>> app.include_router(router)
+
+Long-running workflows can be submitted as jobs instead (POST /jobs): the
+request returns 202 with a session ID at once, a bounded worker pool runs the
+job, and GET /sessions/{id}/events streams its progress as Server-Sent Events.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
@@ -23,13 +30,34 @@ from pydantic import BaseModel, Field
 
 try:
     from fastapi import APIRouter, HTTPException, Query  # type: ignore[import-not-found]
+    from fastapi.responses import (  # type: ignore[import-not-found]
+        PlainTextResponse,
+        StreamingResponse,
+    )
 except ImportError as e:
     raise ImportError(
         "FastAPI is required for web integrations. Install with: pip install \"strands-cli[web]\""
     ) from e
 
 from strands_cli.api import SessionManager, Workflow
+from strands_cli.integrations.job_queue import (
+    DEFAULT_MAX_QUEUED,
+    DEFAULT_MAX_WORKERS,
+    Job,
+    JobQueueFullError,
+    WorkflowJobQueue,
+)
 from strands_cli.session import SessionStatus
+from strands_cli.telemetry.metrics import get_metrics
+
+# Prometheus text exposition format
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Comment line sent on idle event streams so proxies don't time them out
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Retry-After hint (seconds) when the job queue rejects a submission
+QUEUE_FULL_RETRY_AFTER = 5
 
 
 class ExecuteRequest(BaseModel):
@@ -51,6 +79,14 @@ class ExecuteResponse(BaseModel):
     duration_seconds: float | None = Field(None, description="Execution duration in seconds")
 
 
+class JobResponse(BaseModel):
+    """Response model for an accepted job submission."""
+
+    session_id: str = Field(description="Session the job will run in")
+    status: str = Field(description="Job status (queued)")
+    events_url: str = Field(description="Server-Sent Events stream for the job")
+
+
 class SessionInfo(BaseModel):
     """Response model for session information."""
 
@@ -72,10 +108,41 @@ class ResumeRequest(BaseModel):
     )
 
 
-def create_workflow_router(
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _stream_job_events(job: Job) -> AsyncIterator[str]:
+    """Stream a job's events as SSE, with keep-alive comments while idle."""
+    events = job.events()
+    pending: asyncio.Future[tuple[str, dict[str, Any]]] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(events))
+            done, _ = await asyncio.wait({pending}, timeout=SSE_KEEPALIVE_SECONDS)
+            if not done:
+                yield ": keepalive\n\n"
+                continue
+            try:
+                event, data = pending.result()
+            except StopAsyncIteration:
+                return
+            pending = None
+            yield _format_sse(event, data)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        await events.aclose()
+
+
+def create_workflow_router(  # noqa: C901 - Route handlers are nested closures
     workflow: Workflow,
     prefix: str = "/workflow",
     storage_dir: Path | None = None,
+    max_concurrent_jobs: int = DEFAULT_MAX_WORKERS,
+    max_queued_jobs: int = DEFAULT_MAX_QUEUED,
 ) -> APIRouter:
     """Create FastAPI router for workflow execution.
 
@@ -83,6 +150,8 @@ def create_workflow_router(
         workflow: Workflow instance to expose via API
         prefix: URL prefix for all routes (default: "/workflow")
         storage_dir: Directory for session storage (default: platform-specific)
+        max_concurrent_jobs: Jobs submitted via POST /jobs that run at once
+        max_queued_jobs: Jobs that may wait for a worker; further submissions get 503
 
     Returns:
         Configured FastAPI router
@@ -99,6 +168,15 @@ def create_workflow_router(
     """
     router = APIRouter(prefix=prefix, tags=["workflow"])
     session_manager = SessionManager(storage_dir=storage_dir)
+    # Jobs save their sessions where the session endpoints look for them
+    job_queue = WorkflowJobQueue(
+        workflow,
+        max_workers=max_concurrent_jobs,
+        max_queued=max_queued_jobs,
+        session_repo=session_manager.repo,
+    )
+    # Stop the job workers with the app (running and queued jobs are abandoned)
+    router.add_event_handler("shutdown", job_queue.close)
 
     @router.post("/execute", response_model=ExecuteResponse)  # type: ignore[misc]
     async def execute_workflow(request: ExecuteRequest) -> ExecuteResponse:
@@ -141,6 +219,63 @@ def create_workflow_router(
                 detail=f"Workflow execution failed: {e}",
             ) from e
 
+    @router.post("/jobs", response_model=JobResponse, status_code=202)  # type: ignore[misc]
+    async def submit_job(request: ExecuteRequest) -> JobResponse:
+        """Queue a workflow run and return immediately.
+
+        Args:
+            request: Execution request with variables
+
+        Returns:
+            Session ID and event stream URL of the queued job
+
+        Raises:
+            HTTPException: 503 with Retry-After if the job queue is full
+        """
+        try:
+            job = job_queue.submit(request.variables)
+        except JobQueueFullError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)},
+            ) from None
+
+        return JobResponse(
+            session_id=job.session_id,
+            status=job.status,
+            events_url=f"{router.prefix}/sessions/{job.session_id}/events",
+        )
+
+    @router.get("/sessions/{session_id}/events")  # type: ignore[misc]
+    async def session_events(session_id: str) -> StreamingResponse:
+        """Stream a submitted job's progress as Server-Sent Events.
+
+        Past events are replayed first; the stream ends with a ``job_complete``
+        event carrying the final status and last response.
+
+        Args:
+            session_id: Session ID returned by POST /jobs
+
+        Returns:
+            text/event-stream response
+
+        Raises:
+            HTTPException: If no job with this session ID is known
+        """
+        job = job_queue.get(session_id)
+        if job is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No job found for session: {session_id}",
+            )
+
+        return StreamingResponse(
+            _stream_job_events(job),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @router.get("/sessions", response_model=list[SessionInfo])  # type: ignore[misc]
     async def list_sessions(
         offset: int = Query(0, ge=0, description="Pagination offset"),
@@ -208,10 +343,21 @@ def create_workflow_router(
         Raises:
             HTTPException: If session not found
         """
+        job = job_queue.get(session_id)
         try:
             session = await session_manager.get(session_id)
 
             if session is None:
+                if job is not None:
+                    # Queued jobs have no session on disk yet
+                    return SessionInfo(
+                        session_id=session_id,
+                        workflow_name=workflow.spec.name,
+                        status=job.status,
+                        created_at=job.submitted_at,
+                        updated_at=job.submitted_at,
+                        variables=job.variables,
+                    )
                 raise HTTPException(
                     status_code=404,
                     detail=f"Session not found: {session_id}",
@@ -224,7 +370,8 @@ def create_workflow_router(
                 created_at=session.metadata.created_at,
                 updated_at=session.metadata.updated_at,
                 variables=session.variables,
-                last_response=None,  # TODO: Design how to expose last_response
+                # TODO: Design how to expose last_response for non-job sessions
+                last_response=job.last_response if job else None,
             )
 
         except FileNotFoundError:
@@ -275,6 +422,16 @@ def create_workflow_router(
                 detail=f"Failed to resume session: {e}",
             ) from e
 
+    @router.get("/metrics", response_class=PlainTextResponse)  # type: ignore[misc]
+    async def metrics() -> PlainTextResponse:
+        """Expose runtime metrics for Prometheus scraping.
+
+        Returns:
+            Throughput, latency, token, cache and retry metrics in the Prometheus
+            text exposition format
+        """
+        return PlainTextResponse(get_metrics().render_prometheus(), media_type=METRICS_CONTENT_TYPE)
+
     @router.delete("/sessions/{session_id}", status_code=204)  # type: ignore[misc]
     async def delete_session(session_id: str) -> None:
         """Delete session.
@@ -0,0 +1,264 @@
+"""Bounded job queue for asynchronous workflow execution.
+
+Backs the job-submission mode of the FastAPI router: a submitted job gets a
+session ID immediately and waits in a bounded queue until one of a fixed
+number of workers runs it. Submissions beyond the queue bound are rejected
+(admission control) instead of piling up behind long-running workflows.
+
+Each worker owns its own WorkflowExecutor, so concurrent jobs never share an
+event bus or agent cache. Job progress comes from
+``WorkflowExecutor.stream_async`` and is kept per job so late subscribers
+(e.g. an SSE client connecting after submission) replay what they missed.
+
+Example:
+    >>> queue = WorkflowJobQueue(workflow, max_workers=4, max_queued=100)
+    >>> job = queue.submit({"topic": "AI"})
+    >>> async for event, data in job.events():
+    ...     print(event, data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from strands_cli.api import Workflow
+from strands_cli.api.execution import WorkflowExecutor
+from strands_cli.exit_codes import EX_HITL_PAUSE
+from strands_cli.session.repository import SessionRepository
+from strands_cli.session.utils import generate_session_id, now_iso8601
+from strands_cli.telemetry.metrics import get_metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_QUEUED = 100
+DEFAULT_RETAIN_FINISHED = 1000
+
+# Event published when a job reaches a terminal status
+JOB_COMPLETE_EVENT = "job_complete"
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """A queued or running workflow job and its event history."""
+
+    session_id: str
+    variables: dict[str, Any]
+    submitted_at: str
+    status: str = "queued"  # queued, running, completed, failed, paused
+    last_response: str | None = None
+    error: str | None = None
+    duration_seconds: float | None = None
+    history: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    _subscribers: list[asyncio.Queue[tuple[str, dict[str, Any]]]] = field(
+        default_factory=list, repr=False
+    )
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a terminal status."""
+        return self.status in ("completed", "failed", "paused")
+
+    def publish(self, event: str, data: dict[str, Any]) -> None:
+        """Record an event and deliver it to current subscribers."""
+        self.history.append((event, data))
+        for subscriber in self._subscribers:
+            subscriber.put_nowait((event, data))
+
+    async def events(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Replay past events, then follow live ones until the job finishes.
+
+        Yields:
+            (event name, event data) tuples; the last one is JOB_COMPLETE_EVENT
+        """
+        subscriber: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        replay = list(self.history)
+        if not self.done:
+            self._subscribers.append(subscriber)
+        try:
+            for item in replay:
+                yield item
+                if item[0] == JOB_COMPLETE_EVENT:
+                    return
+            while True:
+                item = await subscriber.get()
+                yield item
+                if item[0] == JOB_COMPLETE_EVENT:
+                    return
+        finally:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+
+class WorkflowJobQueue:
+    """Runs submitted workflow jobs on a bounded pool of workers."""
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        retain_finished: int = DEFAULT_RETAIN_FINISHED,
+        session_repo: SessionRepository | None = None,
+    ) -> None:
+        """Initialize the queue; workers start on the first submission.
+
+        Args:
+            workflow: Workflow whose spec every job runs
+            max_workers: Jobs that may run concurrently
+            max_queued: Jobs that may wait for a worker before submissions are rejected
+            retain_finished: Finished jobs kept for status and event replay
+            session_repo: Repository job sessions are saved to (default: the
+                user's session store)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_queued < 1:
+            # asyncio.Queue(maxsize=0) would be unbounded
+            raise ValueError(f"max_queued must be >= 1, got {max_queued}")
+        self.workflow = workflow
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.retain_finished = retain_finished
+        self.session_repo = session_repo
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: asyncio.Queue[Job] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue else 0
+
+    def get(self, session_id: str) -> Job | None:
+        """Return a known job by session ID."""
+        return self._jobs.get(session_id)
+
+    def submit(self, variables: dict[str, Any]) -> Job:
+        """Queue a job and return it immediately.
+
+        Must be called from a running event loop.
+
+        Args:
+            variables: Runtime variable overrides for the run
+
+        Returns:
+            The queued job (its session_id identifies the session it will run in)
+
+        Raises:
+            JobQueueFullError: If max_queued jobs are already waiting
+        """
+        queue = self._ensure_workers()
+        job = Job(
+            session_id=generate_session_id(),
+            variables=variables,
+            submitted_at=now_iso8601(),
+        )
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            get_metrics().inc("strands_jobs_rejected_total")
+            raise JobQueueFullError(
+                f"Job queue is full ({self.max_queued} jobs waiting); retry later"
+            ) from None
+
+        self._jobs[job.session_id] = job
+        get_metrics().inc("strands_job_queue_depth")
+        job.publish("job_queued", {"session_id": job.session_id})
+        logger.info("job_queued", session_id=job.session_id, queued=queue.qsize())
+        return job
+
+    def _ensure_workers(self) -> asyncio.Queue[Job]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queued)
+            self._workers = [
+                loop.create_task(self._worker(self._queue), name=f"workflow-job-worker-{i}")
+                for i in range(self.max_workers)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue[Job]) -> None:
+        shared = self.workflow.async_executor()
+        executor = WorkflowExecutor(
+            shared.spec,
+            output_dir=shared.output_dir,
+            force_overwrite=shared.force_overwrite,
+            session_repo=self.session_repo,
+        )
+        while True:
+            job = await queue.get()
+            get_metrics().dec("strands_job_queue_depth")
+            try:
+                await self._run(executor, job)
+            finally:
+                queue.task_done()
+                self._forget_finished()
+
+    async def _run(self, executor: WorkflowExecutor, job: Job) -> None:
+        job.status = "running"
+        job.publish("job_started", {"session_id": job.session_id})
+        executor.last_result = None
+        try:
+            async with executor:
+                async for chunk in executor.stream_async(job.variables, job.session_id):
+                    job.publish(
+                        chunk.chunk_type,
+                        {**chunk.data, "timestamp": chunk.timestamp.isoformat()},
+                    )
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.warning("job_failed", session_id=job.session_id, error=str(e))
+        else:
+            result = executor.last_result
+            if result is not None:
+                job.last_response = result.last_response
+                job.error = result.error
+                job.duration_seconds = result.duration_seconds
+                if result.agent_id == "hitl" and result.exit_code == EX_HITL_PAUSE:
+                    job.status = "paused"
+                else:
+                    job.status = "completed" if result.success else "failed"
+            else:
+                job.status = "completed"
+        job.publish(
+            JOB_COMPLETE_EVENT,
+            {
+                "session_id": job.session_id,
+                "status": job.status,
+                "last_response": job.last_response,
+                "error": job.error,
+                "duration_seconds": job.duration_seconds,
+            },
+        )
+        logger.info("job_finished", session_id=job.session_id, status=job.status)
+
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished jobs beyond retain_finished."""
+        finished = [session_id for session_id, job in self._jobs.items() if job.done]
+        for session_id in finished[: max(len(finished) - self.retain_finished, 0)]:
+            del self._jobs[session_id]
+
+    async def close(self) -> None:
+        """Cancel the workers; queued jobs are abandoned."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+        self._queue = None
@@ -30,6 +30,8 @@ import structlog
 from jinja2 import BaseLoader, StrictUndefined, TemplateSyntaxError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
+from strands_cli.telemetry.profiler import profile_phase
+
 try:
     from jinja2.sandbox import SecurityError  # type: ignore[attr-defined]
 except ImportError:
@@ -224,8 +226,9 @@ def render_template(
     max_output_chars: int | None = None,
 ) -> str:
     """Render a Jinja2 template with safety controls."""
-    env = _create_sandboxed_environment()
-    return _render_with_environment(env, template_str, variables, max_output_chars)
+    with profile_phase("template.render"):
+        env = _create_sandboxed_environment()
+        return _render_with_environment(env, template_str, variables, max_output_chars)
 
 
 class TemplateRenderer:
@@ -257,4 +260,7 @@ class TemplateRenderer:
         Raises:
             TemplateError: If rendering fails
         """
-        return _render_with_environment(self.env, template_str, variables, self.max_output_chars)
+        with profile_phase("template.render"):
+            return _render_with_environment(
+                self.env, template_str, variables, self.max_output_chars
+            )
@@ -26,6 +26,7 @@ from pydantic import ValidationError as PydanticValidationError
 from ruamel.yaml import YAML
 
 from strands_cli.schema.validator import validate_spec
+from strands_cli.telemetry.profiler import profile_phase
 from strands_cli.types import Spec
 
 logger = structlog.get_logger(__name__)
@@ -222,6 +223,51 @@ def load_spec(file_path: str | Path, variables: dict[str, str] | None = None) ->
 
     _validate_file_path(file_path)
 
+    with profile_phase("spec.parse"):
+        spec_data = _read_and_parse(file_path, variables)
+
+    with profile_phase("spec.validate"):
+        # Validate against JSON Schema
+        validate_spec(spec_data)
+
+        if debug:
+            logger.debug("schema_validation_passed")
+
+        # Convert to typed Pydantic model
+        try:
+            spec = Spec.model_validate(spec_data)
+        except PydanticValidationError as e:
+            raise LoadError(f"Failed to create typed Spec: {e}") from e
+
+    # Attach spec directory for skills path resolution
+    # This is not part of the Pydantic model but needed for runtime context
+    spec._spec_dir = str(file_path.parent)  # type: ignore[attr-defined]
+
+    if debug:
+        logger.debug(
+            "spec_loaded",
+            spec_name=spec.name,
+            spec_version=spec.version,
+            agents=list(spec.agents.keys()),
+            pattern=spec.pattern.type if spec.pattern else None,
+            spec_dir=str(file_path.parent),
+        )
+    return spec
+
+
+def _read_and_parse(file_path: Path, variables: dict[str, str] | None) -> dict[str, Any]:
+    """Read and parse a spec file, resolve references and merge variables.
+
+    Args:
+        file_path: Validated path to the spec file
+        variables: Optional CLI variables to merge into inputs.values
+
+    Returns:
+        Spec data ready for schema validation
+
+    Raises:
+        LoadError: If the file cannot be read or parsed
+    """
     # Read file content
     try:
         content = file_path.read_text(encoding="utf-8")
@@ -230,7 +276,7 @@ def load_spec(file_path: str | Path, variables: dict[str, str] | None = None) ->
 
     spec_data = _parse_file_content(file_path, content)
 
-    if debug:
+    if os.environ.get("STRANDS_DEBUG", "").lower() == "true":
         logger.debug(
             "spec_parsed",
             spec_name=spec_data.get("name", "<unnamed>"),
@@ -249,32 +295,7 @@ def load_spec(file_path: str | Path, variables: dict[str, str] | None = None) ->
     if variables:
         _merge_variables(spec_data, variables)
 
-    # Validate against JSON Schema
-    validate_spec(spec_data)
-
-    if debug:
-        logger.debug("schema_validation_passed")
-
-    # Convert to typed Pydantic model
-    try:
-        spec = Spec.model_validate(spec_data)
-
-        # Attach spec directory for skills path resolution
-        # This is not part of the Pydantic model but needed for runtime context
-        spec._spec_dir = str(file_path.parent)  # type: ignore[attr-defined]
-
-        if debug:
-            logger.debug(
-                "spec_loaded",
-                spec_name=spec.name,
-                spec_version=spec.version,
-                agents=list(spec.agents.keys()),
-                pattern=spec.pattern.type if spec.pattern else None,
-                spec_dir=str(file_path.parent),
-            )
-        return spec
-    except PydanticValidationError as e:
-        raise LoadError(f"Failed to create typed Spec: {e}") from e
+    return spec_data
 
 
 def parse_variables(var_args: list[str]) -> dict[str, str]:
@@ -444,6 +465,7 @@ def _resolve_agent_reference(  # noqa: C901  # Complexity justified for robust r
         "inference",
         "top_p",
         "max_tokens",
+        "cascade",
     }
 
     for key, value in override_fields.items():
@@ -0,0 +1,168 @@
+"""Load driver for capacity planning (``strands loadtest``).
+
+Runs many copies of one workflow concurrently through ``WorkflowExecutor``,
+the entry point shared by the Python API, the daemon and the FastAPI router.
+Every run gets its own ``AgentCache`` and session, so executors, agent
+caching, HITL session checkpoints and the retry/circuit-breaker stack are all
+exercised as they would be by concurrent API jobs.
+
+Pair it with ``provider: simulated`` (see runtime.simulated) to measure the
+framework on one box without provider quotas or cost: latency, throttling and
+error rates come from ``runtime.simulation``, so the report shows how much
+overhead, queueing and retrying the CLI adds at a given concurrency.
+
+Sessions are written to a scratch directory (a temporary one unless given) so
+load runs never clutter ``strands sessions list``.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from strands_cli.api.execution import WorkflowExecutor
+from strands_cli.runtime.strands_adapter import resolve_agent_runtime
+from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import Spec
+
+logger = structlog.get_logger(__name__)
+
+SIMULATED_OUTCOMES = ("ok", "throttled", "error")
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _counters(model_ids: set[str]) -> dict[str, float]:
+    """Snapshot of the process-wide series a load test reports as deltas."""
+    metrics = get_metrics()
+    snapshot = {
+        f"{token_type}_tokens": sum(
+            metrics.value("strands_tokens_total", model=model_id, type=token_type)
+            for model_id in model_ids
+        )
+        for token_type in ("input", "output")
+    }
+    snapshot |= {
+        "retries": metrics.value("strands_agent_retries_total"),
+        "session_saves": float(
+            metrics.histogram_count("strands_session_operation_duration_seconds", operation="save")
+        ),
+    }
+    for outcome in SIMULATED_OUTCOMES:
+        snapshot[f"simulated_{outcome}"] = metrics.value(
+            "strands_simulated_calls_total", outcome=outcome
+        )
+    return snapshot
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of a load test."""
+
+    runs: int
+    concurrency: int
+    succeeded: int = 0
+    failed: int = 0
+    wall_seconds: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+    counters: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Completed runs per second."""
+        return self.runs / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary suitable for JSON output."""
+        return {
+            "runs": self.runs,
+            "concurrency": self.concurrency,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_per_second": round(self.throughput, 3),
+            "latency_seconds": {
+                "p50": round(_percentile(self.latencies, 0.50), 3),
+                "p90": round(_percentile(self.latencies, 0.90), 3),
+                "p99": round(_percentile(self.latencies, 0.99), 3),
+                "max": round(max(self.latencies, default=0.0), 3),
+            },
+            "errors": dict(self.errors),
+            "counters": {name: int(value) for name, value in self.counters.items()},
+        }
+
+
+async def run_load_test(
+    spec: Spec,
+    runs: int,
+    concurrency: int,
+    variables: dict[str, Any] | None = None,
+    session_dir: Path | None = None,
+) -> LoadTestReport:
+    """Run a workflow ``runs`` times with at most ``concurrency`` runs in flight.
+
+    Args:
+        spec: Workflow spec (typically with ``provider: simulated``)
+        runs: Total number of workflow runs
+        concurrency: Maximum concurrent runs
+        variables: Variables passed to every run
+        session_dir: Directory for run sessions (default: temporary, removed afterwards)
+
+    Returns:
+        Report with throughput, latency percentiles, errors and counter deltas
+    """
+    report = LoadTestReport(runs=runs, concurrency=concurrency)
+    scratch = None if session_dir else Path(tempfile.mkdtemp(prefix="strands-loadtest-"))
+    repo = FileSessionRepository(storage_dir=session_dir or scratch)
+    semaphore = asyncio.Semaphore(concurrency)
+    model_ids = {
+        resolve_agent_runtime(spec, agent).model_id or "unknown" for agent in spec.agents.values()
+    }
+    before = _counters(model_ids)
+
+    async def _one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                async with WorkflowExecutor(spec, session_repo=repo) as executor:
+                    result = await executor.run(dict(variables or {}))
+            except Exception as e:
+                report.failed += 1
+                report.errors[type(e).__name__] += 1
+                logger.debug("loadtest_run_failed", run=index, error=str(e))
+                return
+            finally:
+                report.latencies.append(time.perf_counter() - started)
+            if result.success:
+                report.succeeded += 1
+            else:
+                report.failed += 1
+                report.errors[(result.error or "unknown error").split(":")[0]] += 1
+
+    wall_started = time.perf_counter()
+    try:
+        await asyncio.gather(*(_one(index) for index in range(runs)))
+    finally:
+        report.wall_seconds = time.perf_counter() - wall_started
+        if scratch is not None:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    after = _counters(model_ids)
+    report.counters = {name: after[name] - before[name] for name in after}
+    logger.info("loadtest_complete", **report.to_dict())
+    return report
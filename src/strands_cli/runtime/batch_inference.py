@@ -0,0 +1,342 @@
+"""Offline batch inference for large, tool-free fan-outs.
+
+Orchestrator worker rounds and parallel branches can fan out to hundreds of
+independent agent calls that compete for the same live-request quota.
+Providers offer discounted asynchronous batch APIs for exactly this shape of
+work. With ``runtime.batch`` set, executors pack eligible calls into one batch
+job, poll until it finishes and map the answers back into their results:
+
+    1. ``batch_eligible`` decides whether an agent's calls can be batched: the
+       provider has a batch API (OpenAI, including OpenAI-compatible servers via
+       ``runtime.host``), the agent has no tools (a batch request is a single
+       model turn), and no model cascade is configured.
+    2. ``run_batch`` uploads the requests as JSONL, creates the batch job and
+       polls it every ``poll_interval_s`` until it reaches a terminal status or
+       ``timeout_s`` passes.
+    3. Requests the job did not answer come back as failed ``BatchResult``s so
+       the executor can run them live.
+
+The batch ID is recorded in ``session_state.pattern_state["batch_jobs"]`` and
+checkpointed right after submission, so a resumed session re-attaches to the
+running job instead of paying for it twice. Turnaround (submission to results)
+is logged and recorded in the ``strands_batch_turnaround_seconds`` histogram.
+
+Bedrock batch inference needs S3 staging and an IAM service role, so Bedrock
+runtimes fall back to live requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from strands_cli.runtime.providers import ProviderError
+from strands_cli.runtime.strands_adapter import build_system_prompt, resolve_agent_runtime
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import ProviderType, Runtime, Spec
+
+logger = structlog.get_logger(__name__)
+
+# Provider batch job statuses after which polling stops
+TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+
+class BatchJobError(Exception):
+    """Raised when a batch job cannot be submitted or does not finish."""
+
+
+@dataclass
+class BatchRequest:
+    """One agent call packed into a batch job."""
+
+    custom_id: str
+    system_prompt: str
+    prompt: str
+
+
+@dataclass
+class BatchResult:
+    """Answer (or error) for one batched request."""
+
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+    total_tokens: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request produced an answer."""
+        return self.text is not None
+
+
+class OpenAIBatchClient:
+    """OpenAI Batch API client (also works with OpenAI-compatible servers)."""
+
+    provider = "openai"
+
+    def __init__(self, runtime: Runtime) -> None:
+        """Initialize the client from the agent's effective runtime.
+
+        Args:
+            runtime: Runtime with provider=openai (host is used as the base URL)
+
+        Raises:
+            ProviderError: If OPENAI_API_KEY is not set
+        """
+        from openai import AsyncOpenAI
+
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ProviderError("OpenAI batch inference requires OPENAI_API_KEY")
+        self.runtime = runtime
+        self.model_id = runtime.model_id or "gpt-4o-mini"
+        self._client = AsyncOpenAI(api_key=api_key, base_url=runtime.host)
+
+    def _body(self, request: BatchRequest) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            "model": self.model_id,
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.prompt},
+            ],
+        }
+        for param in ("temperature", "top_p", "max_tokens"):
+            value = getattr(self.runtime, param)
+            if value is not None:
+                body[param] = value
+        return body
+
+    async def submit(self, requests: list[BatchRequest], completion_window: str) -> str:
+        """Upload the requests and create the batch job.
+
+        Returns:
+            Provider batch ID
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_ENDPOINT,
+                    "body": self._body(request),
+                }
+            )
+            for request in requests
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = await self._client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window=completion_window,  # type: ignore[arg-type]
+        )
+        return batch.id
+
+    async def status(self, batch_id: str) -> tuple[str, list[str]]:
+        """Current status and the IDs of output/error files available so far."""
+        batch = await self._client.batches.retrieve(batch_id)
+        files = [file_id for file_id in (batch.output_file_id, batch.error_file_id) if file_id]
+        return batch.status, files
+
+    async def results(self, file_ids: list[str]) -> dict[str, BatchResult]:
+        """Download and parse output and error files."""
+        results: dict[str, BatchResult] = {}
+        for file_id in file_ids:
+            content = await self._client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    result = _parse_output_line(json.loads(line))
+                    # An answer wins over an error line for the same request
+                    if result.ok or result.custom_id not in results:
+                        results[result.custom_id] = result
+        return results
+
+
+def _parse_output_line(record: dict[str, Any]) -> BatchResult:
+    """Parse one line of an OpenAI batch output or error file."""
+    custom_id = str(record.get("custom_id"))
+    response = record.get("response") or {}
+    body = response.get("body") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        error = record.get("error") or body.get("error") or {}
+        message = error.get("message") if isinstance(error, dict) else str(error)
+        return BatchResult(custom_id, error=message or f"HTTP {response.get('status_code')}")
+    try:
+        text = body["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return BatchResult(custom_id, error="Batch response has no message content")
+    usage = body.get("usage") or {}
+    return BatchResult(custom_id, text=text or "", total_tokens=usage.get("total_tokens"))
+
+
+def batch_eligible(spec: Spec, agent_id: str, tool_overrides: list[str] | None = None) -> bool:
+    """Whether an agent's calls can be sent as batch requests.
+
+    Args:
+        spec: Workflow spec (runtime.batch must be set)
+        agent_id: Agent making the calls
+        tool_overrides: Step or worker tool overrides (None uses the agent's tools)
+
+    Returns:
+        True if batching is enabled and the agent is a tool-free OpenAI agent
+        without a model cascade
+    """
+    if spec.runtime.batch is None or spec.runtime.provider != ProviderType.OPENAI:
+        return False
+    agent_config = spec.agents[agent_id]
+    tools = tool_overrides if tool_overrides is not None else agent_config.tools
+    retrieval = spec.context_policy.retrieval if spec.context_policy else None
+    cascade = agent_config.cascade or spec.runtime.cascade
+    return (
+        not tools
+        and not (retrieval and retrieval.jit_tools)
+        and not spec.skills
+        and not (cascade and cascade.models)
+    )
+
+
+def build_batch_requests(
+    spec: Spec,
+    agent_id: str,
+    prompts: dict[str, str],
+    injected_notes: str | None = None,
+) -> list[BatchRequest]:
+    """Build batch requests for one agent.
+
+    Args:
+        spec: Workflow spec
+        agent_id: Agent answering every prompt
+        prompts: custom_id -> user prompt
+        injected_notes: Notes injected into the system prompt, as for live calls
+
+    Returns:
+        Requests in prompt order
+    """
+    system_prompt = build_system_prompt(spec.agents[agent_id], spec, agent_id, injected_notes)
+    return [BatchRequest(custom_id, system_prompt, prompt) for custom_id, prompt in prompts.items()]
+
+
+def _job_key(agent_id: str, requests: list[BatchRequest]) -> str:
+    """Stable key for a set of requests (identifies the job across resumes)."""
+    digest = hashlib.sha256()
+    for request in requests:
+        digest.update(f"{request.custom_id}\0{request.system_prompt}\0{request.prompt}\0".encode())
+    return f"{agent_id}:{digest.hexdigest()[:16]}"
+
+
+async def run_batch(
+    spec: Spec,
+    agent_id: str,
+    requests: list[BatchRequest],
+    session_state: Any | None = None,
+    checkpoint: Callable[[], Awaitable[None]] | None = None,
+    client: OpenAIBatchClient | None = None,
+) -> dict[str, BatchResult]:
+    """Submit requests as one batch job and wait for the answers.
+
+    Args:
+        spec: Workflow spec (runtime.batch configures polling)
+        agent_id: Agent answering the requests (its model and inference settings are used)
+        requests: Requests to batch
+        session_state: Session whose pattern_state records the running job (resume)
+        checkpoint: Saves the session after the job ID is recorded
+        client: Batch client (default: built from the agent's runtime)
+
+    Returns:
+        custom_id -> BatchResult for every request; unanswered requests carry an error
+
+    Raises:
+        BatchJobError: If the job cannot be submitted, fails as a whole or times out
+    """
+    config = spec.runtime.batch
+    if config is None:
+        raise BatchJobError("runtime.batch is not configured")
+    if client is None:
+        try:
+            client = OpenAIBatchClient(resolve_agent_runtime(spec, spec.agents[agent_id]))
+        except ProviderError as e:
+            raise BatchJobError(str(e)) from e
+
+    jobs: dict[str, str] = {}
+    if session_state is not None:
+        jobs = session_state.pattern_state.setdefault("batch_jobs", {})
+    key = _job_key(agent_id, requests)
+    started = time.monotonic()
+
+    batch_id = jobs.get(key)
+    if batch_id:
+        logger.info("batch_job_reattached", agent=agent_id, batch_id=batch_id)
+    else:
+        try:
+            batch_id = await client.submit(requests, config.completion_window)
+        except Exception as e:
+            raise BatchJobError(f"Failed to submit batch job for '{agent_id}': {e}") from e
+        jobs[key] = batch_id
+        logger.info(
+            "batch_job_submitted", agent=agent_id, batch_id=batch_id, requests=len(requests)
+        )
+        if checkpoint is not None:
+            await checkpoint()
+
+    deadline = started + config.timeout_s
+    while True:
+        try:
+            status, files = await client.status(batch_id)
+        except Exception as e:
+            raise BatchJobError(f"Failed to poll batch job {batch_id}: {e}") from e
+        if status in TERMINAL_STATUSES:
+            break
+        if time.monotonic() >= deadline:
+            raise BatchJobError(
+                f"Batch job {batch_id} did not finish within {config.timeout_s}s (status: {status})"
+            )
+        await asyncio.sleep(config.poll_interval_s)
+
+    if status == "failed" and not files:
+        jobs.pop(key, None)
+        raise BatchJobError(f"Batch job {batch_id} failed")
+
+    try:
+        answered = await client.results(files)
+    except Exception as e:
+        raise BatchJobError(f"Failed to download results of batch job {batch_id}: {e}") from e
+    jobs.pop(key, None)
+
+    results = {
+        request.custom_id: answered.get(request.custom_id)
+        or BatchResult(request.custom_id, error=f"No result in batch job ({status})")
+        for request in requests
+    }
+    turnaround = time.monotonic() - started
+    succeeded = sum(1 for result in results.values() if result.ok)
+    metrics = get_metrics()
+    metrics.observe("strands_batch_turnaround_seconds", turnaround, provider=client.provider)
+    metrics.inc(
+        "strands_batch_requests_total", succeeded, provider=client.provider, status="succeeded"
+    )
+    metrics.inc(
+        "strands_batch_requests_total",
+        len(results) - succeeded,
+        provider=client.provider,
+        status="failed",
+    )
+    logger.info(
+        "batch_job_completed",
+        agent=agent_id,
+        batch_id=batch_id,
+        status=status,
+        requests=len(requests),
+        succeeded=succeeded,
+        turnaround_seconds=round(turnaround, 3),
+    )
+    return results
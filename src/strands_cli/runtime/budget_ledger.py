@@ -0,0 +1,359 @@
+"""Run-wide token budget ledger shared by concurrent agents.
+
+BudgetEnforcerHook and the executors' own budget checks look at usage only
+after an invocation finishes, and parallel branches, workers and graph nodes
+add to the total independently. A fan-out can therefore overshoot
+``budgets.max_tokens`` by the width of the batch before any check fires.
+
+The ledger is one object per run (see ``with_budget_ledger``) that every agent
+invocation goes through (``invoke_agent_with_retry``):
+
+    1. Before the call, the invocation reserves its estimated tokens. If the
+       tokens spent plus everything reserved by in-flight siblings plus the
+       estimate would exceed the budget, the call is refused up front with
+       BudgetExceededError.
+    2. After the call, the reservation is replaced by the actual usage.
+    3. Once actual spend reaches the hard limit, the ledger is exhausted: the
+       invocation that crossed the limit raises BudgetExceededError, in-flight
+       siblings are cancelled and surface BudgetExceededError too (not a bare
+       CancelledError), and later reservations are refused.
+
+Estimates are deliberately cheap (about 4 characters per token for the system
+prompt, history and input, plus ``runtime.max_tokens`` as the output
+allowance when configured), so spend tracks the budget closely at any
+concurrency without tokenizing every call.
+
+Example:
+    @with_budget_ledger
+    async def run_parallel(spec, variables=None, session_state=None, ...):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from strands_cli.runtime.budget_enforcer import BudgetExceededError
+from strands_cli.session.checkpoint_utils import get_cumulative_tokens
+from strands_cli.types import Spec
+
+logger = structlog.get_logger(__name__)
+
+# Rough characters-per-token ratio for reservation estimates
+CHARS_PER_TOKEN = 4
+
+
+@dataclass(eq=False)
+class Reservation:
+    """Tokens held for one in-flight invocation."""
+
+    label: str
+    tokens: int
+    task: asyncio.Task[Any] | None
+    cancelled_by_budget: bool = False
+    response: Any = field(default=None, repr=False)
+
+
+class TokenBudgetLedger:
+    """Tracks spent and reserved tokens against one run's budget."""
+
+    def __init__(
+        self,
+        max_tokens: int,
+        warn_threshold: float = 0.8,
+        spent: int = 0,
+        output_allowance: int = 0,
+    ) -> None:
+        """Initialize the ledger.
+
+        Args:
+            max_tokens: Hard token limit for the run (budgets.max_tokens)
+            warn_threshold: Fraction of the budget at which a warning is logged
+            spent: Tokens already used (e.g. by the session being resumed)
+            output_allowance: Tokens reserved per call for the response
+        """
+        self.max_tokens = max_tokens
+        self.output_allowance = output_allowance
+        self.warn_tokens = int(max_tokens * warn_threshold)
+        self.spent = spent
+        self.reserved = 0
+        self.exhausted = spent >= max_tokens
+        self._warned = False
+        self._in_flight: list[Reservation] = []
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int, label: str) -> Reservation:
+        """Reserve estimated tokens for a call about to start.
+
+        Args:
+            tokens: Estimated tokens the call will use
+            label: Agent or step name for diagnostics
+
+        Returns:
+            Reservation to settle with commit() or release()
+
+        Raises:
+            BudgetExceededError: If the budget is exhausted or the call would exceed it
+        """
+        with self._lock:
+            committed = self.spent + self.reserved
+            if self.exhausted or committed + tokens > self.max_tokens:
+                logger.warning(
+                    "token_budget_reservation_refused",
+                    agent=label,
+                    estimated_tokens=tokens,
+                    spent=self.spent,
+                    reserved=self.reserved,
+                    max_tokens=self.max_tokens,
+                )
+                raise BudgetExceededError(
+                    f"Token budget would be exceeded by '{label}': {self.spent} spent + "
+                    f"{self.reserved} reserved + ~{tokens} estimated > {self.max_tokens} tokens. "
+                    "Call cancelled before it started.",
+                    cumulative_tokens=self.spent,
+                    max_tokens=self.max_tokens,
+                )
+            reservation = Reservation(label, tokens, _current_task())
+            self.reserved += tokens
+            self._in_flight.append(reservation)
+            return reservation
+
+    def release(self, reservation: Reservation, spent_tokens: int = 0) -> None:
+        """Drop a reservation of a call that failed or was cancelled.
+
+        Args:
+            reservation: Reservation taken before the call
+            spent_tokens: Usage the failed call is known to have incurred
+        """
+        with self._lock:
+            self._settle(reservation)
+            self.spent += spent_tokens
+
+    def commit(self, reservation: Reservation, actual_tokens: int) -> None:
+        """Replace a reservation with the call's actual usage.
+
+        Args:
+            reservation: Reservation taken before the call
+            actual_tokens: Tokens the call used
+
+        Raises:
+            BudgetExceededError: If this call brought spend to the hard limit; in-flight
+                siblings are cancelled
+        """
+        with self._lock:
+            self._settle(reservation)
+            self.spent += actual_tokens
+            if self.spent >= self.warn_tokens and not self._warned:
+                self._warned = True
+                logger.warning(
+                    "token_budget_warning",
+                    cumulative_tokens=self.spent,
+                    max_tokens=self.max_tokens,
+                    remaining_tokens=max(self.max_tokens - self.spent, 0),
+                )
+            if self.spent < self.max_tokens:
+                return
+            newly_exhausted = not self.exhausted
+            self.exhausted = True
+            siblings = list(self._in_flight) if newly_exhausted else []
+
+        if newly_exhausted:
+            self._cancel_in_flight(siblings, reservation.label)
+        raise BudgetExceededError(
+            f"Token budget exhausted: {self.spent}/{self.max_tokens} tokens used (100%). "
+            "Workflow aborted to prevent cost overrun.",
+            cumulative_tokens=self.spent,
+            max_tokens=self.max_tokens,
+        )
+
+    def _settle(self, reservation: Reservation) -> None:
+        """Remove a reservation from the in-flight set (caller holds the lock)."""
+        if reservation in self._in_flight:
+            self._in_flight.remove(reservation)
+            self.reserved -= reservation.tokens
+
+    def _cancel_in_flight(self, siblings: list[Reservation], tripped_by: str) -> None:
+        current = _current_task()
+        cancelled = 0
+        for sibling in siblings:
+            task = sibling.task
+            if task is None or task is current or task.done():
+                continue
+            sibling.cancelled_by_budget = True
+            task.cancel(msg="token budget exhausted")
+            cancelled += 1
+        logger.error(
+            "token_budget_exceeded",
+            cumulative_tokens=self.spent,
+            max_tokens=self.max_tokens,
+            tripped_by=tripped_by,
+            cancelled_in_flight=cancelled,
+        )
+
+    def budget_error(self, reservation: Reservation) -> BudgetExceededError:
+        """Error raised in place of the CancelledError of a cancelled sibling."""
+        return BudgetExceededError(
+            f"Token budget exhausted ({self.spent}/{self.max_tokens} tokens) while "
+            f"'{reservation.label}' was running; call cancelled.",
+            cumulative_tokens=self.spent,
+            max_tokens=self.max_tokens,
+        )
+
+
+def _current_task() -> asyncio.Task[Any] | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+_active: ContextVar[TokenBudgetLedger | None] = ContextVar("strands_budget_ledger", default=None)
+
+
+def get_budget_ledger() -> TokenBudgetLedger | None:
+    """Return the ledger of the current run, or None if it has no token budget."""
+    return _active.get()
+
+
+@contextmanager
+def budget_ledger_scope(spec: Spec, spent: int = 0) -> Iterator[TokenBudgetLedger | None]:
+    """Activate a ledger for the spec's token budget for the enclosed run.
+
+    Reuses the active ledger when one is already set, so nested executors share
+    the outer run's budget.
+
+    Args:
+        spec: Workflow spec (budgets.max_tokens, warn_threshold and runtime.max_tokens
+            are read)
+        spent: Tokens already used by the run (resume)
+
+    Yields:
+        The active ledger, or None if the spec has no token budget
+    """
+    active = _active.get()
+    runtime = getattr(spec, "runtime", None)
+    budgets = (runtime.budgets if runtime is not None else None) or {}
+    max_tokens = budgets.get("max_tokens")
+    if active is not None or not max_tokens:
+        yield active
+        return
+    ledger = TokenBudgetLedger(
+        max_tokens,
+        warn_threshold=budgets.get("warn_threshold", 0.8),
+        spent=spent,
+        output_allowance=spec.runtime.max_tokens or 0,
+    )
+    token = _active.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _active.reset(token)
+
+
+def with_budget_ledger[**P, R](func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Run an executor entry point (``run_*(spec, ..., session_state, ...)``) under a ledger.
+
+    Tokens already recorded in ``session_state`` (resume) count as spent.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        arguments = signature.bind_partial(*args, **kwargs).arguments
+        spent = get_cumulative_tokens(arguments.get("session_state"))
+        with budget_ledger_scope(arguments["spec"], spent=spent):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _usage_total(agent: Any) -> int | None:
+    """Provider-reported total tokens of the agent so far, if available."""
+    metrics = getattr(agent, "event_loop_metrics", None)
+    usage = getattr(metrics, "accumulated_usage", None)
+    total = usage.get("totalTokens") if isinstance(usage, dict) else None
+    return total if isinstance(total, int) else None
+
+
+@contextmanager
+def budget_reservation(agent: Any, input_text: str) -> Iterator[Reservation]:
+    """Hold the current run's budget for one agent invocation.
+
+    Set ``reservation.response`` to the invocation's result before leaving the
+    block; usage is taken from the agent's metrics, or estimated from the
+    response when the provider reports none.
+
+    Args:
+        agent: Agent about to be invoked
+        input_text: Input for the invocation
+
+    Yields:
+        The reservation (untracked when the run has no token budget)
+
+    Raises:
+        BudgetExceededError: If the call would exceed the budget, pushed spend to the
+            limit, or was cancelled because a sibling did
+    """
+    ledger = _active.get()
+    if ledger is None:
+        yield Reservation(str(getattr(agent, "name", "unknown")), 0, None)
+        return
+
+    estimate = estimate_invocation_tokens(agent, input_text, ledger.output_allowance)
+    reservation = ledger.reserve(estimate, str(getattr(agent, "name", "unknown")))
+    usage_before = _usage_total(agent)
+
+    def used() -> int:
+        usage_after = _usage_total(agent)
+        if usage_before is not None and usage_after is not None and usage_after >= usage_before:
+            return usage_after - usage_before
+        if reservation.response is None:
+            return 0
+        output = len(str(reservation.response)) // CHARS_PER_TOKEN
+        return estimate - ledger.output_allowance + output
+
+    try:
+        yield reservation
+    except asyncio.CancelledError:
+        ledger.release(reservation, spent_tokens=used())
+        task = _current_task()
+        if not reservation.cancelled_by_budget or task is None:
+            raise
+        # Surface the budget, not a bare cancellation, to the executor
+        task.uncancel()
+        raise ledger.budget_error(reservation) from None
+    except BaseException:
+        ledger.release(reservation, spent_tokens=used())
+        raise
+    ledger.commit(reservation, used())
+
+
+def estimate_invocation_tokens(agent: Any, input_text: str, output_allowance: int = 0) -> int:
+    """Cheap token estimate for one agent invocation.
+
+    Args:
+        agent: Agent about to be invoked (system prompt and history are counted)
+        input_text: New user input
+        output_allowance: Tokens to hold for the response (e.g. runtime.max_tokens)
+
+    Returns:
+        Estimated tokens (at least 1)
+    """
+    chars = len(input_text)
+    system_prompt = getattr(agent, "system_prompt", None)
+    if isinstance(system_prompt, str):
+        chars += len(system_prompt)
+    messages = getattr(agent, "messages", None)
+    if isinstance(messages, list):
+        chars += sum(len(str(message)) for message in messages)
+    return max(chars // CHARS_PER_TOKEN, 1) + output_allowance
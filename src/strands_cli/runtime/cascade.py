@@ -0,0 +1,418 @@
+"""Model cascades: answer with a cheaper model first, escalate only when needed.
+
+Routing, evaluation and many worker subtasks are usually fine on a small fast
+model. A cascade (``runtime.cascade`` or per-agent ``cascade``) lists cheaper
+model IDs of the same provider that are tried, in order, before the agent's
+own model. Each tier's output is checked by an acceptor:
+
+    - schema: the output is JSON that validates against the agent's output_schema
+    - evaluator: an evaluator agent scores the output at or above min_score
+    - confidence: a confidence marker in the output is at or above min_confidence
+
+The first accepted output is returned. A rejected (or failed) tier's exchange
+is dropped from the agent's history and the call escalates to the next tier,
+ending with the agent's own model, whose answer is always used. Session
+persistence is paused while tiers are tried, so a resumed session only ever
+replays the accepted exchange.
+
+Cascades are built with the agent (``build_agent``) and applied by
+``invoke_agent_with_retry``, so they work in every pattern executor. Outcomes
+are counted per tier in ``strands_cascade_calls_total{agent,model,outcome}``
+(outcome: accepted, escalated, error, or final for the agent's own model),
+from which per-tier hit rates follow.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import weakref
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import structlog
+from jsonschema import Draft202012Validator
+from strands.session import SessionManager
+
+from strands_cli.runtime.providers import create_model
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import Agent as AgentConfig
+from strands_cli.types import Cascade, CascadeAccept, EvaluatorDecision, Runtime, Spec
+
+logger = structlog.get_logger(__name__)
+
+EVALUATOR_PROMPT = (
+    "Rate how well the response below completes the task.\n\n"
+    "Task:\n{task}\n\nResponse:\n{response}\n\n"
+    'Reply with JSON only: {{"score": <0-100>, "issues": [...]}}'
+)
+
+
+class CascadeConfigError(Exception):
+    """Raised when a cascade's acceptor cannot be configured."""
+
+
+class SchemaAcceptor:
+    """Accepts outputs that are JSON valid against a schema."""
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        """Initialize the acceptor.
+
+        Args:
+            schema: JSON Schema the output must satisfy
+        """
+        self.validator = Draft202012Validator(schema)
+
+    async def accepts(self, task: str, output: str) -> bool:
+        """Whether the output parses as JSON and validates against the schema."""
+        try:
+            payload = json.loads(output)
+        except json.JSONDecodeError:
+            return False
+        return self.validator.is_valid(payload)
+
+
+class ConfidenceAcceptor:
+    """Accepts outputs whose confidence marker meets a threshold."""
+
+    def __init__(self, pattern: str, min_confidence: float) -> None:
+        """Initialize the acceptor.
+
+        Args:
+            pattern: Regex whose first group is the numeric confidence
+            min_confidence: Minimum confidence to accept
+        """
+        self.pattern = re.compile(pattern, re.IGNORECASE)
+        self.min_confidence = min_confidence
+
+    async def accepts(self, task: str, output: str) -> bool:
+        """Whether the output carries a confidence of at least min_confidence."""
+        match = self.pattern.search(output)
+        if match is None:
+            return False
+        try:
+            return float(match.group(1)) >= self.min_confidence
+        except (IndexError, TypeError, ValueError):
+            return False
+
+
+# Negative AgentCache worker indexes, one per evaluator acceptor. Pools and
+# executors only use indexes >= 0, so an acceptor never shares (and clears the
+# history of) an evaluator instance a pattern uses, or one another acceptor uses.
+_evaluator_slots = itertools.count(-1, -1)
+
+
+class EvaluatorAcceptor:
+    """Accepts outputs an evaluator agent scores at or above min_score."""
+
+    def __init__(
+        self, spec: Spec, agent_id: str, min_score: int, agent_cache: Any | None = None
+    ) -> None:
+        """Initialize the acceptor; the evaluator agent is built on first use.
+
+        Args:
+            spec: Workflow spec defining the evaluator agent
+            agent_id: Evaluator agent ID
+            min_score: Minimum score (0-100) to accept
+            agent_cache: The run's AgentCache, which builds the evaluator and closes
+                its MCP clients with the run (None = build it standalone)
+        """
+        self.spec = spec
+        self.agent_id = agent_id
+        self.min_score = min_score
+        self.agent_cache = agent_cache
+        self._slot = next(_evaluator_slots)
+        self._evaluator: Any | None = None
+
+    async def _get_evaluator(self) -> Any:
+        if self._evaluator is None:
+            agent_config = self.spec.agents[self.agent_id]
+            if self.agent_cache is not None:
+                evaluator = await self.agent_cache.get_or_build_agent(
+                    self.spec, self.agent_id, agent_config, worker_index=self._slot
+                )
+            else:
+                from strands_cli.runtime.strands_adapter import build_agent
+
+                evaluator = build_agent(self.spec, self.agent_id, agent_config)
+            # Scoring runs on the evaluator's own model, never through a cascade
+            _cascades.pop(evaluator, None)
+            self._evaluator = evaluator
+        return self._evaluator
+
+    async def accepts(self, task: str, output: str) -> bool:
+        """Whether the evaluator scores the output at least min_score."""
+        from strands_cli.exec.utils import (
+            get_retry_config,
+            invoke_agent_with_retry,
+            request_structured_output,
+            structured_output_schema,
+            structured_result,
+        )
+        from strands_cli.runtime.budget_enforcer import BudgetExceededError
+
+        max_attempts, wait_min, wait_max = get_retry_config(self.spec)
+        try:
+            evaluator = await self._get_evaluator()
+            # Each check is scored on its own, without earlier checks in context
+            evaluator.messages.clear()
+            with request_structured_output(structured_output_schema(self.spec, EvaluatorDecision)):
+                response = await invoke_agent_with_retry(
+                    evaluator,
+                    EVALUATOR_PROMPT.format(task=task, response=output),
+                    max_attempts,
+                    wait_min,
+                    wait_max,
+                )
+            decision = structured_result(response, EvaluatorDecision)
+            score = decision.score if decision is not None else _parse_score(str(response))
+        except BudgetExceededError:
+            raise
+        except Exception as e:
+            logger.warning("cascade_evaluator_failed", evaluator=self.agent_id, error=str(e))
+            return False
+        return score is not None and score >= self.min_score
+
+
+def _parse_score(response: str) -> int | None:
+    """Score from an evaluator reply (bare JSON or a JSON object inside text)."""
+    match = re.search(r"\{.*\}", response, re.DOTALL)
+    if match is None:
+        return None
+    try:
+        return EvaluatorDecision(**json.loads(match.group(0))).score
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return None
+
+
+Acceptor = SchemaAcceptor | ConfidenceAcceptor | EvaluatorAcceptor
+
+# Returned by ModelCascade._try_tiers when no tier was accepted
+_REJECTED = object()
+
+_SESSION_WRITES = ("append_message", "redact_latest_message", "sync_agent")
+
+
+def _skip_session_write(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+@contextmanager
+def _session_paused(agent: Any) -> Iterator[Any | None]:
+    """Suspend writes of the agent's session manager for the duration of the block.
+
+    The session manager persists messages from agent hooks as they are added.
+    Shadowing its write methods on the instance turns those hooks into no-ops.
+
+    Yields:
+        The agent's session manager, or None when it has none
+    """
+    session_manager = getattr(agent, "_session_manager", None)
+    if not isinstance(session_manager, SessionManager):
+        yield None
+        return
+    for method in _SESSION_WRITES:
+        setattr(session_manager, method, _skip_session_write)
+    try:
+        yield session_manager
+    finally:
+        for method in _SESSION_WRITES:
+            vars(session_manager).pop(method, None)
+
+
+def _persist_exchange(session_manager: Any, agent: Any, history: list[Any]) -> None:
+    """Save the messages added since ``history`` (the accepted exchange) to the session."""
+    known = {id(message) for message in history}
+    for message in agent.messages:
+        if id(message) not in known:
+            session_manager.append_message(message, agent)
+    session_manager.sync_agent(agent)
+
+
+class ModelCascade:
+    """Cheaper model tiers tried before an agent's own model."""
+
+    def __init__(self, tiers: list[tuple[str, Any]], acceptor: Acceptor, primary: str) -> None:
+        """Initialize the cascade.
+
+        Args:
+            tiers: (model_id, model client) pairs, cheapest first
+            acceptor: Decides whether a tier's output is used
+            primary: Label of the agent's own model (final tier)
+        """
+        self.tiers = tiers
+        self.acceptor = acceptor
+        self.primary = primary
+
+    async def invoke(self, agent: Any, task: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``call`` on each tier until one is accepted, then on the agent's own model.
+
+        Args:
+            agent: Agent whose ``model`` is swapped per tier
+            task: Input of the invocation (given to evaluator acceptors)
+            call: Invokes the agent once (with retries)
+
+        Returns:
+            The first accepted tier's result, or the agent's own model's result
+        """
+        name = str(getattr(agent, "name", "unknown"))
+        history = list(agent.messages)
+        # Tier attempts are not persisted; only an accepted exchange is saved
+        with _session_paused(agent) as session_manager:
+            result = await self._try_tiers(agent, name, task, call, history)
+        if result is not _REJECTED:
+            if session_manager is not None:
+                _persist_exchange(session_manager, agent, history)
+            return result
+
+        result = await call()
+        get_metrics().inc(
+            "strands_cascade_calls_total", agent=name, model=self.primary, outcome="final"
+        )
+        return result
+
+    async def _try_tiers(
+        self,
+        agent: Any,
+        name: str,
+        task: str,
+        call: Callable[[], Awaitable[Any]],
+        history: list[Any],
+    ) -> Any:
+        """Result of the first accepted tier, or _REJECTED when every tier was rejected."""
+        primary_model = agent.model
+        metrics = get_metrics()
+        try:
+            for model_id, model in self.tiers:
+                agent.model = model
+                try:
+                    result = await call()
+                except Exception as e:
+                    logger.warning("cascade_tier_failed", agent=name, model=model_id, error=str(e))
+                    outcome = "error"
+                else:
+                    accepted = await self.acceptor.accepts(task, str(result))
+                    outcome = "accepted" if accepted else "escalated"
+                metrics.inc(
+                    "strands_cascade_calls_total", agent=name, model=model_id, outcome=outcome
+                )
+                logger.debug("cascade_tier", agent=name, model=model_id, outcome=outcome)
+                if outcome == "accepted":
+                    return result
+                # Drop the rejected exchange so the next tier answers from the same history
+                agent.messages[:] = history
+        finally:
+            agent.model = primary_model
+        return _REJECTED
+
+
+def _load_schema(schema_ref: str | dict[str, Any], spec: Spec) -> dict[str, Any]:
+    """Load a JSON schema from an inline dict or a path relative to the spec file."""
+    if isinstance(schema_ref, dict):
+        return schema_ref
+    schema_path = Path(schema_ref)
+    spec_dir = getattr(spec, "_spec_dir", None)
+    if not schema_path.is_absolute() and spec_dir:
+        schema_path = Path(spec_dir) / schema_path
+    try:
+        return json.loads(schema_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise CascadeConfigError(f"Failed to read cascade schema {schema_path}: {e}") from e
+
+
+def _build_acceptor(
+    accept: CascadeAccept, spec: Spec, agent_config: AgentConfig, agent_cache: Any | None
+) -> Acceptor:
+    if accept.type == "schema":
+        schema_ref = accept.schema_ or agent_config.output_schema
+        if not schema_ref:
+            raise CascadeConfigError(
+                "cascade.accept type 'schema' needs accept.schema or the agent's output_schema"
+            )
+        return SchemaAcceptor(_load_schema(schema_ref, spec))
+    if accept.type == "evaluator":
+        assert accept.agent is not None  # enforced by CascadeAccept
+        if accept.agent not in spec.agents:
+            raise CascadeConfigError(f"cascade.accept.agent '{accept.agent}' is not defined")
+        return EvaluatorAcceptor(spec, accept.agent, accept.min_score, agent_cache)
+    return ConfidenceAcceptor(accept.pattern, accept.min_confidence)
+
+
+def build_cascade(
+    spec: Spec,
+    agent_id: str,
+    agent_config: AgentConfig,
+    runtime: Runtime,
+    agent_cache: Any | None = None,
+) -> ModelCascade | None:
+    """Build the cascade for an agent (agent ``cascade`` overrides ``runtime.cascade``).
+
+    Args:
+        spec: Workflow spec
+        agent_id: Agent being built
+        agent_config: Agent configuration
+        runtime: The agent's effective runtime (model_id and inference overrides applied)
+        agent_cache: The run's AgentCache, used to build evaluator acceptors
+
+    Returns:
+        ModelCascade, or None when the agent has no cascade
+
+    Raises:
+        CascadeConfigError: If the acceptor is misconfigured
+        ProviderError: If a tier's model client cannot be created
+    """
+    config: Cascade | None = agent_config.cascade or spec.runtime.cascade
+    if config is None:
+        return None
+    tiers = [
+        (model_id, create_model(runtime.model_copy(update={"model_id": model_id})))
+        for model_id in config.models
+        if model_id != runtime.model_id
+    ]
+    if not tiers:
+        return None
+    logger.debug(
+        "cascade_built",
+        agent=agent_id,
+        tiers=[model_id for model_id, _ in tiers],
+        accept=config.accept.type,
+    )
+    acceptor = _build_acceptor(config.accept, spec, agent_config, agent_cache)
+    return ModelCascade(tiers, acceptor, primary=runtime.model_id or "default")
+
+
+_cascades: weakref.WeakKeyDictionary[Any, ModelCascade] = weakref.WeakKeyDictionary()
+
+
+def attach_cascade(agent: Any, cascade: ModelCascade) -> None:
+    """Associate a cascade with a built agent."""
+    _cascades[agent] = cascade
+
+
+def get_cascade(agent: Any) -> ModelCascade | None:
+    """Return the cascade attached to an agent, if any."""
+    try:
+        return _cascades.get(agent)
+    except TypeError:
+        # Not weak-referenceable, so never attached
+        return None
+
+
+async def invoke_with_cascade(agent: Any, task: str, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``call`` through the agent's cascade, or directly when it has none.
+
+    Args:
+        agent: Agent about to be invoked
+        task: Input of the invocation
+        call: Invokes the agent once (with retries)
+
+    Returns:
+        The accepted result
+    """
+    cascade = get_cascade(agent)
+    if cascade is None:
+        return await call()
+    return await cascade.invoke(agent, task, call)
@@ -0,0 +1,269 @@
+"""Process-level circuit breakers for model providers.
+
+Every agent invocation retries transient errors on its own, so during a
+provider brown-out each branch of a parallel, graph or orchestrator run keeps
+hammering the failing endpoint until its retries are exhausted. A breaker per
+(provider, model) pair is shared by every executor in the process and sheds
+that load instead:
+
+    - closed: calls pass; consecutive transient failures are counted
+    - open: after CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive failures calls
+      fail immediately with CircuitOpenError (no retries) until the recovery
+      timeout, or the provider's Retry-After hint if longer, has passed
+    - half-open: one probe call is let through; success closes the breaker,
+      failure reopens it
+
+Only transient failures (timeouts, connection errors, throttling) count.
+Any other outcome means the provider answered, so it counts as a success.
+
+Breakers are enabled by default; set STRANDS_CIRCUIT_BREAKER=false to disable
+them. Tunables: CIRCUIT_BREAKER_FAILURE_THRESHOLD (default 5) and
+CIRCUIT_BREAKER_RECOVERY_S (default 30).
+
+State is reported as the ``strands_circuit_breaker_state`` gauge
+(0 = closed, 1 = half-open, 2 = open) and rejected calls as
+``strands_circuit_breaker_rejections_total``.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import os
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from strands_cli.telemetry.metrics import get_metrics
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_S = 30.0
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Gauge values for strands_circuit_breaker_state
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+    def __init__(self, key: str, retry_in: float) -> None:
+        """Initialize the error.
+
+        Args:
+            key: Breaker key (``provider:model``)
+            retry_in: Seconds until the breaker lets a probe call through
+        """
+        self.key = key
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit breaker open for {key} after repeated provider failures; "
+            f"retry in {retry_in:.1f}s"
+        )
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one provider and model."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_s: float = DEFAULT_RECOVERY_S,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            provider: Provider label (e.g. the model class name)
+            model: Model identifier
+            failure_threshold: Consecutive transient failures that open the breaker
+            recovery_s: Seconds the breaker stays open before allowing a probe
+        """
+        self.provider = provider
+        self.model = model
+        self.failure_threshold = failure_threshold
+        self.recovery_s = recovery_s
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_until = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """Registry key (``provider:model``)."""
+        return f"{self.provider}:{self.model}"
+
+    def before_call(self) -> None:
+        """Admit a call or shed it.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe in flight
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._opened_until:
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            retry_in = max(self._opened_until - now, 0.0)
+
+        get_metrics().inc(
+            "strands_circuit_breaker_rejections_total", provider=self.provider, model=self.model
+        )
+        raise CircuitOpenError(self.key, retry_in)
+
+    def record_success(self) -> None:
+        """Record a call the provider answered; closes a half-open breaker."""
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def release(self) -> None:
+        """Give up an admitted call without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Record a transient provider failure.
+
+        Args:
+            retry_after: Provider's Retry-After hint in seconds, if any; the
+                breaker stays open at least this long once it opens
+        """
+        with self._lock:
+            self.failures += 1
+            probe_failed = self._probe_in_flight
+            self._probe_in_flight = False
+            if probe_failed or self.failures >= self.failure_threshold:
+                self._opened_until = time.monotonic() + max(self.recovery_s, retry_after or 0.0)
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Move to a new state (caller holds the lock)."""
+        if state == self.state:
+            return
+        get_metrics().inc(
+            "strands_circuit_breaker_state",
+            _STATE_VALUES[state] - _STATE_VALUES[self.state],
+            provider=self.provider,
+            model=self.model,
+        )
+        logger.warning(
+            "circuit_breaker_transition",
+            provider=self.provider,
+            model=self.model,
+            from_state=self.state,
+            to_state=state,
+            failures=self.failures,
+        )
+        self.state = state
+
+
+def _parse_retry_after(value: Any) -> float | None:
+    """Parse a Retry-After value (delay seconds or HTTP date) into seconds."""
+    if value is None:
+        return None
+    if isinstance(value, int | float):
+        return max(float(value), 0.0)
+    text = str(value).strip()
+    try:
+        return max(float(text), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _header(headers: Any, name: str) -> Any:
+    """Case-insensitive header lookup on httpx headers or plain dicts."""
+    if headers is None:
+        return None
+    get = getattr(headers, "get", None)
+    if not callable(get):
+        return None
+    value = get(name)
+    if value is None and isinstance(headers, dict):
+        lowered = {str(k).lower(): v for k, v in headers.items()}
+        value = lowered.get(name.lower())
+    return value
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Extract a server Retry-After hint from an error or the errors it wraps.
+
+    Understands a ``retry_after`` attribute, HTTP client errors carrying a
+    response with headers (OpenAI, Anthropic, httpx), and botocore
+    ``ClientError`` responses (Bedrock).
+
+    Args:
+        error: Exception raised by a model call
+
+    Returns:
+        Delay in seconds, or None if the error carries no hint
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        delay = _parse_retry_after(getattr(current, "retry_after", None))
+        if delay is not None:
+            return delay
+        response = getattr(current, "response", None)
+        if isinstance(response, dict):
+            # botocore ClientError
+            headers = response.get("ResponseMetadata", {}).get("HTTPHeaders")
+        else:
+            headers = getattr(response, "headers", None)
+        delay = _parse_retry_after(_header(headers, "retry-after"))
+        if delay is not None:
+            return delay
+        current = current.__cause__ or current.__context__
+    return None
+
+
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, model: str) -> CircuitBreaker | None:
+    """Return the shared breaker for a provider and model, or None when disabled."""
+    if os.environ.get("STRANDS_CIRCUIT_BREAKER", "").lower() == "false":
+        return None
+
+    with _breakers_lock:
+        breaker = _breakers.get((provider, model))
+        if breaker is None:
+            breaker = _breakers[(provider, model)] = CircuitBreaker(
+                provider,
+                model,
+                failure_threshold=int(
+                    os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", str(DEFAULT_FAILURE_THRESHOLD))
+                ),
+                recovery_s=float(os.getenv("CIRCUIT_BREAKER_RECOVERY_S", str(DEFAULT_RECOVERY_S))),
+            )
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Discard all breakers (tests and long-lived daemons)."""
+    with _breakers_lock:
+        _breakers.clear()
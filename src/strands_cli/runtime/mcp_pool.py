@@ -0,0 +1,280 @@
+"""Process-level MCP server pool.
+
+Keeps MCP server connections warm across workflow runs in the same process
+(API servers, batch jobs, long-lived sessions). Without the pool every
+AgentCache starts its own MCPClient — and, for stdio servers, a new
+subprocess — and repeats tool discovery before the first agent call.
+
+Pooling model:
+    - Servers are keyed by transport config (command/args/env or url/headers),
+      so two workflows declaring the same server share one connection
+    - The pool registers itself as a tool-provider consumer, so agents being
+      garbage-collected never tear down a pooled server
+    - Tool lists are discovered once per connection and reused by every agent
+      (MCPClient caches its loaded tools while the provider stays started)
+    - Leases are tracked per owner (one AgentCache per run); idle servers with
+      no leases are stopped after MCP_POOL_IDLE_TIMEOUT_S
+    - Servers are health-checked with list_tools at most every
+      MCP_POOL_HEALTH_CHECK_S on acquire and transparently restarted on failure
+
+MCPClient multiplexes tool calls onto its own background event loop, so one
+pooled connection can be leased to concurrent agents safely.
+
+The pool is opt-in: set STRANDS_MCP_POOL=true to enable it. When disabled,
+MCP clients keep the per-run lifecycle owned by AgentCache.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from strands_cli.types import McpServer
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_S = 300.0
+DEFAULT_HEALTH_CHECK_S = 30.0
+
+
+def mcp_server_key(config: McpServer) -> str:
+    """Compute the pool key for an MCP server config.
+
+    The server ``id`` is deliberately excluded: identical servers declared
+    under different ids in different workflows share one connection.
+
+    Args:
+        config: MCP server configuration
+
+    Returns:
+        Stable hex digest of the transport configuration
+    """
+    payload = {
+        "command": config.command,
+        "args": config.args or [],
+        "env": config.env or {},
+        "url": config.url,
+        "headers": config.headers or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _run_coroutine_sync(factory: Callable[[], Any]) -> Any:
+    """Run a coroutine to completion from sync code, even inside a running loop."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(factory())).result()
+
+
+@dataclass
+class _PooledServer:
+    """A warm MCP connection and its lease bookkeeping."""
+
+    key: str
+    server_id: str
+    client: Any
+    tool_count: int = 0
+    owners: set[int] = field(default_factory=set)
+    idle_since: float = field(default_factory=time.monotonic)
+    last_health_check: float = field(default_factory=time.monotonic)
+
+
+class MCPServerPool:
+    """Lease warm MCP connections to agents across workflow runs.
+
+    Example:
+        pool = MCPServerPool()
+        client = pool.acquire(server_config, owner=cache, factory=create_client)
+        ...
+        pool.release(cache)
+    """
+
+    def __init__(
+        self,
+        idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+        health_check_interval_s: float = DEFAULT_HEALTH_CHECK_S,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            idle_timeout_s: Seconds an unleased server stays warm before it is stopped
+            health_check_interval_s: Minimum seconds between health checks per server
+        """
+        self.idle_timeout_s = idle_timeout_s
+        self.health_check_interval_s = health_check_interval_s
+        self._servers: dict[str, _PooledServer] = {}
+        self._lock = threading.Lock()
+        self.starts = 0
+        self.reuses = 0
+
+    def acquire(self, config: McpServer, owner: object, factory: Callable[[], Any]) -> Any:
+        """Lease a warm MCP client for ``config`` to ``owner``.
+
+        Args:
+            config: MCP server configuration
+            owner: Lease holder (typically the run's AgentCache); released via release()
+            factory: Zero-arg callable creating a new, unstarted MCPClient
+
+        Returns:
+            Started MCPClient with its tool list already loaded
+
+        Raises:
+            Exception: If the server cannot be started (propagated from the factory/start)
+        """
+        key = mcp_server_key(config)
+        with self._lock:
+            self._reap_idle_locked()
+            entry = self._servers.get(key)
+
+            if entry is not None and not self._is_healthy(entry):
+                logger.warning("mcp_pool_server_unhealthy", server_id=entry.server_id, key=key)
+                self._stop_entry(entry)
+                del self._servers[key]
+                entry = None
+
+            if entry is None:
+                entry = self._start(key, config, factory)
+                self._servers[key] = entry
+                self.starts += 1
+            else:
+                self.reuses += 1
+                logger.debug(
+                    "mcp_pool_reuse",
+                    server_id=config.id,
+                    key=key,
+                    owners=len(entry.owners),
+                )
+
+            entry.owners.add(id(owner))
+            return entry.client
+
+    def owns(self, client: Any) -> bool:
+        """Return True if ``client`` is a pooled connection."""
+        with self._lock:
+            return any(entry.client is client for entry in self._servers.values())
+
+    def release(self, owner: object) -> None:
+        """Release every lease held by ``owner`` and stop servers idle past the timeout."""
+        now = time.monotonic()
+        with self._lock:
+            for entry in self._servers.values():
+                if id(owner) in entry.owners:
+                    entry.owners.discard(id(owner))
+                    if not entry.owners:
+                        entry.idle_since = now
+            self._reap_idle_locked()
+
+    def shutdown(self) -> None:
+        """Stop all pooled servers regardless of leases."""
+        with self._lock:
+            for entry in self._servers.values():
+                self._stop_entry(entry)
+            self._servers.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics for logging and metrics."""
+        with self._lock:
+            return {
+                "servers": len(self._servers),
+                "leased": sum(1 for entry in self._servers.values() if entry.owners),
+                "starts": self.starts,
+                "reuses": self.reuses,
+            }
+
+    def _start(self, key: str, config: McpServer, factory: Callable[[], Any]) -> _PooledServer:
+        client = factory()
+        # Hold a consumer slot so agents releasing the provider never stop it
+        client.add_consumer(self._consumer_id(key))
+        try:
+            tools = _run_coroutine_sync(client.load_tools)
+        except Exception:
+            self._stop_client(client, config.id)
+            raise
+
+        logger.info("mcp_pool_server_started", server_id=config.id, key=key, tools=len(tools))
+        return _PooledServer(key=key, server_id=config.id, client=client, tool_count=len(tools))
+
+    def _is_healthy(self, entry: _PooledServer) -> bool:
+        now = time.monotonic()
+        if now - entry.last_health_check < self.health_check_interval_s:
+            return True
+        try:
+            entry.client.list_tools_sync()
+        except Exception as e:
+            logger.debug("mcp_pool_health_check_failed", server_id=entry.server_id, error=str(e))
+            return False
+        entry.last_health_check = now
+        return True
+
+    def _reap_idle_locked(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, entry in self._servers.items()
+            if not entry.owners and now - entry.idle_since >= self.idle_timeout_s
+        ]
+        for key in expired:
+            entry = self._servers.pop(key)
+            logger.info("mcp_pool_server_idle_stop", server_id=entry.server_id, key=key)
+            self._stop_entry(entry)
+
+    def _stop_entry(self, entry: _PooledServer) -> None:
+        self._stop_client(entry.client, entry.server_id)
+
+    @staticmethod
+    def _stop_client(client: Any, server_id: str) -> None:
+        try:
+            client.stop(None, None, None)
+        except Exception as e:
+            logger.warning("mcp_pool_stop_failed", server_id=server_id, error=str(e))
+
+    def _consumer_id(self, key: str) -> str:
+        return f"strands-mcp-pool:{id(self)}:{key}"
+
+
+_pool: MCPServerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_mcp_pool() -> MCPServerPool | None:
+    """Return the process-level MCP pool, or None when pooling is disabled.
+
+    Enabled with STRANDS_MCP_POOL=true. Tunables:
+    MCP_POOL_IDLE_TIMEOUT_S (default 300) and MCP_POOL_HEALTH_CHECK_S (default 30).
+    """
+    global _pool
+
+    if os.environ.get("STRANDS_MCP_POOL", "").lower() != "true":
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = MCPServerPool(
+                idle_timeout_s=float(
+                    os.getenv("MCP_POOL_IDLE_TIMEOUT_S", str(DEFAULT_IDLE_TIMEOUT_S))
+                ),
+                health_check_interval_s=float(
+                    os.getenv("MCP_POOL_HEALTH_CHECK_S", str(DEFAULT_HEALTH_CHECK_S))
+                ),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def shutdown_mcp_pool() -> None:
+    """Stop all pooled MCP servers and discard the process-level pool."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
@@ -14,6 +14,10 @@ Ollama:
 
 Both providers support model_id override from runtime or agent config.
 
+Simulated:
+    - In-process fake model for load testing (see runtime/simulated.py)
+    - Behaviour (latency, failures, output) comes from runtime.simulation
+
 Performance Optimization:
     - Model clients are cached using functools.lru_cache with maxsize=16
     - This prevents redundant client creation in multi-step workflows
@@ -30,7 +34,9 @@ from strands.models.bedrock import BedrockModel
 from strands.models.ollama import OllamaModel
 from strands.models.openai import OpenAIModel
 
-from strands_cli.types import ProviderType, Runtime
+from strands_cli.runtime.simulated import SimulatedModel
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import ProviderType, Runtime, SimulationConfig
 
 if TYPE_CHECKING:
     from strands.models.anthropic import AnthropicModel
@@ -58,6 +64,7 @@ class RuntimeConfig:
         temperature: Sampling temperature (OpenAI only)
         top_p: Nucleus sampling parameter (OpenAI only)
         max_tokens: Maximum tokens to generate (OpenAI only)
+        simulation: JSON-encoded SimulationConfig (simulated provider only)
     """
 
     provider: str
@@ -67,6 +74,7 @@ class RuntimeConfig:
     temperature: float | None
     top_p: float | None
     max_tokens: int | None
+    simulation: str | None = None
 
 
 def create_bedrock_model(runtime: Runtime) -> BedrockModel:
@@ -407,10 +415,34 @@ def create_gemini_model(runtime: Runtime) -> "GeminiModel":
     return model
 
 
+def create_simulated_model(runtime: Runtime) -> SimulatedModel:
+    """Create a simulated model for load testing.
+
+    The model answers in-process with the latency, failure rates and output
+    configured in runtime.simulation. No credentials or network are needed.
+
+    Args:
+        runtime: Runtime configuration with provider=simulated
+
+    Returns:
+        SimulatedModel ready for agent creation
+    """
+    logger = structlog.get_logger(__name__)
+    simulation = runtime.simulation or SimulationConfig()
+    logger.debug(
+        "creating_simulated_model",
+        model_id=runtime.model_id,
+        latency_ms=simulation.latency_ms,
+        error_rate=simulation.error_rate,
+        throttle_rate=simulation.throttle_rate,
+    )
+    return SimulatedModel(simulation, model_id=runtime.model_id)
+
+
 @lru_cache(maxsize=16)
 def _create_model_cached(
     config: RuntimeConfig,
-) -> Union[BedrockModel, OllamaModel, OpenAIModel, "AnthropicModel", "GeminiModel"]:
+) -> Union[BedrockModel, OllamaModel, OpenAIModel, "AnthropicModel", "GeminiModel", SimulatedModel]:
     """Create a model client with LRU caching.
 
     This cached version prevents redundant model client creation in multi-step
@@ -438,7 +470,7 @@ def _create_model_cached(
     except ValueError as e:
         raise ProviderError(
             f"Unsupported provider: {config.provider}. "
-            f"Use 'bedrock', 'ollama', 'openai', 'anthropic', or 'gemini'."
+            f"Use 'bedrock', 'ollama', 'openai', 'anthropic', 'gemini', or 'simulated'."
         ) from e
 
     runtime = Runtime(
@@ -449,6 +481,9 @@ def _create_model_cached(
         temperature=config.temperature,
         top_p=config.top_p,
         max_tokens=config.max_tokens,
+        simulation=(
+            SimulationConfig.model_validate_json(config.simulation) if config.simulation else None
+        ),
     )
 
     logger.debug(
@@ -469,16 +504,18 @@ def _create_model_cached(
         return create_anthropic_model(runtime)
     elif runtime.provider == ProviderType.GEMINI:
         return create_gemini_model(runtime)
+    elif runtime.provider == ProviderType.SIMULATED:
+        return create_simulated_model(runtime)
     else:
         raise ProviderError(
             f"Unsupported provider: {runtime.provider}. "
-            f"Use 'bedrock', 'ollama', 'openai', 'anthropic', or 'gemini'."
+            f"Use 'bedrock', 'ollama', 'openai', 'anthropic', 'gemini', or 'simulated'."
         )
 
 
 def create_model(
     runtime: Runtime,
-) -> Union[BedrockModel, OllamaModel, OpenAIModel, "AnthropicModel", "GeminiModel"]:
+) -> Union[BedrockModel, OllamaModel, OpenAIModel, "AnthropicModel", "GeminiModel", SimulatedModel]:
     """Create a model client based on the provider.
 
     This function converts the Runtime object to a hashable RuntimeConfig
@@ -491,7 +528,8 @@ def create_model(
         runtime: Runtime configuration
 
     Returns:
-        Strands model (BedrockModel, OllamaModel, OpenAIModel, AnthropicModel, or GeminiModel)
+        Strands model (BedrockModel, OllamaModel, OpenAIModel, AnthropicModel, GeminiModel,
+        or SimulatedModel)
 
     Raises:
         ProviderError: If provider is unsupported or configuration is invalid
@@ -507,13 +545,24 @@ def create_model(
         temperature=runtime.temperature,
         top_p=runtime.top_p,
         max_tokens=runtime.max_tokens,
+        simulation=(
+            runtime.simulation.model_dump_json()
+            if runtime.provider == ProviderType.SIMULATED and runtime.simulation
+            else None
+        ),
     )
 
     # Call cached function
+    hits_before = _create_model_cached.cache_info().hits
     model = _create_model_cached(config)
 
     # Log cache performance (every 10 calls to avoid spam)
     cache_info = _create_model_cached.cache_info()
+    get_metrics().inc(
+        "strands_cache_requests_total",
+        cache="model_client",
+        result="hit" if cache_info.hits > hits_before else "miss",
+    )
     total_calls = cache_info.hits + cache_info.misses
     if total_calls > 0 and total_calls % 10 == 0:
         hit_rate = cache_info.hits / total_calls if total_calls > 0 else 0
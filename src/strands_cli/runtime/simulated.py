@@ -0,0 +1,227 @@
+"""Simulated model provider for load testing and capacity planning.
+
+``provider: simulated`` swaps every agent's model for ``SimulatedModel``, a
+Strands ``Model`` that answers in-process. No network calls are made and no
+tokens are paid for, but everything above the model runs for real: the Strands
+event loop and its throttling retries, hooks, ``invoke_agent_with_retry`` and
+the circuit breaker, ``AgentCache``, executors and session checkpoints.
+
+Behaviour is configured with ``runtime.simulation`` (``SimulationConfig``):
+
+    - latency: time to first token sampled per call from a fixed, uniform,
+      normal, lognormal or exponential distribution
+    - streaming: output is emitted token by token at ``tokens_per_second``
+    - failures: ``error_rate`` raises ConnectionError (retried as transient),
+      ``throttle_rate`` and ``max_concurrency`` raise ModelThrottledException
+      carrying ``retry_after_s``
+    - output: scripted ``responses`` in turn, or filler text of
+      ``output_tokens`` words
+    - usage: input/output token counts are reported like a real provider
+      (input estimated at four characters per token)
+
+Tools are never called; every response is a single text turn. Call outcomes
+are counted in ``strands_simulated_calls_total{outcome}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from strands.models.model import Model
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import SimulationConfig
+
+T = TypeVar("T", bound=BaseModel)
+
+FILLER_TEXT = (
+    "the workflow step completed and produced a concise simulated answer "
+    "covering requirements findings risks and next actions for review"
+)
+
+
+class SimulatedThrottlingError(ModelThrottledException):
+    """Throttling raised by the simulated provider, with a Retry-After hint."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            retry_after: Retry-After hint in seconds (read by the retry policy)
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def _message_text(messages: Messages) -> str:
+    parts: list[str] = []
+    for message in messages:
+        for block in message.get("content", []):
+            if "text" in block:
+                parts.append(block["text"])
+            elif "toolResult" in block:
+                parts.append(json.dumps(block["toolResult"].get("content", []), default=str))
+    return "\n".join(parts)
+
+
+class SimulatedModel(Model):
+    """In-process model with configurable latency, failures and output."""
+
+    def __init__(self, simulation: SimulationConfig | None = None, model_id: str | None = None):
+        """Initialize the model.
+
+        Args:
+            simulation: Behaviour settings (defaults if None)
+            model_id: Model ID reported in the config
+        """
+        self.simulation = simulation or SimulationConfig()
+        self.config: dict[str, Any] = {"model_id": model_id or "simulated"}
+        self._rng = random.Random(self.simulation.seed)
+        self._responses = itertools.cycle(self.simulation.responses or [""])
+        self.in_flight = 0
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the model configuration."""
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        """Return the model configuration."""
+        return self.config
+
+    def sample_latency(self) -> float:
+        """Sample one time-to-first-token delay in seconds."""
+        sim = self.simulation
+        mean, spread = sim.latency_ms, sim.latency_stddev_ms
+        distribution = sim.latency_distribution
+        if distribution == "fixed" or mean == 0:
+            value = mean
+        elif distribution == "uniform":
+            value = self._rng.uniform(mean - spread, mean + spread)
+        elif distribution == "normal":
+            value = self._rng.gauss(mean, spread)
+        elif distribution == "exponential":
+            value = self._rng.expovariate(1 / mean)
+        else:
+            # Lognormal with the configured mean and standard deviation
+            sigma2 = math.log(1 + (spread / mean) ** 2)
+            value = self._rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        return max(value, 0.0) / 1000
+
+    def next_response(self) -> str:
+        """The next scripted response, or filler text of output_tokens words."""
+        if self.simulation.responses:
+            return next(self._responses)
+        words = itertools.islice(
+            itertools.cycle(FILLER_TEXT.split()), self.simulation.output_tokens
+        )
+        return " ".join(words)
+
+    def _admit(self) -> None:
+        """Apply simulated rate limits and failures before a call starts."""
+        sim = self.simulation
+        metrics = get_metrics()
+        if sim.max_concurrency is not None and self.in_flight >= sim.max_concurrency:
+            metrics.inc("strands_simulated_calls_total", outcome="throttled")
+            raise SimulatedThrottlingError(
+                f"Simulated rate limit: {self.in_flight} calls in flight", sim.retry_after_s
+            )
+        roll = self._rng.random()
+        if roll < sim.throttle_rate:
+            metrics.inc("strands_simulated_calls_total", outcome="throttled")
+            raise SimulatedThrottlingError("Simulated throttling", sim.retry_after_s)
+        if roll < sim.throttle_rate + sim.error_rate:
+            metrics.inc("strands_simulated_calls_total", outcome="error")
+            raise ConnectionError("Simulated provider error")
+
+    async def _generate(self) -> AsyncGenerator[str, None]:
+        """Wait for the sampled latency, then yield the response in chunks."""
+        self._admit()
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.sample_latency())
+            text = self.next_response()
+            rate = self.simulation.tokens_per_second
+            if rate <= 0:
+                yield text
+            else:
+                words = text.split(" ")
+                for index, word in enumerate(words):
+                    yield word if index == 0 else f" {word}"
+                    await asyncio.sleep(1 / rate)
+        finally:
+            self.in_flight -= 1
+        get_metrics().inc("strands_simulated_calls_total", outcome="ok")
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: list[ToolSpec] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterable[StreamEvent]:
+        """Stream a simulated response in the Strands event format."""
+        input_text = "\n".join(filter(None, [system_prompt or "", _message_text(messages)]))
+        started = time.monotonic()
+        output: list[str] = []
+
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {}}}
+        async for chunk in self._generate():
+            output.append(chunk)
+            yield {"contentBlockDelta": {"delta": {"text": chunk}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+        text = "".join(output)
+        input_tokens = _estimate_tokens(input_text)
+        output_tokens = len(text.split()) if text else 0
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": output_tokens,
+                    "totalTokens": input_tokens + output_tokens,
+                },
+                "metrics": {"latencyMs": int((time.monotonic() - started) * 1000)},
+            }
+        }
+
+    async def structured_output(
+        self,
+        output_model: type[T],
+        prompt: Messages,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[dict[str, T | Any], None]:
+        """Parse the next (scripted) response as the output model.
+
+        Raises:
+            ValueError: If the response is not valid JSON for the output model
+        """
+        chunks = [chunk async for chunk in self._generate()]
+        text = "".join(chunks)
+        try:
+            output = output_model.model_validate_json(text)
+        except ValueError as e:
+            raise ValueError(
+                f"Simulated response is not valid {output_model.__name__} JSON; "
+                "script one with runtime.simulation.responses"
+            ) from e
+        yield {"output": output}
@@ -3,7 +3,7 @@
 Transforms validated workflow specifications into executable Strands Agent instances.
 Handles:
 
-1. System prompt construction (agent prompt + skills + runtime context)
+1. System prompt construction (static prefix + per-step notes, with prompt-cache points)
 2. Model client creation (provider-specific)
 3. Tool loading and validation (Python callables, HTTP executors)
 4. Agent assembly with Strands SDK
@@ -31,12 +31,14 @@ except ImportError:
     streamablehttp_client = None  # type: ignore
     StdioServerParameters = None  # type: ignore
 
+from strands_cli.runtime.cascade import attach_cascade, build_cascade
+from strands_cli.runtime.mcp_pool import get_mcp_pool
 from strands_cli.runtime.providers import create_model
 from strands_cli.runtime.tools import load_python_callable
 from strands_cli.tools import get_registry
 from strands_cli.tools.http_executor_factory import create_http_executor_tool
 from strands_cli.types import Agent as AgentConfig
-from strands_cli.types import Spec
+from strands_cli.types import McpServer, Runtime, Spec
 
 
 class AdapterError(Exception):
@@ -45,17 +47,50 @@ class AdapterError(Exception):
     pass
 
 
-def build_system_prompt(
+# Model families that accept cachePoint blocks in the system prompt. Anything
+# not listed (including an unset model ID) gets a plain string system prompt.
+_ANTHROPIC_PROMPT_CACHE_MODELS = (
+    "claude-opus-4",
+    "claude-sonnet-4",
+    "claude-haiku-4",
+    "claude-3-7-sonnet",
+    "claude-3-5-sonnet",
+    "claude-3-5-haiku",
+    "claude-3-opus",
+    "claude-3-haiku",
+)
+_BEDROCK_PROMPT_CACHE_MODELS = (
+    "anthropic.claude-opus-4",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-haiku-4",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-3-5-haiku",
+    "amazon.nova-micro",
+    "amazon.nova-lite",
+    "amazon.nova-pro",
+    "amazon.nova-premier",
+)
+
+
+def build_system_prompt_parts(
     agent_config: AgentConfig, spec: Spec, agent_id: str, injected_notes: str | None = None
-) -> str:
-    """Build the system prompt for an agent.
+) -> tuple[str, str | None]:
+    """Build the system prompt as a static prefix and a volatile suffix.
+
+    The static prefix depends only on the spec and agent, so it is byte-identical
+    across every step, branch and worker of a run (and across runs of the same
+    spec). Provider prompt caches match on prefixes, so it holds everything that
+    does not change per invocation:
 
-    Combines multiple sources into a comprehensive system prompt:
     1. Agent's base prompt (agent.prompt) - core instructions
-    2. Structured notes (optional) - previous workflow steps for continuity
-    3. Skills metadata injection - available tools/capabilities
+    2. Skills metadata injection - available tools/capabilities
+    3. HTTP tool reference
     4. Runtime banner - workflow context, budgets, tags
 
+    The volatile suffix holds per-step content:
+
+    5. Structured notes (optional) - previous workflow steps for continuity
+
     Skills are injected as metadata only (id, path, description).
     No code execution occurs; this provides context to the LLM.
 
@@ -66,18 +101,14 @@ def build_system_prompt(
         injected_notes: Optional Markdown notes from previous steps (Phase 6.2)
 
     Returns:
-        Complete system prompt for agent initialization
+        Tuple of (static_prefix, volatile_suffix); the suffix is None without notes
     """
     sections = []
 
     # 1. Base agent prompt
     sections.append(agent_config.prompt)
 
-    # 2. Structured notes injection (Phase 6.2)
-    if injected_notes:
-        sections.append(f"\n# Previous Workflow Steps\n{injected_notes}")
-
-    # 3. Skills metadata injection with usage instructions
+    # 2. Skills metadata injection with usage instructions
     if spec.skills:
         # Add instructions for how to use skills (progressive loading)
         skills_instructions = [
@@ -104,7 +135,7 @@ def build_system_prompt(
             skills_lines.append(skill_line)
         sections.append("\n".join(skills_lines))
 
-    # 4. HTTP Executor Tool Metadata
+    # 3. HTTP Executor Tool Metadata
     if spec.tools and spec.tools.http_executors:
         http_tool_lines = ["", "# HTTP Tools Reference", ""]
         for http_exec in spec.tools.http_executors:
@@ -123,7 +154,7 @@ def build_system_prompt(
             http_tool_lines.append("")
         sections.append("\n".join(http_tool_lines))
 
-    # 5. Runtime banner
+    # 4. Runtime banner
     banner_lines = ["", "# Runtime Context", ""]
     banner_lines.append(f"- **Workflow:** {spec.name}")
     if spec.description:
@@ -140,7 +171,124 @@ def build_system_prompt(
 
     sections.append("\n".join(banner_lines))
 
-    return "\n\n".join(sections)
+    # 5. Structured notes injection (Phase 6.2) - volatile, kept after the cacheable prefix
+    volatile = f"# Previous Workflow Steps\n{injected_notes}" if injected_notes else None
+
+    return "\n\n".join(sections), volatile
+
+
+def build_system_prompt(
+    agent_config: AgentConfig, spec: Spec, agent_id: str, injected_notes: str | None = None
+) -> str:
+    """Build the system prompt for an agent.
+
+    Joins the static prefix and volatile suffix from build_system_prompt_parts().
+
+    Args:
+        agent_config: Agent configuration from spec.agents[agent_id]
+        spec: Full workflow spec for context
+        agent_id: ID of this agent
+        injected_notes: Optional Markdown notes from previous steps (Phase 6.2)
+
+    Returns:
+        Complete system prompt for agent initialization
+    """
+    static_prefix, volatile_suffix = build_system_prompt_parts(
+        agent_config, spec, agent_id, injected_notes
+    )
+    if volatile_suffix:
+        return f"{static_prefix}\n\n{volatile_suffix}"
+    return static_prefix
+
+
+def supports_prompt_cache_points(provider: str, model_id: str | None) -> bool:
+    """Return True if the provider accepts explicit cache points in the system prompt.
+
+    Anthropic and Bedrock cache up to an explicit cachePoint block, but only for
+    the model families that support prompt caching; other models reject the
+    block. OpenAI caches matching prompt prefixes automatically and needs no
+    marker; other providers have no prompt cache. Disable markers with
+    STRANDS_PROMPT_CACHE=false.
+
+    Args:
+        provider: Runtime provider value (e.g., "bedrock")
+        model_id: Effective model ID (None means the provider default, which is
+            not assumed to support caching)
+
+    Returns:
+        True if a cachePoint block should be emitted
+    """
+    if os.environ.get("STRANDS_PROMPT_CACHE", "true").lower() == "false":
+        return False
+    if not model_id:
+        return False
+    if provider == "anthropic":
+        return model_id.startswith(_ANTHROPIC_PROMPT_CACHE_MODELS)
+    if provider == "bedrock":
+        # Cross-region and inference profile IDs wrap the model ID ("us.anthropic...")
+        return any(family in model_id for family in _BEDROCK_PROMPT_CACHE_MODELS)
+    return False
+
+
+def build_cacheable_system_prompt(
+    static_prefix: str, volatile_suffix: str | None, use_cache_point: bool
+) -> str | list[dict[str, Any]]:
+    """Assemble the system prompt, marking the end of the static prefix when supported.
+
+    Args:
+        static_prefix: Spec-derived prompt text shared across invocations
+        volatile_suffix: Per-step text (notes), or None
+        use_cache_point: Emit a cachePoint block after the static prefix
+
+    Returns:
+        Plain string, or Strands system content blocks with a cache point
+    """
+    if not use_cache_point:
+        if volatile_suffix:
+            return f"{static_prefix}\n\n{volatile_suffix}"
+        return static_prefix
+
+    blocks: list[dict[str, Any]] = [
+        {"text": static_prefix},
+        {"cachePoint": {"type": "default"}},
+    ]
+    if volatile_suffix:
+        blocks.append({"text": volatile_suffix})
+    return blocks
+
+
+def build_agent_system_prompt(
+    spec: Spec,
+    agent_id: str,
+    agent_config: AgentConfig,
+    injected_notes: str | None = None,
+    effective_runtime: Runtime | None = None,
+) -> str | list[dict[str, Any]]:
+    """Build an agent's full system prompt for its resolved provider.
+
+    Used by build_agent and by AgentPool to refresh the notes of a reused agent.
+
+    Args:
+        spec: Full workflow spec for context
+        agent_id: ID of this agent
+        agent_config: Agent configuration from spec.agents[agent_id]
+        injected_notes: Optional Markdown notes from previous steps (Phase 6.2)
+        effective_runtime: Runtime already resolved for this agent (resolved if None)
+
+    Returns:
+        System prompt as accepted by the Strands Agent
+    """
+    if effective_runtime is None:
+        effective_runtime = resolve_agent_runtime(spec, agent_config)
+    static_prefix, volatile_suffix = build_system_prompt_parts(
+        agent_config, spec, agent_id, injected_notes
+    )
+    provider = getattr(effective_runtime.provider, "value", effective_runtime.provider)
+    return build_cacheable_system_prompt(
+        static_prefix,
+        volatile_suffix,
+        use_cache_point=supports_prompt_cache_points(provider, effective_runtime.model_id),
+    )
 
 
 def _load_python_tools(
@@ -245,7 +393,81 @@ def _load_native_tools(tools_to_use: list[str] | None) -> list[Any]:
     return tools
 
 
-def _load_mcp_tools(spec: Spec, tools_to_use: list[str] | None) -> list[tuple[str, Any]]:
+def _create_mcp_client(mcp_config: McpServer, mcp_timeout: int) -> Any:
+    """Create an unstarted MCPClient for one server config.
+
+    Args:
+        mcp_config: MCP server configuration (stdio command or HTTPS url)
+        mcp_timeout: Configured startup timeout (logged; see Phase 9.1 note below)
+
+    Returns:
+        MCPClient instance
+
+    Raises:
+        ValueError: If the config has neither 'command' nor 'url'
+    """
+    import structlog
+
+    logger = structlog.get_logger(__name__)
+
+    # Determine transport type based on config
+    if mcp_config.command:
+        # stdio transport
+        server_params = StdioServerParameters(
+            command=mcp_config.command,
+            args=mcp_config.args or [],
+            env=mcp_config.env or {},
+        )
+
+        # Create MCPClient with stdio transport
+        # TODO Phase 9.1: Add timeout enforcement via asyncio.wait_for
+        # Current limitation: MCP SDK uses sync client creation, hung servers will block
+        # Configured timeout: {mcp_timeout}s (via MCP_STARTUP_TIMEOUT_S env var)
+        mcp_client = MCPClient(lambda params=server_params: stdio_client(params))  # type: ignore[misc]
+
+        logger.info(
+            "mcp_client_created",
+            id=mcp_config.id,
+            transport="stdio",
+            command=mcp_config.command,
+            args=mcp_config.args,
+            timeout_s=mcp_timeout,
+        )
+        return mcp_client
+
+    if mcp_config.url:
+        # HTTPS transport (streamable HTTP)
+        url = mcp_config.url
+        headers = mcp_config.headers or None
+
+        # Create transport callable for streamable HTTP
+        from collections.abc import Callable
+
+        def create_http_transport(
+            endpoint: str = url, custom_headers: dict[str, str] | None = headers
+        ) -> Callable[..., Any]:
+            from typing import cast
+
+            result: Any = streamablehttp_client(endpoint, headers=custom_headers)
+            return cast(Callable[..., Any], result)
+
+        # Create MCPClient with HTTPS transport
+        mcp_client = MCPClient(create_http_transport)  # type: ignore[arg-type]
+
+        logger.info(
+            "mcp_client_created",
+            id=mcp_config.id,
+            transport="https",
+            url=mcp_config.url,
+        )
+        return mcp_client
+
+    raise ValueError("MCP config must have either 'command' or 'url'")
+
+
+def _load_mcp_tools(
+    spec: Spec, tools_to_use: list[str] | None, owner: Any | None = None
+) -> list[tuple[str, Any]]:
     """Load MCP server tools using Strands SDK MCPClient.
 
     Phase 9: Uses native Strands SDK MCP support with MCPClient.
@@ -256,10 +478,14 @@ def _load_mcp_tools(spec: Spec, tools_to_use: list[str] | None) -> list[tuple[st
     1. stdio: Command-based MCP servers (npx, uvx, python, etc.)
     2. HTTPS: Remote MCP servers via streamable HTTP
 
+    When the process-level MCP pool is enabled (STRANDS_MCP_POOL=true) and an
+    owner is given, warm pooled clients are leased instead of creating new ones.
+
     Args:
         spec: Full workflow spec (for spec.tools.mcp configuration)
         tools_to_use: Optional list of tool IDs to filter by (currently ignored for MCP -
                      all tools from configured MCP servers are loaded)
+        owner: Optional lease holder for pooled clients (the run's AgentCache)
 
     Returns:
         List of tuples: (server_id, MCPClient instance) for deduplication
@@ -290,71 +516,25 @@ def _load_mcp_tools(spec: Spec, tools_to_use: list[str] | None) -> list[tuple[st
             "Install with: pip install mcp strands-agents[mcp]"
         )
 
+    pool = get_mcp_pool() if owner is not None else None
+
     for mcp_config in spec.tools.mcp:
         try:
-            # Determine transport type based on config
-            if mcp_config.command:
-                # stdio transport
-                server_params = StdioServerParameters(
-                    command=mcp_config.command,
-                    args=mcp_config.args or [],
-                    env=mcp_config.env or {},
+            if pool is not None:
+                mcp_client = pool.acquire(
+                    mcp_config,
+                    owner=owner,
+                    factory=lambda cfg=mcp_config: _create_mcp_client(cfg, mcp_timeout),
                 )
-
-                # Create MCPClient with stdio transport
-                # TODO Phase 9.1: Add timeout enforcement via asyncio.wait_for
-                # Current limitation: MCP SDK uses sync client creation, hung servers will block
-                # Configured timeout: {mcp_timeout}s (via MCP_STARTUP_TIMEOUT_S env var)
-                mcp_client = MCPClient(lambda params=server_params: stdio_client(params))  # type: ignore[misc]
-
-                logger.info(
-                    "mcp_client_created",
-                    id=mcp_config.id,
-                    transport="stdio",
-                    command=mcp_config.command,
-                    args=mcp_config.args,
-                    timeout_s=mcp_timeout,
-                )
-
-            elif mcp_config.url:
-                # HTTPS transport (streamable HTTP)
-                url = mcp_config.url
-                headers = mcp_config.headers or None
-
-                # Create transport callable for streamable HTTP
-                from collections.abc import Callable
-
-                def create_http_transport(
-                    endpoint: str = url, custom_headers: dict[str, str] | None = headers
-                ) -> Callable[..., Any]:
-                    from typing import cast
-
-                    result: Any = streamablehttp_client(endpoint, headers=custom_headers)
-                    return cast(Callable[..., Any], result)
-
-                # Create MCPClient with HTTPS transport
-                mcp_client = MCPClient(create_http_transport)  # type: ignore[arg-type]
-
-                logger.info(
-                    "mcp_client_created",
-                    id=mcp_config.id,
-                    transport="https",
-                    url=mcp_config.url,
-                )
-
             else:
-                logger.warning(
-                    "mcp_config_invalid",
-                    id=mcp_config.id,
-                    error="MCP config must have either 'command' or 'url'",
-                )
-                failed_servers.append(
-                    (mcp_config.id, "MCP config must have either 'command' or 'url'")
-                )
-                continue
+                mcp_client = _create_mcp_client(mcp_config, mcp_timeout)
 
             mcp_clients.append((mcp_config.id, mcp_client))
 
+        except ValueError as e:
+            logger.warning("mcp_config_invalid", id=mcp_config.id, error=str(e))
+            failed_servers.append((mcp_config.id, str(e)))
+
         except Exception as e:
             logger.warning(
                 "mcp_client_creation_failed",
@@ -374,6 +554,36 @@ def _load_mcp_tools(spec: Spec, tools_to_use: list[str] | None) -> list[tuple[st
     return mcp_clients
 
 
+def resolve_agent_runtime(spec: Spec, agent_config: AgentConfig) -> Runtime:
+    """Apply an agent's model_id and inference overrides to the spec runtime.
+
+    Args:
+        spec: Workflow spec
+        agent_config: Agent configuration
+
+    Returns:
+        The runtime the agent's model is created from (spec.runtime if no overrides)
+    """
+    runtime_overrides: dict[str, Any] = {}
+
+    # Model ID override
+    if agent_config.model_id:
+        runtime_overrides["model_id"] = agent_config.model_id
+
+    # Inference parameter overrides (temperature, top_p, max_tokens)
+    if agent_config.inference:
+        if agent_config.inference.temperature is not None:
+            runtime_overrides["temperature"] = agent_config.inference.temperature
+        if agent_config.inference.top_p is not None:
+            runtime_overrides["top_p"] = agent_config.inference.top_p
+        if agent_config.inference.max_tokens is not None:
+            runtime_overrides["max_tokens"] = agent_config.inference.max_tokens
+
+    if not runtime_overrides:
+        return spec.runtime
+    return spec.runtime.model_copy(update=runtime_overrides)
+
+
 def build_agent(  # noqa: C901
     spec: Spec,
     agent_id: str,
@@ -435,33 +645,15 @@ def build_agent(  # noqa: C901
     # Create the model with agent-level overrides if specified
     # (model_id and/or inference parameters)
     try:
-        # Build runtime with agent-level overrides
-        runtime_overrides: dict[str, Any] = {}
-
-        # Model ID override
-        if agent_config.model_id:
-            runtime_overrides["model_id"] = agent_config.model_id
-
-        # Inference parameter overrides (temperature, top_p, max_tokens)
-        if agent_config.inference:
-            if agent_config.inference.temperature is not None:
-                runtime_overrides["temperature"] = agent_config.inference.temperature
-            if agent_config.inference.top_p is not None:
-                runtime_overrides["top_p"] = agent_config.inference.top_p
-            if agent_config.inference.max_tokens is not None:
-                runtime_overrides["max_tokens"] = agent_config.inference.max_tokens
-
-        # Apply overrides if any exist
-        if runtime_overrides:
-            runtime_with_override = spec.runtime.model_copy(update=runtime_overrides)
-            model = create_model(runtime_with_override)
-        else:
-            model = create_model(spec.runtime)
+        effective_runtime = resolve_agent_runtime(spec, agent_config)
+        model = create_model(effective_runtime)
     except Exception as e:
         raise AdapterError(f"Failed to create model: {e}") from e
 
-    # Build system prompt with optional notes injection
-    system_prompt = build_system_prompt(agent_config, spec, agent_id, injected_notes)
+    # Build system prompt: cacheable static prefix, then per-step notes
+    system_prompt = build_agent_system_prompt(
+        spec, agent_id, agent_config, injected_notes, effective_runtime=effective_runtime
+    )
 
     # Determine which tools to use
     tools_to_use = tool_overrides if tool_overrides is not None else agent_config.tools
@@ -505,7 +697,7 @@ def build_agent(  # noqa: C901
 
     # Phase 9: Load MCP server tools (uses Strands SDK MCPClient with ToolProvider interface)
     # Returns list of (server_id, client) tuples for deduplication
-    mcp_clients_with_ids = _load_mcp_tools(spec, tools_to_use)
+    mcp_clients_with_ids = _load_mcp_tools(spec, tools_to_use, owner=agent_cache)
 
     # Extract clients for agent tools and track in cache by server_id (deduplication)
     if agent_cache and mcp_clients_with_ids:
@@ -566,4 +758,14 @@ def build_agent(  # noqa: C901
     except Exception as e:
         raise AdapterError(f"Failed to create Strands Agent: {e}") from e
 
+    # Cheaper models tried before this agent's own model (runtime or agent cascade)
+    try:
+        cascade = build_cascade(
+            spec, agent_id, agent_config, effective_runtime, agent_cache=agent_cache
+        )
+    except Exception as e:
+        raise AdapterError(f"Failed to configure model cascade for '{agent_id}': {e}") from e
+    if cascade is not None:
+        attach_cascade(agent, cascade)
+
     return agent
@@ -8,7 +8,9 @@ Key Components:
     SessionMetadata: Core metadata (ID, status, timestamps)
     TokenUsage: Token consumption tracking
     SessionStatus: Enum for session lifecycle states
+    SessionRepository: Storage protocol (file and S3 backends)
     FileSessionRepository: File-based session storage
+    S3SessionRepository: Shared session storage in an S3-compatible bucket
     SessionError: Base exception for session operations
 
 Phase 1 (MVP):
@@ -177,9 +179,21 @@ class SessionAlreadyCompletedError(SessionError):
     pass
 
 
+class SessionConflictError(SessionError):
+    """Raised when another writer saved a session since it was last read.
+
+    Occurs with shared (S3) session storage when two workers save the same
+    session concurrently. The losing save is discarded; reload the session
+    to continue from the winner's checkpoint.
+    """
+
+    pass
+
+
 # Export public API
 __all__ = [
     "SessionAlreadyCompletedError",
+    "SessionConflictError",
     "SessionCorruptedError",
     "SessionError",
     "SessionMetadata",
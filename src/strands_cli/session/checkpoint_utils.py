@@ -5,7 +5,7 @@ from typing import Any
 import structlog
 
 from strands_cli.session import SessionState, SessionStatus
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 from strands_cli.session.utils import now_iso8601
 
 logger = structlog.get_logger(__name__)
@@ -13,7 +13,7 @@ logger = structlog.get_logger(__name__)
 
 def validate_session_params(
     session_state: SessionState | None,
-    session_repo: FileSessionRepository | None,
+    session_repo: SessionRepository | None,
 ) -> None:
     """Validate that both or neither session parameters are provided.
 
@@ -30,7 +30,7 @@ def validate_session_params(
 
 async def checkpoint_pattern_state(
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
     pattern_state_updates: dict[str, Any],
     token_increment: int = 0,
     status: SessionStatus = SessionStatus.RUNNING,
@@ -71,7 +71,7 @@ async def checkpoint_pattern_state(
 
 async def finalize_session(
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
 ) -> None:
     """Mark session as completed and checkpoint.
 
@@ -89,7 +89,7 @@ async def finalize_session(
 
 async def fail_session(
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
     error: Exception,
 ) -> None:
     """Mark session as failed and checkpoint.
@@ -9,13 +9,13 @@ from datetime import UTC, datetime, timedelta
 import structlog
 
 from strands_cli.session import SessionStatus
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository
 
 logger = structlog.get_logger(__name__)
 
 
 async def cleanup_expired_sessions(
-    repo: FileSessionRepository,
+    repo: SessionRepository,
     max_age_days: int = 7,
     keep_completed: bool = True,
 ) -> int:
@@ -33,7 +33,7 @@ async def cleanup_expired_sessions(
         Number of sessions deleted
 
     Example:
-        >>> repo = FileSessionRepository()
+        >>> repo = create_session_repository()
         >>> deleted = await cleanup_expired_sessions(repo, max_age_days=30)
         >>> print(f"Deleted {deleted} expired sessions")
     """
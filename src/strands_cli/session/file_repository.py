@@ -1,9 +1,9 @@
 """File-based session persistence repository.
 
 Provides async file-based session storage using local filesystem with
-platform-specific directories. All methods are async-wrapped for
-future S3 migration compatibility while using synchronous file I/O
-internally via asyncio.to_thread().
+platform-specific directories. Implements the SessionRepository protocol
+shared with S3SessionRepository, using synchronous file I/O internally via
+asyncio.to_thread().
 
 Storage Structure:
     {data_dir}/sessions/session_{session_id}/
@@ -12,6 +12,10 @@ Storage Structure:
     ├── spec_snapshot.yaml   # Original workflow spec
     └── agents/              # Strands SDK agent sessions (Phase 2)
 
+With STRANDS_SESSION_FORMAT=compact, JSON is minified and the pattern state is
+stored compressed as pattern_state.json.zst (or .gz without zstandard); see
+session.storage_format. Both formats are read regardless of the setting.
+
 Example:
     >>> repo = FileSessionRepository()
     >>> state = SessionState(...)
@@ -25,6 +29,7 @@ import json
 import re
 import shutil
 from pathlib import Path
+from typing import Any
 
 import structlog
 
@@ -36,15 +41,28 @@ from strands_cli.session import (
     TokenUsage,
 )
 from strands_cli.session.locking import session_lock
+from strands_cli.session.storage_format import (
+    COMPACT_FORMAT,
+    compressed_suffix,
+    dump_json,
+    encode_file,
+    load_json,
+)
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.telemetry.profiler import profile_phase
 
 logger = structlog.get_logger(__name__)
 
+PATTERN_STATE_FILE = "pattern_state.json"
+# Pattern state file names in load order (compressed variants first)
+PATTERN_STATE_FILES = (f"{PATTERN_STATE_FILE}.zst", f"{PATTERN_STATE_FILE}.gz", PATTERN_STATE_FILE)
+
 
 class FileSessionRepository:
     """File-based session storage using local filesystem.
 
-    All methods are async-wrapped using asyncio.to_thread() for consistency
-    with future S3SessionRepository while keeping implementation simple.
+    All methods are async-wrapped using asyncio.to_thread() to implement the
+    SessionRepository protocol shared with S3SessionRepository.
 
     Storage structure:
         {storage_dir}/session_{session_id}/
@@ -54,15 +72,18 @@ class FileSessionRepository:
         └── agents/  # Managed by Strands SDK FileSessionManager (Phase 2)
     """
 
-    def __init__(self, storage_dir: Path | None = None):
+    def __init__(self, storage_dir: Path | None = None, session_format: str | None = None):
         """Initialize repository with storage directory.
 
         Args:
             storage_dir: Base directory for sessions
                 (default: {data_dir}/sessions from platformdirs)
+            session_format: "json" or "compact" for files written
+                (default: STRANDS_SESSION_FORMAT, "json")
         """
         config = StrandsConfig()
         self.storage_dir = storage_dir or (config.data_dir / "sessions")
+        self.session_format = session_format or config.session_format
 
         # Create storage directory synchronously during init
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -89,6 +110,46 @@ class FileSessionRepository:
             )
         return self.storage_dir / f"session_{session_id}"
 
+    @property
+    def compact(self) -> bool:
+        """Whether sessions are written in the compact, compressed format."""
+        return self.session_format == COMPACT_FORMAT
+
+    def _pattern_state_file(self) -> str:
+        """Name of the pattern state file in the configured format."""
+        return PATTERN_STATE_FILE + (compressed_suffix() if self.compact else "")
+
+    def _write_session_files(
+        self, session_dir: Path, session_data: dict[str, Any], pattern_state: dict[str, Any]
+    ) -> None:
+        """Atomically write session.json and the pattern state in the configured format.
+
+        Pattern state files in other formats are removed so that a session
+        never holds two diverging copies.
+        """
+        session_json = session_dir / "session.json"
+        session_tmp = session_dir / "session.json.tmp"
+        session_tmp.write_bytes(dump_json(session_data, self.compact))
+        session_tmp.replace(session_json)
+
+        pattern_name = self._pattern_state_file()
+        pattern_file = session_dir / pattern_name
+        pattern_tmp = session_dir / f"{pattern_name}.tmp"
+        pattern_tmp.write_bytes(encode_file(pattern_state, self.compact))
+        pattern_tmp.replace(pattern_file)
+        for stale in PATTERN_STATE_FILES:
+            if stale != pattern_name:
+                (session_dir / stale).unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_pattern_state(session_dir: Path) -> dict[str, Any]:
+        """Read the pattern state in whichever format it was written."""
+        for name in PATTERN_STATE_FILES:
+            path = session_dir / name
+            if path.exists():
+                return dict(load_json(path.read_bytes()))
+        raise FileNotFoundError(f"No pattern state in {session_dir}")
+
     async def exists(self, session_id: str) -> bool:
         """Check if session exists.
 
@@ -141,9 +202,8 @@ class FileSessionRepository:
             # Acquire lock for atomic write
             with session_lock(session_dir):
                 try:
-                    # Write session.json atomically (metadata, variables, runtime, usage)
-                    session_json = session_dir / "session.json"
-                    session_tmp = session_dir / "session.json.tmp"
+                    # Write session.json (metadata, variables, runtime, usage) and
+                    # the pattern-specific execution state atomically
                     session_data = {
                         "metadata": state.metadata.model_dump(),
                         "variables": state.variables,
@@ -151,20 +211,7 @@ class FileSessionRepository:
                         "token_usage": state.token_usage.model_dump(),
                         "artifacts_written": state.artifacts_written,
                     }
-                    session_tmp.write_text(
-                        json.dumps(session_data, indent=2),
-                        encoding="utf-8",
-                    )
-                    session_tmp.replace(session_json)
-
-                    # Write pattern_state.json atomically (pattern-specific execution state)
-                    pattern_json = session_dir / "pattern_state.json"
-                    pattern_tmp = session_dir / "pattern_state.json.tmp"
-                    pattern_tmp.write_text(
-                        json.dumps(state.pattern_state, indent=2),
-                        encoding="utf-8",
-                    )
-                    pattern_tmp.replace(pattern_json)
+                    self._write_session_files(session_dir, session_data, state.pattern_state)
 
                     # Write spec_snapshot.yaml atomically ONLY if spec_content is non-empty
                     # This allows checkpoints to skip spec updates (pass empty string)
@@ -186,7 +233,11 @@ class FileSessionRepository:
                     pattern=state.metadata.pattern_type,
                 )
 
-        await asyncio.to_thread(_save)
+        with (
+            get_metrics().track("strands_session_operation_duration_seconds", operation="save"),
+            profile_phase("checkpoint.write"),
+        ):
+            await asyncio.to_thread(_save)
 
     async def load(self, session_id: str) -> SessionState | None:
         """Load session state from disk with lazy pattern_state loading.
@@ -220,12 +271,11 @@ class FileSessionRepository:
             try:
                 # Load session.json immediately
                 session_json = session_dir / "session.json"
-                session_data = json.loads(session_json.read_text(encoding="utf-8"))
+                session_data = load_json(session_json.read_bytes())
 
                 # Eagerly load pattern_state for now (lazy loading requires custom descriptor)
                 # TODO Phase 4.5: Implement full lazy loading with property descriptor
-                pattern_json = session_dir / "pattern_state.json"
-                pattern_state = json.loads(pattern_json.read_text(encoding="utf-8"))
+                pattern_state = self._read_pattern_state(session_dir)
 
                 # Construct SessionState
                 state = SessionState(
@@ -250,7 +300,8 @@ class FileSessionRepository:
             except Exception as e:
                 raise SessionCorruptedError(f"Failed to load session {session_id}: {e}") from e
 
-        return await asyncio.to_thread(_load)
+        with get_metrics().track("strands_session_operation_duration_seconds", operation="load"):
+            return await asyncio.to_thread(_load)
 
     async def delete(self, session_id: str) -> None:
         """Delete session completely.
@@ -299,7 +350,7 @@ class FileSessionRepository:
                 session_json = session_dir / "session.json"
                 if session_json.exists():
                     try:
-                        data = json.loads(session_json.read_text(encoding="utf-8"))
+                        data = load_json(session_json.read_bytes())
                         sessions.append(SessionMetadata(**data["metadata"]))
                     except Exception as e:
                         # Log but don't fail listing for one corrupted session
@@ -312,6 +363,79 @@ class FileSessionRepository:
 
         return await asyncio.to_thread(_list)
 
+    async def convert(self, session_id: str) -> tuple[int, int]:
+        """Rewrite a session's files in the repository's session format.
+
+        Converts session.json, the pattern state and every agent session file
+        under agents/ (agent state and message histories). Used to migrate
+        existing sessions after changing STRANDS_SESSION_FORMAT.
+
+        Args:
+            session_id: Session ID to convert
+
+        Returns:
+            Tuple of (bytes before, bytes after) over the converted files
+
+        Raises:
+            FileNotFoundError: If the session doesn't exist
+            SessionCorruptedError: If a file cannot be read or written
+
+        Example:
+            >>> repo = FileSessionRepository(session_format="compact")
+            >>> before, after = await repo.convert("abc-123")
+        """
+
+        def _convert() -> tuple[int, int]:
+            session_dir = self._session_dir(session_id)
+            if not session_dir.exists():
+                raise FileNotFoundError(f"Session directory not found: {session_dir}")
+
+            with session_lock(session_dir):
+                before = after = 0
+                try:
+                    session_json = session_dir / "session.json"
+                    before += session_json.stat().st_size
+                    before += sum(
+                        (session_dir / name).stat().st_size
+                        for name in PATTERN_STATE_FILES
+                        if (session_dir / name).exists()
+                    )
+                    self._write_session_files(
+                        session_dir,
+                        load_json(session_json.read_bytes()),
+                        self._read_pattern_state(session_dir),
+                    )
+                    after += session_json.stat().st_size
+                    after += (session_dir / self._pattern_state_file()).stat().st_size
+
+                    agents_dir = session_dir / "agents"
+                    for path in sorted(agents_dir.rglob("*.json")):
+                        if path.is_symlink() or not path.is_file():
+                            continue
+                        raw = path.read_bytes()
+                        # Indented agent files match the SDK's own format
+                        encoded = encode_file(load_json(raw), self.compact, ensure_ascii=False)
+                        tmp = path.with_name(f".{path.name}.tmp")
+                        tmp.write_bytes(encoded)
+                        tmp.replace(path)
+                        before += len(raw)
+                        after += len(encoded)
+                except Exception as e:
+                    raise SessionCorruptedError(
+                        f"Failed to convert session {session_id}: {e}"
+                    ) from e
+
+            logger.info(
+                "session_converted",
+                session_id=session_id,
+                format=self.session_format,
+                bytes_before=before,
+                bytes_after=after,
+            )
+            return before, after
+
+        return await asyncio.to_thread(_convert)
+
     def get_agents_dir(self, session_id: str) -> Path:
         """Get agents directory for Strands SDK FileSessionManager.
 
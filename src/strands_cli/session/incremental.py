@@ -0,0 +1,212 @@
+"""Incremental re-execution: reuse unchanged chain steps and workflow tasks.
+
+Every chain step and workflow task records a content hash next to its response
+in the session's pattern_state. The hash covers everything that determines the
+answer:
+
+    - the agent's configuration and its full system prompt (prompt, skills,
+      runtime banner, injected notes)
+    - the effective model config (provider, model_id, region, host, inference)
+    - the step's tool overrides and rendered input
+    - the hashes of upstream results (the previous chain step; a task's deps)
+
+With ``strands run --incremental``, earlier sessions of the same workflow are
+loaded into an ``IncrementalCache``. A step whose hash is already cached reuses
+the stored response instead of invoking its agent. Because upstream hashes are
+part of every hash, editing one prompt re-executes that step and everything
+downstream of it, while unaffected steps are answered from the cache.
+
+A reused step does not add an exchange to its agent's conversation history, so
+later steps of the same agent see only the exchanges that actually ran. Step
+outputs remain available to templates via ``steps[n].response`` and
+``tasks.<id>.response``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import structlog
+
+from strands_cli.runtime.strands_adapter import build_system_prompt, resolve_agent_runtime
+from strands_cli.session import SessionState
+from strands_cli.session.repository import SessionRepository
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import Spec
+
+logger = structlog.get_logger(__name__)
+
+# Most recent sessions of a workflow searched for reusable results
+MAX_SESSIONS_SCANNED = 10
+
+_MODEL_FIELDS = {"provider", "model_id", "region", "host", "temperature", "top_p", "max_tokens"}
+
+
+def content_hash(
+    spec: Spec,
+    agent_id: str,
+    rendered_input: str,
+    upstream: list[str],
+    tool_overrides: list[str] | None = None,
+    injected_notes: str | None = None,
+) -> str:
+    """Hash everything that determines an agent call's response.
+
+    Args:
+        spec: Workflow spec
+        agent_id: Agent answering the call
+        rendered_input: Fully rendered user input
+        upstream: Hashes of the results this call depends on
+        tool_overrides: Step or task tool overrides
+        injected_notes: Notes injected into the system prompt
+
+    Returns:
+        Hex-encoded SHA256 hash
+    """
+    agent_config = spec.agents[agent_id]
+    runtime = resolve_agent_runtime(spec, agent_config)
+    payload = {
+        "agent": agent_id,
+        "config": agent_config.model_dump(mode="json", exclude_none=True),
+        "system_prompt": build_system_prompt(agent_config, spec, agent_id, injected_notes),
+        "model": runtime.model_dump(mode="json", include=_MODEL_FIELDS),
+        "tools": tool_overrides,
+        "input": rendered_input,
+        "upstream": upstream,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def result_hash(record: dict[str, Any]) -> str:
+    """Hash identifying a recorded result as an upstream input.
+
+    Agent results carry their content hash; HITL responses (and results
+    recorded before hashes existed) are identified by their response text.
+    """
+    recorded = record.get("hash")
+    if recorded:
+        return str(recorded)
+    response = str(record.get("response", ""))
+    return hashlib.sha256(response.encode("utf-8")).hexdigest()
+
+
+class IncrementalCache:
+    """Responses of earlier runs keyed by content hash."""
+
+    def __init__(self, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            entries: content hash -> recorded result (must contain "response")
+        """
+        self.entries = entries or {}
+        self.reused = 0
+        self.executed = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_session(self, state: SessionState) -> None:
+        """Add the hashed results of a session (existing entries win)."""
+        pattern_state = state.pattern_state
+        records = list(pattern_state.get("step_history") or [])
+        records.extend((pattern_state.get("task_results") or {}).values())
+        for record in records:
+            content = record.get("hash") if isinstance(record, dict) else None
+            if content and "response" in record:
+                self.entries.setdefault(content, record)
+
+    def lookup(self, content: str, pattern: str) -> dict[str, Any] | None:
+        """Return the cached result for a hash and count the outcome.
+
+        Args:
+            content: Content hash of the call about to run
+            pattern: Pattern type label for metrics
+
+        Returns:
+            The recorded result, or None if the call has to run
+        """
+        record = self.entries.get(content)
+        if record is None:
+            self.executed += 1
+            return None
+        self.reused += 1
+        get_metrics().inc("strands_incremental_reused_total", pattern=pattern)
+        return record
+
+
+_active: ContextVar[IncrementalCache | None] = ContextVar("incremental_cache", default=None)
+
+
+def get_incremental_cache() -> IncrementalCache | None:
+    """Return the cache of the current run, if it runs incrementally."""
+    return _active.get()
+
+
+@contextmanager
+def incremental_scope(cache: IncrementalCache | None) -> Iterator[IncrementalCache | None]:
+    """Make a cache available to the executors of the enclosed run.
+
+    The scope is a context variable, so it is inherited by ``asyncio.run``.
+
+    Args:
+        cache: Cache to activate (None runs everything)
+
+    Yields:
+        The active cache
+    """
+    token = _active.set(cache)
+    try:
+        yield cache
+    finally:
+        _active.reset(token)
+
+
+async def load_incremental_cache(
+    repo: SessionRepository,
+    workflow_name: str,
+    exclude_session_id: str | None = None,
+) -> IncrementalCache:
+    """Collect hashed results from earlier sessions of a workflow.
+
+    Sessions are scanned newest first, whatever their status: steps a failed
+    run completed are as reusable as those of a completed run.
+
+    Args:
+        repo: Session repository
+        workflow_name: Spec name whose sessions are scanned
+        exclude_session_id: Session of the current run
+
+    Returns:
+        Cache with the results of up to MAX_SESSIONS_SCANNED sessions
+    """
+    cache = IncrementalCache()
+    sessions = [
+        metadata
+        for metadata in await repo.list_sessions()
+        if metadata.workflow_name == workflow_name and metadata.session_id != exclude_session_id
+    ]
+    sessions.sort(key=lambda metadata: metadata.updated_at, reverse=True)
+    for metadata in sessions[:MAX_SESSIONS_SCANNED]:
+        try:
+            state = await repo.load(metadata.session_id)
+        except Exception as e:
+            logger.warning(
+                "incremental_session_skipped", session_id=metadata.session_id, error=str(e)
+            )
+            continue
+        if state is not None:
+            cache.add_session(state)
+    logger.info(
+        "incremental_cache_loaded",
+        workflow=workflow_name,
+        sessions=min(len(sessions), MAX_SESSIONS_SCANNED),
+        entries=len(cache),
+    )
+    return cache
@@ -0,0 +1,94 @@
+"""Session storage protocol and backend selection.
+
+Executors, resume, cleanup and the API only depend on ``SessionRepository``;
+``create_session_repository`` picks the backend from configuration:
+
+    - file (default): FileSessionRepository under {data_dir}/sessions
+    - s3: S3SessionRepository in STRANDS_SESSION_S3_BUCKET, shared by every
+      worker pointed at the same bucket and prefix
+
+Agent histories are always written by the Strands SDK to a local directory
+(``get_agents_dir``); the S3 backend uploads that directory with each save
+and restores it on load, so any worker can resume any session.
+
+Example:
+    >>> repo = create_session_repository()
+    >>> await repo.save(state, spec_content)
+    >>> state = await repo.load(session_id)
+"""
+
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from strands_cli.config import StrandsConfig
+from strands_cli.session import SessionMetadata, SessionState
+
+
+@runtime_checkable
+class SessionRepository(Protocol):
+    """Async session storage shared by the file and S3 backends."""
+
+    @property
+    def compact(self) -> bool:
+        """Whether sessions are written in the compact, compressed format."""
+        ...
+
+    async def exists(self, session_id: str) -> bool:
+        """Check if a session exists."""
+        ...
+
+    async def save(self, state: SessionState, spec_content: str | None = None) -> None:
+        """Save complete session state (empty spec_content keeps the snapshot)."""
+        ...
+
+    async def load(self, session_id: str) -> SessionState | None:
+        """Load session state, or None if the session doesn't exist."""
+        ...
+
+    async def delete(self, session_id: str) -> None:
+        """Delete a session and its agent histories."""
+        ...
+
+    async def list_sessions(self) -> list[SessionMetadata]:
+        """List metadata of all stored sessions."""
+        ...
+
+    def get_agents_dir(self, session_id: str) -> Path:
+        """Local directory for Strands SDK agent sessions."""
+        ...
+
+    async def get_spec_snapshot_path(self, session_id: str) -> Path:
+        """Local path of the session's spec snapshot."""
+        ...
+
+
+def create_session_repository(storage_dir: Path | None = None) -> SessionRepository:
+    """Create the configured session repository.
+
+    Args:
+        storage_dir: Session directory for the file backend; when given, the
+            file backend is used regardless of STRANDS_SESSION_BACKEND
+
+    Returns:
+        FileSessionRepository or S3SessionRepository
+
+    Raises:
+        ValueError: If the S3 backend is selected without a bucket
+    """
+    from strands_cli.session.file_repository import FileSessionRepository
+
+    config = StrandsConfig()
+    if storage_dir is not None or config.session_backend == "file":
+        return FileSessionRepository(storage_dir=storage_dir)
+
+    from strands_cli.session.s3_repository import S3SessionRepository
+
+    if not config.session_s3_bucket:
+        raise ValueError("STRANDS_SESSION_BACKEND=s3 requires STRANDS_SESSION_S3_BUCKET to be set")
+    return S3SessionRepository(
+        bucket=config.session_s3_bucket,
+        prefix=config.session_s3_prefix,
+        endpoint_url=config.session_s3_endpoint_url,
+        region=config.aws_region,
+        profile=config.aws_profile,
+    )
@@ -9,7 +9,7 @@ Functions:
     run_resume: Main resume entry point called from CLI
 
 Phase 2 Features:
-    - Load session from FileSessionRepository
+    - Load session from the session repository
     - Validate session state (not completed, spec hash check)
     - Load spec from snapshot
     - Restore agent conversation history
@@ -34,7 +34,7 @@ from strands_cli.session import (
     SessionState,
     SessionStatus,
 )
-from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.repository import SessionRepository, create_session_repository
 from strands_cli.session.utils import compute_spec_hash
 from strands_cli.telemetry import configure_telemetry
 from strands_cli.types import PatternType, RunResult, Spec
@@ -44,7 +44,7 @@ console = Console()
 
 
 async def _load_and_validate_session(
-    session_id: str, repo: FileSessionRepository, verbose: bool
+    session_id: str, repo: SessionRepository, verbose: bool
 ) -> SessionState:
     """Load session and validate it can be resumed.
 
@@ -78,8 +78,8 @@ async def _load_and_validate_session(
     return state
 
 
-def _load_spec_from_snapshot(
-    session_id: str, repo: FileSessionRepository, state: SessionState
+async def _load_spec_from_snapshot(
+    session_id: str, repo: SessionRepository, state: SessionState
 ) -> Spec:
     """Load spec from snapshot and validate hash.
 
@@ -94,8 +94,7 @@ def _load_spec_from_snapshot(
     Raises:
         SessionNotFoundError: If snapshot file not found
     """
-    session_dir = repo._session_dir(session_id)
-    spec_snapshot_path = session_dir / "spec_snapshot.yaml"
+    spec_snapshot_path = await repo.get_spec_snapshot_path(session_id)
 
     if not spec_snapshot_path.exists():
         raise SessionNotFoundError(
@@ -126,7 +125,7 @@ async def _dispatch_pattern_executor(
     spec: Spec,
     variables: dict[str, Any],
     session_state: SessionState,
-    session_repo: FileSessionRepository,
+    session_repo: SessionRepository,
     hitl_response: str | None = None,
 ) -> RunResult:
     """Dispatch to pattern-specific executor with session resume support.
@@ -207,6 +206,7 @@ async def run_resume(
     debug: bool = False,
     verbose: bool = False,
     trace: bool = False,
+    session_repo: SessionRepository | None = None,
 ) -> RunResult:
     """Resume workflow execution from saved session with optional HITL response.
 
@@ -224,6 +224,7 @@ async def run_resume(
         debug: Enable debug logging
         verbose: Enable verbose output
         trace: Enable trace export
+        session_repo: Repository holding the session (default: the configured store)
 
     Returns:
         RunResult from resumed execution with spec and variables attached
@@ -242,7 +243,7 @@ async def run_resume(
         >>> result = await run_resume("abc-123", hitl_response="approved")
 
     Phase 2 Implementation:
-        - ✅ Load session from FileSessionRepository
+        - ✅ Load session from the session repository
         - ✅ Validate session state (check status != COMPLETED)
         - ✅ Load spec from spec_snapshot.yaml
         - ✅ Validate spec hash (warn if changed)
@@ -266,11 +267,11 @@ async def run_resume(
         console.print(f"[dim]Loading session: {session_id}[/dim]")
 
     # Load and validate session
-    repo = FileSessionRepository()
+    repo = session_repo or create_session_repository()
     state = await _load_and_validate_session(session_id, repo, verbose)
 
     # Load spec from snapshot and validate hash
-    spec = _load_spec_from_snapshot(session_id, repo, state)
+    spec = await _load_spec_from_snapshot(session_id, repo, state)
 
     # Configure telemetry if specified
     if spec.telemetry:
@@ -0,0 +1,691 @@
+"""S3-compatible session repository for workers sharing sessions.
+
+Stores sessions in a bucket (AWS S3, MinIO or any S3-compatible store) so
+that a session checkpointed by one worker can be resumed by another. I/O is
+native async (httpx with SigV4 signing from botocore) rather than
+``asyncio.to_thread`` around blocking calls, and concurrent writers are
+serialised with conditional writes instead of ``session.locking`` file locks.
+
+Object layout:
+    {prefix}session_{session_id}/
+    ├── session.json                   # Commit record: metadata, variables, usage
+    │                                  # and the keys of the current objects below
+    ├── pattern_state-{revision}.json  # Pattern state (.zst/.gz when compact)
+    ├── agents-{revision}.tar.zst      # Archive of agent histories (or .gz)
+    └── spec_snapshot.yaml             # Original workflow spec
+
+Saves upload the pattern state (and the agent archive, when the local agent
+histories changed) under fresh keys, then commit by writing session.json
+with ``If-Match`` on the ETag this repository last read or wrote
+(``If-None-Match: *`` for a new session). If another worker committed in
+between, the write fails with 412, the fresh objects are removed and
+``SessionConflictError`` is raised; the other worker's checkpoint stays
+intact. Superseded objects are deleted after a successful commit.
+
+Agent histories are written by the Strands SDK to a local working copy under
+{data_dir}/session-cache; ``load`` restores it from the bucket. Archives
+larger than ``multipart_threshold`` are uploaded as a multipart upload whose
+parts are sent in parallel.
+
+Credentials and region come from the standard AWS chain (environment,
+profile, instance role); ``endpoint_url`` selects an S3-compatible server
+with path-style addressing.
+
+Example:
+    >>> repo = S3SessionRepository("my-bucket", endpoint_url="http://localhost:9000")
+    >>> await repo.save(state, spec_content)
+    >>> state = await S3SessionRepository("my-bucket").load(session_id)  # any worker
+"""
+
+import asyncio
+import hashlib
+import io
+import re
+import shutil
+import tarfile
+import uuid
+import xml.etree.ElementTree as ET
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, urlencode
+
+import boto3
+import httpx
+import structlog
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+
+from strands_cli.config import StrandsConfig
+from strands_cli.session import (
+    SessionConflictError,
+    SessionCorruptedError,
+    SessionMetadata,
+    SessionState,
+    TokenUsage,
+)
+from strands_cli.session.storage_format import (
+    COMPACT_FORMAT,
+    compress,
+    compressed_suffix,
+    decompress,
+    dump_json,
+    encode_file,
+    load_json,
+)
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.telemetry.profiler import profile_phase
+
+logger = structlog.get_logger(__name__)
+
+SESSION_FILE = "session.json"
+SPEC_SNAPSHOT_FILE = "spec_snapshot.yaml"
+
+# S3 requires parts of at least 5 MiB (except the last one)
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+PART_SIZE = 8 * 1024 * 1024
+MAX_PARALLEL_PARTS = 8
+
+
+class S3StorageError(Exception):
+    """Unexpected response from the S3-compatible store."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            status_code: HTTP status of the failed request
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _PreconditionFailedError(S3StorageError):
+    """A conditional write lost against another writer."""
+
+
+def _xml_texts(body: bytes, tag: str) -> list[str]:
+    """Texts of all elements named ``tag`` in an S3 XML response (any namespace)."""
+    root = ET.fromstring(body)
+    return [
+        element.text or ""
+        for element in root.iter()
+        if element.tag == tag or element.tag.endswith("}" + tag)
+    ]
+
+
+class S3Client:
+    """Minimal async S3 client: object get/put/delete, listing and multipart upload."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None = None,
+        region: str = "us-east-1",
+        profile: str | None = None,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+        part_size: int = PART_SIZE,
+    ):
+        """Initialize the client.
+
+        Args:
+            bucket: Bucket name
+            endpoint_url: S3-compatible endpoint (path-style); AWS S3 if None
+            region: Signing region
+            profile: AWS profile for credentials
+            multipart_threshold: Uploads at least this large use multipart upload
+            part_size: Multipart part size in bytes
+        """
+        self.bucket = bucket
+        self.region = region
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+        if endpoint_url:
+            self.base_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        else:
+            self.base_url = f"https://{bucket}.s3.{region}.amazonaws.com"
+        self._credentials = boto3.Session(profile_name=profile).get_credentials()
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """HTTP client bound to the running event loop (the CLI runs several loops)."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0))
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        if self._http is not None and self._http_loop is asyncio.get_running_loop():
+            await self._http.aclose()
+        self._http = None
+
+    async def _request(
+        self,
+        method: str,
+        key: str = "",
+        params: dict[str, Any] | None = None,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a (SigV4-signed) request for an object key.
+
+        Raises:
+            _PreconditionFailedError: On HTTP 412 (or 409 for conditional writes)
+            S3StorageError: On any other error status except 404
+        """
+        url = f"{self.base_url}/{quote(key, safe='/-_.~')}"
+        if params:
+            url += "?" + urlencode(params, quote_via=quote)
+        request_headers = dict(headers or {})
+        if self._credentials is not None:
+            signed = AWSRequest(method=method, url=url, data=body, headers=request_headers)
+            S3SigV4Auth(self._credentials.get_frozen_credentials(), "s3", self.region).add_auth(
+                signed
+            )
+            request_headers = dict(signed.headers.items())
+
+        response = await self._client().request(
+            method, url, content=body or None, headers=request_headers
+        )
+        # 409 ConditionalRequestConflict: a concurrent conditional write is in flight
+        if response.status_code in (409, 412):
+            raise _PreconditionFailedError(f"Precondition failed for {key}", 412)
+        if response.status_code >= 400 and response.status_code != 404:
+            raise S3StorageError(
+                f"S3 {method} {key or '/'} failed: HTTP {response.status_code} "
+                f"{response.text[:200]}",
+                response.status_code,
+            )
+        return response
+
+    async def get(self, key: str) -> tuple[bytes, str] | None:
+        """Object body and ETag, or None if the object doesn't exist."""
+        response = await self._request("GET", key)
+        if response.status_code == 404:
+            return None
+        return response.content, response.headers.get("ETag", "")
+
+    async def head(self, key: str) -> bool:
+        """Whether the object exists."""
+        response = await self._request("HEAD", key)
+        return response.status_code != 404
+
+    async def put(
+        self,
+        key: str,
+        body: bytes,
+        if_match: str | None = None,
+        if_none_match: bool = False,
+    ) -> str:
+        """Write an object, optionally conditional on its current ETag.
+
+        Args:
+            key: Object key
+            body: Object contents
+            if_match: Only write if the object's ETag still matches
+            if_none_match: Only write if the object doesn't exist
+
+        Returns:
+            ETag of the written object
+
+        Raises:
+            _PreconditionFailedError: If the condition doesn't hold
+        """
+        if len(body) >= self.multipart_threshold and not (if_match or if_none_match):
+            return await self._put_multipart(key, body)
+        headers = {}
+        if if_match:
+            headers["If-Match"] = if_match
+        elif if_none_match:
+            headers["If-None-Match"] = "*"
+        response = await self._request("PUT", key, body=body, headers=headers)
+        return response.headers.get("ETag", "")
+
+    async def _put_multipart(self, key: str, body: bytes) -> str:
+        """Upload a large object in parts sent concurrently; aborted on failure."""
+        response = await self._request("POST", key, params={"uploads": ""})
+        upload_id = _xml_texts(response.content, "UploadId")[0]
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_PARTS)
+
+        async def _part(number: int, offset: int) -> str:
+            async with semaphore:
+                part = await self._request(
+                    "PUT",
+                    key,
+                    params={"partNumber": number, "uploadId": upload_id},
+                    body=body[offset : offset + self.part_size],
+                )
+                return part.headers.get("ETag", "")
+
+        try:
+            etags = await asyncio.gather(
+                *(
+                    _part(number, offset)
+                    for number, offset in enumerate(range(0, len(body), self.part_size), start=1)
+                )
+            )
+            manifest = "".join(
+                f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+                for number, etag in enumerate(etags, start=1)
+            )
+            response = await self._request(
+                "POST",
+                key,
+                params={"uploadId": upload_id},
+                body=f"<CompleteMultipartUpload>{manifest}</CompleteMultipartUpload>".encode(),
+            )
+            # CompleteMultipartUpload can fail with HTTP 200 and an error document
+            if _xml_texts(response.content, "Code"):
+                raise S3StorageError(f"Multipart upload of {key} failed: {response.text[:200]}")
+        except BaseException:
+            try:
+                await self._request("DELETE", key, params={"uploadId": upload_id})
+            except Exception as e:
+                logger.warning("s3_multipart_abort_failed", key=key, error=str(e))
+            raise
+
+        logger.debug("s3_multipart_upload", key=key, parts=len(etags), size=len(body))
+        etag_values = _xml_texts(response.content, "ETag")
+        return etag_values[0] if etag_values else ""
+
+    async def delete(self, key: str) -> None:
+        """Delete an object (missing objects are ignored)."""
+        await self._request("DELETE", key)
+
+    async def list(self, prefix: str) -> list[str]:
+        """Keys of all objects under a prefix."""
+        keys: list[str] = []
+        params: dict[str, Any] = {"list-type": 2, "prefix": prefix}
+        while True:
+            response = await self._request("GET", params=params)
+            keys.extend(_xml_texts(response.content, "Key"))
+            truncated = _xml_texts(response.content, "IsTruncated")
+            tokens = _xml_texts(response.content, "NextContinuationToken")
+            if not truncated or truncated[0] != "true" or not tokens:
+                return keys
+            params["continuation-token"] = tokens[0]
+
+
+@dataclass
+class _SessionHead:
+    """What this repository last read or wrote for a session."""
+
+    etag: str
+    revision: int
+    pattern_state_key: str
+    agents_key: str | None = None
+    agents_fingerprint: str | None = None
+
+
+def _fingerprint(agents_dir: Path) -> str | None:
+    """Cheap change detector for a local agents directory (None if empty)."""
+    if not agents_dir.exists():
+        return None
+    digest = hashlib.sha256()
+    found = False
+    for path in sorted(agents_dir.rglob("*")):
+        if path.is_file() and not path.is_symlink():
+            stat = path.stat()
+            digest.update(
+                f"{path.relative_to(agents_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+            found = True
+    return digest.hexdigest() if found else None
+
+
+def _pack(agents_dir: Path) -> bytes:
+    """Compressed tar archive of an agents directory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for path in sorted(agents_dir.rglob("*")):
+            if path.is_file() and not path.is_symlink():
+                archive.add(path, arcname=str(path.relative_to(agents_dir)))
+    return compress(buffer.getvalue())
+
+
+def _unpack(payload: bytes, agents_dir: Path) -> None:
+    """Replace an agents directory with the contents of an archive."""
+    shutil.rmtree(agents_dir, ignore_errors=True)
+    agents_dir.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(fileobj=io.BytesIO(decompress(payload)), mode="r") as archive:
+        archive.extractall(agents_dir, filter="data")
+
+
+class S3SessionRepository:
+    """Session storage in an S3-compatible bucket, shared between workers.
+
+    Implements the SessionRepository protocol. Each instance tracks the
+    ETag of every session it loaded or saved; saving a session this
+    instance has not loaded only succeeds if the session doesn't exist yet.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "sessions/",
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        profile: str | None = None,
+        cache_dir: Path | None = None,
+        session_format: str | None = None,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+        part_size: int = PART_SIZE,
+    ):
+        """Initialize the repository.
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix for sessions
+            endpoint_url: S3-compatible endpoint such as MinIO (default: AWS S3)
+            region: Region (default: STRANDS_AWS_REGION)
+            profile: AWS profile (default: STRANDS_AWS_PROFILE)
+            cache_dir: Local working copies of agent histories and spec snapshots
+                (default: {data_dir}/session-cache)
+            session_format: "json" or "compact" (default: STRANDS_SESSION_FORMAT)
+            multipart_threshold: Agent archives at least this large use multipart upload
+            part_size: Multipart part size in bytes
+        """
+        config = StrandsConfig()
+        self.bucket = bucket
+        self.prefix = prefix if not prefix or prefix.endswith("/") else f"{prefix}/"
+        self.session_format = session_format or config.session_format
+        self.client = S3Client(
+            bucket,
+            endpoint_url=endpoint_url,
+            region=region or config.aws_region,
+            profile=profile if profile is not None else config.aws_profile,
+            multipart_threshold=multipart_threshold,
+            part_size=part_size,
+        )
+        self.cache_dir = (cache_dir or config.data_dir / "session-cache") / bucket
+        self._heads: dict[str, _SessionHead] = {}
+        self._save_locks: dict[str, asyncio.Lock] = {}
+
+        logger.debug("session_repository_init", backend="s3", bucket=bucket, prefix=self.prefix)
+
+    @property
+    def compact(self) -> bool:
+        """Whether sessions are written in the compact, compressed format."""
+        return self.session_format == COMPACT_FORMAT
+
+    def _key(self, session_id: str, name: str = "") -> str:
+        """Object key of a session file.
+
+        Raises:
+            SessionCorruptedError: If session_id contains invalid characters
+        """
+        if not re.fullmatch(r"[A-Za-z0-9_-]+", session_id):
+            raise SessionCorruptedError(
+                f"Invalid session identifier '{session_id}' (only [A-Za-z0-9_-] allowed)"
+            )
+        return f"{self.prefix}session_{session_id}/{name}"
+
+    def _local_dir(self, session_id: str) -> Path:
+        """Local working directory of a session."""
+        self._key(session_id)
+        return self.cache_dir / f"session_{session_id}"
+
+    async def _discard(self, keys: list[str | None]) -> None:
+        """Best-effort removal of objects that are no longer referenced."""
+        results = await asyncio.gather(
+            *(self.client.delete(key) for key in keys if key), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("s3_object_cleanup_failed", error=str(result))
+
+    async def exists(self, session_id: str) -> bool:
+        """Check if session exists.
+
+        Args:
+            session_id: Session ID to check
+
+        Returns:
+            True if the session's commit record exists
+        """
+        return await self.client.head(self._key(session_id, SESSION_FILE))
+
+    async def save(self, state: SessionState, spec_content: str | None = None) -> None:
+        """Save complete session state with a conditional commit.
+
+        Args:
+            state: Session state to persist
+            spec_content: Original workflow spec (None or empty = keep snapshot)
+
+        Raises:
+            SessionConflictError: If another writer committed the session first
+            SessionCorruptedError: If the store rejects a write
+        """
+        session_id = state.metadata.session_id
+        lock = self._save_locks.setdefault(session_id, asyncio.Lock())
+        with (
+            get_metrics().track("strands_session_operation_duration_seconds", operation="save"),
+            profile_phase("checkpoint.write"),
+        ):
+            async with lock:
+                await self._save(state, spec_content)
+
+    async def _save(self, state: SessionState, spec_content: str | None) -> None:
+        session_id = state.metadata.session_id
+        head = self._heads.get(session_id)
+        revision = (head.revision if head else 0) + 1
+        token = f"{revision}-{uuid.uuid4().hex[:8]}"
+        suffix = compressed_suffix() if self.compact else ""
+        pattern_key = self._key(session_id, f"pattern_state-{token}.json{suffix}")
+        local_dir = self._local_dir(session_id)
+        agents_dir = local_dir / "agents"
+
+        fingerprint = await asyncio.to_thread(_fingerprint, agents_dir)
+        agents_key = head.agents_key if head else None
+        uploads: list[Awaitable[str]] = [
+            self.client.put(pattern_key, encode_file(state.pattern_state, self.compact))
+        ]
+        new_keys: list[str | None] = [pattern_key]
+        if fingerprint and fingerprint != (head.agents_fingerprint if head else None):
+            agents_key = self._key(session_id, f"agents-{token}.tar{compressed_suffix()}")
+            new_keys.append(agents_key)
+            uploads.append(self.client.put(agents_key, await asyncio.to_thread(_pack, agents_dir)))
+        if spec_content:
+            uploads.append(
+                self.client.put(
+                    self._key(session_id, SPEC_SNAPSHOT_FILE), spec_content.encode("utf-8")
+                )
+            )
+
+        record = {
+            "metadata": state.metadata.model_dump(),
+            "variables": state.variables,
+            "runtime_config": state.runtime_config,
+            "token_usage": state.token_usage.model_dump(),
+            "artifacts_written": state.artifacts_written,
+            "storage": {
+                "revision": revision,
+                "pattern_state": pattern_key,
+                "agents": agents_key,
+            },
+        }
+        try:
+            for result in await asyncio.gather(*uploads, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    raise result
+            etag = await self.client.put(
+                self._key(session_id, SESSION_FILE),
+                dump_json(record, self.compact),
+                if_match=head.etag if head else None,
+                if_none_match=head is None,
+            )
+        except _PreconditionFailedError as e:
+            await self._discard(new_keys)
+            raise SessionConflictError(
+                f"Session {session_id} was saved by another worker since it was loaded; "
+                "reload it to continue from the latest checkpoint"
+            ) from e
+        except S3StorageError as e:
+            await self._discard(new_keys)
+            raise SessionCorruptedError(f"Failed to save session {session_id}: {e}") from e
+
+        if spec_content:
+            await asyncio.to_thread(self._write_local_spec, session_id, spec_content)
+        if head:
+            await self._discard(
+                [head.pattern_state_key, head.agents_key if head.agents_key != agents_key else None]
+            )
+        self._heads[session_id] = _SessionHead(
+            etag=etag,
+            revision=revision,
+            pattern_state_key=pattern_key,
+            agents_key=agents_key,
+            agents_fingerprint=fingerprint or (head.agents_fingerprint if head else None),
+        )
+        logger.info(
+            "session_saved",
+            session_id=session_id,
+            status=state.metadata.status,
+            pattern=state.metadata.pattern_type,
+            backend="s3",
+            revision=revision,
+        )
+
+    def _write_local_spec(self, session_id: str, spec_content: str) -> None:
+        local_dir = self._local_dir(session_id)
+        local_dir.mkdir(parents=True, exist_ok=True)
+        (local_dir / SPEC_SNAPSHOT_FILE).write_text(spec_content, encoding="utf-8")
+
+    async def load(self, session_id: str) -> SessionState | None:
+        """Load session state and restore its local agent histories.
+
+        Args:
+            session_id: Session ID to load
+
+        Returns:
+            SessionState if found, None otherwise
+
+        Raises:
+            SessionCorruptedError: If session data is invalid or incomplete
+        """
+        with get_metrics().track("strands_session_operation_duration_seconds", operation="load"):
+            found = await self.client.get(self._key(session_id, SESSION_FILE))
+            if found is None:
+                logger.warning("session_not_found", session_id=session_id)
+                return None
+            body, etag = found
+            try:
+                record = load_json(body)
+                storage = record.get("storage", {})
+                pattern_key = storage["pattern_state"]
+                agents_key = storage.get("agents")
+                pattern, agents, spec = await asyncio.gather(
+                    self.client.get(pattern_key),
+                    self.client.get(agents_key) if agents_key else asyncio.sleep(0, None),
+                    self.client.get(self._key(session_id, SPEC_SNAPSHOT_FILE)),
+                )
+                if pattern is None:
+                    raise SessionCorruptedError(f"Pattern state {pattern_key} is missing")
+
+                local_dir = self._local_dir(session_id)
+                fingerprint = None
+                if agents:
+                    await asyncio.to_thread(_unpack, agents[0], local_dir / "agents")
+                    fingerprint = await asyncio.to_thread(_fingerprint, local_dir / "agents")
+                if spec:
+                    await asyncio.to_thread(
+                        self._write_local_spec, session_id, spec[0].decode("utf-8")
+                    )
+
+                state = SessionState(
+                    metadata=SessionMetadata(**record["metadata"]),
+                    variables=record["variables"],
+                    runtime_config=record["runtime_config"],
+                    pattern_state=load_json(pattern[0]),
+                    token_usage=TokenUsage(**record["token_usage"]),
+                    artifacts_written=record.get("artifacts_written", []),
+                )
+            except SessionCorruptedError:
+                raise
+            except Exception as e:
+                raise SessionCorruptedError(f"Failed to load session {session_id}: {e}") from e
+
+            self._heads[session_id] = _SessionHead(
+                etag=etag,
+                revision=int(storage.get("revision", 0)),
+                pattern_state_key=pattern_key,
+                agents_key=agents_key,
+                agents_fingerprint=fingerprint,
+            )
+            logger.info(
+                "session_loaded",
+                session_id=session_id,
+                status=state.metadata.status,
+                pattern=state.metadata.pattern_type,
+                backend="s3",
+            )
+            return state
+
+    async def delete(self, session_id: str) -> None:
+        """Delete a session's objects and its local working copy.
+
+        Raises:
+            FileNotFoundError: If the session doesn't exist
+        """
+        keys = await self.client.list(self._key(session_id))
+        if not keys:
+            raise FileNotFoundError(
+                f"Session not found: s3://{self.bucket}/{self._key(session_id)}"
+            )
+        # Remove the commit record first so a partial delete never looks valid
+        await self.client.delete(self._key(session_id, SESSION_FILE))
+        await asyncio.gather(
+            *(self.client.delete(key) for key in keys if not key.endswith(f"/{SESSION_FILE}"))
+        )
+        await asyncio.to_thread(shutil.rmtree, self._local_dir(session_id), True)
+        self._heads.pop(session_id, None)
+        logger.info("session_deleted", session_id=session_id, backend="s3")
+
+    async def list_sessions(self) -> list[SessionMetadata]:
+        """List all sessions under the prefix.
+
+        Returns:
+            List of session metadata objects (unsorted)
+        """
+        keys = [
+            key
+            for key in await self.client.list(f"{self.prefix}session_")
+            if key.endswith(f"/{SESSION_FILE}")
+        ]
+        bodies = await asyncio.gather(
+            *(self.client.get(key) for key in keys), return_exceptions=True
+        )
+        sessions = []
+        for key, found in zip(keys, bodies, strict=True):
+            if found is None:
+                continue
+            try:
+                if isinstance(found, BaseException):
+                    raise found
+                sessions.append(SessionMetadata(**load_json(found[0])["metadata"]))
+            except Exception as e:
+                logger.warning("corrupted_session_skipped", key=key, error=str(e))
+        return sessions
+
+    def get_agents_dir(self, session_id: str) -> Path:
+        """Local directory for Strands SDK agent sessions.
+
+        Restored by ``load`` and uploaded by ``save`` when it changed.
+        """
+        return self._local_dir(session_id) / "agents"
+
+    async def get_spec_snapshot_path(self, session_id: str) -> Path:
+        """Local path of the session's spec snapshot, downloaded if needed."""
+        path = self._local_dir(session_id) / SPEC_SNAPSHOT_FILE
+        if not await asyncio.to_thread(path.exists):
+            found = await self.client.get(self._key(session_id, SPEC_SNAPSHOT_FILE))
+            if found is not None:
+                await asyncio.to_thread(
+                    self._write_local_spec, session_id, found[0].decode("utf-8")
+                )
+        return path
@@ -0,0 +1,170 @@
+"""On-disk encoding of session files: indented JSON or compact, compressed JSON.
+
+``STRANDS_SESSION_FORMAT`` selects how sessions are written:
+
+    - json (default): indented JSON, readable in any editor
+    - compact: orjson without indentation; pattern state and agent message
+      histories are compressed with zstd when ``zstandard`` is installed
+      (``uv pip install "strands-cli[compact]"``), gzip otherwise
+
+``session.json`` stays uncompressed in both formats, so ``strands sessions
+list`` only parses small metadata files.
+
+Reading never depends on the setting: compressed payloads are recognised by
+their magic bytes, so sessions written in either format (including sessions
+from before compact storage existed) load and resume unchanged.
+``strands sessions compact`` converts existing sessions.
+"""
+
+import contextlib
+import gzip
+import json
+import os
+import tempfile
+from typing import Any, cast
+
+import orjson
+from strands.session.file_session_manager import FileSessionManager
+from strands.types.exceptions import SessionException
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+JSON_FORMAT = "json"
+COMPACT_FORMAT = "compact"
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_MAGIC = b"\x1f\x8b"
+
+# zstd level 3 is zstd's default: most of the ratio at a fraction of the CPU
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+
+def compressed_suffix() -> str:
+    """File suffix of compressed payloads written by this installation."""
+    return ".zst" if ZSTD_AVAILABLE else ".gz"
+
+
+def dump_json(data: Any, compact: bool, ensure_ascii: bool = True) -> bytes:
+    """Serialize data as indented JSON or, for compact storage, with orjson.
+
+    Args:
+        data: JSON-compatible data
+        compact: Minify with orjson instead of indenting
+        ensure_ascii: Escape non-ASCII characters in indented output
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if compact:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def compress(payload: bytes) -> bytes:
+    """Compress a payload with zstd, or gzip if zstandard is not installed."""
+    if ZSTD_AVAILABLE:
+        return cast(bytes, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload))
+    return gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def decompress(payload: bytes) -> bytes:
+    """Decompress a zstd or gzip payload; other payloads are returned as-is.
+
+    Raises:
+        ValueError: If the payload is zstd-compressed and zstandard is not installed
+    """
+    if payload.startswith(ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise ValueError(
+                "Session data is zstd-compressed; install zstandard to read it: "
+                'uv pip install "strands-cli[compact]"'
+            )
+        return cast(bytes, zstandard.ZstdDecompressor().decompressobj().decompress(payload))
+    if payload.startswith(GZIP_MAGIC):
+        return gzip.decompress(payload)
+    return payload
+
+
+def load_json(payload: bytes) -> Any:
+    """Parse session file contents in any supported format.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+        ValueError: If the payload cannot be decompressed
+    """
+    raw = decompress(payload)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # json writes NaN/Infinity, which orjson rejects
+        return json.loads(raw)
+
+
+def encode_file(data: Any, compact: bool, ensure_ascii: bool = True) -> bytes:
+    """Encode a compressible session file (pattern state, agent files)."""
+    payload = dump_json(data, compact, ensure_ascii)
+    return compress(payload) if compact else payload
+
+
+class CompactFileSessionManager(FileSessionManager):
+    """Strands FileSessionManager that can store agent histories compressed.
+
+    File names are unchanged (``message_<n>.json``) so the SDK's listing and
+    pagination keep working; the contents are compact, compressed JSON when
+    ``compact`` is set. Reads detect the format, so agent sessions written
+    either way are restored.
+    """
+
+    def __init__(self, session_id: str, storage_dir: str, compact: bool = False, **kwargs: Any):
+        """Initialize the session manager.
+
+        Args:
+            session_id: Agent session ID
+            storage_dir: Directory holding agent sessions
+            compact: Write compact, compressed files
+            **kwargs: Passed to FileSessionManager
+        """
+        self.compact = compact
+        super().__init__(session_id=session_id, storage_dir=storage_dir, **kwargs)
+
+    def _read_file(self, path: str) -> dict[str, Any]:
+        """Read a session file in any supported format, refusing symlinks."""
+        if os.path.islink(path):
+            raise SessionException(
+                f"Refusing to read symlink at {path}. "
+                "This may indicate a symlink attack or session tampering."
+            )
+        try:
+            with open(path, "rb") as f:
+                return cast(dict[str, Any], load_json(f.read()))
+        except ValueError as e:
+            raise SessionException(f"Invalid session data in file {path}: {e}") from e
+
+    def _write_file(self, path: str, data: dict[str, Any]) -> None:
+        """Write a session file atomically in the configured format."""
+        if not self.compact:
+            super()._write_file(path, data)
+            return
+
+        dir_path = os.path.dirname(path)
+        os.makedirs(dir_path, mode=0o700, exist_ok=True)
+        if os.path.islink(path):
+            raise SessionException(
+                f"Refusing to write to symlink at {path}. This may indicate a symlink attack."
+            )
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".strands_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encode_file(data, compact=True))
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
@@ -0,0 +1,342 @@
+"""Runtime metrics registry with Prometheus and OpenTelemetry export.
+
+Executors, AgentCache, model providers, the session repository and tools
+report counters, gauges and latency histograms into one process-wide
+registry. The registry can be:
+- Rendered in the Prometheus text exposition format (the ``/metrics`` route of
+  ``integrations.fastapi_router.create_workflow_router``)
+- Forwarded to an OpenTelemetry meter (configured by ``configure_telemetry``
+  when an OTLP endpoint is set), which exports on its own interval
+
+Metrics:
+    strands_workflow_runs_total{pattern,status}: Completed workflow runs
+    strands_workflow_duration_seconds{pattern}: Workflow wall time
+    strands_workflows_in_progress{pattern}: Workflows currently running
+    strands_agent_invocations_in_progress{agent}: Agent invocations in flight
+    strands_agent_invocation_duration_seconds{agent}: Agent invocation wall time
+    strands_agent_retries_total: Transient-error retries of agent invocations
+    strands_agent_pool_waiting: Leases waiting for a free pooled agent (queue depth)
+    strands_model_call_duration_seconds{model}: Latency of individual model calls
+    strands_tokens_total{model,type}: Provider tokens (input/output/cache_read/cache_write)
+    strands_tool_calls_total{tool,status}: Tool calls by outcome
+    strands_tool_duration_seconds{tool}: Tool call latency
+    strands_cache_requests_total{cache,result}: Agent/model-client cache hits and misses
+    strands_session_operation_duration_seconds{operation}: Session repository latency
+    strands_job_queue_depth: Submitted jobs waiting for a worker (FastAPI job mode)
+    strands_jobs_rejected_total: Job submissions rejected by a full queue
+    strands_circuit_breaker_state{provider,model}: Breaker state (0 closed, 1 half-open, 2 open)
+    strands_circuit_breaker_rejections_total{provider,model}: Calls shed by an open breaker
+    strands_cascade_calls_total{agent,model,outcome}: Model cascade tier outcomes
+    strands_batch_turnaround_seconds{provider}: Batch job submission-to-results time
+    strands_batch_requests_total{provider,status}: Batched requests by outcome
+    strands_incremental_reused_total{pattern}: Steps/tasks answered from earlier runs
+    strands_simulated_calls_total{outcome}: Simulated provider calls (ok/error/throttled)
+    strands_session_runtime_sessions{state}: WorkflowSessions running, queued or paused
+    strands_session_runtime_rejected_total: WorkflowSession starts refused by admission control
+    strands_structured_output_total{agent,outcome}: Router/orchestrator/evaluator decisions
+        (native, fallback to text, parse_retry round-trips)
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from strands_cli.exit_codes import EX_HITL_PAUSE
+
+logger = structlog.get_logger(__name__)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# Latency buckets in seconds, spanning fast tool calls to long model calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+METRICS: dict[str, tuple[str, str]] = {
+    "strands_workflow_runs_total": (COUNTER, "Completed workflow runs"),
+    "strands_workflow_duration_seconds": (HISTOGRAM, "Workflow wall time"),
+    "strands_workflows_in_progress": (GAUGE, "Workflows currently running"),
+    "strands_agent_invocations_in_progress": (GAUGE, "Agent invocations in flight"),
+    "strands_agent_invocation_duration_seconds": (HISTOGRAM, "Agent invocation wall time"),
+    "strands_agent_retries_total": (COUNTER, "Retries of agent invocations"),
+    "strands_agent_pool_waiting": (GAUGE, "Leases waiting for a free pooled agent"),
+    "strands_model_call_duration_seconds": (HISTOGRAM, "Latency of individual model calls"),
+    "strands_tokens_total": (COUNTER, "Provider-reported tokens"),
+    "strands_tool_calls_total": (COUNTER, "Tool calls by outcome"),
+    "strands_tool_duration_seconds": (HISTOGRAM, "Tool call latency"),
+    "strands_cache_requests_total": (COUNTER, "Agent and model-client cache lookups"),
+    "strands_session_operation_duration_seconds": (HISTOGRAM, "Session repository latency"),
+    "strands_job_queue_depth": (GAUGE, "Submitted jobs waiting for a worker"),
+    "strands_jobs_rejected_total": (COUNTER, "Job submissions rejected by a full queue"),
+    "strands_circuit_breaker_state": (
+        GAUGE,
+        "Provider circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ),
+    "strands_circuit_breaker_rejections_total": (COUNTER, "Calls shed by an open breaker"),
+    "strands_cascade_calls_total": (COUNTER, "Model cascade tier outcomes"),
+    "strands_batch_turnaround_seconds": (HISTOGRAM, "Batch job submission-to-results time"),
+    "strands_batch_requests_total": (COUNTER, "Batched requests by outcome"),
+    "strands_incremental_reused_total": (COUNTER, "Steps/tasks answered from earlier runs"),
+    "strands_simulated_calls_total": (COUNTER, "Simulated provider calls by outcome"),
+    "strands_session_runtime_sessions": (GAUGE, "WorkflowSessions by runtime state"),
+    "strands_session_runtime_rejected_total": (
+        COUNTER,
+        "WorkflowSession starts refused by admission control",
+    ),
+    "strands_structured_output_total": (COUNTER, "Control-agent structured output by outcome"),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class _Histogram:
+    """Cumulative bucket counts plus sum and count for one label set."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class RunOutcome:
+    """Outcome of a tracked workflow run."""
+
+    status: str = "error"
+
+    def set_result(self, result: Any) -> None:
+        """Derive the status from a RunResult (completed, failed or paused for HITL)."""
+        if getattr(result, "exit_code", None) == EX_HITL_PAUSE:
+            self.status = "paused"
+        else:
+            self.status = "completed" if result.success else "failed"
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[str, str] | None = None) -> str:
+    pairs = [*key, extra] if extra else list(key)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class MetricsRegistry:
+    """Thread-safe in-process metrics store.
+
+    Metric names must be declared in METRICS so every series has a type and
+    help text. Recording is cheap (a dict update under a lock) so it can be
+    called on hot paths; export happens only when scraped or on the OTEL
+    reader's interval.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._values: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, _Histogram]] = {}
+        self._meter: Any | None = None
+        self._instruments: dict[str, Any] = {}
+
+    def _kind(self, name: str) -> str:
+        try:
+            return METRICS[name][0]
+        except KeyError:
+            raise ValueError(f"Unknown metric: {name}") from None
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Increment a counter, or move a gauge up (or down with a negative value)."""
+        self._kind(name)
+        key = _label_key(labels)
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+        self._forward(name, value, labels)
+
+    def dec(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Move a gauge down."""
+        self.inc(name, -value, **labels)
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one histogram observation."""
+        self._kind(name)
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+        self._forward(name, value, labels)
+
+    @contextmanager
+    def track(self, histogram: str, gauge: str | None = None, **labels: Any) -> Iterator[None]:
+        """Time a block into a histogram, optionally counting it in a gauge while it runs.
+
+        Args:
+            histogram: Histogram that receives the block's duration in seconds
+            gauge: Optional in-progress gauge (same labels) incremented for the duration
+            **labels: Labels for both series
+        """
+        if gauge:
+            self.inc(gauge, **labels)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(histogram, time.perf_counter() - start, **labels)
+            if gauge:
+                self.dec(gauge, **labels)
+
+    @contextmanager
+    def track_run(self, pattern: str) -> Iterator[RunOutcome]:
+        """Track one workflow run: duration, in-progress gauge and outcome counter.
+
+        The caller reports the RunResult with ``outcome.set_result(result)``; a
+        run that raises is counted as "error".
+
+        Args:
+            pattern: Workflow pattern type
+        """
+        outcome = RunOutcome()
+        try:
+            with self.track(
+                "strands_workflow_duration_seconds",
+                "strands_workflows_in_progress",
+                pattern=pattern,
+            ):
+                yield outcome
+        except BaseException:
+            outcome.status = "error"
+            raise
+        finally:
+            self.inc("strands_workflow_runs_total", pattern=pattern, status=outcome.status)
+
+    def value(self, name: str, **labels: Any) -> float:
+        """Current value of a counter or gauge series (0 if never recorded)."""
+        with self._lock:
+            return self._values.get(name, {}).get(_label_key(labels), 0.0)
+
+    def histogram_count(self, name: str, **labels: Any) -> int:
+        """Number of observations in a histogram series."""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_label_key(labels))
+            return histogram.count if histogram else 0
+
+    def render_prometheus(self) -> str:
+        """Render all recorded series in the Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            for name, (kind, help_text) in METRICS.items():
+                if kind == HISTOGRAM:
+                    histograms = self._histograms.get(name)
+                    if not histograms:
+                        continue
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} histogram")
+                    for key, histogram in sorted(histograms.items()):
+                        for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                            labels = _format_labels(key, ("le", _format_value(bound)))
+                            lines.append(f"{name}_bucket{labels} {count}")
+                        labels = _format_labels(key, ("le", "+Inf"))
+                        lines.append(f"{name}_bucket{labels} {histogram.count}")
+                        lines.append(
+                            f"{name}_sum{_format_labels(key)} {_format_value(histogram.total)}"
+                        )
+                        lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+                else:
+                    values = self._values.get(name)
+                    if not values:
+                        continue
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    for key, value in sorted(values.items()):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def attach_meter(self, meter: Any) -> None:
+        """Forward every subsequent recording to an OpenTelemetry meter.
+
+        Counters map to OTEL counters, gauges to up-down counters and
+        histograms to histograms (unit: seconds).
+
+        Args:
+            meter: opentelemetry.metrics.Meter (None detaches)
+        """
+        with self._lock:
+            self._meter = meter
+            self._instruments = {}
+
+    def _forward(self, name: str, value: float, labels: dict[str, Any]) -> None:
+        meter = self._meter
+        if meter is None:
+            return
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            kind, help_text = METRICS[name]
+            unit = "s" if name.endswith("_seconds") else "1"
+            if kind == COUNTER:
+                instrument = meter.create_counter(name, unit=unit, description=help_text)
+            elif kind == GAUGE:
+                instrument = meter.create_up_down_counter(name, unit=unit, description=help_text)
+            else:
+                instrument = meter.create_histogram(name, unit=unit, description=help_text)
+            self._instruments[name] = instrument
+        attributes = {label: str(label_value) for label, label_value in labels.items()}
+        try:
+            if METRICS[name][0] == HISTOGRAM:
+                instrument.record(value, attributes)
+            else:
+                instrument.add(value, attributes)
+        except Exception as e:
+            logger.debug("metrics_forward_failed", metric=name, error=str(e))
+
+    def reset(self) -> None:
+        """Drop all recorded series (tests and long-lived daemons)."""
+        with self._lock:
+            self._values.clear()
+            self._histograms.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
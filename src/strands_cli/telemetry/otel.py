@@ -3,6 +3,7 @@
 Provides OTEL tracing with:
 - TracerProvider with configurable sampling (TraceIdRatioBased)
 - OTLP/Console exporters based on endpoint configuration
+- OTLP export of the runtime metrics registry when an endpoint is configured
 - Auto-instrumentation for httpx and logging
 - Structlog trace context injection
 - Redaction of sensitive data per telemetry.redact config
@@ -38,6 +39,7 @@ from opentelemetry.sdk.trace.export import (
 )
 from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
 
+from strands_cli.telemetry.metrics import get_metrics
 from strands_cli.telemetry.redaction import RedactionEngine
 
 logger = structlog.get_logger(__name__)
@@ -327,6 +329,9 @@ _tracer_provider: TracerProvider | NoOpTracerProvider = NoOpTracerProvider()
 # Global trace collector (initially None)
 _trace_collector: TraceCollector | None = None
 
+# Global meter provider exporting the metrics registry (None = metrics not exported)
+_meter_provider: Any | None = None
+
 # Global lock for thread-safe configuration
 _telemetry_lock = Lock()
 
@@ -469,6 +474,9 @@ def _configure_telemetry_locked(spec_telemetry: dict[str, Any] | None = None) ->
     trace.set_tracer_provider(provider)
     _tracer_provider = provider
 
+    if endpoint:
+        _configure_metrics_exporter(endpoint, resource)
+
     # Auto-instrument httpx (all HTTP calls in doctor command and HTTP executors)
     try:
         from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
@@ -490,6 +498,35 @@ def _configure_telemetry_locked(spec_telemetry: dict[str, Any] | None = None) ->
     logger.info("telemetry_configured", provider_type=type(provider).__name__)
 
 
+def _configure_metrics_exporter(endpoint: str, resource: Resource) -> None:
+    """Export the runtime metrics registry over OTLP.
+
+    Uses a PeriodicExportingMetricReader, so the export interval follows
+    OTEL_METRIC_EXPORT_INTERVAL (default: 60s).
+
+    Args:
+        endpoint: OTLP gRPC endpoint
+        resource: Resource shared with the tracer provider
+    """
+    global _meter_provider
+
+    try:
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+            OTLPMetricExporter,
+        )
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+        if _meter_provider is not None:
+            _meter_provider.shutdown()
+        reader = PeriodicExportingMetricReader(OTLPMetricExporter(endpoint=endpoint))
+        _meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
+        get_metrics().attach_meter(_meter_provider.get_meter("strands-cli"))
+        logger.info("otlp_metrics_exporter_configured", endpoint=endpoint)
+    except Exception as e:
+        logger.warning("otlp_metrics_exporter_failed", error=str(e))
+
+
 def force_flush_telemetry(timeout_millis: int = 30000) -> bool:
     """Force flush pending spans to exporters.
 
@@ -519,14 +556,19 @@ def force_flush_telemetry(timeout_millis: int = 30000) -> bool:
 
 
 def shutdown_telemetry() -> None:
-    """Shutdown telemetry and flush pending spans."""
-    global _tracer_provider
+    """Shutdown telemetry and flush pending spans and metrics."""
+    global _tracer_provider, _meter_provider
 
     if hasattr(_tracer_provider, "shutdown"):
         logger.debug("telemetry_shutting_down")
         _tracer_provider.shutdown()
         logger.info("telemetry_shutdown_complete")
 
+    if _meter_provider is not None:
+        get_metrics().attach_meter(None)
+        _meter_provider.shutdown()
+        _meter_provider = None
+
 
 def add_otel_context(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Structlog processor to inject OTEL trace context.
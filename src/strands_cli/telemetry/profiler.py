@@ -0,0 +1,304 @@
+"""Per-phase run profiler for ``strands run --profile``.
+
+Times the phases of a run (spec parsing and validation, agent construction,
+agent invocations, model calls, tool calls, template rendering, checkpoint and
+artifact writes) and separates time spent waiting on the LLM from the CLI's
+own orchestration time, which is otherwise hidden inside model wall time.
+
+Phases nest: each phase's self time excludes the phases timed inside it.
+Nesting is tracked per asyncio task (via a ContextVar) so concurrent branches
+of parallel, workflow and graph patterns are attributed to the right parent.
+
+When no profiler is active, ``profile_phase`` returns a shared null context
+and ``record_phase`` returns immediately, so instrumentation costs nothing on
+normal runs.
+
+Outputs:
+    - JSON report: summary, per-phase, per-step and per-tool tables
+    - Folded stacks (``run;agent.invoke[writer];model.call 1234``) of self time
+      in microseconds, readable by flamegraph.pl, speedscope and inferno
+    - Optional cProfile stats of the main thread (``.pstats``)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+PHASE_LLM = "model.call"
+PHASE_TOOL = "tool.call"
+PHASE_STEP = "agent.invoke"
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class _Frame:
+    """An open (or externally timed) phase."""
+
+    name: str
+    labels: dict[str, str]
+    start: float = 0.0
+    children_seconds: float = 0.0
+    llm_seconds: float = 0.0
+    tool_seconds: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Frame name as shown in folded stacks."""
+        if not self.labels:
+            return self.name
+        return f"{self.name}[{','.join(self.labels.values())}]"
+
+
+@dataclass
+class _Stats:
+    """Aggregate timings for one phase or tool."""
+
+    count: int = 0
+    total: float = 0.0
+    self_total: float = 0.0
+    max: float = 0.0
+
+    def add(self, duration: float, self_seconds: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.self_total += self_seconds
+        self.max = max(self.max, duration)
+
+
+@dataclass
+class _Step:
+    """One agent invocation."""
+
+    agent: str
+    start_offset: float
+    wall: float
+    llm: float
+    tool: float
+
+
+# Open phases of the current task, innermost last
+_stack: ContextVar[tuple[_Frame, ...]] = ContextVar("strands_profiler_stack", default=())
+
+
+class RunProfiler:
+    """Collects phase timings for one run."""
+
+    def __init__(self, cpu: bool = False) -> None:
+        """Start the run clock.
+
+        Args:
+            cpu: Also record a cProfile of the main thread
+        """
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+        self.cpu_profile = cProfile.Profile() if cpu else None
+        self._lock = threading.Lock()
+        self._phases: dict[str, _Stats] = {}
+        self._tools: dict[str, _Stats] = {}
+        self._steps: list[_Step] = []
+        self._folded: dict[str, float] = {}
+        self._top_level_seconds = 0.0
+        if self.cpu_profile is not None:
+            self.cpu_profile.enable()
+
+    def stop(self) -> None:
+        """Stop the run clock and the CPU profiler (idempotent)."""
+        if self.finished is not None:
+            return
+        self.finished = time.perf_counter()
+        if self.cpu_profile is not None:
+            self.cpu_profile.disable()
+
+    @property
+    def wall_seconds(self) -> float:
+        """Elapsed run time (up to stop() once stopped)."""
+        return (self.finished or time.perf_counter()) - self.started
+
+    @contextmanager
+    def phase(self, name: str, **labels: Any) -> Iterator[None]:
+        """Time a block as a phase nested under the current one."""
+        frame = _Frame(name, {k: str(v) for k, v in labels.items()}, time.perf_counter())
+        parents = _stack.get()
+        token = _stack.set((*parents, frame))
+        try:
+            yield
+        finally:
+            _stack.reset(token)
+            self._close(frame, time.perf_counter() - frame.start, parents)
+
+    def record(self, name: str, duration: float, **labels: Any) -> None:
+        """Record a phase timed elsewhere (e.g. by an agent hook) under the current one."""
+        frame = _Frame(name, {k: str(v) for k, v in labels.items()})
+        self._close(frame, duration, _stack.get())
+
+    def _close(self, frame: _Frame, duration: float, parents: tuple[_Frame, ...]) -> None:
+        # Concurrent children can sum to more than the parent's wall time
+        self_seconds = max(duration - frame.children_seconds, 0.0)
+        path = ";".join(["run", *(parent.key for parent in parents), frame.key])
+        with self._lock:
+            self._phases.setdefault(frame.name, _Stats()).add(duration, self_seconds)
+            self._folded[path] = self._folded.get(path, 0.0) + self_seconds
+            if parents:
+                parents[-1].children_seconds += duration
+            else:
+                self._top_level_seconds += duration
+            if frame.name in (PHASE_LLM, PHASE_TOOL):
+                for parent in parents:
+                    if frame.name == PHASE_LLM:
+                        parent.llm_seconds += duration
+                    else:
+                        parent.tool_seconds += duration
+            if frame.name == PHASE_TOOL:
+                tool = frame.labels.get("tool", "unknown")
+                self._tools.setdefault(tool, _Stats()).add(duration, self_seconds)
+            elif frame.name == PHASE_STEP:
+                self._steps.append(
+                    _Step(
+                        agent=frame.labels.get("agent", "unknown"),
+                        start_offset=frame.start - self.started,
+                        wall=duration,
+                        llm=frame.llm_seconds,
+                        tool=frame.tool_seconds,
+                    )
+                )
+
+    def report(self, **metadata: Any) -> dict[str, Any]:
+        """Build the structured timing breakdown.
+
+        Durations of concurrent phases are summed, so for parallel patterns the
+        LLM, tool and self totals can exceed the run's wall time.
+
+        Args:
+            **metadata: Extra top-level fields (e.g. spec_name, pattern)
+
+        Returns:
+            JSON-serializable report with summary, phases, steps and tools
+        """
+        wall = self.wall_seconds
+        with self._lock:
+            phases = dict(self._phases)
+            tools = dict(self._tools)
+            steps = sorted(self._steps, key=lambda step: step.start_offset)
+            top_level = self._top_level_seconds
+
+        llm = phases[PHASE_LLM].total if PHASE_LLM in phases else 0.0
+        tool_time = phases[PHASE_TOOL].total if PHASE_TOOL in phases else 0.0
+        unattributed = max(wall - top_level, 0.0)
+        self_time = unattributed + sum(
+            stats.self_total
+            for name, stats in phases.items()
+            if name not in (PHASE_LLM, PHASE_TOOL)
+        )
+
+        return {
+            **metadata,
+            "wall_seconds": round(wall, 6),
+            "summary": {
+                "llm_wait_seconds": round(llm, 6),
+                "tool_seconds": round(tool_time, 6),
+                "self_seconds": round(self_time, 6),
+                "unattributed_seconds": round(unattributed, 6),
+            },
+            "phases": [
+                {
+                    "phase": name,
+                    "count": stats.count,
+                    "total_seconds": round(stats.total, 6),
+                    "self_seconds": round(stats.self_total, 6),
+                    "max_seconds": round(stats.max, 6),
+                }
+                for name, stats in sorted(phases.items(), key=lambda item: -item[1].total)
+            ],
+            "steps": [
+                {
+                    "index": index,
+                    "agent": step.agent,
+                    "start_offset_seconds": round(step.start_offset, 6),
+                    "wall_seconds": round(step.wall, 6),
+                    "llm_seconds": round(step.llm, 6),
+                    "tool_seconds": round(step.tool, 6),
+                    "self_seconds": round(max(step.wall - step.llm - step.tool, 0.0), 6),
+                }
+                for index, step in enumerate(steps)
+            ],
+            "tools": [
+                {
+                    "tool": name,
+                    "calls": stats.count,
+                    "total_seconds": round(stats.total, 6),
+                    "max_seconds": round(stats.max, 6),
+                }
+                for name, stats in sorted(tools.items(), key=lambda item: -item[1].total)
+            ],
+        }
+
+    def folded_stacks(self) -> str:
+        """Self time per phase stack in the folded format, in microseconds."""
+        with self._lock:
+            folded = dict(self._folded)
+            top_level = self._top_level_seconds
+        folded["run"] = folded.get("run", 0.0) + max(self.wall_seconds - top_level, 0.0)
+        lines = [
+            f"{path} {round(seconds * 1_000_000)}"
+            for path, seconds in sorted(folded.items())
+            if seconds > 0
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_active: RunProfiler | None = None
+
+
+def start_profiling(cpu: bool = False) -> RunProfiler:
+    """Start profiling the current run.
+
+    Args:
+        cpu: Also record a cProfile of the main thread
+
+    Returns:
+        The active profiler
+    """
+    global _active
+    _active = RunProfiler(cpu=cpu)
+    return _active
+
+
+def stop_profiling() -> RunProfiler | None:
+    """Stop and detach the active profiler.
+
+    Returns:
+        The stopped profiler, or None if profiling was not active
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> RunProfiler | None:
+    """Return the active profiler, or None if profiling is off."""
+    return _active
+
+
+def profile_phase(name: str, **labels: Any) -> AbstractContextManager[None]:
+    """Time a block as a phase of the active profiler (no-op when profiling is off)."""
+    profiler = _active
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.phase(name, **labels)
+
+
+def record_phase(name: str, duration: float, **labels: Any) -> None:
+    """Record an externally timed phase with the active profiler (no-op when off)."""
+    profiler = _active
+    if profiler is not None:
+        profiler.record(name, duration, **labels)
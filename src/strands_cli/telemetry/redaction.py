@@ -2,10 +2,16 @@
 
 Provides pattern-based redaction of sensitive data in span attributes,
 including emails, credit cards, SSNs, phone numbers, and API keys.
+
+Patterns are applied one after another, exactly as listed, but each pass is
+skipped when a cheap prefilter says it cannot match: emails need an "@" (and
+are matched only in the whitespace-delimited windows around it), card/SSN/phone
+numbers need a digit, and API keys need a sensitive key context.
 """
 
 import json
 import re
+from functools import lru_cache
 from re import Pattern
 from typing import Any
 
@@ -13,6 +19,27 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+_SENSITIVE_KEY_TERMS = ("key", "token", "secret", "password", "credential")
+
+# CREDIT_CARD_PATTERN, SSN_PATTERN and PHONE_PATTERN led by \d instead of \b (the
+# boundary becomes a lookbehind), so the regex engine skips ahead to digits
+# instead of trying every position. Same matches, applied in the same order.
+_DIGIT_PATTERN = re.compile(r"\d")
+_NUMBER_PATTERNS = (
+    re.compile(r"\d(?<!\w\d)\d{3}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b"),  # Credit card
+    re.compile(r"\d(?<!\w\d)\d{2}-\d{2}-\d{4}\b"),  # SSN
+    re.compile(r"\d(?<!\w\d)\d{2}[-.]?\d{3}[-.]?\d{4}\b"),  # Phone
+)
+_EMAIL_WINDOW_DELIMITERS = (" ", "\n", "\t")
+_MIN_API_KEY_LENGTH = 20
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key_name(key: str) -> bool:
+    """Cached check whether an attribute key name suggests sensitive data."""
+    key_lower = key.lower()
+    return any(term in key_lower for term in _SENSITIVE_KEY_TERMS)
+
 
 class RedactionEngine:
     """Engine for detecting and redacting PII in span attributes."""
@@ -43,6 +70,7 @@ class RedactionEngine:
             self.PHONE_PATTERN,
             self.API_KEY_PATTERN,
         ]
+        builtin_count = len(self.patterns)
 
         # Add custom patterns if provided
         if custom_patterns:
@@ -58,6 +86,7 @@ class RedactionEngine:
                     )
 
         self.redaction_count = 0
+        self._custom_patterns = self.patterns[builtin_count:]
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if attribute key suggests sensitive data.
@@ -68,9 +97,7 @@ class RedactionEngine:
         Returns:
             True if key name suggests sensitive data (API keys, tokens, secrets, etc.).
         """
-        key_lower = key.lower()
-        sensitive_terms = ["key", "token", "secret", "password", "credential"]
-        return any(term in key_lower for term in sensitive_terms)
+        return _is_sensitive_key_name(key)
 
     def redact_value(self, value: Any, is_sensitive_context: bool = True) -> Any:
         """Redact PII from a value of any type.
@@ -106,16 +133,16 @@ class RedactionEngine:
         """
         original = text
 
-        # Apply patterns based on context
-        if is_sensitive_context:
-            # Sensitive context: apply ALL patterns including API key
-            for pattern in self.patterns:
+        if "@" in text:
+            text = self._redact_emails(text)
+        if _DIGIT_PATTERN.search(text) is not None:
+            for pattern in _NUMBER_PATTERNS:
                 text = pattern.sub(self.REDACTED_PLACEHOLDER, text)
-        else:
-            # Non-sensitive context: apply all patterns EXCEPT API key
-            for pattern in self.patterns:
-                if pattern is not self.API_KEY_PATTERN:
-                    text = pattern.sub(self.REDACTED_PLACEHOLDER, text)
+        # Sensitive context applies ALL patterns; otherwise skip the API key pattern
+        if is_sensitive_context and len(text) >= _MIN_API_KEY_LENGTH:
+            text = self.API_KEY_PATTERN.sub(self.REDACTED_PLACEHOLDER, text)
+        for pattern in self._custom_patterns:
+            text = pattern.sub(self.REDACTED_PLACEHOLDER, text)
 
         # Track if redaction occurred
         if text != original:
@@ -123,6 +150,32 @@ class RedactionEngine:
 
         return text
 
+    def _redact_emails(self, text: str) -> str:
+        """Apply EMAIL_PATTERN only to the whitespace-delimited windows around each "@".
+
+        Emails cannot contain whitespace, so matching within those windows finds
+        the same addresses as scanning the whole string.
+
+        Args:
+            text: String containing at least one "@".
+
+        Returns:
+            String with emails replaced.
+        """
+        parts = []
+        last = 0
+        at = text.find("@")
+        while at != -1:
+            start = max(text.rfind(d, last, at) for d in _EMAIL_WINDOW_DELIMITERS) + 1 or last
+            ends = [text.find(d, at) for d in _EMAIL_WINDOW_DELIMITERS]
+            end = min((e for e in ends if e != -1), default=len(text))
+            parts.append(text[last:start])
+            parts.append(self.EMAIL_PATTERN.sub(self.REDACTED_PLACEHOLDER, text[start:end]))
+            last = end
+            at = text.find("@", end)
+        parts.append(text[last:])
+        return "".join(parts)
+
     def _redact_dict(
         self, data: dict[str, Any], is_sensitive_context: bool = True
     ) -> dict[str, Any]:
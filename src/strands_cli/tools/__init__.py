@@ -2,7 +2,7 @@
 
 from strands_cli.tools.registry import get_registry
 
-# Auto-discover happens on first get_registry() call (singleton pattern)
+# Manifest load (or discovery fallback) happens on first get_registry() call
 # No explicit initialization needed
 
 __all__ = ["get_registry"]
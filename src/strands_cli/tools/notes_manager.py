@@ -7,16 +7,29 @@ Key features:
 - Markdown-formatted notes with ISO8601 timestamps
 - Agent attribution and step tracking
 - Thread-safe concurrent writes via filelock
+- Optional in-process write buffering (flushed on a timer, before reads, and on close)
+- Sidecar offset index so reading the last N notes is one seek and read
 - Read last N notes for context injection
-- Atomic writes for reliability
 
 Format:
     ## [2025-11-07T14:32:00Z] — Agent: research-agent (Step 1)
     - **Input**: Analyze sentiment of customer reviews
     - **Tools used**: http_request, file_read
     - **Outcome**: Positive sentiment (0.82 score)
+
+Offset index (``<notes file>.idx``):
+    A little-endian uint64 header holding the notes file size the index covers,
+    followed by one uint64 start offset per entry. Entry boundaries come from the
+    writer, so entries whose text contains ``##`` are never split. If the header
+    does not match the notes file (file created by an older version, edited by hand,
+    or a writer crashed mid-flush), the index is rebuilt by scanning entry headers.
 """
 
+import atexit
+import contextlib
+import struct
+import threading
+import weakref
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -25,6 +38,25 @@ from filelock import FileLock
 
 logger = structlog.get_logger(__name__)
 
+# Flush interval used by workflow executors (NotesAppenderHook writes)
+NOTES_FLUSH_INTERVAL_S = 1.0
+
+# Flush early once this many entries are pending
+MAX_BUFFERED_ENTRIES = 64
+
+_OFFSET = struct.Struct("<Q")
+
+_buffered_managers: "weakref.WeakSet[NotesManager]" = weakref.WeakSet()
+
+
+def _flush_all_buffered() -> None:
+    """Flush every buffered manager at interpreter exit."""
+    for manager in list(_buffered_managers):
+        manager.close()
+
+
+atexit.register(_flush_all_buffered)
+
 
 class NotesManagerError(Exception):
     """Raised when notes operations fail."""
@@ -41,6 +73,11 @@ class NotesManager:
     - Markdown formatting with timestamps and agent attribution
     - Concurrent write safety via file locking
 
+    With ``flush_interval_s > 0`` appends are buffered in memory and written in
+    batches (one lock acquisition per flush instead of per entry). Buffered
+    entries are flushed after ``flush_interval_s``, before every read, when
+    MAX_BUFFERED_ENTRIES are pending, on close(), and at interpreter exit.
+
     Example:
         manager = NotesManager("artifacts/workflow-notes.md")
         manager.append_entry(
@@ -54,24 +91,37 @@ class NotesManager:
         last_notes = manager.read_last_n(3)
     """
 
-    def __init__(self, file_path: str, format: str = "markdown"):
+    def __init__(self, file_path: str, format: str = "markdown", flush_interval_s: float = 0.0):
         """Initialize notes manager.
 
         Args:
             file_path: Path to notes file (e.g., "artifacts/workflow-notes.md")
             format: The format of the notes, either "markdown" or "json".
+            flush_interval_s: Buffer appends for up to this many seconds
+                (0 writes every entry immediately)
         """
         self.file_path = Path(file_path)
         self.lock_path = Path(f"{file_path}.lock")
+        self.index_path = Path(f"{file_path}.idx")
         self.format = format
+        self.flush_interval_s = flush_interval_s
+
+        self._file_lock = FileLock(self.lock_path, timeout=10)
+        self._buffer_lock = threading.RLock()
+        self._pending: list[str] = []
+        self._flush_timer: threading.Timer | None = None
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if flush_interval_s > 0:
+            _buffered_managers.add(self)
+
         logger.debug(
             "notes_manager_initialized",
             file_path=str(self.file_path),
             lock_path=str(self.lock_path),
+            flush_interval_s=flush_interval_s,
         )
 
     def append_entry(
@@ -85,7 +135,8 @@ class NotesManager:
     ) -> None:
         """Append a note entry to the notes file.
 
-        Thread-safe operation using file locking for concurrent writes.
+        Thread-safe operation using file locking for concurrent writes. When
+        buffering is enabled the entry is queued and written by the next flush.
 
         Args:
             timestamp: ISO8601 timestamp (e.g., "2025-11-07T14:32:00Z")
@@ -114,19 +165,116 @@ class NotesManager:
             file=str(self.file_path),
         )
 
-        try:
-            # Use file lock for concurrent write safety
-            lock = FileLock(self.lock_path, timeout=10)
-            with lock, open(self.file_path, "a", encoding="utf-8") as f:
-                f.write(entry + "\n\n")
+        with self._buffer_lock:
+            self._pending.append(entry)
+            if self.flush_interval_s <= 0 or len(self._pending) >= MAX_BUFFERED_ENTRIES:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_s, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
-        except Exception as e:
-            logger.error(
-                "note_append_failed",
-                error=str(e),
-                file=str(self.file_path),
-            )
-            raise NotesManagerError(f"Failed to append note entry: {e}") from e
+    def flush(self) -> None:
+        """Write all buffered entries to the notes file and offset index.
+
+        Raises:
+            NotesManagerError: If the write fails (entries stay buffered for retry)
+        """
+        with self._buffer_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+
+            pending = self._pending
+            self._pending = []
+            try:
+                with self._file_lock:
+                    self._write_entries_locked(pending)
+            except Exception as e:
+                self._pending = pending + self._pending
+                logger.error(
+                    "note_append_failed",
+                    error=str(e),
+                    file=str(self.file_path),
+                )
+                raise NotesManagerError(f"Failed to append note entry: {e}") from e
+
+            logger.debug("notes_flushed", entries=len(pending), file=str(self.file_path))
+
+    def close(self) -> None:
+        """Flush buffered entries; failures are logged rather than raised."""
+        # Already logged on failure; notes are auxiliary and must not fail the run
+        with contextlib.suppress(NotesManagerError):
+            self.flush()
+        _buffered_managers.discard(self)
+
+    def _flush_on_timer(self) -> None:
+        # Already logged on failure; entries are retried on the next flush
+        with contextlib.suppress(NotesManagerError):
+            self.flush()
+
+    def _write_entries_locked(self, entries: list[str]) -> None:
+        """Append entries and their offsets (caller holds the file lock)."""
+        with open(self.file_path, "ab") as f:
+            start = f.tell()
+            self._ensure_index_locked(start)
+
+            offsets: list[int] = []
+            payload = bytearray()
+            for entry in entries:
+                offsets.append(start + len(payload))
+                payload += (entry + "\n\n").encode("utf-8")
+            f.write(payload)
+
+        # Offsets first, covered size last: a crash in between leaves a header
+        # mismatch, which triggers a rebuild instead of a wrong read
+        with open(self.index_path, "r+b") as idx:
+            idx.seek(0, 2)
+            idx.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+            idx.seek(0)
+            idx.write(_OFFSET.pack(start + len(payload)))
+
+    def _ensure_index_locked(self, file_size: int) -> None:
+        """Rebuild the offset index unless it covers exactly ``file_size`` bytes."""
+        try:
+            with open(self.index_path, "rb") as idx:
+                header = idx.read(_OFFSET.size)
+                idx.seek(0, 2)
+                index_size = idx.tell()
+            if (
+                len(header) == _OFFSET.size
+                and index_size % _OFFSET.size == 0
+                and _OFFSET.unpack(header)[0] == file_size
+            ):
+                return
+        except FileNotFoundError:
+            pass
+
+        offsets = self._scan_entry_offsets(file_size)
+        with open(self.index_path, "wb") as idx:
+            idx.write(_OFFSET.pack(file_size))
+            idx.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+
+        logger.debug("notes_index_rebuilt", entries=len(offsets), file=str(self.file_path))
+
+    def _scan_entry_offsets(self, file_size: int) -> list[int]:
+        """Find entry start offsets by scanning the notes file line by line."""
+        if file_size == 0 or not self.file_path.exists():
+            return []
+
+        marker = b"{" if self.format == "json" else b"## ["
+        offsets: list[int] = []
+        position = 0
+        with open(self.file_path, "rb") as f:
+            for line in f:
+                if position >= file_size:
+                    break
+                if line.startswith(marker):
+                    offsets.append(position)
+                position += len(line)
+        return offsets
 
     def read_last_n(self, n: int) -> str:
         """Read the last N note entries from the file.
@@ -146,8 +294,9 @@ class NotesManager:
         """Read the last N note entries for injection into agent context.
 
         This is the primary method for retrieving notes to inject into agent prompts.
-        Uses efficient streaming read from end of file to handle large notes files
-        without loading entire file into memory.
+        Flushes buffered entries first (reads happen at step boundaries), then
+        looks up the start of the Nth-from-last entry in the offset index and reads
+        from there: one seek and read regardless of notes file size.
 
         Alias: read_last_n() is maintained for backwards compatibility.
 
@@ -160,24 +309,32 @@ class NotesManager:
         Raises:
             NotesManagerError: If file read fails
         """
+        self.flush()
+
         if not self.file_path.exists():
             logger.debug("notes_file_not_found", file=str(self.file_path))
             return ""
 
-        try:
-            # For small N, use efficient streaming read from end of file
-            # For large N or small files, fall back to full read
-            file_size = self.file_path.stat().st_size
-
-            # If file is small (<100KB) or N is large, just read entire file
-            if file_size < 100_000 or n > 50:
-                with open(self.file_path, encoding="utf-8") as f:
-                    content = f.read()
-                return self._extract_last_n_entries(content, n)
-
-            # For larger files with small N, read from end efficiently
-            return self._stream_last_n_entries(n)
+        if n <= 0:
+            return ""
 
+        try:
+            located = self._locate_last_n(n)
+            if located is None:
+                # Index missing or stale (another writer, older notes file): rebuild
+                with self._file_lock:
+                    self._ensure_index_locked(self.file_path.stat().st_size)
+                    located = self._locate_last_n(n)
+            if located is None:
+                raise NotesManagerError("Notes index is inconsistent after rebuild")
+
+            start, end, returned = located
+            with open(self.file_path, "rb") as f:
+                f.seek(start)
+                content = f.read(end - start)
+
+        except NotesManagerError:
+            raise
         except Exception as e:
             logger.error(
                 "note_read_failed",
@@ -186,115 +343,45 @@ class NotesManager:
             )
             raise NotesManagerError(f"Failed to read notes: {e}") from e
 
-    def _extract_last_n_entries(self, content: str, n: int) -> str:
-        """Extract last N entries from content string.
-
-        Args:
-            content: Full file content
-            n: Number of entries to extract
-
-        Returns:
-            Formatted string with last N entries
-        """
-        # Handle n=0 case
-        if n <= 0:
-            return ""
-
-        # Split on ## headers (note entries)
-        entries = [entry.strip() for entry in content.split("##") if entry.strip()]
-
-        if not entries:
-            return ""
-
-        # Get last N entries
-        selected_entries = entries[-n:] if len(entries) > n else entries
-
-        # Reconstruct with ## prefixes
-        result = "\n\n".join(f"## {entry}" for entry in selected_entries)
-
         logger.debug(
             "read_last_n_notes",
             requested=n,
-            found=len(entries),
-            returned=len(selected_entries),
+            returned=returned,
+            bytes_read=end - start,
         )
 
-        return result
-
-    def _stream_last_n_entries(self, n: int) -> str:
-        """Stream last N entries from file without loading entire file.
+        return content.decode("utf-8", errors="replace").strip()
 
-        Reads file in chunks from the end, accumulating entries until we have
-        enough. This is memory-efficient for large files.
+    def _locate_last_n(self, n: int) -> tuple[int, int, int] | None:
+        """Return (start, end, entry_count) for the last N entries, or None if stale.
 
-        Args:
-            n: Number of entries to read
-
-        Returns:
-            Formatted string with last N entries
+        The index is valid only if its header equals the current file size, so a
+        concurrent writer that has appended notes but not yet its offsets is
+        detected and handled under the file lock by the caller.
         """
-        # Handle n=0 case
-        if n <= 0:
-            return ""
-
-        chunk_size = 8192  # 8KB chunks
-        entries: list[str] = []
-        partial_entry = ""
-
-        with open(self.file_path, "rb") as f:
-            # Get file size and start from end
-            f.seek(0, 2)  # Seek to end
-            file_size = f.tell()
-
-            # Read chunks from end until we have N entries
-            offset = 0
-            while offset < file_size and len(entries) < n:
-                # Calculate chunk position (read backwards)
-                chunk_start = max(0, file_size - offset - chunk_size)
-                chunk_end = file_size - offset
-
-                # Read chunk
-                f.seek(chunk_start)
-                chunk_bytes = f.read(chunk_end - chunk_start)
-                chunk_text = chunk_bytes.decode("utf-8", errors="replace")
-
-                # Prepend to partial entry (we're reading backwards)
-                chunk_text = chunk_text + partial_entry
-
-                # Split on ## headers
-                parts = chunk_text.split("##")
-
-                # Last part might be incomplete (unless we're at start of file)
-                if chunk_start > 0:
-                    partial_entry = parts[0] if parts else ""
-                    chunk_entries = parts[1:]
-                else:
-                    # At start of file, all parts are complete
-                    partial_entry = ""
-                    chunk_entries = parts
-
-                # Filter empty entries and add to list (reverse because we're reading backwards)
-                for entry in reversed([e.strip() for e in chunk_entries if e.strip()]):
-                    entries.insert(0, entry)
-                    if len(entries) >= n:
-                        break
-
-                offset += chunk_size
-
-        # Take last N entries (we might have collected more)
-        selected_entries = entries[-n:] if len(entries) > n else entries
-
-        # Reconstruct with ## prefixes
-        result = "\n\n".join(f"## {entry}" for entry in selected_entries)
-
-        logger.debug(
-            "streamed_last_n_notes",
-            requested=n,
-            returned=len(selected_entries),
-            file_size=file_size,
-        )
-
-        return result
+        file_size = self.file_path.stat().st_size
+        try:
+            with open(self.index_path, "rb") as idx:
+                header = idx.read(_OFFSET.size)
+                idx.seek(0, 2)
+                index_size = idx.tell()
+                if (
+                    len(header) != _OFFSET.size
+                    or index_size % _OFFSET.size
+                    or _OFFSET.unpack(header)[0] != file_size
+                ):
+                    return None
+
+                count = index_size // _OFFSET.size - 1
+                if count == 0:
+                    return (file_size, file_size, 0)
+                returned = min(n, count)
+                idx.seek(index_size - returned * _OFFSET.size)
+                (start,) = _OFFSET.unpack(idx.read(_OFFSET.size))
+        except FileNotFoundError:
+            return None
+
+        return (start, file_size, returned)
 
     def _format_entry(
         self,
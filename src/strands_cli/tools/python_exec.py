@@ -1,17 +1,19 @@
 """Python code execution tool (Strands SDK module-based pattern).
 
-Execute Python code safely with restricted builtins and stdout capture.
-MVP implementation - production version should add proper sandboxing.
+Execute Python code with restricted builtins and stdout capture. Code runs in
+a pool of warm worker processes (see python_exec_pool) with a per-call
+wall-clock timeout and per-worker memory limit, so runaway code cannot stall
+the agent's process or event loop.
 """
 
-import io
-from contextlib import redirect_stdout
 from typing import Any
 
+from strands_cli.tools.python_exec_pool import DEFAULT_TIMEOUT_S, get_python_exec_pool
+
 # Tool Specification (Strands SDK standard)
 TOOL_SPEC = {
     "name": "python_exec",
-    "description": "Execute Python code and return results (MVP - simple version with restricted builtins)",
+    "description": "Execute Python code and return printed output (restricted builtins, time-limited)",
     "inputSchema": {
         "json": {
             "type": "object",
@@ -20,7 +22,7 @@ TOOL_SPEC = {
                 "timeout": {
                     "type": "integer",
                     "default": 5,
-                    "description": "Timeout in seconds (not enforced in MVP)",
+                    "description": "Timeout in seconds (max 60)",
                 },
             },
             "required": ["code"],
@@ -32,20 +34,17 @@ TOOL_SPEC = {
 def python_exec(tool: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
     """Execute Python code with restricted builtins and stdout capture.
 
-    MVP Implementation:
-    - Uses exec() with restricted globals
-    - Captures stdout via StringIO
-    - Returns result or error
+    Implementation:
+    - Dispatches to a warm worker process from the python_exec pool
+    - Worker runs exec() with restricted globals and a capturing print()
+    - Timeout kills and respawns the worker; memory is capped per worker
+    - Strands runs sync tool functions in a thread, so waiting here never
+      blocks the event loop
 
-    Security Limitations (MVP):
-    - No proper sandboxing (subprocess/docker)
-    - No resource limits (memory, CPU)
-    - No timeout enforcement
-    - Limited builtin allowlist
+    Security Limitations:
+    - Limited builtin allowlist (no import/open/eval), not a full sandbox
     - No AST parsing for dangerous operations
 
-    Production version should address all security limitations.
-
     Args:
         tool: Tool invocation object with toolUseId and input
         **kwargs: Additional arguments (unused)
@@ -65,58 +64,23 @@ def python_exec(tool: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
         }
 
     try:
-        # Capture stdout
-        output = io.StringIO()
-
-        with redirect_stdout(output):
-            # Restricted globals - only safe builtins
-            # Production: expand this list carefully or use AST validation
-            restricted_globals = {
-                "__builtins__": {
-                    # Type constructors
-                    "int": int,
-                    "float": float,
-                    "str": str,
-                    "bool": bool,
-                    "list": list,
-                    "dict": dict,
-                    "tuple": tuple,
-                    "set": set,
-                    # Utilities
-                    "len": len,
-                    "range": range,
-                    "enumerate": enumerate,
-                    "zip": zip,
-                    "sum": sum,
-                    "min": min,
-                    "max": max,
-                    "abs": abs,
-                    "round": round,
-                    "sorted": sorted,
-                    "reversed": reversed,
-                    # Output
-                    "print": print,
-                    # Type checking
-                    "isinstance": isinstance,
-                    "type": type,
-                }
-            }
+        timeout = float(tool_input.get("timeout") or DEFAULT_TIMEOUT_S)
+    except (TypeError, ValueError):
+        timeout = DEFAULT_TIMEOUT_S
 
-            # Execute code with restricted environment
-            exec(code, restricted_globals)
-
-        # Get captured output
-        result = output.getvalue()
+    result = get_python_exec_pool().run(code, timeout=timeout)
 
-        return {
-            "toolUseId": tool_use_id,
-            "status": "success",
-            "content": [{"text": result if result else "Code executed successfully (no output)"}],
-        }
-
-    except Exception as e:
+    if not result.success:
         return {
             "toolUseId": tool_use_id,
             "status": "error",
-            "content": [{"text": f"Execution failed: {type(e).__name__}: {e!s}"}],
+            "content": [{"text": result.output}],
         }
+
+    return {
+        "toolUseId": tool_use_id,
+        "status": "success",
+        "content": [
+            {"text": result.output if result.output else "Code executed successfully (no output)"}
+        ],
+    }
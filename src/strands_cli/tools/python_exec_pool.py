@@ -0,0 +1,247 @@
+"""Warm worker-process pool backing the python_exec tool.
+
+Runs agent-supplied code outside the agent's process so that:
+    - A runaway loop can be stopped: each call has a wall-clock timeout, and a
+      worker that overruns is killed and replaced by a fresh one
+    - Memory is bounded per worker (RLIMIT_AS on POSIX)
+    - Calls from parallel branches run on separate cores instead of
+      contending for the GIL in the orchestrating process
+    - Output is captured by a worker-local print(), not redirect_stdout, so
+      the parent's stdout (and any tee on it) is never swapped out
+
+Workers are started from a forkserver (spawn on platforms without one) the
+first time code is executed, then stay warm and are reused across calls.
+
+Configuration (environment):
+    STRANDS_PYTHON_EXEC_WORKERS: Pool size (default: min(4, cpu_count))
+    STRANDS_PYTHON_EXEC_MEMORY_MB: Per-worker address-space limit (default: 512)
+"""
+
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_TIMEOUT_S = 5.0
+MAX_TIMEOUT_S = 60.0
+DEFAULT_MEMORY_MB = 512
+
+
+@dataclass
+class ExecResult:
+    """Outcome of one code execution."""
+
+    success: bool
+    output: str
+
+
+def _restricted_builtins(print_fn: Any) -> dict[str, Any]:
+    """Build the restricted builtin namespace exposed to executed code."""
+    return {
+        # Type constructors
+        "int": int,
+        "float": float,
+        "str": str,
+        "bool": bool,
+        "list": list,
+        "dict": dict,
+        "tuple": tuple,
+        "set": set,
+        # Utilities
+        "len": len,
+        "range": range,
+        "enumerate": enumerate,
+        "zip": zip,
+        "sum": sum,
+        "min": min,
+        "max": max,
+        "abs": abs,
+        "round": round,
+        "sorted": sorted,
+        "reversed": reversed,
+        # Output
+        "print": print_fn,
+        # Type checking
+        "isinstance": isinstance,
+        "type": type,
+    }
+
+
+def _worker_main(conn: Connection, memory_limit_mb: int) -> None:
+    """Worker loop: receive code, execute it, send back (success, output)."""
+    if memory_limit_mb > 0:
+        try:
+            import resource
+
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass  # Not supported on this platform; timeouts still apply
+
+    while True:
+        try:
+            code = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        lines: list[str] = []
+
+        def _print(
+            *args: Any, sep: str = " ", end: str = "\n", _lines: list[str] = lines, **_: Any
+        ) -> None:
+            _lines.append(sep.join(str(arg) for arg in args) + end)
+
+        try:
+            exec(code, {"__builtins__": _restricted_builtins(_print)})
+            message: tuple[bool, str] = (True, "".join(lines))
+        except MemoryError:
+            message = (False, "Execution failed: MemoryError: memory limit exceeded")
+        except BaseException as e:  # Report everything, including SystemExit
+            message = (False, f"Execution failed: {type(e).__name__}: {e!s}")
+
+        try:
+            conn.send(message)
+        except (EOFError, OSError):
+            return
+
+
+class _Worker:
+    """One warm interpreter process and the parent's end of its pipe."""
+
+    def __init__(self, context: Any, memory_limit_mb: int) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, memory_limit_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class PythonExecPool:
+    """Bounded pool of warm worker processes for python_exec.
+
+    Thread-safe: Strands runs sync tool functions via asyncio.to_thread, so
+    concurrent tool calls from parallel branches arrive on different threads.
+    """
+
+    def __init__(self, size: int | None = None, memory_limit_mb: int | None = None) -> None:
+        """Create the pool (workers start on first use).
+
+        Args:
+            size: Number of worker processes
+            memory_limit_mb: Per-worker address-space limit in MiB (0 disables)
+        """
+        self.size = size or int(
+            os.environ.get("STRANDS_PYTHON_EXEC_WORKERS", min(4, os.cpu_count() or 1))
+        )
+        self.memory_limit_mb = (
+            memory_limit_mb
+            if memory_limit_mb is not None
+            else int(os.environ.get("STRANDS_PYTHON_EXEC_MEMORY_MB", DEFAULT_MEMORY_MB))
+        )
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context("forkserver")
+            # Import once in the fork server so every worker forks warm
+            self._context.set_forkserver_preload([__name__])
+        else:
+            self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._dispatcher: ThreadPoolExecutor | None = None
+        self.respawns = 0
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for _ in range(self.size):
+                worker = _Worker(self._context, self.memory_limit_mb)
+                self._workers.append(worker)
+                self._idle.put(worker)
+            logger.debug("python_exec_pool_started", workers=self.size)
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.kill()
+        fresh = _Worker(self._context, self.memory_limit_mb)
+        with self._lock:
+            self._workers[self._workers.index(worker)] = fresh
+            self.respawns += 1
+        return fresh
+
+    def run(self, code: str, timeout: float = DEFAULT_TIMEOUT_S) -> ExecResult:
+        """Execute code on a warm worker, blocking the calling thread only.
+
+        Args:
+            code: Python source to execute
+            timeout: Wall-clock limit in seconds (clamped to MAX_TIMEOUT_S)
+
+        Returns:
+            ExecResult with captured output or a formatted error message
+        """
+        self._ensure_started()
+        timeout = min(max(timeout, 0.1), MAX_TIMEOUT_S)
+        worker = self._idle.get()
+        try:
+            worker.conn.send(code)
+            if not worker.conn.poll(timeout):
+                logger.warning("python_exec_timeout", timeout_s=timeout)
+                worker = self._replace(worker)
+                return ExecResult(False, f"Execution failed: TimeoutError: exceeded {timeout:g}s")
+            success, output = worker.conn.recv()
+            return ExecResult(success, output)
+        except (EOFError, OSError) as e:
+            logger.warning("python_exec_worker_died", error=str(e))
+            worker = self._replace(worker)
+            return ExecResult(False, "Execution failed: WorkerCrashed: worker process exited")
+        finally:
+            self._idle.put(worker)
+
+    def submit(self, code: str, timeout: float = DEFAULT_TIMEOUT_S) -> "Future[ExecResult]":
+        """Dispatch code asynchronously; wrap with asyncio.wrap_future() in async code."""
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = ThreadPoolExecutor(
+                    max_workers=self.size, thread_name_prefix="python-exec"
+                )
+        return self._dispatcher.submit(self.run, code, timeout)
+
+    def shutdown(self) -> None:
+        """Kill all workers."""
+        with self._lock:
+            for worker in self._workers:
+                worker.kill()
+            self._workers.clear()
+            self._idle = queue.Queue()
+            if self._dispatcher is not None:
+                self._dispatcher.shutdown(wait=False)
+                self._dispatcher = None
+
+
+_pool: PythonExecPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_python_exec_pool() -> PythonExecPool:
+    """Return the process-wide python_exec pool, creating it on first use."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = PythonExecPool()
+            atexit.register(_pool.shutdown)
+        return _pool
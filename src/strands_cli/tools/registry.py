@@ -2,17 +2,42 @@
 
 This module provides auto-discovery and registration of native tools that follow
 the Strands SDK module-based pattern with TOOL_SPEC exports.
+
+Lookups are answered from a generated manifest (manifest.json next to this
+module) so that listing, validation and allowlist checks never import tool
+modules and their heavy dependencies (httpx, trafilatura, search clients).
+A tool module is imported only when an agent binds it. If the manifest is
+missing or no longer matches the modules on disk, the registry falls back to
+import-based discovery.
+
+Regenerate the manifest after adding or changing a tool:
+
+    python scripts/generate_tool_manifest.py
 """
 
 import importlib
+import json
 import pkgutil
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+MANIFEST_VERSION = 1
+
+# Modules to skip (not tools themselves)
+SKIP_MODULES = {
+    "registry",  # This registry module
+    "http_executor_factory",  # Creates HTTP executor tools dynamically
+    "notes_manager",  # Utility for notes management
+    "skill_loader",  # Factory for skill loading (dynamically injected)
+    "python_exec_pool",  # Worker process pool backing python_exec
+}
+
 
 @dataclass
 class ToolInfo:
@@ -22,11 +47,13 @@ class ToolInfo:
         id: Tool identifier (e.g., "http_request")
         module_path: Full import path (e.g., "strands_cli.tools.http_request")
         description: Tool description from TOOL_SPEC
+        spec: Full TOOL_SPEC (from the manifest or the imported module)
     """
 
     id: str
     module_path: str
     description: str
+    spec: dict[str, Any] = field(default_factory=dict)
 
     @property
     def import_path(self) -> str:
@@ -38,11 +65,11 @@ class ToolInfo:
         return self.module_path
 
 
-
 class ToolRegistry:
     """Simple singleton registry for native tools.
 
-    Auto-discovers tools from the strands_cli.tools module on first instantiation.
+    Loads the tool manifest on first instantiation, falling back to auto-discovery
+    from the strands_cli.tools module when the manifest is missing or stale.
     Tools must export a TOOL_SPEC dictionary following the Strands SDK pattern.
     """
 
@@ -54,9 +81,59 @@ class ToolRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools = {}
-            cls._instance._discover_tools()
+            if not cls._instance._load_manifest():
+                cls._instance._discover_tools()
         return cls._instance
 
+    @staticmethod
+    def _candidate_modules() -> list[str]:
+        """List tool module names on disk without importing them."""
+        tools_dir = Path(__file__).parent
+        return sorted(
+            module_name
+            for _importer, module_name, _is_pkg in pkgutil.iter_modules([str(tools_dir)])
+            if not module_name.startswith("_") and module_name not in SKIP_MODULES
+        )
+
+    def _load_manifest(self, path: Path = MANIFEST_PATH) -> bool:
+        """Populate the registry from the generated manifest.
+
+        Args:
+            path: Manifest file location
+
+        Returns:
+            True if the manifest was loaded, False if it is missing, invalid,
+            or stale (tool modules added/removed since it was generated)
+        """
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.debug("tool_manifest_unavailable", path=str(path), error=str(e))
+            return False
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            logger.warning("tool_manifest_version_mismatch", path=str(path))
+            return False
+
+        if manifest.get("modules") != self._candidate_modules():
+            logger.warning(
+                "Tool manifest is stale, falling back to discovery "
+                "(regenerate with: python scripts/generate_tool_manifest.py)",
+                path=str(path),
+            )
+            return False
+
+        for entry in manifest.get("tools", []):
+            self._tools[entry["id"]] = ToolInfo(
+                id=entry["id"],
+                module_path=entry["module_path"],
+                description=entry.get("description", ""),
+                spec=entry.get("spec", {}),
+            )
+
+        logger.debug("tool_manifest_loaded", tools=len(self._tools))
+        return True
+
     def _discover_tools(self) -> None:
         """Auto-discover tools from strands_cli.tools module.
 
@@ -65,14 +142,7 @@ class ToolRegistry:
         modules but continues discovery.
         """
         tools_dir = Path(__file__).parent
-
-        # Modules to skip (not tools themselves)
-        skip_modules = {
-            "registry",  # This registry module
-            "http_executor_factory",  # Creates HTTP executor tools dynamically
-            "notes_manager",  # Utility for notes management
-            "skill_loader",  # Factory for skill loading (dynamically injected)
-        }
+        skip_modules = SKIP_MODULES
 
         # Scan all .py files (skip __init__, registry, etc.)
         for _importer, module_name, _is_pkg in pkgutil.iter_modules([str(tools_dir)]):
@@ -118,6 +188,7 @@ class ToolRegistry:
                     id=tool_id,
                     module_path=f"strands_cli.tools.{module_name}",
                     description=spec.get("description", ""),
+                    spec=dict(spec),
                 )
                 self._tools[tool_id] = tool_info
 
@@ -186,7 +257,8 @@ class ToolRegistry:
         """Reset registry to clean state.
 
         WARNING: This method is for testing only. It clears all discovered
-        tools and re-runs discovery. Not intended for production use.
+        tools and re-runs import-based discovery (bypassing the manifest).
+        Not intended for production use.
         """
         self._tools.clear()
         self._discover_tools()
@@ -199,3 +271,49 @@ def get_registry() -> ToolRegistry:
         The singleton ToolRegistry instance
     """
     return ToolRegistry()
+
+
+def build_manifest() -> dict[str, Any]:
+    """Build the tool manifest by importing every tool module.
+
+    Returns:
+        Manifest dict with version, scanned module names and tool entries
+
+    Raises:
+        ImportError: If any candidate tool module fails to import (a manifest
+            built with missing optional dependencies would silently drop tools)
+    """
+    modules = ToolRegistry._candidate_modules()
+    tools: dict[str, dict[str, Any]] = {}
+
+    for module_name in modules:
+        module_path = f"strands_cli.tools.{module_name}"
+        module = importlib.import_module(module_path)
+        spec = getattr(module, "TOOL_SPEC", None)
+        if not isinstance(spec, dict) or "name" not in spec:
+            continue
+        tools[spec["name"]] = {
+            "id": spec["name"],
+            "module_path": module_path,
+            "description": spec.get("description", ""),
+            "spec": spec,
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "modules": modules,
+        "tools": [tools[tool_id] for tool_id in sorted(tools)],
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Path:
+    """Regenerate the tool manifest file.
+
+    Args:
+        path: Destination (defaults to manifest.json next to this module)
+
+    Returns:
+        Path of the written manifest
+    """
+    path.write_text(json.dumps(build_manifest(), indent=2) + "\n", encoding="utf-8")
+    return path
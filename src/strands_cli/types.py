@@ -93,6 +93,7 @@ class ProviderType(str, Enum):
     OPENAI = "openai"  # OpenAI API
     ANTHROPIC = "anthropic"  # Anthropic Claude API (requires API key)
     GEMINI = "gemini"  # Google Gemini API (requires API key)
+    SIMULATED = "simulated"  # In-process fake model for load tests (no network, no tokens)
     AZURE_OPENAI = "azure_openai"  # Azure OpenAI (future support)
 
 
@@ -138,6 +139,83 @@ class ToolType(str, Enum):
     MCP = "mcp"  # Model Context Protocol servers (future support)
 
 
+class CascadeAccept(BaseModel):
+    """Acceptor deciding whether a cheaper cascade tier's output is good enough.
+
+    Types:
+    - schema: output parses as JSON and validates against the agent's output_schema
+      (or ``schema`` when given)
+    - evaluator: an evaluator agent scores the output; accepted at >= min_score
+    - confidence: a confidence marker in the output (``pattern``, first group
+      numeric) is >= min_confidence
+    """
+
+    type: Literal["schema", "evaluator", "confidence"]
+    schema_: str | dict[str, Any] | None = Field(None, alias="schema")  # schema
+    agent: str | None = None  # evaluator: agent ID that scores the output
+    min_score: int = Field(default=80, ge=0, le=100)  # evaluator
+    pattern: str = r"CONFIDENCE:\s*(\d+(?:\.\d+)?)"  # confidence marker regex
+    min_confidence: float = 70  # confidence
+
+    model_config = {"populate_by_name": True}
+
+    @model_validator(mode="after")
+    def validate_evaluator_agent(self) -> "CascadeAccept":
+        """Evaluator acceptors need the ID of the scoring agent."""
+        if self.type == "evaluator" and not self.agent:
+            raise ValueError("cascade.accept.agent is required for type 'evaluator'")
+        return self
+
+
+class Cascade(BaseModel):
+    """Model cascade: cheaper models tried before the agent's own model.
+
+    Each tier in ``models`` is tried in order; the first output the acceptor
+    accepts is used. If every cheaper tier is rejected (or fails), the agent's
+    own model (runtime or agent model_id) answers.
+    """
+
+    models: list[str]  # Cheaper model IDs (same provider), tried in order
+    accept: CascadeAccept
+
+
+class BatchConfig(BaseModel):
+    """Offline batch inference for large, tool-free fan-outs.
+
+    When set, orchestrator worker rounds and parallel branches with at least
+    ``min_requests`` eligible calls are packed into one provider batch job
+    (discounted, asynchronous) instead of live requests.
+    """
+
+    min_requests: int = Field(default=20, ge=1)  # Smallest fan-out worth a batch job
+    poll_interval_s: float = Field(default=30, gt=0)  # Delay between status polls
+    timeout_s: int = Field(default=86400, ge=1)  # Give up (and fail the round) after this
+    completion_window: str = "24h"  # Provider completion window
+
+
+class SimulationConfig(BaseModel):
+    """Behaviour of the simulated provider (load testing and capacity planning).
+
+    Latency is sampled per call from ``latency_distribution`` with mean
+    ``latency_ms`` and spread ``latency_stddev_ms``; output is then streamed
+    at ``tokens_per_second`` (0 sends it in one chunk).
+    """
+
+    latency_distribution: Literal["fixed", "uniform", "normal", "lognormal", "exponential"] = (
+        "lognormal"
+    )
+    latency_ms: float = Field(default=500, ge=0)  # Mean time to first token
+    latency_stddev_ms: float = Field(default=150, ge=0)  # Spread (uniform: half-width)
+    tokens_per_second: float = Field(default=0, ge=0)  # Streaming rate (0 = one chunk)
+    output_tokens: int = Field(default=64, ge=1)  # Length of generated filler responses
+    responses: list[str] = Field(default_factory=list)  # Scripted responses, used in turn
+    error_rate: float = Field(default=0, ge=0, le=1)  # Share of calls failing (ConnectionError)
+    throttle_rate: float = Field(default=0, ge=0, le=1)  # Share of calls throttled
+    max_concurrency: int | None = Field(default=None, ge=1)  # Calls above this are throttled
+    retry_after_s: float | None = Field(default=None, ge=0)  # Retry-After on throttles
+    seed: int | None = None  # Seed for reproducible latency/error sequences
+
+
 class Runtime(BaseModel):
     """Runtime configuration for model execution.
 
@@ -155,6 +233,10 @@ class Runtime(BaseModel):
     max_parallel: int | None = Field(default=None, ge=1)  # Max concurrent tasks/workers
     budgets: dict[str, Any] | None = None  # Token/cost budgets (logged only)
     failure_policy: dict[str, Any] | None = None  # Retry and backoff configuration
+    cascade: Cascade | None = None  # Cheaper models tried first for every agent
+    batch: BatchConfig | None = None  # Provider batch jobs for large fan-outs (opt-in)
+    simulation: SimulationConfig | None = None  # Simulated provider behaviour
+    structured_output: bool = True  # Schema-constrained router/orchestrator/evaluator output
 
 
 class Secret(BaseModel):
@@ -514,6 +596,10 @@ class Agent(BaseModel):
         "for this agent. Provider support: OpenAI/Azure (fully supported), "
         "Bedrock (limited by SDK), Ollama (not supported).",
     )
+    cascade: Cascade | None = Field(
+        None,
+        description="Overrides runtime.cascade for this agent (empty models disables it)",
+    )
 
     @model_validator(mode="after")
     def validate_ref_or_prompt(self) -> "Agent":
@@ -945,10 +1031,12 @@ class AcceptConfig(BaseModel):
     Attributes:
         min_score: Minimum score (0-100) to accept output
         max_iters: Maximum iterations (default: 3)
+        candidates: Candidate drafts generated per iteration (default: 1, best-of-N when > 1)
     """
 
     min_score: int = Field(ge=0, le=100)  # Minimum score (0-100, required)
     max_iters: int = Field(default=3, ge=1)  # Maximum iterations (default: 3)
+    candidates: int = Field(default=1, ge=1)  # Parallel candidates per iteration (default: 1)
 
 
 class EvaluatorDecision(BaseModel):
@@ -1116,6 +1204,25 @@ class OrchestratorConfig(BaseModel):
     limits: OrchestratorLimits | None = None  # Execution limits (optional)
 
 
+class OrchestratorSubtask(BaseModel):
+    """Single subtask delegated by the orchestrator to a worker."""
+
+    task: str  # Subtask description given to the worker
+
+
+class OrchestratorPlan(BaseModel):
+    """Orchestrator agent decision output.
+
+    Schema requested from providers with native structured output. The
+    text equivalent is a bare JSON array: [{"task": "description"}, ...]
+
+    Attributes:
+        subtasks: Subtasks to delegate (empty when no work is needed)
+    """
+
+    subtasks: list[OrchestratorSubtask] = Field(default_factory=list)
+
+
 class WorkerTemplate(BaseModel):
     """Worker template configuration for orchestrator-workers pattern.
 
@@ -1152,6 +1259,9 @@ class PatternConfig(BaseModel):
     decomposition_review: HITLStep | None = None  # HITL pause after task decomposition (optional)
     worker_template: WorkerTemplate | None = None  # Worker template
     reduce_review: HITLStep | None = None  # HITL pause before reduce step (optional)
+    reduce_group_size: int | None = Field(
+        default=None, ge=2
+    )  # Tree reduce fan-in (streams worker outputs through reducers in groups of k)
     writeup: ChainStep | None = None  # Optional final synthesis step
 
     # Graph fields
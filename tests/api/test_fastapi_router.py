@@ -3,6 +3,11 @@
 Note: Requires [web] extras (fastapi, uvicorn).
 """
 
+import asyncio
+import json
+import threading
+import time
+
 import pytest
 
 # Skip all tests if fastapi not installed
@@ -12,7 +17,10 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from strands_cli.api import Workflow
+from strands_cli.exit_codes import EX_HITL_PAUSE, EX_RUNTIME
 from strands_cli.integrations.fastapi_router import create_workflow_router
+from strands_cli.integrations.job_queue import Job, WorkflowJobQueue
+from strands_cli.types import PatternType, RunResult
 
 
 @pytest.fixture
@@ -345,3 +353,200 @@ def test_response_models(test_workflow):
     # Verify the route exists and is callable
     assert execute_route is not None, "Execute route should exist"
     assert callable(execute_route.endpoint), "Execute endpoint should be callable"
+
+
+def test_metrics_endpoint(test_client):
+    """Test GET /workflow/metrics exposes Prometheus text after a run."""
+    from strands_cli.telemetry.metrics import get_metrics
+
+    get_metrics().reset()
+    test_client.post("/workflow/execute", json={"variables": {"topic": "test"}})
+
+    response = test_client.get("/workflow/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE strands_workflow_runs_total counter" in response.text
+    assert 'strands_workflow_runs_total{pattern="chain",status="completed"} 1' in response.text
+    assert "strands_workflow_duration_seconds_count" in response.text
+
+
+@pytest.fixture
+def job_app(test_workflow, mocker):
+    """Build an app whose job queue runs one job at a time with one waiting slot."""
+
+    def build(invoke):
+        mocker.patch("strands_cli.exec.chain.invoke_agent_with_retry", side_effect=invoke)
+        app = FastAPI()
+        app.include_router(
+            create_workflow_router(
+                test_workflow, prefix="/workflow", max_concurrent_jobs=1, max_queued_jobs=1
+            )
+        )
+        return app
+
+    return build
+
+
+def test_submit_job_streams_events(job_app):
+    """Test POST /workflow/jobs returns 202 and the job's events stream over SSE."""
+
+    async def mock_invoke(*args, **kwargs):
+        return "Job response"
+
+    # Context manager keeps one event loop alive for the background workers
+    with TestClient(job_app(mock_invoke)) as client:
+        response = client.post("/workflow/jobs", json={"variables": {"topic": "test"}})
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["events_url"] == f"/workflow/sessions/{data['session_id']}/events"
+
+        events = client.get(data["events_url"])
+
+        assert events.headers["content-type"].startswith("text/event-stream")
+        names = [
+            line.removeprefix("event: ")
+            for line in events.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert names[:2] == ["job_queued", "job_started"]
+        assert "step_complete" in names
+        assert names[-1] == "job_complete"
+        final = json.loads(events.text.strip().splitlines()[-1].removeprefix("data: "))
+        assert final["status"] == "completed"
+        assert final["last_response"] == "Job response"
+
+        session = client.get(f"/workflow/sessions/{data['session_id']}").json()
+        assert session["status"] == "completed"
+        assert session["last_response"] == "Job response"
+
+
+def test_submit_job_rejected_when_queue_full(job_app):
+    """Test admission control returns 503 with Retry-After once the queue is full."""
+    release = threading.Event()
+
+    async def blocking_invoke(*args, **kwargs):
+        await asyncio.to_thread(release.wait, 10)
+        return "Released"
+
+    with TestClient(job_app(blocking_invoke)) as client:
+        running = client.post("/workflow/jobs", json={"variables": {}}).json()
+        # Wait until the single worker has picked up the first job
+        running_url = f"/workflow/sessions/{running['session_id']}"
+        for _ in range(200):
+            if client.get(running_url).json()["status"] == "running":
+                break
+            time.sleep(0.01)
+        queued = client.post("/workflow/jobs", json={"variables": {}})
+        rejected = client.post("/workflow/jobs", json={"variables": {}})
+
+        assert queued.status_code == 202
+        assert (
+            client.get(f"/workflow/sessions/{queued.json()['session_id']}").json()["status"]
+            == "queued"
+        )
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "5"
+        release.set()
+
+
+def test_session_events_unknown_session(test_client):
+    """Test GET /workflow/sessions/{id}/events returns 404 for sessions without a job."""
+    response = test_client.get("/workflow/sessions/nonexistent/events")
+
+    assert response.status_code == 404
+
+
+def test_router_shutdown_stops_job_workers(job_app, mocker):
+    """Test app shutdown cancels the job queue's worker tasks."""
+    close = mocker.spy(WorkflowJobQueue, "close")
+
+    async def mock_invoke(*args, **kwargs):
+        return "Job response"
+
+    with TestClient(job_app(mock_invoke)) as client:
+        client.post("/workflow/jobs", json={"variables": {}})
+
+    assert close.called
+    queue = close.call_args.args[0]
+    assert queue._workers == []
+
+
+@pytest.mark.parametrize(
+    ("exit_code", "success", "status"),
+    [(EX_HITL_PAUSE, True, "paused"), (EX_RUNTIME, False, "failed")],
+)
+@pytest.mark.asyncio
+async def test_job_paused_only_on_hitl_exit_code(test_workflow, exit_code, success, status):
+    """Test a job is paused only when the run exited with EX_HITL_PAUSE at a HITL step."""
+
+    class _Executor:
+        last_result: RunResult | None = None
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+        async def stream_async(self, variables, session_id):
+            self.last_result = RunResult(
+                success=success,
+                agent_id="hitl",
+                pattern_type=PatternType.CHAIN,
+                started_at="2025-01-01T00:00:00Z",
+                completed_at="2025-01-01T00:00:01Z",
+                duration_seconds=1.0,
+                exit_code=exit_code,
+            )
+            for _ in ():
+                yield
+
+    job = Job(session_id="s1", variables={}, submitted_at="2025-01-01T00:00:00Z")
+    await WorkflowJobQueue(test_workflow)._run(_Executor(), job)
+
+    assert job.status == status
+
+
+def test_paused_job_resumes_from_custom_storage_dir(
+    sample_openai_spec, tmp_path, mocker, monkeypatch
+):
+    """Test a job paused at a HITL step is saved to, and resumed from, the router's storage_dir."""
+    from strands_cli.types import ChainStep
+
+    # The user's default session store must not be involved
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    sample_openai_spec.pattern.config.steps = [
+        ChainStep(agent="test_agent", input="Draft"),
+        ChainStep(type="hitl", prompt="Approve the draft?"),
+        ChainStep(agent="test_agent", input="Finalize: {{ hitl_response }}"),
+    ]
+
+    async def mock_invoke(*args, **kwargs):
+        return "Job response"
+
+    mocker.patch("strands_cli.exec.chain.invoke_agent_with_retry", side_effect=mock_invoke)
+    storage_dir = tmp_path / "sessions"
+    app = FastAPI()
+    app.include_router(
+        create_workflow_router(
+            Workflow(sample_openai_spec), prefix="/workflow", storage_dir=storage_dir
+        )
+    )
+
+    with TestClient(app) as client:
+        session_id = client.post("/workflow/jobs", json={"variables": {}}).json()["session_id"]
+        events = client.get(f"/workflow/sessions/{session_id}/events")
+        final = json.loads(events.text.strip().splitlines()[-1].removeprefix("data: "))
+        assert final["status"] == "paused"
+        assert (storage_dir / f"session_{session_id}").is_dir()
+
+        resumed = client.post(
+            f"/workflow/sessions/{session_id}/resume", json={"hitl_response": "approved"}
+        )
+
+        assert resumed.status_code == 200, resumed.text
+        assert resumed.json()["status"] == "completed"
+        assert resumed.json()["last_response"] == "Job response"
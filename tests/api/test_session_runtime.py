@@ -0,0 +1,207 @@
+"""Tests for the multiplexed WorkflowSession runtime."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from strands_cli.api.session_runtime import SessionAdmissionError, SessionLimits, SessionRuntime
+from strands_cli.api.workflow_session import SessionStateEnum, WorkflowSession
+from strands_cli.exit_codes import EX_HITL_PAUSE
+from strands_cli.session import SessionStatus
+from strands_cli.types import (
+    Pattern,
+    PatternConfig,
+    PatternType,
+    ProviderType,
+    RunResult,
+    Runtime,
+    Spec,
+)
+
+HITL = {"active": True, "task_id": "review", "prompt": "OK?", "layer_index": 0}
+
+
+def _result(agent_id: str = "system", exit_code: int = 0) -> RunResult:
+    return RunResult(
+        success=True,
+        exit_code=exit_code,
+        pattern_type=PatternType.WORKFLOW,
+        agent_id=agent_id,
+        last_response="done",
+        started_at="now",
+        completed_at="now",
+        duration_seconds=0.0,
+    )
+
+
+async def _wait_until(predicate: Callable[[], bool], polls: int = 200) -> None:
+    for _ in range(polls):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+def spec() -> Spec:
+    return Spec(
+        name="test_workflow",
+        pattern=Pattern(type=PatternType.WORKFLOW, config=PatternConfig(tasks=[])),
+        runtime=Runtime(provider=ProviderType.OLLAMA),
+        agents={},
+    )
+
+
+@pytest.fixture
+def repo() -> MagicMock:
+    repo = MagicMock()
+    repo.save = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def runtime() -> Iterator[SessionRuntime]:
+    runtime = SessionRuntime(loops=2)
+    yield runtime
+    runtime.shutdown()
+
+
+def _session(
+    spec: Spec,
+    repo: MagicMock,
+    runtime: SessionRuntime,
+    execute: Callable[..., Any],
+    limits: SessionLimits | None = None,
+) -> WorkflowSession:
+    executor = MagicMock()
+    executor._execute_pattern = AsyncMock(side_effect=execute)
+    with patch("strands_cli.api.workflow_session.WorkflowExecutor", return_value=executor):
+        return WorkflowSession(spec, {}, repository=repo, runtime=runtime, limits=limits)
+
+
+@pytest.mark.asyncio
+async def test_sessions_spread_over_loops_with_affinity(
+    spec: Spec, repo: MagicMock, runtime: SessionRuntime
+) -> None:
+    """Sessions go to the least-loaded loop and every round runs on that loop."""
+    threads: dict[str, set[str]] = {}
+
+    async def execute(variables: Any, state: Any, repo: Any, hitl_response: Any) -> RunResult:
+        threads.setdefault(state.metadata.session_id, set()).add(threading.current_thread().name)
+        if hitl_response is None:
+            state.pattern_state["hitl_state"] = dict(HITL)
+            return _result("hitl", EX_HITL_PAUSE)
+        return _result()
+
+    sessions = [_session(spec, repo, runtime, execute) for _ in range(4)]
+    for session in sessions:
+        session.start()
+    await _wait_until(lambda: all(s.is_paused() for s in sessions))
+
+    stats = runtime.stats()
+    assert (stats.live, stats.paused, stats.live_per_loop) == (4, 4, [2, 2])
+
+    # Resume from foreign threads; each response lands on the session's own loop
+    resumers = [threading.Thread(target=s.resume, args=("yes",)) for s in sessions]
+    for thread in resumers:
+        thread.start()
+    for thread in resumers:
+        thread.join()
+    await _wait_until(lambda: all(s.is_complete() for s in sessions))
+
+    assert all(len(names) == 1 for names in threads.values())
+    assert len(set().union(*threads.values())) == 2
+    await _wait_until(lambda: runtime.stats().live == 0)
+    assert runtime.stats().completed_total == 4
+
+
+@pytest.mark.asyncio
+async def test_admission_and_running_limits(spec: Spec, repo: MagicMock) -> None:
+    """max_sessions rejects starts; max_running_per_loop queues executions."""
+    runtime = SessionRuntime(loops=1, max_sessions=2, max_running_per_loop=1)
+    release = threading.Event()
+
+    async def execute(*args: Any) -> RunResult:
+        await asyncio.to_thread(release.wait, 2)
+        return _result()
+
+    try:
+        first, second = (_session(spec, repo, runtime, execute) for _ in range(2))
+        first.start()
+        second.start()
+        with pytest.raises(SessionAdmissionError, match="full"):
+            _session(spec, repo, runtime, execute).start()
+
+        await _wait_until(lambda: runtime.stats().queued == 1)
+        assert runtime.stats().running == 1
+        release.set()
+        await _wait_until(lambda: first.is_complete() and second.is_complete())
+        await _wait_until(lambda: runtime.stats().live == 0)
+
+        third = _session(spec, repo, runtime, execute)
+        third.start()
+        await _wait_until(third.is_complete)
+        assert runtime.stats().rejected_total == 1
+    finally:
+        runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_resume_only_once(spec: Spec, repo: MagicMock, runtime: SessionRuntime) -> None:
+    """A second resume for the same pause is rejected rather than queued."""
+
+    async def execute(variables: Any, state: Any, repo: Any, hitl_response: Any) -> RunResult:
+        if hitl_response is None:
+            state.pattern_state["hitl_state"] = dict(HITL)
+            return _result("hitl", EX_HITL_PAUSE)
+        await asyncio.sleep(0.05)
+        return _result()
+
+    session = _session(spec, repo, runtime, execute)
+    session.start()
+    await _wait_until(session.is_paused)
+
+    session.resume("yes")
+    with pytest.raises(RuntimeError, match="not paused"):
+        session.resume("again")
+    await _wait_until(session.is_complete)
+
+
+@pytest.mark.asyncio
+async def test_run_time_limit(spec: Spec, repo: MagicMock, runtime: SessionRuntime) -> None:
+    """Sessions exceeding max_run_seconds fail with TimeoutError."""
+
+    async def execute(*args: Any) -> RunResult:
+        await asyncio.sleep(5)
+        return _result()
+
+    session = _session(spec, repo, runtime, execute, SessionLimits(max_run_seconds=0.05))
+    session.start()
+    await _wait_until(session.is_failed)
+
+    assert isinstance(session.get_error(), TimeoutError)
+    assert "max_run_seconds" in str(session.get_error())
+    assert repo.save.await_args.args[0].metadata.status == SessionStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_hitl_wait_limit_keeps_session_resumable(
+    spec: Spec, repo: MagicMock, runtime: SessionRuntime
+) -> None:
+    """An unanswered HITL gate times out and the session is saved as paused."""
+
+    async def execute(variables: Any, state: Any, *args: Any) -> RunResult:
+        state.pattern_state["hitl_state"] = dict(HITL)
+        return _result("hitl", EX_HITL_PAUSE)
+
+    session = _session(spec, repo, runtime, execute, SessionLimits(max_hitl_wait_seconds=0.05))
+    session.start()
+    await _wait_until(lambda: session.state == SessionStateEnum.FAILED)
+
+    assert "No HITL response" in str(session.get_error())
+    assert repo.save.await_args.args[0].metadata.status == SessionStatus.PAUSED
+    await _wait_until(lambda: runtime.stats().paused == 0 and runtime.stats().live == 0)
@@ -25,6 +25,16 @@ def _set_default_api_keys(monkeypatch: Any) -> None:
 
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test-placeholder")
 
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers() -> Any:
+    """Keep provider circuit breaker state from leaking between tests."""
+    from strands_cli.runtime.circuit_breaker import reset_circuit_breakers
+
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
 # ============================================================================
 # Fixture Paths
 # ============================================================================
@@ -982,6 +982,23 @@ class TestEvaluatorOptimizerBuilder:
         assert workflow.spec.pattern.config.accept.min_score == 80
         assert workflow.spec.pattern.config.accept.max_iters == 3
 
+    def test_evaluator_optimizer_candidates(self) -> None:
+        """Test evaluator-optimizer with best-of-N candidates."""
+        workflow = (
+            FluentBuilder("test-eo")
+            .runtime("openai", model="gpt-4o-mini")
+            .agent("writer", "Write")
+            .agent("critic", "Evaluate")
+            .evaluator_optimizer()
+            .producer("writer", "Write")
+            .evaluator("critic", "Evaluate")
+            .accept(min_score=80, candidates=4)
+            .revise_prompt("Improve")
+            .build()
+        )
+
+        assert workflow.spec.pattern.config.accept.candidates == 4
+
     def test_evaluator_optimizer_review_gate(self) -> None:
         """Test evaluator-optimizer with review gate."""
         workflow = (
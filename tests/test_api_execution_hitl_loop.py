@@ -74,7 +74,7 @@ async def test_run_interactive_sets_spec_hash(minimal_chain_spec: Spec, mocker)
         return None
 
     mock_repo.save.side_effect = capture_save
-    mocker.patch("strands_cli.api.execution.FileSessionRepository", return_value=mock_repo)
+    mocker.patch("strands_cli.api.execution.create_session_repository", return_value=mock_repo)
     mocker.patch("strands_cli.api.execution.generate_session_id", return_value="session-123")
 
     # Mock executor path to return successful completion
@@ -101,7 +101,7 @@ async def test_run_interactive_sets_spec_hash(minimal_chain_spec: Spec, mocker)
     assert result.session_id == "session-123"
     assert saved_states, "Session repository save should be invoked"
 
-    spec_dict = minimal_chain_spec.model_dump(mode="json")
+    spec_dict = minimal_chain_spec.model_dump(mode="json", by_alias=True, exclude_unset=True)
     spec_snapshot = json.dumps(spec_dict, sort_keys=True, indent=2)
     expected_hash = hashlib.sha256(spec_snapshot.encode("utf-8")).hexdigest()
 
@@ -127,7 +127,7 @@ async def test_single_hitl_pause_handled(minimal_chain_spec: Spec, mocker) -> No
     # Mock session repo
     mock_repo = AsyncMock()
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -230,7 +230,7 @@ async def test_multiple_hitl_pauses_handled(minimal_chain_spec: Spec, mocker) ->
     # Mock session repo
     mock_repo = AsyncMock()
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -344,7 +344,7 @@ async def test_session_state_updated_after_hitl(minimal_chain_spec: Spec, mocker
     mock_repo.save.side_effect = capture_save
 
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -456,7 +456,7 @@ async def test_keyboard_interrupt_marks_session_paused(minimal_chain_spec: Spec,
     mock_repo.save.side_effect = capture_save
 
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -527,7 +527,7 @@ async def test_exception_marks_session_failed(minimal_chain_spec: Spec, mocker)
     mock_repo.save.side_effect = capture_save
 
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -576,7 +576,7 @@ async def test_safety_limit_prevents_infinite_loop(minimal_chain_spec: Spec, moc
     mock_repo.save.side_effect = capture_save
 
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -636,7 +636,7 @@ async def test_missing_hitl_state_raises_error(minimal_chain_spec: Spec, mocker)
 
     mock_repo = AsyncMock()
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -680,7 +680,7 @@ async def test_inactive_hitl_state_raises_error(minimal_chain_spec: Spec, mocker
 
     mock_repo = AsyncMock()
     mocker.patch(
-        "strands_cli.api.execution.FileSessionRepository",
+        "strands_cli.api.execution.create_session_repository",
         return_value=mock_repo,
     )
 
@@ -723,7 +723,7 @@ async def test_run_sets_session_id(minimal_chain_spec: Spec, mocker) -> None:
     executor = WorkflowExecutor(minimal_chain_spec)
 
     mock_repo = AsyncMock()
-    mocker.patch("strands_cli.api.execution.FileSessionRepository", return_value=mock_repo)
+    mocker.patch("strands_cli.api.execution.create_session_repository", return_value=mock_repo)
     mocker.patch("strands_cli.api.execution.generate_session_id", return_value="session-run")
 
     now_ts = datetime.now(UTC).isoformat()
@@ -762,7 +762,7 @@ async def test_run_updates_session_metadata(minimal_chain_spec: Spec, mocker) ->
     mock_repo = AsyncMock()
     mock_repo.save.side_effect = capture_save
 
-    mocker.patch("strands_cli.api.execution.FileSessionRepository", return_value=mock_repo)
+    mocker.patch("strands_cli.api.execution.create_session_repository", return_value=mock_repo)
     mocker.patch("strands_cli.api.execution.generate_session_id", return_value="session-meta")
 
     now_ts = datetime.now(UTC).isoformat()
@@ -804,7 +804,7 @@ async def test_run_failure_updates_session_metadata(minimal_chain_spec: Spec, mo
     mock_repo = AsyncMock()
     mock_repo.save.side_effect = capture_save
 
-    mocker.patch("strands_cli.api.execution.FileSessionRepository", return_value=mock_repo)
+    mocker.patch("strands_cli.api.execution.create_session_repository", return_value=mock_repo)
     mocker.patch("strands_cli.api.execution.generate_session_id", return_value="session-fail")
 
     async def mock_execute_pattern(variables, session_state, session_repo, hitl_response):
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+import pytest
 from typer.testing import CliRunner
 
 from strands_cli.__main__ import app
@@ -12,6 +13,12 @@ from strands_cli.exit_codes import EX_OK
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_result_cache(tmp_path: Path, monkeypatch: Any) -> None:
+    """Keep `atomic test` result caches out of the user's cache directory."""
+    monkeypatch.setenv("STRANDS_CACHE_DIR", str(tmp_path / "cache"))
+
+
 def _write_atomic_manifest(base: Path) -> Path:
     agent_dir = base / "agents" / "atomic" / "alpha"
     agent_dir.mkdir(parents=True, exist_ok=True)
@@ -238,3 +245,99 @@ def test_atomic_init_scaffolds_files() -> None:
         assert Path("agents/atomic/gamma/schemas/output.json").exists()
         assert Path("agents/atomic/gamma/tests.yaml").exists()
         assert Path("agents/atomic/gamma/examples/sample.json").exists()
+
+
+def _write_test_cases(base: Path, count: int) -> None:
+    agent_dir = base / "agents" / "atomic" / "alpha"
+    lines = ["tests:"]
+    for i in range(count):
+        (base / f"input{i}.json").write_text(json.dumps({"topic": f"t{i}"}), encoding="utf-8")
+        lines += [
+            f"  - name: case{i}",
+            f"    input: ../../../input{i}.json",
+            "    expect:",
+            "      checks:",
+            "        - type: contains",
+            "          value: ok",
+        ]
+    (agent_dir / "tests.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_atomic_test_runs_cases_concurrently_and_caches_passes(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    import asyncio
+
+    from strands_cli.types import PatternType, RunResult
+
+    monkeypatch.chdir(tmp_path)
+    manifest = _write_atomic_manifest(tmp_path)
+    _write_test_cases(tmp_path, 4)
+
+    calls: list[dict[str, Any]] = []
+    pools: set[int] = set()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_run_single_agent(spec: Any, variables: Any = None, **kwargs: Any) -> RunResult:
+        nonlocal in_flight, max_in_flight
+        calls.append(variables)
+        pools.add(id(kwargs["agent_pool"]))
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = "nope" if variables["topic"] == "t3" else "ok"
+        return RunResult(
+            success=True,
+            last_response=response,
+            agent_id="worker",
+            pattern_type=PatternType.CHAIN,
+            started_at="2025-01-01T00:00:00Z",
+            completed_at="2025-01-01T00:00:01Z",
+            duration_seconds=1.0,
+        )
+
+    load_calls = 0
+    from strands_cli.atomic import cli as atomic_cli
+
+    real_load_spec = atomic_cli.load_spec
+
+    def counting_load_spec(*args: Any, **kwargs: Any) -> Any:
+        nonlocal load_calls
+        load_calls += 1
+        return real_load_spec(*args, **kwargs)
+
+    monkeypatch.setattr("strands_cli.atomic.cli.run_single_agent", fake_run_single_agent)
+    monkeypatch.setattr("strands_cli.atomic.cli.load_spec", counting_load_spec)
+
+    result = runner.invoke(app, ["atomic", "test", "alpha", "--json", "--jobs", "4"])
+
+    payload = json.loads(result.stdout)
+    assert [case["status"] for case in payload] == ["pass", "pass", "pass", "fail"]
+    assert load_calls == 1
+    assert len(calls) == 4
+    assert len(pools) == 1
+    assert max_in_flight == 4
+
+    # Unchanged passing cases are skipped on rerun; the failing one runs again
+    calls.clear()
+    result = runner.invoke(app, ["atomic", "test", "alpha", "--json"])
+    payload = json.loads(result.stdout)
+    assert [case["message"] for case in payload[:3]] == ["cached"] * 3
+    assert calls == [{"topic": "t3"}]
+
+    # Editing an input or the manifest invalidates the cached result
+    calls.clear()
+    (tmp_path / "input0.json").write_text(json.dumps({"topic": "changed"}), encoding="utf-8")
+    runner.invoke(app, ["atomic", "test", "alpha", "--json"])
+    assert {"topic": "changed"} in calls and len(calls) == 2
+
+    calls.clear()
+    manifest.write_text(manifest.read_text() + "description: edited\n", encoding="utf-8")
+    runner.invoke(app, ["atomic", "test", "alpha", "--json"])
+    assert len(calls) == 4
+
+    calls.clear()
+    runner.invoke(app, ["atomic", "test", "alpha", "--json", "--no-cache"])
+    assert len(calls) == 4
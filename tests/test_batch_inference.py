@@ -0,0 +1,298 @@
+"""Tests for offline batch inference against a local fake OpenAI batch server."""
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from strands_cli.exec.orchestrator_workers import _execute_workers_batch
+from strands_cli.exec.parallel import _execute_all_branches_async
+from strands_cli.runtime.batch_inference import (
+    BatchRequest,
+    BatchResult,
+    _job_key,
+    batch_eligible,
+    build_batch_requests,
+    run_batch,
+)
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import Spec
+
+
+class FakeBatchServer:
+    """Minimal OpenAI Files + Batches API: answers every request after one poll."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.batches_created = 0
+        self.polls = 0
+        self._files: dict[str, str] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _send(self, payload: Any, raw: bool = False) -> None:
+                body = payload.encode() if raw else json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path.endswith("/files"):
+                    for line in body.splitlines():
+                        if line.startswith(b'{"custom_id"'):
+                            server.requests.append(json.loads(line))
+                    self._send(_file("file-in"))
+                else:
+                    server.batches_created += 1
+                    self._send(_batch("validating"))
+
+            def do_GET(self) -> None:
+                if self.path.endswith("/content"):
+                    file_id = self.path.split("/")[-2]
+                    self._send(server._files[file_id], raw=True)
+                    return
+                server.polls += 1
+                if server.polls < 2:
+                    self._send(_batch("in_progress"))
+                    return
+                server._write_results()
+                self._send(_batch("completed", "file-out", "file-err"))
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def _write_results(self) -> None:
+        output, errors = [], []
+        for request in self.requests:
+            prompt = request["body"]["messages"][-1]["content"]
+            if "FAIL" in prompt:
+                response = {"status_code": 400, "body": {"error": {"message": "bad request"}}}
+                errors.append({"custom_id": request["custom_id"], "response": response})
+                continue
+            completion = {
+                "choices": [{"message": {"role": "assistant", "content": f"answer: {prompt}"}}],
+                "usage": {"total_tokens": 42},
+            }
+            output.append(
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": completion},
+                    "error": None,
+                }
+            )
+        self._files["file-out"] = "\n".join(json.dumps(line) for line in output)
+        self._files["file-err"] = "\n".join(json.dumps(line) for line in errors)
+
+
+def _file(file_id: str) -> dict[str, Any]:
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": 0,
+        "created_at": 0,
+        "filename": "batch.jsonl",
+        "purpose": "batch",
+        "status": "processed",
+    }
+
+
+def _batch(status: str, output: str | None = None, error: str | None = None) -> dict[str, Any]:
+    return {
+        "id": "batch_1",
+        "object": "batch",
+        "endpoint": "/v1/chat/completions",
+        "input_file_id": "file-in",
+        "completion_window": "24h",
+        "created_at": 0,
+        "status": status,
+        "output_file_id": output,
+        "error_file_id": error,
+    }
+
+
+@pytest.fixture
+def fake_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeBatchServer]:
+    """Fake batch server running in a background thread."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    server = FakeBatchServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def _spec(host: str = "http://127.0.0.1:1/v1", min_requests: int = 2, **runtime: Any) -> Spec:
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "batch",
+            "runtime": {
+                "provider": "openai",
+                "model_id": "gpt-4o-mini",
+                "host": host,
+                "batch": {"min_requests": min_requests, "poll_interval_s": 0.01},
+                **runtime,
+            },
+            "agents": {
+                "worker": {"prompt": "You answer questions.", "inference": {"temperature": 0.2}},
+                "tooled": {"prompt": "You browse.", "tools": ["http_request"]},
+            },
+            "pattern": {
+                "type": "parallel",
+                "config": {
+                    "branches": [
+                        {"id": "a", "steps": [{"agent": "worker", "input": "Topic {{topic}}"}]},
+                        {"id": "b", "steps": [{"agent": "worker", "input": "FAIL {{topic}}"}]},
+                        {"id": "c", "steps": [{"agent": "worker", "input": "Other"}]},
+                    ]
+                },
+            },
+        }
+    )
+
+
+class TestBatchEligibility:
+    """Tests for which calls may be batched."""
+
+    def test_tool_free_openai_agents_only(self) -> None:
+        """Agents with tools, non-OpenAI providers and unset runtime.batch are excluded."""
+        spec = _spec()
+
+        assert batch_eligible(spec, "worker")
+        assert not batch_eligible(spec, "worker", tool_overrides=["http_request"])
+        assert not batch_eligible(spec, "tooled")
+        assert batch_eligible(spec, "tooled", tool_overrides=[])
+        assert not batch_eligible(
+            spec.model_copy(update={"runtime": spec.runtime.model_copy(update={"batch": None})}),
+            "worker",
+        )
+        bedrock = spec.runtime.model_copy(update={"provider": "bedrock"})
+        assert not batch_eligible(spec.model_copy(update={"runtime": bedrock}), "worker")
+
+
+class TestRunBatch:
+    """Tests for submitting and polling batch jobs."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_against_fake_server(self, fake_server: FakeBatchServer) -> None:
+        """Requests are uploaded as JSONL, polled to completion and mapped back by ID."""
+        spec = _spec(fake_server.base_url)
+        requests = build_batch_requests(spec, "worker", {"r1": "one", "r2": "FAIL two"})
+        session_state = MagicMock()
+        session_state.pattern_state = {}
+        checkpoint = AsyncMock()
+        metrics = get_metrics()
+        metrics.reset()
+
+        results = await run_batch(spec, "worker", requests, session_state, checkpoint)
+
+        assert results["r1"] == BatchResult("r1", text="answer: one", total_tokens=42)
+        assert not results["r2"].ok
+        assert results["r2"].error == "bad request"
+        body = fake_server.requests[0]["body"]
+        assert body["model"] == "gpt-4o-mini"
+        assert body["temperature"] == 0.2
+        assert body["messages"][0]["role"] == "system"
+        assert fake_server.polls == 2
+        # Job recorded and checkpointed while running, cleared once results are in
+        checkpoint.assert_awaited_once()
+        assert session_state.pattern_state["batch_jobs"] == {}
+        assert metrics.histogram_count("strands_batch_turnaround_seconds", provider="openai") == 1
+        assert (
+            metrics.value("strands_batch_requests_total", provider="openai", status="failed") == 1
+        )
+        metrics.reset()
+
+    @pytest.mark.asyncio
+    async def test_resume_reattaches_to_running_job(self) -> None:
+        """A job recorded in the session is polled instead of being submitted again."""
+        spec = _spec()
+        requests = [BatchRequest("r1", "system", "one")]
+        session_state = MagicMock()
+        session_state.pattern_state = {"batch_jobs": {_job_key("worker", requests): "batch_9"}}
+        client = MagicMock(provider="openai")
+        client.submit = AsyncMock()
+        client.status = AsyncMock(return_value=("completed", ["file-out"]))
+        client.results = AsyncMock(return_value={"r1": BatchResult("r1", text="done")})
+
+        results = await run_batch(spec, "worker", requests, session_state, client=client)
+
+        client.submit.assert_not_awaited()
+        client.status.assert_awaited_once_with("batch_9")
+        assert results["r1"].text == "done"
+
+
+class TestExecutorsUseBatch:
+    """Tests for batch mode in the orchestrator and parallel executors."""
+
+    @pytest.mark.asyncio
+    async def test_worker_round_batches_and_runs_failures_live(
+        self, fake_server: FakeBatchServer
+    ) -> None:
+        """Answered subtasks come from the batch; failed ones fall back to live workers."""
+        spec = _spec(fake_server.base_url)
+        subtasks = [{"task": "alpha"}, {"task": "FAIL beta"}, {"task": "gamma"}]
+        live = AsyncMock(
+            return_value={"response": "live", "status": "success", "tokens": 1, "task": "x"}
+        )
+
+        with patch("strands_cli.exec.orchestrator_workers._execute_worker", live):
+            results, tokens = await _execute_workers_batch(
+                MagicMock(), spec, "worker", subtasks, None, 4, None, list, None, 1, 0, 0
+            )
+
+        assert [result["response"] for result in results] == [
+            "answer: alpha",
+            "live",
+            "answer: gamma",
+        ]
+        assert tokens == 42 + 1 + 42
+        live.assert_awaited_once()
+        assert live.await_args.args[3] == {"task": "FAIL beta"}
+
+    @pytest.mark.asyncio
+    async def test_small_fan_out_stays_live(self, fake_server: FakeBatchServer) -> None:
+        """Fan-outs below min_requests do not create batch jobs."""
+        spec = _spec(fake_server.base_url, min_requests=5)
+        live = AsyncMock(
+            return_value={"response": "live", "status": "success", "tokens": 1, "task": "x"}
+        )
+
+        with patch("strands_cli.exec.orchestrator_workers._execute_worker", live):
+            await _execute_workers_batch(
+                MagicMock(), spec, "worker", [{"task": "a"}], None, 4, None, list, None, 1, 0, 0
+            )
+
+        assert fake_server.batches_created == 0
+
+    @pytest.mark.asyncio
+    async def test_parallel_branches_batched(self, fake_server: FakeBatchServer) -> None:
+        """Single-step branches are rendered, batched and returned with step history."""
+        spec = _spec(fake_server.base_url)
+        live = AsyncMock(return_value=("live", 1, []))
+
+        with patch("strands_cli.exec.parallel._execute_branch", live):
+            results = dict(
+                await _execute_all_branches_async(
+                    spec, spec.pattern.config.branches, {"topic": "AI"}, MagicMock(), None, 1, 0, 0
+                )
+            )
+
+        assert results["a"][0] == "answer: Topic AI"
+        assert results["a"][2][0]["agent"] == "worker"
+        assert results["c"][0] == "answer: Other"
+        assert results["b"] == ("live", 1, [])
+        assert fake_server.batches_created == 1
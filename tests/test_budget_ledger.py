@@ -0,0 +1,193 @@
+"""Tests for the run-wide token budget ledger."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from strands_cli.exec.utils import invoke_agent_with_retry
+from strands_cli.runtime.budget_enforcer import BudgetExceededError
+from strands_cli.runtime.budget_ledger import (
+    TokenBudgetLedger,
+    budget_ledger_scope,
+    estimate_invocation_tokens,
+    get_budget_ledger,
+    with_budget_ledger,
+)
+from strands_cli.types import Spec
+
+
+def _spec(max_tokens: int | None, runtime_max_tokens: int | None = None) -> Spec:
+    budgets = {"max_tokens": max_tokens} if max_tokens else None
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "budget-ledger",
+            "runtime": {
+                "provider": "ollama",
+                "model_id": "llama3",
+                "host": "http://localhost:11434",
+                "budgets": budgets,
+                "max_tokens": runtime_max_tokens,
+            },
+            "agents": {"writer": {"prompt": "Write"}},
+            "pattern": {"type": "chain", "config": {"steps": [{"agent": "writer"}]}},
+        }
+    )
+
+
+def _agent(name: str, invoke: object, tokens_per_call: int) -> MagicMock:
+    """Agent whose metrics report tokens_per_call after each successful call."""
+    agent = MagicMock()
+    agent.name = name
+    agent.system_prompt = ""
+    agent.messages = []
+    agent.model.get_config.return_value = {"model_id": "m"}
+    agent.event_loop_metrics.accumulated_usage = {"totalTokens": 0}
+
+    async def invoke_async(input_text: str) -> str:
+        result = await invoke(input_text)
+        agent.event_loop_metrics.accumulated_usage["totalTokens"] += tokens_per_call
+        return result
+
+    agent.invoke_async = invoke_async
+    return agent
+
+
+class TestTokenBudgetLedger:
+    """Tests for reservations and commits."""
+
+    def test_refuses_reservation_that_would_exceed_budget(self) -> None:
+        """Spent plus in-flight reservations plus the estimate must fit the budget."""
+        ledger = TokenBudgetLedger(100, spent=40)
+        first = ledger.reserve(50, "a")
+
+        with pytest.raises(BudgetExceededError, match="would be exceeded by 'b'"):
+            ledger.reserve(20, "b")
+
+        ledger.release(first)
+        assert ledger.reserve(20, "b").tokens == 20
+
+    def test_commit_at_limit_exhausts_ledger(self) -> None:
+        """Reaching the hard limit raises and refuses every later reservation."""
+        ledger = TokenBudgetLedger(100)
+        reservation = ledger.reserve(10, "a")
+
+        with pytest.raises(BudgetExceededError, match="exhausted"):
+            ledger.commit(reservation, 100)
+
+        assert ledger.exhausted
+        assert ledger.reserved == 0
+        with pytest.raises(BudgetExceededError):
+            ledger.reserve(1, "b")
+
+    def test_estimate_counts_prompt_history_and_allowance(self) -> None:
+        """Estimates are about 4 characters per token plus the output allowance."""
+        agent = MagicMock()
+        agent.system_prompt = "x" * 40
+        agent.messages = []
+
+        assert estimate_invocation_tokens(agent, "y" * 40, output_allowance=50) == 70
+
+
+class TestBudgetLedgerScope:
+    """Tests for activating the ledger around a run."""
+
+    def test_no_ledger_without_token_budget(self) -> None:
+        """Runs without budgets.max_tokens are not tracked."""
+        with budget_ledger_scope(_spec(None)) as ledger:
+            assert ledger is None
+            assert get_budget_ledger() is None
+
+    def test_nested_scopes_share_ledger(self) -> None:
+        """Nested executors reserve against the outer run's budget."""
+        with (
+            budget_ledger_scope(_spec(1000, runtime_max_tokens=64)) as outer,
+            budget_ledger_scope(_spec(50)) as inner,
+        ):
+            assert inner is outer
+        assert outer.max_tokens == 1000
+        assert outer.output_allowance == 64
+        assert get_budget_ledger() is None
+
+    @pytest.mark.asyncio
+    async def test_decorator_seeds_spent_from_session(self) -> None:
+        """Tokens recorded in a resumed session count against the budget."""
+        seen: list[TokenBudgetLedger | None] = []
+
+        @with_budget_ledger
+        async def run(spec: Spec, variables: dict | None = None, session_state=None) -> None:
+            seen.append(get_budget_ledger())
+
+        session_state = MagicMock()
+        session_state.token_usage.total_input_tokens = 300
+        session_state.token_usage.total_output_tokens = 200
+
+        await run(_spec(1000), session_state=session_state)
+
+        assert seen[0] is not None
+        assert seen[0].spent == 500
+
+
+class TestInvokeWithLedger:
+    """Tests for the ledger inside invoke_agent_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_actual_usage_is_committed(self) -> None:
+        """Provider-reported usage replaces the reservation."""
+
+        async def invoke(_: str) -> str:
+            return "ok"
+
+        with budget_ledger_scope(_spec(1000)) as ledger:
+            await invoke_agent_with_retry(_agent("a", invoke, 120), "hi", 1, 0, 0)
+
+        assert ledger.spent == 120
+        assert ledger.reserved == 0
+
+    @pytest.mark.asyncio
+    async def test_call_refused_before_reaching_provider(self) -> None:
+        """A call whose estimate cannot fit is cancelled before it starts."""
+        calls = 0
+
+        async def invoke(_: str) -> str:
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        with (
+            budget_ledger_scope(_spec(100), spent=95),
+            pytest.raises(BudgetExceededError, match="before it started"),
+        ):
+            await invoke_agent_with_retry(_agent("a", invoke, 10), "x" * 40, 1, 0, 0)
+
+        assert calls == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_siblings_cancelled_at_hard_limit(self) -> None:
+        """Once one branch exhausts the budget, running siblings stop with the budget error."""
+        sibling_started = asyncio.Event()
+
+        async def fast(_: str) -> str:
+            await sibling_started.wait()
+            return "done"
+
+        async def slow(_: str) -> str:
+            sibling_started.set()
+            await asyncio.sleep(60)
+            return "never"
+
+        with budget_ledger_scope(_spec(100)) as ledger:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    invoke_agent_with_retry(_agent("fast", fast, 100), "a", 1, 0, 0),
+                    invoke_agent_with_retry(_agent("slow", slow, 100), "b", 1, 0, 0),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+
+        assert all(isinstance(result, BudgetExceededError) for result in results)
+        assert "'slow' was running" in str(results[1])
+        assert ledger.exhausted
+        assert ledger.reserved == 0
@@ -0,0 +1,298 @@
+"""Tests for model cascades (cheaper models first, escalating on rejection)."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from strands.session import SessionManager
+
+from strands_cli.exec.utils import invoke_agent_with_retry
+from strands_cli.runtime.cascade import (
+    CascadeConfigError,
+    ConfidenceAcceptor,
+    EvaluatorAcceptor,
+    ModelCascade,
+    SchemaAcceptor,
+    attach_cascade,
+    build_cascade,
+)
+from strands_cli.telemetry.metrics import MetricsRegistry, get_metrics
+from strands_cli.types import Spec
+
+
+@pytest.fixture
+def global_metrics() -> MetricsRegistry:
+    """The process-wide registry, cleared before and after the test."""
+    metrics = get_metrics()
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+def _spec(cascade: dict | None, agent_cascade: dict | None = None) -> Spec:
+    writer: dict = {"prompt": "Write", "output_schema": {"type": "object", "required": ["ok"]}}
+    if agent_cascade is not None:
+        writer["cascade"] = agent_cascade
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "cascade",
+            "runtime": {
+                "provider": "openai",
+                "model_id": "large",
+                "cascade": cascade,
+            },
+            "agents": {"writer": writer, "judge": {"prompt": "Judge"}},
+            "pattern": {"type": "chain", "config": {"steps": [{"agent": "writer"}]}},
+        }
+    )
+
+
+def _agent(answers: dict[str, str]) -> SimpleNamespace:
+    """Agent whose reply depends on the model it currently holds."""
+    agent = SimpleNamespace(name="writer", model="large", messages=[])
+
+    async def call() -> str:
+        agent.messages.append({"role": "assistant", "model": agent.model})
+        return answers[agent.model]
+
+    agent.call = call
+    return agent
+
+
+class TestAcceptors:
+    """Tests for the built-in acceptors."""
+
+    @pytest.mark.asyncio
+    async def test_schema_acceptor(self) -> None:
+        """Outputs must be JSON valid against the schema."""
+        acceptor = SchemaAcceptor({"type": "object", "required": ["ok"]})
+
+        assert await acceptor.accepts("task", '{"ok": true}')
+        assert not await acceptor.accepts("task", '{"other": 1}')
+        assert not await acceptor.accepts("task", "not json")
+
+    @pytest.mark.asyncio
+    async def test_confidence_acceptor(self) -> None:
+        """The marker's number must reach the threshold; a missing marker rejects."""
+        acceptor = ConfidenceAcceptor(r"CONFIDENCE:\s*(\d+)", 70)
+
+        assert await acceptor.accepts("task", "Answer.\nconfidence: 85")
+        assert not await acceptor.accepts("task", "Answer.\nCONFIDENCE: 40")
+        assert not await acceptor.accepts("task", "Answer without marker")
+
+    @pytest.mark.asyncio
+    async def test_evaluator_acceptor_scores_with_fresh_history(self) -> None:
+        """The evaluator's JSON score decides; each check starts without prior messages."""
+        evaluator = MagicMock()
+        evaluator.messages = [{"role": "user"}]
+
+        async def invoke_async(prompt: str, **kwargs: Any) -> str:
+            assert "Response:\nDraft" in prompt
+            return 'Verdict: {"score": 85, "issues": []}'
+
+        evaluator.invoke_async = invoke_async
+        acceptor = EvaluatorAcceptor(_spec(None), "judge", min_score=80)
+
+        with patch(
+            "strands_cli.runtime.strands_adapter.build_agent", return_value=evaluator
+        ) as build:
+            assert await acceptor.accepts("Write", "Draft")
+            acceptor.min_score = 90
+            assert not await acceptor.accepts("Write", "Draft")
+
+        build.assert_called_once()
+        assert evaluator.messages == []
+
+    @pytest.mark.asyncio
+    async def test_evaluator_acceptor_builds_through_run_cache(self) -> None:
+        """With the run's AgentCache, the evaluator gets its own slot there (closed with the run)."""
+        evaluator = MagicMock()
+        evaluator.messages = []
+
+        async def invoke_async(prompt: str, **kwargs: Any) -> str:
+            return '{"score": 90, "issues": []}'
+
+        evaluator.invoke_async = invoke_async
+        cache = MagicMock()
+        cache.get_or_build_agent = AsyncMock(return_value=evaluator)
+        acceptor = EvaluatorAcceptor(_spec(None), "judge", min_score=80, agent_cache=cache)
+
+        with patch("strands_cli.runtime.strands_adapter.build_agent") as build:
+            assert await acceptor.accepts("Write", "Draft")
+            assert await acceptor.accepts("Write", "Draft")
+
+        build.assert_not_called()
+        cache.get_or_build_agent.assert_awaited_once()
+        assert cache.get_or_build_agent.await_args.kwargs["worker_index"] < 0
+
+
+class TestModelCascade:
+    """Tests for tier escalation."""
+
+    @pytest.mark.asyncio
+    async def test_cheap_tier_accepted(self, global_metrics: MetricsRegistry) -> None:
+        """An accepted cheap answer is returned without calling the agent's own model."""
+        agent = _agent({"small": "CONFIDENCE: 90", "large": "big"})
+        cascade = ModelCascade(
+            [("small", "small")], ConfidenceAcceptor(r"CONFIDENCE:\s*(\d+)", 70), "large"
+        )
+
+        result = await cascade.invoke(agent, "task", agent.call)
+
+        assert result == "CONFIDENCE: 90"
+        assert agent.model == "large"
+        assert (
+            global_metrics.value(
+                "strands_cascade_calls_total", agent="writer", model="small", outcome="accepted"
+            )
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_escalates_and_drops_rejected_exchange(
+        self, global_metrics: MetricsRegistry
+    ) -> None:
+        """Rejected and failing tiers escalate; only the final exchange stays in history."""
+        agent = _agent({"small": "CONFIDENCE: 10", "large": "big"})
+        agent.messages.append({"role": "user"})
+
+        async def call() -> str:
+            if agent.model == "medium":
+                raise RuntimeError("provider down")
+            return await agent.call()
+
+        cascade = ModelCascade(
+            [("small", "small"), ("medium", "medium")],
+            ConfidenceAcceptor(r"CONFIDENCE:\s*(\d+)", 70),
+            "large",
+        )
+
+        result = await cascade.invoke(agent, "task", call)
+
+        assert result == "big"
+        assert agent.messages == [{"role": "user"}, {"role": "assistant", "model": "large"}]
+        for model, outcome in (("small", "escalated"), ("medium", "error"), ("large", "final")):
+            assert (
+                global_metrics.value(
+                    "strands_cascade_calls_total", agent="writer", model=model, outcome=outcome
+                )
+                == 1
+            )
+
+    @pytest.mark.asyncio
+    async def test_only_accepted_exchange_is_persisted(self) -> None:
+        """Rejected tiers never reach the session; the final exchange persists as usual."""
+
+        class _Recorder(SessionManager):
+            def __init__(self) -> None:
+                self.saved: list[Any] = []
+
+            def append_message(self, message: Any, agent: Any, **kwargs: Any) -> None:
+                self.saved.append(message)
+
+            def redact_latest_message(self, message: Any, agent: Any, **kwargs: Any) -> None:
+                pass
+
+            def sync_agent(self, agent: Any, **kwargs: Any) -> None:
+                pass
+
+            def initialize(self, agent: Any, **kwargs: Any) -> None:
+                pass
+
+        def _persisting(answers: dict[str, str]) -> Any:
+            agent = _agent(answers)
+            agent._session_manager = _Recorder()
+
+            async def call() -> str:
+                # Like the SDK's MessageAddedEvent hook
+                agent.messages.append({"role": "assistant", "model": agent.model})
+                agent._session_manager.append_message(agent.messages[-1], agent)
+                return answers[agent.model]
+
+            agent.call = call
+            return agent
+
+        acceptor = ConfidenceAcceptor(r"CONFIDENCE:\s*(\d+)", 70)
+        cascade = ModelCascade([("small", "small"), ("medium", "medium")], acceptor, "large")
+
+        escalated = _persisting({"small": "no", "medium": "no", "large": "big"})
+        await cascade.invoke(escalated, "task", escalated.call)
+        assert escalated._session_manager.saved == [{"role": "assistant", "model": "large"}]
+
+        accepted = _persisting({"small": "no", "medium": "CONFIDENCE: 90", "large": "big"})
+        await cascade.invoke(accepted, "task", accepted.call)
+        assert accepted._session_manager.saved == [{"role": "assistant", "model": "medium"}]
+        assert "append_message" not in vars(accepted._session_manager)
+
+    @pytest.mark.asyncio
+    async def test_invoke_agent_with_retry_uses_attached_cascade(self) -> None:
+        """Every executor goes through invoke_agent_with_retry, which applies the cascade."""
+        models = {"small": MagicMock(), "large": MagicMock()}
+        for model_id, model in models.items():
+            model.get_config.return_value = {"model_id": model_id}
+        agent = MagicMock()
+        agent.name = "writer"
+        agent.model = models["large"]
+        agent.messages = []
+
+        async def invoke_async(_: str) -> str:
+            return '{"ok": true}' if agent.model is models["small"] else "large answer"
+
+        agent.invoke_async = invoke_async
+        attach_cascade(
+            agent,
+            ModelCascade([("small", models["small"])], SchemaAcceptor({"type": "object"}), "large"),
+        )
+
+        assert await invoke_agent_with_retry(agent, "hi", 1, 0, 0) == '{"ok": true}'
+        assert agent.model is models["large"]
+
+
+class TestBuildCascade:
+    """Tests for resolving cascade configuration."""
+
+    def test_runtime_cascade_uses_agent_output_schema(self) -> None:
+        """Schema acceptors default to the agent's output_schema; tiers share the provider."""
+        spec = _spec({"models": ["small", "large"], "accept": {"type": "schema"}})
+
+        with patch("strands_cli.runtime.cascade.create_model") as create_model:
+            cascade = build_cascade(spec, "writer", spec.agents["writer"], spec.runtime)
+
+        assert [model_id for model_id, _ in cascade.tiers] == ["small"]
+        assert create_model.call_args.args[0].model_id == "small"
+        assert create_model.call_args.args[0].provider == spec.runtime.provider
+        assert isinstance(cascade.acceptor, SchemaAcceptor)
+        assert cascade.primary == "large"
+
+    def test_agent_can_opt_out(self) -> None:
+        """An agent-level cascade with no models disables the runtime cascade."""
+        spec = _spec(
+            {"models": ["small"], "accept": {"type": "confidence"}},
+            agent_cascade={"models": [], "accept": {"type": "confidence"}},
+        )
+
+        with patch("strands_cli.runtime.cascade.create_model"):
+            assert build_cascade(spec, "writer", spec.agents["writer"], spec.runtime) is None
+            assert build_cascade(spec, "judge", spec.agents["judge"], spec.runtime) is not None
+
+    def test_schema_acceptor_requires_schema(self) -> None:
+        """An agent without output_schema needs accept.schema."""
+        spec = _spec({"models": ["small"], "accept": {"type": "schema"}})
+
+        with (
+            patch("strands_cli.runtime.cascade.create_model"),
+            pytest.raises(CascadeConfigError, match="output_schema"),
+        ):
+            build_cascade(spec, "judge", spec.agents["judge"], spec.runtime)
+
+    def test_evaluator_must_exist(self) -> None:
+        """Evaluator acceptors reference a defined agent."""
+        spec = _spec({"models": ["small"], "accept": {"type": "evaluator", "agent": "nobody"}})
+
+        with (
+            patch("strands_cli.runtime.cascade.create_model"),
+            pytest.raises(CascadeConfigError, match="nobody"),
+        ):
+            build_cascade(spec, "writer", spec.agents["writer"], spec.runtime)
@@ -526,10 +526,10 @@ class TestChainAgentSessionRestoration:
 
         repo = FileSessionRepository(storage_dir=tmp_path)
 
-        # Mock FileSessionManager (it's imported inside chain.py)
+        # Mock the session manager class (it's imported inside chain.py)
         mock_session_manager = MagicMock()
         mock_file_session_manager_class = mocker.patch(
-            "strands.session.file_session_manager.FileSessionManager",
+            "strands_cli.session.storage_format.CompactFileSessionManager",
             return_value=mock_session_manager,
         )
 
@@ -628,7 +628,7 @@ class TestChainAgentSessionRestoration:
         # Mock FileSessionManager
         mock_session_manager = MagicMock()
         mock_file_session_manager_class = mocker.patch(
-            "strands.session.file_session_manager.FileSessionManager",
+            "strands_cli.session.storage_format.CompactFileSessionManager",
             return_value=mock_session_manager,
         )
 
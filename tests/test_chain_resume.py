@@ -315,7 +315,7 @@ async def test_chain_resume_agent_session_restoration(
     mock_agent.invoke_async = AsyncMock(side_effect=["Analysis complete", "Summary complete"])
 
     mock_file_session_manager = mocker.patch(
-        "strands.session.file_session_manager.FileSessionManager"
+        "strands_cli.session.storage_format.CompactFileSessionManager"
     )
 
     mocker.patch(
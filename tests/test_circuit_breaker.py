@@ -0,0 +1,204 @@
+"""Tests for provider circuit breakers and Retry-After-aware backoff."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from strands.types.exceptions import ModelThrottledException
+from tenacity import RetryCallState
+
+from strands_cli.exec.utils import create_retry_decorator, invoke_agent_with_retry
+from strands_cli.runtime.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    retry_after_seconds,
+)
+from strands_cli.telemetry.metrics import MetricsRegistry, get_metrics
+
+
+@pytest.fixture
+def global_metrics() -> MetricsRegistry:
+    """The process-wide registry, cleared before and after the test."""
+    metrics = get_metrics()
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, global_metrics: MetricsRegistry) -> None:
+        """The breaker opens at the threshold and sheds calls while open."""
+        breaker = CircuitBreaker("OpenAIModel", "gpt", failure_threshold=2, recovery_s=60)
+
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        with pytest.raises(CircuitOpenError, match="OpenAIModel:gpt"):
+            breaker.before_call()
+        labels = {"provider": "OpenAIModel", "model": "gpt"}
+        assert global_metrics.value("strands_circuit_breaker_state", **labels) == 2
+        assert global_metrics.value("strands_circuit_breaker_rejections_total", **labels) == 1
+
+    def test_success_resets_failure_count(self) -> None:
+        """Failures must be consecutive to open the breaker."""
+        breaker = CircuitBreaker("p", "m", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_admits_one_probe(self, global_metrics: MetricsRegistry) -> None:
+        """After recovery one probe passes; its success closes the breaker."""
+        breaker = CircuitBreaker("p", "m", failure_threshold=1, recovery_s=0)
+        breaker.record_failure()
+
+        breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert global_metrics.value("strands_circuit_breaker_state", provider="p", model="m") == 0
+
+    def test_failed_probe_reopens(self) -> None:
+        """A failed probe reopens the breaker, honouring a longer Retry-After."""
+        breaker = CircuitBreaker("p", "m", failure_threshold=3, recovery_s=0)
+        breaker.failures = 3
+        breaker.record_failure()
+        breaker.before_call()
+
+        breaker.record_failure(retry_after=120)
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_in > 100
+
+    def test_registry_shares_breakers_and_can_be_disabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """One breaker per provider and model; STRANDS_CIRCUIT_BREAKER=false disables them."""
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "7")
+
+        breaker = get_circuit_breaker("BedrockModel", "claude")
+
+        assert breaker is get_circuit_breaker("BedrockModel", "claude")
+        assert breaker is not get_circuit_breaker("BedrockModel", "other")
+        assert breaker.failure_threshold == 7
+        monkeypatch.setenv("STRANDS_CIRCUIT_BREAKER", "false")
+        assert get_circuit_breaker("BedrockModel", "claude") is None
+
+
+class TestRetryAfter:
+    """Tests for Retry-After extraction and backoff."""
+
+    def test_reads_http_and_botocore_errors(self) -> None:
+        """Hints are read from HTTP responses, botocore errors and wrapped causes."""
+        http_error = Exception("429")
+        http_error.response = SimpleNamespace(headers={"Retry-After": "7"})
+        boto_error = Exception("ThrottlingException")
+        boto_error.response = {"ResponseMetadata": {"HTTPHeaders": {"retry-after": "3"}}}
+        wrapped = ModelThrottledException("throttled")
+        wrapped.__cause__ = http_error
+
+        assert retry_after_seconds(http_error) == 7
+        assert retry_after_seconds(boto_error) == 3
+        assert retry_after_seconds(wrapped) == 7
+        assert retry_after_seconds(ModelThrottledException("no hint")) is None
+
+    def test_reads_http_date(self) -> None:
+        """An HTTP-date Retry-After in the past means no wait."""
+        error = Exception("429")
+        error.retry_after = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        assert retry_after_seconds(error) == 0
+
+    def test_wait_is_jittered_and_honours_retry_after(self) -> None:
+        """Backoff stays within [wait_min, exponential] unless Retry-After asks for more."""
+        decorated = create_retry_decorator(max_attempts=5, wait_min=1, wait_max=4)(lambda: None)
+        wait = decorated.retry.wait
+
+        def state(error: BaseException, attempt: int) -> RetryCallState:
+            retry_state = RetryCallState(MagicMock(), None, (), {})
+            retry_state.attempt_number = attempt
+            retry_state.set_exception((type(error), error, None))
+            return retry_state
+
+        delays = {wait(state(ConnectionError("reset"), 3)) for _ in range(20)}
+        assert all(1 <= delay <= 4 for delay in delays)
+        assert len(delays) > 1
+
+        throttled = ModelThrottledException("slow down")
+        throttled.retry_after = 30
+        assert wait(state(throttled, 1)) == 30
+
+
+class TestInvokeWithBreaker:
+    """Tests for the breaker inside invoke_agent_with_retry."""
+
+    def _agent(self, invoke: object) -> MagicMock:
+        agent = MagicMock()
+        agent.name = "writer"
+        agent.model.get_config.return_value = {"model_id": "m1"}
+        agent.invoke_async = invoke
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_sheds_load(
+        self, monkeypatch: pytest.MonkeyPatch, global_metrics: MetricsRegistry
+    ) -> None:
+        """Once the breaker opens, calls fail fast without reaching the provider."""
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
+        calls = 0
+
+        async def invoke(_: str) -> str:
+            nonlocal calls
+            calls += 1
+            raise ModelThrottledException("throttled")
+
+        agent = self._agent(invoke)
+
+        # The second failure opens the breaker, so the third attempt is shed
+        with pytest.raises(CircuitOpenError):
+            await invoke_agent_with_retry(agent, "hi", 5, 0, 0)
+        assert calls == 2
+
+        with pytest.raises(CircuitOpenError):
+            await invoke_agent_with_retry(agent, "hi", 5, 0, 0)
+        assert calls == 2
+        assert (
+            global_metrics.value(
+                "strands_circuit_breaker_rejections_total",
+                provider="MagicMock",
+                model="m1",
+            )
+            == 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_transient_errors_do_not_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Errors other than timeouts, connection errors and throttling count as answers."""
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "1")
+
+        async def invoke(_: str) -> str:
+            raise ValueError("bad request")
+
+        agent = self._agent(invoke)
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await invoke_agent_with_retry(agent, "hi", 3, 0, 0)
+
+        assert get_circuit_breaker("MagicMock", "m1").state == CLOSED
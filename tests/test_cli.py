@@ -413,6 +413,49 @@ class TestRunCommand:
         assert result.exit_code == EX_OK
         assert "Loading spec:" in result.stdout or "Provider:" in result.stdout
 
+    def test_run_profile_writes_timing_breakdown(
+        self,
+        minimal_ollama_spec: Path,
+        temp_artifacts_dir: Path,
+        mock_ollama_client: Mock,
+        mock_strands_agent: Mock,
+        mock_create_model: Any,
+        mocker: Any,
+    ) -> None:
+        """Test run command with --profile writes the profile report and folded stacks."""
+        import json
+
+        mocker.patch("time.sleep")
+        mock_strands_agent.invoke_async.return_value = "Profiled response."
+
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                str(minimal_ollama_spec),
+                "--out",
+                str(temp_artifacts_dir),
+                "--profile",
+                "--no-save-session",
+                "--force",
+            ],
+        )
+
+        assert result.exit_code == EX_OK
+        assert "Profile: wall" in result.stdout
+        profile_files = sorted(p.name for p in temp_artifacts_dir.glob("*-profile.*"))
+        assert [name.rsplit(".", 1)[1] for name in profile_files] == ["folded", "json"]
+        report = json.loads(next(temp_artifacts_dir.glob("*-profile.json")).read_text())
+        phases = {phase["phase"] for phase in report["phases"]}
+        assert {"spec.parse", "spec.validate", "agent.invoke"} <= phases
+        assert report["steps"][0]["index"] == 0
+        assert set(report["summary"]) == {
+            "llm_wait_seconds",
+            "tool_seconds",
+            "self_seconds",
+            "unattributed_seconds",
+        }
+
     def test_run_unsupported_spec_returns_unsupported(
         self,
         temp_artifacts_dir: Path,
@@ -1050,6 +1093,25 @@ class TestSessionsCommand:
         assert result.exit_code == EX_USAGE
         assert "Session not found" in result.stdout
 
+    def test_sessions_compact_rejects_non_file_backend(
+        self, tmp_path: Path, monkeypatch: Any
+    ) -> None:
+        """Test sessions compact refuses to run against the S3 backend."""
+        from strands_cli.exit_codes import EX_USAGE
+
+        monkeypatch.setenv("STRANDS_SESSION_BACKEND", "s3")
+        monkeypatch.setenv("STRANDS_SESSION_S3_BUCKET", "sessions-bucket")
+        convert = Mock()
+        monkeypatch.setattr(
+            "strands_cli.session.file_repository.FileSessionRepository.convert", convert
+        )
+
+        result = runner.invoke(app, ["sessions", "compact"])
+
+        assert result.exit_code == EX_USAGE
+        assert "STRANDS_SESSION_BACKEND is 's3'" in result.stdout
+        convert.assert_not_called()
+
     def test_sessions_help(self) -> None:
         """Test sessions command shows help."""
         result = runner.invoke(app, ["sessions", "--help"])
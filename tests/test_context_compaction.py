@@ -9,11 +9,12 @@ Coverage:
 - Integration: AgentCache with different conversation managers, hook event flow
 """
 
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from strands.agent.conversation_manager import SummarizingConversationManager
-from strands.hooks import AfterInvocationEvent, HookRegistry
+from strands.hooks import AfterInvocationEvent, BeforeInvocationEvent, HookRegistry
 
 from strands_cli.exec.hooks import ProactiveCompactionHook
 from strands_cli.runtime.context_manager import create_from_policy
@@ -161,12 +162,25 @@ class TestProactiveCompactionHook:
     """Tests for ProactiveCompactionHook trigger logic."""
 
     @pytest.fixture
-    def mock_conversation_manager(self) -> MagicMock:
-        """Mock SummarizingConversationManager."""
-        manager = MagicMock(spec=SummarizingConversationManager)
-        manager.summarize_async = AsyncMock()
-        manager.history = [{"role": "user", "content": "msg"}] * 10  # 10 messages
-        return manager
+    def summary_message(self) -> dict:
+        """Summary message returned by the mocked summarization call."""
+        return {"role": "user", "content": [{"text": "Summary of earlier steps"}]}
+
+    @pytest.fixture
+    def summarization_agent(self, summary_message: dict) -> MagicMock:
+        """Dedicated summarization agent whose reply is the summary."""
+        agent = MagicMock()
+        agent.return_value.message = summary_message
+        return agent
+
+    @pytest.fixture
+    def mock_conversation_manager(
+        self, summarization_agent: MagicMock
+    ) -> SummarizingConversationManager:
+        """SummarizingConversationManager with a mocked dedicated summarization agent."""
+        return SummarizingConversationManager(
+            summary_ratio=0.5, preserve_recent_messages=2, summarization_agent=summarization_agent
+        )
 
     @pytest.fixture
     def mock_config(self) -> Compaction:
@@ -188,123 +202,209 @@ class TestProactiveCompactionHook:
         event.response.usage.output_tokens = 200
         return event
 
+    def _agent(
+        self, manager: object, total_tokens: int | None, message_count: int = 10
+    ) -> MagicMock:
+        agent = MagicMock()
+        agent.name = "test-agent"
+        agent.conversation_manager = manager
+        agent.accumulated_usage = {"totalTokens": total_tokens} if total_tokens else None
+        agent.messages = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": [{"text": f"m{i}"}]}
+            for i in range(message_count)
+        ]
+        return agent
+
+    def _wait_for_summary(self, hook: ProactiveCompactionHook, agent: MagicMock) -> None:
+        hook._pending[id(agent)].future.result(timeout=5)
+
     @pytest.mark.asyncio
     async def test_hook_registration_adds_callback(
         self, mock_conversation_manager: MagicMock, mock_config: Compaction
     ) -> None:
-        """Test that register_hooks() adds callback to HookRegistry."""
+        """Test that register_hooks() adds before- and after-invocation callbacks."""
         hook = ProactiveCompactionHook(threshold_tokens=mock_config.when_tokens_over)
 
         mock_registry = MagicMock(spec=HookRegistry)
         hook.register_hooks(mock_registry)
 
-        # Verify add_callback was called with AfterInvocationEvent
-        assert mock_registry.add_callback.call_count == 1
-        call_args = mock_registry.add_callback.call_args
-        assert call_args[0][0] == AfterInvocationEvent
-        # Verify callback is callable
-        assert callable(call_args[0][1])
+        events = [call[0][0] for call in mock_registry.add_callback.call_args_list]
+        assert events == [BeforeInvocationEvent, AfterInvocationEvent]
+        assert all(callable(call[0][1]) for call in mock_registry.add_callback.call_args_list)
 
     @pytest.mark.asyncio
-    async def test_no_compaction_when_below_threshold(
-        self, mock_conversation_manager: MagicMock, mock_config: Compaction, mock_event: MagicMock
+    async def test_no_compaction_when_below_precompute_ratio(
+        self, mock_conversation_manager: SummarizingConversationManager, mock_event: MagicMock
     ) -> None:
-        """Test that compaction is NOT triggered when input_tokens < threshold."""
-        # Setup agent with conversation_manager and accumulated_usage
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        # accumulated_usage should be a dict, not MagicMock with attributes
-        mock_agent.accumulated_usage = {"totalTokens": 800}  # Below threshold
-        mock_event.agent = mock_agent
+        """Test that no summary is started below precompute_ratio of the threshold."""
+        mock_event.agent = self._agent(mock_conversation_manager, 600)
 
         hook = ProactiveCompactionHook(threshold_tokens=1000)
         hook._check_and_compact(mock_event)
 
-        # apply_management should NOT be called
-        mock_conversation_manager.apply_management.assert_not_called()
+        mock_conversation_manager.summarization_agent.assert_not_called()
+        assert hook._pending == {}
 
     @pytest.mark.asyncio
-    async def test_compaction_triggered_when_at_threshold(
-        self, mock_conversation_manager: MagicMock, mock_config: Compaction, mock_event: MagicMock
+    async def test_summary_precomputed_and_swapped_at_next_turn(
+        self,
+        mock_conversation_manager: SummarizingConversationManager,
+        mock_event: MagicMock,
+        summary_message: dict,
     ) -> None:
-        """Test that compaction IS triggered when input_tokens >= threshold."""
-        # Setup agent with conversation_manager and accumulated_usage
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        mock_agent.accumulated_usage = {"totalTokens": 1000}  # At threshold
-        mock_event.agent = mock_agent
+        """Test that a summary starts at 70% and replaces the oldest messages next turn."""
+        agent = self._agent(mock_conversation_manager, 700)
+        original = list(agent.messages)
+        mock_event.agent = agent
 
         hook = ProactiveCompactionHook(threshold_tokens=1000)
         hook._check_and_compact(mock_event)
+        self._wait_for_summary(hook, agent)
+
+        # History is untouched until the next turn boundary
+        assert agent.messages == original
+
+        hook._swap_in_summary_before_turn(MagicMock(agent=agent))
 
-        # apply_management SHOULD be called once
-        mock_conversation_manager.apply_management.assert_called_once()
+        summary = agent.messages[0]
+        assert {k: v for k, v in summary.items() if k != "tracking_id"} == summary_message
+        assert agent.messages[1:] == original[5:]
+        assert mock_conversation_manager.removed_message_count == 5
+        assert mock_conversation_manager.get_state()["summary_message"] is summary
+        assert hook.compacted is True
+        assert hook.compaction_count == 1
 
     @pytest.mark.asyncio
-    async def test_compaction_triggered_when_above_threshold(
-        self, mock_conversation_manager: MagicMock, mock_config: Compaction, mock_event: MagicMock
+    async def test_step_does_not_wait_for_summary(
+        self, mock_conversation_manager: SummarizingConversationManager, mock_event: MagicMock
     ) -> None:
-        """Test that compaction IS triggered when input_tokens > threshold."""
-        # Setup agent with conversation_manager and accumulated_usage
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        mock_agent.accumulated_usage = {"totalTokens": 1500}  # Above threshold
-        mock_event.agent = mock_agent
+        """Test that a slow summary never blocks the invocation hooks."""
+        release = threading.Event()
+        late = MagicMock(message={"role": "user", "content": [{"text": "late summary"}]})
+        mock_conversation_manager.summarization_agent.side_effect = lambda *_: (
+            release.wait(5),
+            late,
+        )[1]
+        agent = self._agent(mock_conversation_manager, 1500)
+        original = list(agent.messages)
+        mock_event.agent = agent
 
         hook = ProactiveCompactionHook(threshold_tokens=1000)
         hook._check_and_compact(mock_event)
+        hook._swap_in_summary_before_turn(MagicMock(agent=agent))
+        hook._check_and_compact(mock_event)  # Still in flight: no second job
+
+        assert agent.messages == original
+        assert hook.compacted is False
+        assert mock_conversation_manager.summarization_agent.call_count == 1
 
-        # apply_management SHOULD be called once
-        mock_conversation_manager.apply_management.assert_called_once()
+        release.set()
+        self._wait_for_summary(hook, agent)
+        hook._swap_in_summary_before_turn(MagicMock(agent=agent))
+        assert agent.messages[0]["content"][0]["text"] == "late summary"
 
     @pytest.mark.asyncio
-    async def test_compaction_only_triggers_once(
-        self, mock_conversation_manager: MagicMock, mock_event: MagicMock
+    async def test_compaction_repeats_as_history_grows(
+        self,
+        mock_conversation_manager: SummarizingConversationManager,
+        mock_event: MagicMock,
+        summary_message: dict,
     ) -> None:
-        """Test that compaction only triggers once (compacted flag prevents re-trigger)."""
-        # Setup agent
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        mock_agent.accumulated_usage = {"totalTokens": 2000}
-        mock_event.agent = mock_agent
-
+        """Test that compaction can fire any number of times over a long run."""
+        agent = self._agent(mock_conversation_manager, 900)
+        mock_event.agent = agent
         hook = ProactiveCompactionHook(threshold_tokens=1000)
 
-        # First call should trigger
-        hook._check_and_compact(mock_event)
-        assert mock_conversation_manager.apply_management.call_count == 1
+        for _ in range(3):
+            hook._check_and_compact(mock_event)
+            self._wait_for_summary(hook, agent)
+            hook._swap_in_summary_before_turn(MagicMock(agent=agent))
+            agent.messages.extend(
+                {"role": role, "content": [{"text": "more"}]} for role in ("user", "assistant") * 3
+            )
+
+        assert hook.compaction_count == 3
+        assert mock_conversation_manager.summarization_agent.call_count == 3
+        # Previous summaries are folded into the next one and not counted as removed
+        assert mock_conversation_manager.removed_message_count == 5 + 5 + 5
+
+    @pytest.mark.asyncio
+    async def test_summary_discarded_when_history_changed(
+        self, mock_conversation_manager: SummarizingConversationManager, mock_event: MagicMock
+    ) -> None:
+        """Test that a summary is dropped if the summarized messages were rewritten."""
+        agent = self._agent(mock_conversation_manager, 1200)
+        mock_event.agent = agent
 
-        # Second call should NOT trigger (already compacted)
+        hook = ProactiveCompactionHook(threshold_tokens=1000)
         hook._check_and_compact(mock_event)
-        assert mock_conversation_manager.apply_management.call_count == 1  # Still 1
+        self._wait_for_summary(hook, agent)
+
+        agent.messages[:] = agent.messages[2:]
+        rewritten = list(agent.messages)
+        hook._swap_in_summary_before_turn(MagicMock(agent=agent))
+
+        assert agent.messages == rewritten
+        assert hook.compacted is False
+        assert hook._pending == {}
 
     @pytest.mark.asyncio
     async def test_no_compaction_when_usage_missing(
-        self, mock_conversation_manager: MagicMock, mock_config: Compaction
+        self, mock_conversation_manager: SummarizingConversationManager
     ) -> None:
         """Test that compaction is NOT triggered when event has no usage data."""
         event_no_usage = MagicMock(spec=AfterInvocationEvent)
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        mock_agent.accumulated_usage = None  # No usage data
-        event_no_usage.agent = mock_agent
+        event_no_usage.agent = self._agent(mock_conversation_manager, None)
 
         hook = ProactiveCompactionHook(threshold_tokens=1000)
         hook._check_and_compact(event_no_usage)
 
-        # Should not crash, and should not call apply_management
-        mock_conversation_manager.apply_management.assert_not_called()
+        # Should not crash, and should not start a summary
+        mock_conversation_manager.summarization_agent.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_multiple_invocations_only_compact_once(
-        self, mock_conversation_manager: MagicMock, mock_config: Compaction, mock_event: MagicMock
+    async def test_without_summarization_agent_compacts_synchronously(
+        self, mock_event: MagicMock, summary_message: dict
     ) -> None:
-        """Test that compaction only happens once due to compacted flag."""
-        # Setup agent
-        mock_agent = MagicMock()
-        mock_agent.conversation_manager = mock_conversation_manager
-        mock_agent.accumulated_usage = {"totalTokens": 1200}
-        mock_event.agent = mock_agent
+        """Test that the live agent is only used for summaries between turns, never in background."""
+        manager = SummarizingConversationManager(summary_ratio=0.5, preserve_recent_messages=2)
+        agent = self._agent(manager, 1200)
+        original = list(agent.messages)
+        mock_event.agent = agent
+
+        def _reduce(target: MagicMock, e: Exception | None = None) -> None:
+            manager.removed_message_count += 5
+            target.messages[:] = [summary_message, *target.messages[5:]]
+
+        hook = ProactiveCompactionHook(threshold_tokens=1000)
+        with patch.object(manager, "reduce_context", side_effect=_reduce) as reduce:
+            hook._check_and_compact(mock_event)
+
+        reduce.assert_called_once_with(agent)
+        assert hook._pending == {}
+        assert agent.messages == [summary_message, *original[5:]]
+        assert manager.preserve_recent_messages == 2
+        assert hook.compaction_count == 1
+
+    @pytest.mark.asyncio
+    async def test_without_summarization_agent_below_threshold_is_noop(
+        self, mock_event: MagicMock
+    ) -> None:
+        """Test that synchronous compaction waits for the full threshold, not the precompute ratio."""
+        manager = SummarizingConversationManager(summary_ratio=0.5, preserve_recent_messages=2)
+        mock_event.agent = self._agent(manager, 800)
+
+        hook = ProactiveCompactionHook(threshold_tokens=1000)
+        with patch.object(manager, "reduce_context") as reduce:
+            hook._check_and_compact(mock_event)
+
+        reduce.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_other_managers_compact_synchronously_once(self, mock_event: MagicMock) -> None:
+        """Test that non-summarizing managers keep the single-fire apply_management path."""
+        manager = MagicMock(preserve_recent_messages=12)
+        mock_event.agent = self._agent(manager, 1200, message_count=30)
 
         hook = ProactiveCompactionHook(threshold_tokens=1000)
 
@@ -313,8 +413,8 @@ class TestProactiveCompactionHook:
         hook._check_and_compact(mock_event)
         hook._check_and_compact(mock_event)
 
-        # apply_management should only be called once (compacted flag prevents re-trigger)
-        assert mock_conversation_manager.apply_management.call_count == 1
+        assert manager.apply_management.call_count == 1
+        assert hook.compacted is True
 
 
 class TestAgentCacheWithCompaction:
@@ -0,0 +1,239 @@
+"""Tests for the resident daemon (strands serve) and thin client mode."""
+
+import asyncio
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from strands_cli.__main__ import app
+from strands_cli.daemon import (
+    DaemonError,
+    SpecCache,
+    StrandsDaemon,
+    parse_address,
+    run_daemon,
+    send_request,
+)
+from strands_cli.exit_codes import EX_HITL_PAUSE, EX_OK, EX_RUNTIME, EX_SCHEMA, EX_USAGE
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    directory = tempfile.mkdtemp(prefix="strands-")
+    yield str(Path(directory) / "d.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _run_result(**overrides: Any) -> MagicMock:
+    result = MagicMock(
+        success=True,
+        agent_id="writer",
+        session_id="session-1",
+        error=None,
+        duration_seconds=0.5,
+        artifacts_written=["/tmp/out/report.md"],
+    )
+    for key, value in overrides.items():
+        setattr(result, key, value)
+    return result
+
+
+def test_parse_address() -> None:
+    """host:port and :port select TCP; anything path-like is a Unix socket."""
+    assert parse_address("127.0.0.1:8765") == ("tcp", ("127.0.0.1", 8765))
+    assert parse_address(":8765") == ("tcp", ("127.0.0.1", 8765))
+    assert parse_address("/run/strands.sock") == ("unix", "/run/strands.sock")
+    assert parse_address("C:\\strands\\d.sock")[0] == "unix"
+
+
+def test_daemon_refuses_non_loopback_tcp() -> None:
+    """The unauthenticated protocol is never served beyond loopback."""
+    with pytest.raises(DaemonError, match="loopback"):
+        run_daemon("0.0.0.0:8765")
+    with pytest.raises(DaemonError, match="loopback"):
+        asyncio.run(StrandsDaemon("example.com:8765").serve_forever())
+
+
+@pytest.mark.asyncio
+async def test_daemon_socket_is_created_owner_only(
+    socket_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The socket is bound under a restrictive umask, not chmod-ed afterwards."""
+    monkeypatch.setenv("STRANDS_MCP_POOL", "true")
+    modes = []
+    start_unix_server = asyncio.start_unix_server
+
+    async def recording_start(*args: Any, **kwargs: Any) -> Any:
+        server = await start_unix_server(*args, **kwargs)
+        modes.append(os.stat(kwargs["path"]).st_mode & 0o777)
+        return server
+
+    daemon = StrandsDaemon(socket_path)
+    with patch("strands_cli.daemon.asyncio.start_unix_server", recording_start):
+        server_task = asyncio.create_task(daemon.serve_forever())
+        for _ in range(200):
+            if modes:
+                break
+            await asyncio.sleep(0.01)
+        daemon._stop_event.set()
+        await asyncio.wait_for(server_task, timeout=5)
+
+    assert len(modes) == 1
+    assert modes[0] & 0o077 == 0  # No group/other access, even before any chmod
+
+
+def test_spec_cache_reuses_validated_spec_until_file_changes(
+    minimal_ollama_spec: Path, tmp_path: Path
+) -> None:
+    """Repeat loads hit the cache; editing the file or variables misses."""
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(minimal_ollama_spec.read_text(encoding="utf-8"), encoding="utf-8")
+    cache = SpecCache()
+
+    first = cache.get(str(spec_file), {})
+    second = cache.get(str(spec_file), {})
+    assert first is not second  # Callers get private copies
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(str(spec_file), {"topic": "AI"})
+    spec_file.write_text(spec_file.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    cache.get(str(spec_file), {})
+    assert cache.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_daemon_serves_jobs_over_unix_socket(
+    minimal_ollama_spec: Path, socket_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ping, run, stats and shutdown round-trip through the socket protocol."""
+    monkeypatch.setenv("STRANDS_MCP_POOL", "true")  # Restored after the daemon sets it
+    daemon = StrandsDaemon(socket_path, max_jobs=2)
+
+    with patch("strands_cli.api.execution.WorkflowExecutor") as mock_executor_cls:
+        executor = mock_executor_cls.return_value
+        executor.__aenter__ = AsyncMock(return_value=executor)
+        executor.__aexit__ = AsyncMock(return_value=False)
+        executor.run = AsyncMock(return_value=_run_result())
+
+        server_task = asyncio.create_task(daemon.serve_forever())
+        for _ in range(100):
+            try:
+                ping = await asyncio.to_thread(send_request, socket_path, {"op": "ping"}, 5)
+                break
+            except DaemonError:
+                await asyncio.sleep(0.01)
+        run_request = {"op": "run", "spec_file": str(minimal_ollama_spec), "variables": {}}
+        first = await asyncio.to_thread(send_request, socket_path, run_request, 5)
+        second = await asyncio.to_thread(send_request, socket_path, run_request, 5)
+        stats = await asyncio.to_thread(send_request, socket_path, {"op": "stats"}, 5)
+        await asyncio.to_thread(send_request, socket_path, {"op": "shutdown"}, 5)
+        await asyncio.wait_for(server_task, timeout=5)
+
+    assert ping["exit_code"] == EX_OK
+    assert first["exit_code"] == EX_OK
+    assert first["artifacts_written"] == ["/tmp/out/report.md"]
+    assert second["session_id"] == "session-1"
+    assert stats["jobs_completed"] == 2
+    assert stats["spec_cache"] == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_daemon_maps_job_outcomes_to_exit_codes(
+    minimal_ollama_spec: Path, tmp_path: Path
+) -> None:
+    """Invalid specs, failures and HITL pauses map to the CLI exit codes."""
+    daemon = StrandsDaemon(str(tmp_path / "unused.sock"))
+    bad_spec = tmp_path / "bad.yaml"
+    bad_spec.write_text("name: [unclosed", encoding="utf-8")
+
+    with patch("strands_cli.api.execution.WorkflowExecutor") as mock_executor_cls:
+        executor = mock_executor_cls.return_value
+        executor.__aenter__ = AsyncMock(return_value=executor)
+        executor.__aexit__ = AsyncMock(return_value=False)
+        executor.run = AsyncMock(
+            side_effect=[
+                _run_result(agent_id="hitl"),
+                _run_result(success=False, error="model error"),
+                RuntimeError("boom"),
+            ]
+        )
+        request = {"op": "run", "spec_file": str(minimal_ollama_spec)}
+
+        paused = await daemon.handle_request(request)
+        failed = await daemon.handle_request(request)
+        crashed = await daemon.handle_request(request)
+
+    invalid = await daemon.handle_request({"op": "run", "spec_file": str(bad_spec)})
+    unknown = await daemon.handle_request({"op": "frobnicate"})
+
+    assert paused["exit_code"] == EX_HITL_PAUSE
+    assert failed["exit_code"] == EX_RUNTIME
+    assert failed["error"] == "model error"
+    assert crashed["exit_code"] == EX_RUNTIME
+    assert "boom" in crashed["error"]
+    assert invalid["exit_code"] == EX_SCHEMA
+    assert unknown["exit_code"] == EX_USAGE
+    assert (daemon.jobs_completed, daemon.jobs_failed) == (1, 3)
+
+
+def test_send_request_unreachable_daemon_raises(socket_path: str) -> None:
+    """A missing socket surfaces as DaemonError rather than OSError."""
+    with pytest.raises(DaemonError, match="Cannot reach strands daemon"):
+        send_request(socket_path, {"op": "ping"}, timeout=1)
+
+
+def test_run_daemon_flag_submits_resolved_paths(minimal_ollama_spec: Path, tmp_path: Path) -> None:
+    """strands run --daemon sends absolute paths and exits with the daemon's code."""
+    with patch("strands_cli.daemon.send_request") as mock_send:
+        mock_send.return_value = {
+            "exit_code": EX_OK,
+            "duration_seconds": 1.25,
+            "artifacts_written": ["report.md"],
+        }
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                str(minimal_ollama_spec),
+                "--daemon",
+                "--var",
+                "topic=AI",
+                "--out",
+                str(tmp_path),
+            ],
+        )
+
+    assert result.exit_code == EX_OK
+    assert "(daemon)" in result.stdout
+    request = mock_send.call_args.args[1]
+    assert request["op"] == "run"
+    assert Path(request["spec_file"]).is_absolute()
+    assert request["out"] == str(tmp_path.resolve())
+    assert request["variables"] == {"topic": "AI"}
+
+
+def test_run_daemon_flag_rejects_resume(minimal_ollama_spec: Path) -> None:
+    """Resume stays a local operation."""
+    result = runner.invoke(app, ["run", "--resume", "abc", "--daemon"])
+
+    assert result.exit_code == EX_USAGE
+
+
+@pytest.mark.parametrize("flag", ["--no-save-session", "--bypass-tool-consent", "--debug"])
+def test_run_daemon_flag_rejects_process_wide_options(minimal_ollama_spec: Path, flag: str) -> None:
+    """Options the daemon cannot apply per job are rejected, not silently dropped."""
+    with patch("strands_cli.daemon.send_request") as mock_send:
+        result = runner.invoke(app, ["run", str(minimal_ollama_spec), "--daemon", flag])
+
+    assert result.exit_code == EX_USAGE
+    mock_send.assert_not_called()
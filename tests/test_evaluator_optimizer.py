@@ -574,3 +574,178 @@ async def test_default_revision_prompt_includes_context(mock_cache_class):
 
     # Verify it's not just the hardcoded broken default
     assert revision_prompt != "Revise the draft based on the evaluator feedback."
+
+
+# ============================================================================
+# Best-of-N Candidate Tests
+# ============================================================================
+
+
+def _best_of_n_spec(candidates: int, max_parallel: int | None = None) -> Spec:
+    """Create an evaluator-optimizer spec with N parallel candidates."""
+    return Spec(
+        version=0,
+        name="test-best-of-n",
+        runtime=Runtime(
+            provider=ProviderType.OLLAMA,
+            host="http://localhost:11434",
+            max_parallel=max_parallel,
+        ),
+        agents={
+            "writer": Agent(prompt="You write drafts"),
+            "critic": Agent(prompt="You critique"),
+        },
+        pattern={
+            "type": PatternType.EVALUATOR_OPTIMIZER,
+            "config": PatternConfig(
+                producer="writer",
+                evaluator=EvaluatorConfig(agent="critic", input="Evaluate: {{ draft }}"),
+                accept=AcceptConfig(min_score=80, max_iters=3, candidates=candidates),
+                revise_prompt="Improve: {{ draft }}",
+            ),
+        },
+    )
+
+
+def _scoring_agents(scores: dict[str, int], delays: dict[str, float] | None = None):
+    """Build a get_or_build_agent side effect with per-candidate producers.
+
+    Producer for worker_index i returns "draft-<round>-<i>"; the evaluator scores
+    drafts by looking them up in ``scores``.
+    """
+    import asyncio
+
+    delays = delays or {}
+    producer_rounds: dict[int, int] = {}
+    built: list[tuple[str, int | None]] = []
+
+    def _make_producer(index: int) -> MagicMock:
+        async def _invoke(prompt):
+            producer_rounds[index] = producer_rounds.get(index, 0) + 1
+            return f"draft-{producer_rounds[index]}-{index}"
+
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(side_effect=_invoke)
+        return agent
+
+    async def _evaluate(prompt, **kwargs):
+        draft = prompt.removeprefix("Evaluate: ")
+        await asyncio.sleep(delays.get(draft, 0))
+        return f'{{"score": {scores[draft]}, "issues": ["I"], "fixes": ["F"]}}'
+
+    async def get_agent_side_effect(spec, agent_id, config, tool_overrides=None, **kwargs):
+        index = kwargs.get("worker_index")
+        built.append((agent_id, index))
+        if agent_id == "writer":
+            return _make_producer(index or 0)
+        agent = MagicMock()
+        agent.invoke_async = AsyncMock(side_effect=_evaluate)
+        return agent
+
+    return get_agent_side_effect, built
+
+
+@pytest.mark.asyncio
+@patch("strands_cli.exec.evaluator_optimizer.AgentCache")
+async def test_best_of_n_selects_highest_scoring_candidate(mock_cache_class):
+    """Best candidate of each round moves forward until min_score is reached."""
+    mock_cache = MagicMock()
+    mock_cache_class.return_value = mock_cache
+    mock_cache.close = AsyncMock()
+
+    side_effect, built = _scoring_agents(
+        {
+            "draft-1-0": 40,
+            "draft-1-1": 70,
+            "draft-1-2": 60,
+            "draft-2-0": 50,
+            "draft-2-1": 75,
+            "draft-2-2": 85,
+        }
+    )
+    mock_cache.get_or_build_agent = AsyncMock(side_effect=side_effect)
+
+    result = await run_evaluator_optimizer(_best_of_n_spec(candidates=3, max_parallel=2))
+
+    assert result.success is True
+    assert result.last_response == "draft-2-2"
+    assert result.execution_context["final_score"] == 85
+
+    history = result.execution_context["history"]
+    assert len(history) == 2
+    assert history[0]["selected_candidate"] == 1
+    assert history[0]["candidate_scores"] == [40, 70, 60]
+    assert history[0]["draft"] == "draft-1-1"
+    assert history[1]["selected_candidate"] == 2
+
+    # One isolated producer/evaluator pair per candidate
+    assert sorted(built, key=str) == sorted(
+        [("writer", None), ("critic", None)]
+        + [(agent_id, i) for i in (1, 2) for agent_id in ("writer", "critic")],
+        key=str,
+    )
+
+
+@pytest.mark.asyncio
+@patch("strands_cli.exec.evaluator_optimizer.AgentCache")
+async def test_best_of_n_early_stop_cancels_pending_evaluations(mock_cache_class):
+    """A candidate reaching min_score cancels evaluations still in flight."""
+    mock_cache = MagicMock()
+    mock_cache_class.return_value = mock_cache
+    mock_cache.close = AsyncMock()
+
+    side_effect, _ = _scoring_agents(
+        {"draft-1-0": 95, "draft-1-1": 99},
+        delays={"draft-1-1": 30},
+    )
+    mock_cache.get_or_build_agent = AsyncMock(side_effect=side_effect)
+
+    result = await run_evaluator_optimizer(_best_of_n_spec(candidates=2))
+
+    assert result.success is True
+    assert result.last_response == "draft-1-0"
+    assert result.execution_context["history"][0]["candidate_scores"] == [95, None]
+
+
+@pytest.mark.asyncio
+@patch("strands_cli.exec.evaluator_optimizer.AgentCache")
+async def test_best_of_n_checkpoints_candidate_drafts(mock_cache_class, tmp_path):
+    """Unevaluated candidates are checkpointed so resume can evaluate them."""
+    from strands_cli.session import SessionMetadata, SessionState, SessionStatus, TokenUsage
+    from strands_cli.session.file_repository import FileSessionRepository
+    from strands_cli.session.utils import generate_session_id, now_iso8601
+
+    mock_cache = MagicMock()
+    mock_cache_class.return_value = mock_cache
+    mock_cache.close = AsyncMock()
+
+    side_effect, _ = _scoring_agents({"draft-1-0": 20, "draft-1-1": 90})
+    mock_cache.get_or_build_agent = AsyncMock(side_effect=side_effect)
+
+    spec = _best_of_n_spec(candidates=2)
+    repo = FileSessionRepository(storage_dir=tmp_path)
+    now = now_iso8601()
+    session_state = SessionState(
+        metadata=SessionMetadata(
+            session_id=generate_session_id(),
+            workflow_name=spec.name,
+            spec_hash="abc",
+            pattern_type=PatternType.EVALUATOR_OPTIMIZER.value,
+            status=SessionStatus.RUNNING,
+            created_at=now,
+            updated_at=now,
+        ),
+        variables={},
+        runtime_config={},
+        pattern_state={},
+        token_usage=TokenUsage(),
+    )
+    await repo.save(session_state, "")
+
+    result = await run_evaluator_optimizer(spec, session_state=session_state, session_repo=repo)
+
+    assert result.last_response == "draft-1-1"
+    saved = await repo.load(session_state.metadata.session_id)
+    assert saved is not None
+    assert saved.pattern_state["candidate_drafts"] == ["draft-1-1"]
+    assert saved.pattern_state["accepted"] is True
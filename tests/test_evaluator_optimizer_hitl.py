@@ -115,7 +115,7 @@ async def test_evaluator_optimizer_review_gate_pause(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         if call_count[0] == 1:
             # Producer initial draft
@@ -190,7 +190,7 @@ async def test_evaluator_optimizer_resume_with_continue(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         responses = [
             mock_draft_v1,  # Producer iteration 0
@@ -267,7 +267,7 @@ async def test_evaluator_optimizer_resume_with_stop(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         if call_count[0] == 1:
             return mock_draft_v1
@@ -349,7 +349,7 @@ async def test_evaluator_optimizer_multiple_review_gates(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         return mock_responses[call_count[0] - 1]
 
@@ -435,7 +435,7 @@ async def test_evaluator_optimizer_no_review_gate_no_pause(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         responses = [mock_draft_v1, mock_eval_v1, mock_draft_v2, mock_eval_v2]
         return responses[call_count[0] - 1]
@@ -495,7 +495,7 @@ async def test_evaluator_optimizer_hitl_requires_session(evaluator_spec_with_rev
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         return mock_draft if call_count[0] == 1 else mock_eval
 
@@ -531,7 +531,7 @@ async def test_evaluator_optimizer_hitl_timeout_metadata(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         return mock_draft if call_count[0] == 1 else mock_eval
 
@@ -597,7 +597,7 @@ async def test_evaluator_optimizer_context_display_template(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         return mock_draft if call_count[0] == 1 else mock_eval
 
@@ -673,7 +673,7 @@ async def test_evaluator_optimizer_resume_integration(
 
     call_count = [0]
 
-    async def mock_invoke_side_effect(prompt):
+    async def mock_invoke_side_effect(prompt, **kwargs):
         call_count[0] += 1
         responses = [mock_draft_v1, mock_eval_v1, mock_draft_v2, mock_eval_v2]
         return responses[call_count[0] - 1]
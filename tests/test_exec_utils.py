@@ -5,27 +5,35 @@ Tests shared utilities used across all executors including:
 - Budget threshold checking and warnings
 - Retry decorator creation
 - Agent invocation with retry logic
+- Native structured output for control agents
 - Token estimation
 - AgentCache with worker_index isolation
+- AgentPool slot reuse, state reset and per-lease hooks/notes
 """
 
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from strands.hooks import AfterInvocationEvent, BeforeInvocationEvent, HookProvider, HookRegistry
+from strands.types.exceptions import StructuredOutputException
 
 from strands_cli.exec.utils import (
     TRANSIENT_ERRORS,
     AgentCache,
+    AgentPool,
     ExecutionUtilsError,
     create_retry_decorator,
     estimate_tokens,
     get_retry_config,
     invoke_agent_with_retry,
+    request_structured_output,
+    structured_output_schema,
+    structured_result,
 )
 from strands_cli.loader import load_spec
 from strands_cli.types import Agent as AgentConfig
-from strands_cli.types import ProviderType, Runtime, Spec
+from strands_cli.types import EvaluatorDecision, ProviderType, Runtime, Spec
 
 # --- Fixtures ---
 
@@ -309,6 +317,116 @@ async def test_invoke_agent_with_retry_does_not_retry_non_transient(mocker: Any)
     assert mock_agent.invoke_async.call_count == 1  # No retries
 
 
+# --- Tests for native structured output ---
+
+
+@pytest.mark.asyncio
+async def test_invoke_agent_with_retry_requests_structured_output(mocker: Any) -> None:
+    """Requested schemas are passed to the SDK and returned validated."""
+    decision = EvaluatorDecision(score=90)
+    mock_agent = AsyncMock()
+    mock_agent.invoke_async.return_value = MagicMock(structured_output=decision)
+    mocker.patch("strands_cli.utils.capture_and_display_stdout", mocker.MagicMock())
+
+    with request_structured_output(EvaluatorDecision):
+        result = await invoke_agent_with_retry(mock_agent, "Evaluate", 3, 0, 1)
+
+    mock_agent.invoke_async.assert_called_once_with(
+        "Evaluate", structured_output_model=EvaluatorDecision
+    )
+    assert structured_result(result, EvaluatorDecision) is decision
+
+    # Outside the block responses are plain text again
+    await invoke_agent_with_retry(mock_agent, "Draft", 3, 0, 1)
+    mock_agent.invoke_async.assert_called_with("Draft")
+
+
+@pytest.mark.asyncio
+async def test_invoke_agent_with_retry_falls_back_to_text(mocker: Any) -> None:
+    """A model that never calls the schema tool is answered as text."""
+    mock_agent = AsyncMock()
+    mock_agent.invoke_async.side_effect = [
+        StructuredOutputException("tool not called"),
+        '{"score": 70}',
+    ]
+    mocker.patch("strands_cli.utils.capture_and_display_stdout", mocker.MagicMock())
+
+    with request_structured_output(EvaluatorDecision):
+        result = await invoke_agent_with_retry(mock_agent, "Evaluate", 3, 0, 1)
+
+    assert result == '{"score": 70}'
+    assert structured_result(result, EvaluatorDecision) is None
+    mock_agent.invoke_async.assert_called_with("Evaluate")
+
+
+@pytest.mark.asyncio
+async def test_structured_output_fallback_restores_history(mocker: Any) -> None:
+    """The text retry does not see the failed forced-tool exchange."""
+    mock_agent = AsyncMock()
+    mock_agent.messages = [{"role": "user", "content": [{"text": "Earlier"}]}]
+    before = list(mock_agent.messages)
+    retried_with: list[list[dict[str, Any]]] = []
+
+    async def invoke(input_text: str, **kwargs: Any) -> str:
+        if kwargs:
+            mock_agent.messages.append({"role": "user", "content": [{"text": input_text}]})
+            mock_agent.messages.append({"role": "assistant", "content": [{"text": "no tool"}]})
+            raise StructuredOutputException("tool not called")
+        retried_with.append(list(mock_agent.messages))
+        return '{"score": 70}'
+
+    mock_agent.invoke_async.side_effect = invoke
+    mocker.patch("strands_cli.utils.capture_and_display_stdout", mocker.MagicMock())
+
+    with request_structured_output(EvaluatorDecision):
+        await invoke_agent_with_retry(mock_agent, "Evaluate", 3, 0, 1)
+
+    assert retried_with == [before]
+
+
+@pytest.mark.asyncio
+async def test_structured_output_falls_back_when_model_lacks_tools(mocker: Any) -> None:
+    """Providers that reject tools for the model are answered as text."""
+    mock_agent = AsyncMock()
+    mock_agent.invoke_async.side_effect = [
+        RuntimeError(
+            "registry.ollama.ai/library/gemma:2b does not support tools (status code: 400)"
+        ),
+        '{"score": 70}',
+    ]
+    mocker.patch("strands_cli.utils.capture_and_display_stdout", mocker.MagicMock())
+
+    with request_structured_output(EvaluatorDecision):
+        result = await invoke_agent_with_retry(mock_agent, "Evaluate", 1, 0, 1)
+
+    assert result == '{"score": 70}'
+    mock_agent.invoke_async.assert_called_with("Evaluate")
+
+
+@pytest.mark.asyncio
+async def test_structured_output_other_errors_propagate(mocker: Any) -> None:
+    """Errors unrelated to tool support are not turned into a text retry."""
+    mock_agent = AsyncMock()
+    mock_agent.invoke_async.side_effect = RuntimeError("invalid API key")
+    mocker.patch("strands_cli.utils.capture_and_display_stdout", mocker.MagicMock())
+
+    with request_structured_output(EvaluatorDecision), pytest.raises(RuntimeError):
+        await invoke_agent_with_retry(mock_agent, "Evaluate", 1, 0, 1)
+
+    assert mock_agent.invoke_async.call_count == 1
+
+
+def test_structured_output_schema_respects_runtime(minimal_spec: Spec) -> None:
+    """runtime.structured_output and the simulated provider disable native output."""
+    assert structured_output_schema(minimal_spec, EvaluatorDecision) is EvaluatorDecision
+
+    minimal_spec.runtime.structured_output = False
+    assert structured_output_schema(minimal_spec, EvaluatorDecision) is None
+
+    minimal_spec.runtime = Runtime(provider=ProviderType.SIMULATED)
+    assert structured_output_schema(minimal_spec, EvaluatorDecision) is None
+
+
 # --- Tests for estimate_tokens ---
 
 
@@ -789,3 +907,171 @@ async def test_agent_cache_none_session_manager_separate_from_session() -> None:
         assert len(cache._agents) == 2
 
         await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_agent_pool_bounds_builds_and_resets_state() -> None:
+    """AgentPool reuses slot agents and resets history/usage on return."""
+    import asyncio
+
+    spec = Spec(
+        version=0,
+        name="test-pool",
+        runtime=Runtime(provider=ProviderType.OLLAMA, host="http://localhost:11434"),
+        agents={"agent": AgentConfig(prompt="Test")},
+        pattern={"type": "chain", "config": {"steps": []}},
+    )
+
+    built: list[MagicMock] = []
+
+    def _build(*args: Any, **kwargs: Any) -> MagicMock:
+        agent = MagicMock()
+        agent.tools = []
+        agent.messages = []
+        built.append(agent)
+        return agent
+
+    with patch("strands_cli.exec.utils.build_agent", side_effect=_build):
+        cache = AgentCache()
+        pool = AgentPool(cache, size=2)
+        active = 0
+        peak = 0
+
+        async def _task(i: int) -> None:
+            nonlocal active, peak
+            async with pool.lease(spec, "agent", spec.agents["agent"]) as agent:
+                active += 1
+                peak = max(peak, active)
+                agent.messages.append({"role": "user", "content": [{"text": str(i)}]})
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[_task(i) for i in range(6)])
+
+        assert len(built) == 2
+        assert pool.agents_built == 2
+        assert pool.leases == 6
+        assert peak == 2
+        assert all(agent.messages == [] for agent in built)
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_agent_pool_index_offset_isolates_pools() -> None:
+    """Pools with different offsets never share cached agents."""
+    spec = Spec(
+        version=0,
+        name="test-pool-offset",
+        runtime=Runtime(provider=ProviderType.OLLAMA, host="http://localhost:11434"),
+        agents={"agent": AgentConfig(prompt="Test")},
+        pattern={"type": "chain", "config": {"steps": []}},
+    )
+
+    with patch("strands_cli.exec.utils.build_agent", side_effect=lambda *a, **k: MagicMock()):
+        cache = AgentCache()
+        async with AgentPool(cache, size=1).lease(spec, "agent", spec.agents["agent"]) as a:
+            pass
+        async with AgentPool(cache, size=1, index_offset=10).lease(
+            spec, "agent", spec.agents["agent"]
+        ) as b:
+            pass
+
+        assert a is not b
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_agent_pool_swaps_hooks_and_notes_per_lease() -> None:
+    """A reused pooled agent gets each lease's hooks and notes, not the first build's."""
+
+    class _Hook(HookProvider):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+            registry.add_callback(BeforeInvocationEvent, self.on_invocation)
+
+        def on_invocation(self, event: BeforeInvocationEvent) -> None:
+            self.calls += 1
+
+    spec = Spec(
+        version=0,
+        name="test-pool-hooks",
+        runtime=Runtime(provider=ProviderType.OLLAMA, host="http://localhost:11434"),
+        agents={"agent": AgentConfig(prompt="Test")},
+        pattern={"type": "chain", "config": {"steps": []}},
+    )
+    own = MagicMock()  # Callback the agent registered itself (e.g. session manager)
+
+    def _build(*args: Any, **kwargs: Any) -> MagicMock:
+        agent = MagicMock()
+        agent.messages = []
+        agent.hooks = HookRegistry()
+        agent.hooks.add_callback(BeforeInvocationEvent, own)
+        for hook in kwargs["hooks"]:
+            agent.hooks.add_hook(hook)
+        agent.system_prompt = kwargs["injected_notes"]
+        return agent
+
+    with patch("strands_cli.exec.utils.build_agent", side_effect=_build):
+        cache = AgentCache()
+        pool = AgentPool(cache, size=1)
+        first, second = _Hook(), _Hook()
+
+        async with pool.lease(
+            spec, "agent", spec.agents["agent"], hooks=[first], injected_notes="old notes"
+        ) as agent:
+            assert agent.system_prompt == "old notes"
+            agent.hooks.invoke_callbacks(BeforeInvocationEvent(agent=agent))
+        async with pool.lease(
+            spec, "agent", spec.agents["agent"], hooks=[second], injected_notes="new notes"
+        ) as reused:
+            assert reused is agent
+            reused.hooks.invoke_callbacks(BeforeInvocationEvent(agent=reused))
+            assert "new notes" in reused.system_prompt
+            assert "old notes" not in reused.system_prompt
+        async with pool.lease(spec, "agent", spec.agents["agent"]) as unhooked:
+            unhooked.hooks.invoke_callbacks(BeforeInvocationEvent(agent=unhooked))
+        await cache.close()
+
+    assert (first.calls, second.calls) == (1, 1)
+    assert own.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_agent_pool_forwards_after_events_in_reverse_order() -> None:
+    """Lease hooks keep the SDK's reverse callback order for After* events."""
+    order: list[str] = []
+
+    class _Hook(HookProvider):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+            registry.add_callback(AfterInvocationEvent, lambda event: order.append(self.name))
+
+    spec = Spec(
+        version=0,
+        name="test-pool-hook-order",
+        runtime=Runtime(provider=ProviderType.OLLAMA, host="http://localhost:11434"),
+        agents={"agent": AgentConfig(prompt="Test")},
+        pattern={"type": "chain", "config": {"steps": []}},
+    )
+
+    def _build(*args: Any, **kwargs: Any) -> MagicMock:
+        agent = MagicMock()
+        agent.messages = []
+        agent.hooks = HookRegistry()
+        for hook in kwargs["hooks"]:
+            agent.hooks.add_hook(hook)
+        return agent
+
+    with patch("strands_cli.exec.utils.build_agent", side_effect=_build):
+        cache = AgentCache()
+        async with AgentPool(cache, size=1).lease(
+            spec, "agent", spec.agents["agent"], hooks=[_Hook("a"), _Hook("b")]
+        ) as agent:
+            agent.hooks.invoke_callbacks(AfterInvocationEvent(agent=agent))
+        await cache.close()
+
+    assert order == ["b", "a"]
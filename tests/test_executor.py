@@ -303,6 +303,22 @@ class TestAgentExecution:
         assert result.success is False
         assert "Provider connection failed" in result.error
 
+    @pytest.mark.asyncio
+    async def test_agent_pool_skips_private_cache(
+        self, sample_ollama_spec: Spec, mock_strands_agent: Mock, mocker
+    ):
+        """Test that a run leasing from a pool never builds or closes its own cache."""
+        mock_cache_cls = mocker.patch("strands_cli.exec.single_agent.AgentCache")
+        mock_strands_agent.invoke_async.return_value = "Pooled response"
+        pool = MagicMock()
+        pool.lease.return_value.__aenter__.return_value = mock_strands_agent
+
+        result = await run_single_agent(sample_ollama_spec, agent_pool=pool)
+
+        assert result.success is True
+        assert result.last_response == "Pooled response"
+        mock_cache_cls.assert_not_called()
+
 
 # ============================================================================
 # Retry Logic Tests
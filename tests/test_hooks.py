@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from strands_cli.exec.hooks import NotesAppenderHook, ProactiveCompactionHook
+from strands_cli.exec.hooks import NotesAppenderHook, ProactiveCompactionHook, UsageTrackerHook
 from strands_cli.tools.notes_manager import NotesManager
 
 
@@ -505,3 +505,28 @@ pattern:
         assert len(cache._agents) == 1
 
     await cache.close()
+
+
+def test_usage_tracker_hook_accumulates_cache_tokens() -> None:
+    """UsageTrackerHook sums per-invocation usage including prompt-cache tokens."""
+    tracker = UsageTrackerHook()
+    usages = [
+        {"inputTokens": 100, "outputTokens": 50, "cacheWriteInputTokens": 2000},
+        {"inputTokens": 120, "outputTokens": 40, "cacheReadInputTokens": 2000},
+    ]
+    for usage in usages:
+        agent = Mock()
+        agent.event_loop_metrics.latest_agent_invocation.usage = usage
+        tracker._record_usage(Mock(agent=agent))
+
+    # Agents without metrics are ignored
+    tracker._record_usage(Mock(agent=Mock(spec=[])))
+
+    assert tracker.summary() == {
+        "invocations": 2,
+        "input_tokens": 220,
+        "output_tokens": 90,
+        "cache_read_input_tokens": 2000,
+        "cache_write_input_tokens": 2000,
+        "prompt_cache_hit_rate": round(2000 / 4220, 3),
+    }
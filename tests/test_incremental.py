@@ -0,0 +1,180 @@
+"""Tests for incremental re-execution of chain steps and workflow tasks."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from strands_cli.exec.chain import run_chain
+from strands_cli.exec.workflow import run_workflow
+from strands_cli.session import SessionMetadata, SessionState, SessionStatus, TokenUsage
+from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.incremental import (
+    IncrementalCache,
+    content_hash,
+    incremental_scope,
+    load_incremental_cache,
+)
+from strands_cli.types import Spec
+
+
+def _chain_spec(second_input: str = "Refine {{ steps[0].response }}") -> Spec:
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "incremental-chain",
+            "runtime": {"provider": "ollama", "model_id": "llama3", "host": "http://x"},
+            "agents": {"writer": {"prompt": "You write."}},
+            "pattern": {
+                "type": "chain",
+                "config": {
+                    "steps": [
+                        {"agent": "writer", "input": "Draft"},
+                        {"agent": "writer", "input": second_input},
+                        {"agent": "writer", "input": "Polish {{ steps[1].response }}"},
+                    ]
+                },
+            },
+        }
+    )
+
+
+def _workflow_spec(c_input: str = "C") -> Spec:
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "incremental-workflow",
+            "runtime": {"provider": "ollama", "model_id": "llama3", "host": "http://x"},
+            "agents": {"worker": {"prompt": "You work."}},
+            "pattern": {
+                "type": "workflow",
+                "config": {
+                    "tasks": [
+                        {"id": "a", "agent": "worker", "input": "A"},
+                        {"id": "b", "agent": "worker", "input": "B", "deps": ["a"]},
+                        {"id": "c", "agent": "worker", "input": c_input, "deps": ["a"]},
+                        {"id": "d", "agent": "worker", "input": "D", "deps": ["b", "c"]},
+                    ]
+                },
+            },
+        }
+    )
+
+
+def _echo_agent() -> MagicMock:
+    """Agent answering with its input, counting calls."""
+    agent = MagicMock()
+
+    async def invoke_async(prompt: str) -> str:
+        return f"out({prompt})"
+
+    agent.invoke_async = AsyncMock(side_effect=invoke_async)
+    return agent
+
+
+class TestContentHash:
+    """Tests for step content hashes."""
+
+    def test_hash_covers_prompt_model_input_and_upstream(self) -> None:
+        """Any input to the call changes the hash; identical calls hash identically."""
+        spec = _chain_spec()
+        base = content_hash(spec, "writer", "input", ["up"])
+
+        assert content_hash(_chain_spec(), "writer", "input", ["up"]) == base
+        assert content_hash(spec, "writer", "other input", ["up"]) != base
+        assert content_hash(spec, "writer", "input", ["changed"]) != base
+        assert content_hash(spec, "writer", "input", ["up"], ["http_request"]) != base
+
+        edited = _chain_spec()
+        edited.agents["writer"].prompt = "You write tersely."
+        assert content_hash(edited, "writer", "input", ["up"]) != base
+        edited = _chain_spec()
+        edited.runtime.model_id = "llama3.1"
+        assert content_hash(edited, "writer", "input", ["up"]) != base
+
+
+class TestIncrementalExecution:
+    """Tests for executors reusing cached results."""
+
+    @pytest.mark.asyncio
+    async def test_chain_reruns_changed_step_and_downstream(self) -> None:
+        """Editing step 1 reuses step 0 and reruns steps 1 and 2."""
+        agent = _echo_agent()
+        with patch("strands_cli.exec.utils.AgentCache.get_or_build_agent", return_value=agent):
+            first = await run_chain(_chain_spec())
+            cache = IncrementalCache({s["hash"]: s for s in first.execution_context["steps"]})
+            agent.invoke_async.reset_mock()
+
+            with incremental_scope(cache):
+                second = await run_chain(_chain_spec("Rewrite {{ steps[0].response }}"))
+
+        prompts = [call.args[0] for call in agent.invoke_async.call_args_list]
+        assert prompts == ["Rewrite out(Draft)", "Polish out(Rewrite out(Draft))"]
+        assert second.execution_context["steps"][0]["tokens_estimated"] == 0
+        assert (cache.reused, cache.executed) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_chain_runs_nothing(self) -> None:
+        """A rerun of an unchanged spec is answered entirely from the cache."""
+        agent = _echo_agent()
+        with patch("strands_cli.exec.utils.AgentCache.get_or_build_agent", return_value=agent):
+            first = await run_chain(_chain_spec())
+            cache = IncrementalCache({s["hash"]: s for s in first.execution_context["steps"]})
+            agent.invoke_async.reset_mock()
+
+            with incremental_scope(cache):
+                second = await run_chain(_chain_spec())
+
+        agent.invoke_async.assert_not_called()
+        assert second.last_response == first.last_response
+
+    @pytest.mark.asyncio
+    async def test_workflow_reruns_changed_subgraph_only(self) -> None:
+        """Editing task c reruns c and its dependent d; a and b are reused."""
+        agent = _echo_agent()
+        with patch("strands_cli.exec.utils.AgentCache.get_or_build_agent", return_value=agent):
+            first = await run_workflow(_workflow_spec())
+            tasks: dict[str, Any] = first.execution_context["tasks"]
+            cache = IncrementalCache({t["hash"]: t for t in tasks.values()})
+            agent.invoke_async.reset_mock()
+
+            with incremental_scope(cache):
+                await run_workflow(_workflow_spec("C, revised"))
+
+        prompts = sorted(call.args[0] for call in agent.invoke_async.call_args_list)
+        assert prompts == ["C, revised", "D"]
+        assert (cache.reused, cache.executed) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_load_cache_from_earlier_sessions(tmp_path: Path) -> None:
+    """Hashed results of the same workflow's sessions are loaded, newest first."""
+    repo = FileSessionRepository(storage_dir=tmp_path)
+
+    def _state(session_id: str, name: str, updated_at: str, response: str) -> SessionState:
+        return SessionState(
+            metadata=SessionMetadata(
+                session_id=session_id,
+                workflow_name=name,
+                spec_hash="hash",
+                pattern_type="chain",
+                status=SessionStatus.FAILED,
+                created_at=updated_at,
+                updated_at=updated_at,
+            ),
+            variables={},
+            runtime_config={},
+            pattern_state={"step_history": [{"index": 0, "response": response, "hash": "h0"}]},
+            token_usage=TokenUsage(),
+        )
+
+    await repo.save(_state("old", "wf", "2026-01-01T00:00:00+00:00", "old answer"), "")
+    await repo.save(_state("new", "wf", "2026-02-01T00:00:00+00:00", "new answer"), "")
+    await repo.save(_state("other", "other-wf", "2026-03-01T00:00:00+00:00", "other"), "")
+    await repo.save(_state("current", "wf", "2026-04-01T00:00:00+00:00", "current"), "")
+
+    cache = await load_incremental_cache(repo, "wf", exclude_session_id="current")
+
+    assert cache.lookup("h0", "chain")["response"] == "new answer"
+    assert cache.lookup("missing", "chain") is None
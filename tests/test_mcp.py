@@ -9,11 +9,18 @@ Test Coverage:
 """
 
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
 from strands_cli.capability.checker import check_capability
 from strands_cli.loader.yaml_loader import load_spec
+from strands_cli.runtime.mcp_pool import (
+    MCPServerPool,
+    get_mcp_pool,
+    mcp_server_key,
+    shutdown_mcp_pool,
+)
 from strands_cli.runtime.strands_adapter import (
     MCP_AVAILABLE,
     AdapterError,
@@ -505,3 +512,105 @@ class TestMCPErrorHandling:
 
         # Assert - Should create client even with minimal config
         assert len(result) == 1
+
+
+class TestMCPServerPool:
+    """Tests for the process-level MCP server pool."""
+
+    @staticmethod
+    def _fake_client() -> Mock:
+        from unittest.mock import AsyncMock
+
+        client = Mock()
+        client.load_tools = AsyncMock(return_value=["tool_a", "tool_b"])
+        return client
+
+    def test_pool_key_ignores_server_id(self) -> None:
+        """Identical transports share a key regardless of id; different args do not."""
+        a = McpServer(id="fs", command="uvx", args=["mcp-server-filesystem"])
+        b = McpServer(id="files", command="uvx", args=["mcp-server-filesystem"])
+        c = McpServer(id="fs", command="uvx", args=["mcp-server-git"])
+
+        assert mcp_server_key(a) == mcp_server_key(b)
+        assert mcp_server_key(a) != mcp_server_key(c)
+
+    def test_pool_reuses_warm_server_across_owners(self) -> None:
+        """Second run reuses the started client; tools are discovered once."""
+        pool = MCPServerPool(idle_timeout_s=60)
+        client = self._fake_client()
+        factory = Mock(return_value=client)
+        config = McpServer(id="fs", command="uvx", args=["mcp-server-filesystem"])
+        run_1, run_2 = object(), object()
+
+        assert pool.acquire(config, owner=run_1, factory=factory) is client
+        pool.release(run_1)
+        assert pool.acquire(config, owner=run_2, factory=factory) is client
+
+        factory.assert_called_once()
+        client.load_tools.assert_awaited_once()
+        client.add_consumer.assert_called_once()
+        client.stop.assert_not_called()
+        assert pool.owns(client)
+        assert pool.stats()["reuses"] == 1
+
+    def test_pool_stops_idle_servers_after_timeout(self) -> None:
+        """Released servers past the idle timeout are stopped; leased ones are kept."""
+        pool = MCPServerPool(idle_timeout_s=0)
+        idle_client, leased_client = self._fake_client(), self._fake_client()
+        run_1, run_2 = object(), object()
+
+        pool.acquire(
+            McpServer(id="a", command="server-a"), owner=run_1, factory=lambda: idle_client
+        )
+        pool.acquire(
+            McpServer(id="b", command="server-b"), owner=run_2, factory=lambda: leased_client
+        )
+        pool.release(run_1)
+
+        idle_client.stop.assert_called_once_with(None, None, None)
+        leased_client.stop.assert_not_called()
+        assert pool.stats()["servers"] == 1
+
+    def test_pool_restarts_unhealthy_server(self) -> None:
+        """A failing health check replaces the pooled connection."""
+        pool = MCPServerPool(health_check_interval_s=0)
+        dead, fresh = self._fake_client(), self._fake_client()
+        dead.list_tools_sync.side_effect = RuntimeError("server exited")
+        clients = iter([dead, fresh])
+        config = McpServer(id="fs", command="uvx")
+
+        pool.acquire(config, owner=object(), factory=lambda: next(clients))
+        result = pool.acquire(config, owner=object(), factory=lambda: next(clients))
+
+        assert result is fresh
+        dead.stop.assert_called_once()
+        assert pool.stats()["starts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_cache_releases_pooled_clients_without_stopping(
+        self, minimal_ollama_spec: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With STRANDS_MCP_POOL=true, AgentCache.close releases leases instead of stopping."""
+        from strands_cli.exec.utils import AgentCache
+
+        monkeypatch.setattr("strands_cli.runtime.strands_adapter.MCP_AVAILABLE", True)
+        monkeypatch.setenv("STRANDS_MCP_POOL", "true")
+        shutdown_mcp_pool()
+        client = self._fake_client()
+        monkeypatch.setattr(
+            "strands_cli.runtime.strands_adapter._create_mcp_client", lambda cfg, timeout: client
+        )
+        spec = load_spec(str(minimal_ollama_spec), {})
+        spec.tools = Tools(mcp=[McpServer(id="fs", command="uvx")])
+
+        try:
+            cache = AgentCache()
+            result = _load_mcp_tools(spec, None, owner=cache)
+            cache._mcp_clients.update(dict(result))
+            await cache.close()
+
+            assert result == [("fs", client)]
+            client.stop.assert_not_called()
+            assert get_mcp_pool().stats()["leased"] == 0
+        finally:
+            shutdown_mcp_pool()
@@ -0,0 +1,185 @@
+"""Tests for the runtime metrics registry and its reporters."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from strands_cli.exec.hooks import MetricsHook
+from strands_cli.exec.utils import invoke_agent_with_retry
+from strands_cli.exit_codes import EX_HITL_PAUSE
+from strands_cli.telemetry.metrics import MetricsRegistry, get_metrics
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Registry with small buckets for readable assertions."""
+    return MetricsRegistry(buckets=(0.1, 1.0))
+
+
+@pytest.fixture
+def global_metrics() -> MetricsRegistry:
+    """The process-wide registry, cleared before and after the test."""
+    metrics = get_metrics()
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+class TestMetricsRegistry:
+    """Tests for recording and Prometheus rendering."""
+
+    def test_counter_and_gauge_render(self, registry: MetricsRegistry) -> None:
+        """Counters and gauges render with HELP/TYPE lines and sorted labels."""
+        registry.inc("strands_tool_calls_total", tool="grep", status="success")
+        registry.inc("strands_tool_calls_total", 2, tool="grep", status="success")
+        registry.inc("strands_agent_pool_waiting")
+        registry.dec("strands_agent_pool_waiting")
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE strands_tool_calls_total counter" in text
+        assert 'strands_tool_calls_total{status="success",tool="grep"} 3' in text
+        assert "# TYPE strands_agent_pool_waiting gauge" in text
+        assert "strands_agent_pool_waiting 0" in text
+
+    def test_histogram_buckets_are_cumulative(self, registry: MetricsRegistry) -> None:
+        """Histogram buckets, sum and count follow the exposition format."""
+        for value in (0.05, 0.5, 5.0):
+            registry.observe("strands_tool_duration_seconds", value, tool="grep")
+
+        text = registry.render_prometheus()
+
+        assert 'strands_tool_duration_seconds_bucket{tool="grep",le="0.1"} 1' in text
+        assert 'strands_tool_duration_seconds_bucket{tool="grep",le="1"} 2' in text
+        assert 'strands_tool_duration_seconds_bucket{tool="grep",le="+Inf"} 3' in text
+        assert 'strands_tool_duration_seconds_sum{tool="grep"} 5.55' in text
+        assert 'strands_tool_duration_seconds_count{tool="grep"} 3' in text
+
+    def test_unknown_metric_rejected(self, registry: MetricsRegistry) -> None:
+        """Every metric must be declared so it has a type and help text."""
+        with pytest.raises(ValueError, match="Unknown metric"):
+            registry.inc("strands_made_up_total")
+
+    def test_label_values_escaped(self, registry: MetricsRegistry) -> None:
+        """Quotes and newlines in label values are escaped."""
+        registry.inc("strands_tool_calls_total", tool='say "hi"\n', status="error")
+
+        assert r'tool="say \"hi\"\n"' in registry.render_prometheus()
+
+    def test_track_run_records_outcome(self, registry: MetricsRegistry) -> None:
+        """Workflow runs are timed and counted by outcome, including errors and pauses."""
+        with registry.track_run("chain") as run:
+            assert registry.value("strands_workflows_in_progress", pattern="chain") == 1
+            run.set_result(MagicMock(success=True, exit_code=0))
+        with registry.track_run("chain") as run:
+            run.set_result(MagicMock(success=True, exit_code=EX_HITL_PAUSE))
+        with pytest.raises(RuntimeError), registry.track_run("chain"):
+            raise RuntimeError("boom")
+
+        assert registry.value("strands_workflows_in_progress", pattern="chain") == 0
+        for status in ("completed", "paused", "error"):
+            assert (
+                registry.value("strands_workflow_runs_total", pattern="chain", status=status) == 1
+            )
+        assert registry.histogram_count("strands_workflow_duration_seconds", pattern="chain") == 3
+
+    def test_forwards_to_otel_meter(self, registry: MetricsRegistry) -> None:
+        """Recordings are forwarded to an attached OpenTelemetry meter."""
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        registry.attach_meter(provider.get_meter("test"))
+
+        registry.inc("strands_agent_retries_total")
+        registry.observe("strands_model_call_duration_seconds", 0.2, model="m")
+
+        data = reader.get_metrics_data()
+        names = {
+            metric.name
+            for resource_metrics in data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        assert names == {"strands_agent_retries_total", "strands_model_call_duration_seconds"}
+        provider.shutdown()
+
+
+class TestMetricsReporters:
+    """Tests for the components that report into the registry."""
+
+    def _agent(self, usage: dict | None = None) -> MagicMock:
+        agent = MagicMock()
+        agent.name = "writer"
+        agent.model.get_config.return_value = {"model_id": "claude-test"}
+        agent.event_loop_metrics.latest_agent_invocation.usage = usage
+        return agent
+
+    def test_metrics_hook_records_model_tool_and_tokens(
+        self, global_metrics: MetricsRegistry
+    ) -> None:
+        """MetricsHook reports model latency, tool outcomes and token counters."""
+        hook = MetricsHook()
+        agent = self._agent({"inputTokens": 100, "outputTokens": 20, "cacheReadInputTokens": 400})
+
+        hook._start_model_call(MagicMock(agent=agent))
+        hook._end_model_call(MagicMock(agent=agent))
+        hook._record_tool_call(
+            MagicMock(
+                agent=agent,
+                tool_use={"name": "grep"},
+                result={"status": "error"},
+                exception=None,
+                duration=0.3,
+            )
+        )
+        hook._record_tokens(MagicMock(agent=agent))
+
+        assert (
+            global_metrics.histogram_count(
+                "strands_model_call_duration_seconds", model="claude-test"
+            )
+            == 1
+        )
+        assert global_metrics.value("strands_tool_calls_total", tool="grep", status="error") == 1
+        assert global_metrics.histogram_count("strands_tool_duration_seconds", tool="grep") == 1
+        tokens = {
+            token_type: global_metrics.value(
+                "strands_tokens_total", model="claude-test", type=token_type
+            )
+            for token_type in ("input", "output", "cache_read", "cache_write")
+        }
+        assert tokens == {"input": 100, "output": 20, "cache_read": 400, "cache_write": 0}
+
+    @pytest.mark.asyncio
+    async def test_invoke_agent_with_retry_tracks_invocations(
+        self, global_metrics: MetricsRegistry
+    ) -> None:
+        """Agent invocations are timed and counted in flight; retries are counted."""
+        agent = self._agent()
+        in_flight: list[float] = []
+        calls = 0
+
+        async def invoke(_: str) -> str:
+            nonlocal calls
+            calls += 1
+            in_flight.append(
+                global_metrics.value("strands_agent_invocations_in_progress", agent="writer")
+            )
+            if calls == 1:
+                raise ConnectionError("reset")
+            return "ok"
+
+        agent.invoke_async = invoke
+
+        assert await invoke_agent_with_retry(agent, "hi", 2, 0, 0) == "ok"
+
+        assert in_flight == [1, 1]
+        assert global_metrics.value("strands_agent_invocations_in_progress", agent="writer") == 0
+        assert (
+            global_metrics.histogram_count(
+                "strands_agent_invocation_duration_seconds", agent="writer"
+            )
+            == 1
+        )
+        assert global_metrics.value("strands_agent_retries_total") == 1
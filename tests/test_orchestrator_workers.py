@@ -13,6 +13,7 @@ Tests orchestrator-workers pattern execution including:
 - Agent caching for orchestrator/worker reuse
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -27,6 +28,7 @@ from strands_cli.types import (
     ChainStep,
     OrchestratorConfig,
     OrchestratorLimits,
+    OrchestratorPlan,
     PatternConfig,
     PatternType,
     ProviderType,
@@ -333,6 +335,37 @@ async def test_orchestrator_max_workers_limit(mock_cache_class):
 # ============================================================================
 
 
+@patch("strands_cli.exec.orchestrator_workers.AgentCache")
+@pytest.mark.asyncio
+async def test_orchestrator_native_structured_output(mock_cache_class, minimal_orchestrator_spec):
+    """Subtasks come from the validated OrchestratorPlan; workers get plain text calls."""
+    mock_cache = MagicMock()
+    mock_cache.get_or_build_agent = AsyncMock()
+    mock_cache.close = AsyncMock()
+    mock_cache_class.return_value = mock_cache
+
+    plan = OrchestratorPlan(subtasks=[{"task": "Research topic A"}, {"task": "Research topic B"}])
+
+    async def invoke(prompt, structured_output_model=None):
+        if structured_output_model is not None:
+            return MagicMock(structured_output=plan)
+        return f"Done: {prompt[:20]}"
+
+    mock_agent = MagicMock()
+    mock_agent.invoke_async = AsyncMock(side_effect=invoke)
+    mock_cache.get_or_build_agent.return_value = mock_agent
+
+    result = await run_orchestrator_workers(minimal_orchestrator_spec, variables=None)
+
+    assert result.success is True
+    assert [w["task"] for w in result.execution_context["workers"]] == [
+        "Research topic A",
+        "Research topic B",
+    ]
+    schemas = [c.kwargs.get("structured_output_model") for c in mock_agent.invoke_async.mock_calls]
+    assert schemas == [OrchestratorPlan, None, None]
+
+
 @patch("strands_cli.exec.orchestrator_workers.AgentCache")
 @pytest.mark.asyncio
 async def test_orchestrator_malformed_json_retry(mock_cache_class, minimal_orchestrator_spec):
@@ -552,7 +585,7 @@ async def test_orchestrator_missing_config():
 @patch("strands_cli.exec.orchestrator_workers.AgentCache")
 @pytest.mark.asyncio
 async def test_orchestrator_workers_isolated_agents(mock_cache_class, minimal_orchestrator_spec):
-    """Test that each worker gets its own agent instance via worker_index cache key."""
+    """Test that workers lease pooled agents via slot-based worker_index cache keys."""
     mock_cache = MagicMock()
     mock_cache.get_or_build_agent = AsyncMock()
     mock_cache.close = AsyncMock()
@@ -604,10 +637,10 @@ async def test_orchestrator_workers_isolated_agents(mock_cache_class, minimal_or
     orchestrator_call = mock_cache.get_or_build_agent.call_args_list[0]
     assert orchestrator_call.kwargs.get("worker_index") is None
 
-    # Verify each worker has unique worker_index (0, 1, 2)
+    # Verify workers use pool slots (bounded by the number of subtasks, never None)
     worker_calls = mock_cache.get_or_build_agent.call_args_list[1:]
     worker_indices = [call.kwargs.get("worker_index") for call in worker_calls]
-    assert worker_indices == [0, 1, 2]
+    assert all(index in (0, 1, 2) for index in worker_indices)
 
     mock_cache.close.assert_called_once()
 
@@ -783,7 +816,8 @@ async def test_orchestrator_workers_independent_compaction_hooks(mock_cache_clas
 
     async def capture_hooks(*args, **kwargs):
         hooks = kwargs.get("hooks", [])
-        all_hooks_lists.append(hooks)
+        # Pooled workers get a forwarding provider holding the lease's hooks
+        all_hooks_lists.append([h for hook in hooks for h in getattr(hook, "hooks", [hook])])
         mock_agent = MagicMock()
         # Return different responses based on call count
         if len(all_hooks_lists) == 1:
@@ -893,3 +927,163 @@ async def test_orchestrator_json_parsing_all_retries_exhausted(
     assert '"attempt": 2' in error_message
     assert '"attempt": 3' in error_message
     assert '"response_preview":' in error_message
+
+
+# ============================================================================
+# Tree Reduce Tests
+# ============================================================================
+
+
+def _concat_reduce_fn(calls: list[tuple[int, list[str]]]):
+    """Reduce function that joins group responses and records each call."""
+
+    async def _reduce(group, level, node_index):
+        responses = [item["response"] for item in group]
+        calls.append((level, responses))
+        return "+".join(responses), 1
+
+    return _reduce
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_merges_in_bounded_groups():
+    """Every reducer sees at most group_size items and one root remains."""
+    from strands_cli.exec.orchestrator_workers import _TreeReducer
+
+    calls: list[tuple[int, list[str]]] = []
+    reducer = _TreeReducer(3, _concat_reduce_fn(calls))
+    for i in range(7):
+        reducer.submit({"response": f"w{i}"})
+
+    root = await reducer.finish()
+
+    assert all(len(group) <= 3 for _, group in calls)
+    assert sorted(root.split("+")) == sorted(f"w{i}" for i in range(7))
+    assert reducer.tokens == reducer.nodes == len(calls)
+    assert reducer.levels >= 2
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_single_item_still_reduced():
+    """A single worker result is reduced once (matches non-tree reduce behavior)."""
+    from strands_cli.exec.orchestrator_workers import _TreeReducer
+
+    calls: list[tuple[int, list[str]]] = []
+    reducer = _TreeReducer(4, _concat_reduce_fn(calls))
+    reducer.submit({"response": "only"})
+
+    assert await reducer.finish() == "only"
+    assert calls == [(0, ["only"])]
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_propagates_failure():
+    """Reducer failures surface from finish()."""
+    from strands_cli.exec.orchestrator_workers import _TreeReducer
+
+    async def _failing(group, level, node_index):
+        raise RuntimeError("reduce boom")
+
+    reducer = _TreeReducer(2, _failing)
+    reducer.submit({"response": "a"})
+    reducer.submit({"response": "b"})
+
+    with pytest.raises(RuntimeError, match="reduce boom"):
+        await reducer.finish()
+
+
+@patch("strands_cli.exec.orchestrator_workers.AgentCache")
+@pytest.mark.asyncio
+async def test_orchestrator_tree_reduce_streams_worker_outputs(
+    mock_cache_class, full_orchestrator_spec
+):
+    """reduce_group_size reduces worker outputs in groups, then merges partials."""
+    full_orchestrator_spec.pattern.config.reduce_group_size = 2
+    full_orchestrator_spec.pattern.config.reduce = ChainStep(
+        agent="aggregator",
+        input="Merge level {{ reduce_level }}: "
+        "{% for w in workers %}[{{ w.response }}]{% endfor %}",
+    )
+
+    mock_cache = MagicMock()
+    mock_cache.close = AsyncMock()
+    mock_cache_class.return_value = mock_cache
+
+    reduce_inputs: list[str] = []
+
+    async def _reduce_invoke(prompt):
+        reduce_inputs.append(prompt)
+        return f"merged{len(reduce_inputs)}"
+
+    agents = {
+        "planner": AsyncMock(
+            return_value='[{"task": "T1"}, {"task": "T2"}, {"task": "T3"}, {"task": "T4"}]'
+        ),
+        "researcher": AsyncMock(side_effect=lambda prompt: f"out-{prompt}"),
+        "aggregator": AsyncMock(side_effect=_reduce_invoke),
+        "writer": AsyncMock(return_value="Final report"),
+    }
+
+    async def get_agent(spec, agent_id, config, **kwargs):
+        agent = MagicMock()
+        agent.invoke_async = agents[agent_id]
+        return agent
+
+    mock_cache.get_or_build_agent = AsyncMock(side_effect=get_agent)
+
+    result = await run_orchestrator_workers(full_orchestrator_spec, variables=None)
+
+    assert result.success is True
+    # 4 workers with k=2: two leaf merges + one root merge
+    assert len(reduce_inputs) == 3
+    leaf_inputs = [p for p in reduce_inputs if p.startswith("Merge level 0")]
+    assert len(leaf_inputs) == 2
+    assert all(p.count("[out-") == 2 for p in leaf_inputs)
+    assert reduce_inputs[-1].startswith("Merge level 1")
+    assert result.execution_context["reduce_response"] == "merged3"
+    assert result.execution_context["reduce_tree"] == {"group_size": 2, "nodes": 3, "levels": 2}
+    assert len(result.execution_context["workers"]) == 4
+
+
+@patch("strands_cli.exec.orchestrator_workers.AgentCache")
+@pytest.mark.asyncio
+async def test_orchestrator_worker_agents_scale_with_max_workers(
+    mock_cache_class, minimal_orchestrator_spec
+):
+    """Worker agent builds are bounded by max_workers, not by subtask count."""
+    import asyncio
+
+    minimal_orchestrator_spec.pattern.config.orchestrator.limits = OrchestratorLimits(max_workers=2)
+
+    mock_cache = MagicMock()
+    mock_cache.close = AsyncMock()
+    mock_cache_class.return_value = mock_cache
+
+    worker_agents: dict[int, MagicMock] = {}
+
+    async def _worker_invoke(prompt):
+        await asyncio.sleep(0.01)
+        return f"done {prompt}"
+
+    async def get_agent(spec, agent_id, config, **kwargs):
+        if agent_id == "planner":
+            agent = MagicMock()
+            agent.invoke_async = AsyncMock(
+                return_value=json.dumps([{"task": f"T{i}"} for i in range(10)])
+            )
+            return agent
+        index = kwargs["worker_index"]
+        if index not in worker_agents:
+            agent = MagicMock()
+            agent.messages = []
+            agent.invoke_async = AsyncMock(side_effect=_worker_invoke)
+            worker_agents[index] = agent
+        return worker_agents[index]
+
+    mock_cache.get_or_build_agent = AsyncMock(side_effect=get_agent)
+
+    result = await run_orchestrator_workers(minimal_orchestrator_spec, variables=None)
+
+    assert len(result.execution_context["workers"]) == 10
+    assert set(worker_agents) == {0, 1}
+    assert sum(agent.invoke_async.call_count for agent in worker_agents.values()) == 10
@@ -0,0 +1,127 @@
+"""Tests for the per-phase run profiler behind `strands run --profile`."""
+
+import asyncio
+import time
+
+import pytest
+
+from strands_cli.telemetry.profiler import (
+    RunProfiler,
+    get_profiler,
+    profile_phase,
+    record_phase,
+    start_profiling,
+    stop_profiling,
+)
+
+
+@pytest.fixture
+def profiler() -> RunProfiler:
+    """Active profiler, detached after the test."""
+    active = start_profiling()
+    yield active
+    stop_profiling()
+
+
+def _phase(report: dict, name: str) -> dict:
+    return next(phase for phase in report["phases"] if phase["phase"] == name)
+
+
+def test_profiling_is_a_noop_when_inactive() -> None:
+    """Instrumentation does nothing without an active profiler."""
+    assert get_profiler() is None
+    with profile_phase("spec.parse"):
+        record_phase("model.call", 1.0)
+    assert stop_profiling() is None
+
+
+def test_nested_phases_split_self_time(profiler: RunProfiler) -> None:
+    """A phase's self time excludes the phases nested inside it."""
+    with profile_phase("agent.invoke", agent="writer"):
+        time.sleep(0.01)
+        record_phase("model.call", 0.5, model="m")
+        record_phase("tool.call", 0.25, tool="grep")
+
+    report = profiler.report()
+
+    invoke = _phase(report, "agent.invoke")
+    assert invoke["count"] == 1
+    # Externally recorded children can exceed the measured wall time; self time clamps at 0
+    assert invoke["self_seconds"] == 0.0
+    assert report["summary"]["llm_wait_seconds"] == 0.5
+    assert report["summary"]["tool_seconds"] == 0.25
+    assert report["tools"] == [
+        {"tool": "grep", "calls": 1, "total_seconds": 0.25, "max_seconds": 0.25}
+    ]
+    (step,) = report["steps"]
+    assert step["agent"] == "writer"
+    assert step["llm_seconds"] == 0.5
+    assert step["tool_seconds"] == 0.25
+
+
+def test_step_self_time_is_orchestration_overhead(profiler: RunProfiler) -> None:
+    """Per-step self time is wall time minus LLM wait and tool time."""
+    with profile_phase("agent.invoke", agent="writer"):
+        time.sleep(0.03)
+        record_phase("model.call", 0.01)
+
+    (step,) = profiler.report()["steps"]
+
+    assert step["self_seconds"] == pytest.approx(step["wall_seconds"] - 0.01, abs=1e-5)
+    assert step["self_seconds"] >= 0.015
+
+
+def test_concurrent_tasks_attribute_to_their_own_step(profiler: RunProfiler) -> None:
+    """Parallel branches record model calls under their own agent.invoke phase."""
+
+    async def branch(name: str, llm_seconds: float) -> None:
+        with profile_phase("agent.invoke", agent=name):
+            await asyncio.sleep(0.01)
+            record_phase("model.call", llm_seconds)
+
+    async def run() -> None:
+        await asyncio.gather(branch("a", 0.1), branch("b", 0.2))
+
+    asyncio.run(run())
+
+    steps = {step["agent"]: step["llm_seconds"] for step in profiler.report()["steps"]}
+    assert steps == {"a": 0.1, "b": 0.2}
+
+
+def test_folded_stacks_are_flamegraph_ready(profiler: RunProfiler) -> None:
+    """Folded stacks list each phase path with its self time in microseconds."""
+    with profile_phase("agent.invoke", agent="writer"):
+        record_phase("model.call", 0.002, model="m")
+    profiler.stop()
+
+    lines = profiler.folded_stacks().splitlines()
+
+    assert "run;agent.invoke[writer];model.call[m] 2000" in lines
+    for line in lines:
+        path, micros = line.rsplit(" ", 1)
+        assert path.startswith("run")
+        assert int(micros) > 0
+
+
+def test_unattributed_time_counts_as_self_time(profiler: RunProfiler) -> None:
+    """Run time outside any phase is reported as unattributed orchestration time."""
+    time.sleep(0.02)
+    with profile_phase("spec.parse"):
+        pass
+    profiler.stop()
+
+    summary = profiler.report()["summary"]
+
+    assert summary["unattributed_seconds"] >= 0.015
+    assert summary["self_seconds"] >= summary["unattributed_seconds"]
+
+
+def test_cpu_profile_is_recorded() -> None:
+    """The optional cProfile covers the profiled run."""
+    start_profiling(cpu=True)
+    sum(range(1000))
+    profiler = stop_profiling()
+
+    assert profiler is not None
+    assert profiler.cpu_profile is not None
+    assert profiler.cpu_profile.getstats()
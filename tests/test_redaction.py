@@ -560,3 +560,88 @@ class TestNestedRedaction:
         assert "***REDACTED***" in level3["email"]
         assert "***REDACTED***" in level3["credit_card"]
         assert level3["normal"] == "data"
+
+
+class TestPrefilteredRedaction:
+    """Tests for the prefiltered redaction engine."""
+
+    SAMPLES = (
+        "Contact john.doe@example.com or 555-123-4567",
+        "Card 4111-1111-1111-1111, SSN 123-45-6789, phone 555.123.4567",
+        "a@b.cc\nsecond: ops@example.org\tthird <dev@example.net>",
+        "Not an email: user@localhost, trailing@ and @leading",
+        "ids 12345 and 1234567890123 stay, x5551234567 stays",
+        "token sk-proj-1234567890abcdefghij and 5551234567",
+        "4111111111111111 at start and end 555-123-4567",
+        "plain prose without any personal data at all",
+    )
+
+    @staticmethod
+    def _sequential(engine: RedactionEngine, text: str, is_sensitive_context: bool) -> str:
+        """Reference: every pattern's sub() in turn, as before the prefilters."""
+        for pattern in engine.patterns:
+            if is_sensitive_context or pattern is not engine.API_KEY_PATTERN:
+                text = pattern.sub(engine.REDACTED_PLACEHOLDER, text)
+        return text
+
+    @pytest.mark.parametrize("is_sensitive_context", [True, False])
+    def test_matches_sequential_pattern_application(self, is_sensitive_context: bool) -> None:
+        """Prefiltered output is identical to applying each pattern in turn."""
+        engine = RedactionEngine(custom_patterns=[r"EMP-\d{5}"])
+        for text in self.SAMPLES:
+            assert engine._redact_string(text, is_sensitive_context) == self._sequential(
+                engine, text, is_sensitive_context
+            ), text
+
+    @pytest.mark.parametrize("is_sensitive_context", [True, False])
+    def test_matches_sequential_pattern_application_randomized(
+        self, is_sensitive_context: bool
+    ) -> None:
+        """Prefiltered output is identical to applying each pattern in turn on random input."""
+        import random
+
+        rng = random.Random(20261019)
+        # Digit runs and separators that make card, SSN and phone matches overlap
+        pieces = ["1", "23", "808", "1448", "5561", "-", "-", " ", ".", "@", "a", "x.io"]
+        pieces += ["\n", "\t", "_", "K", "EMP-", "ED", "\u0663"]
+        engine = RedactionEngine(custom_patterns=[r"EMP-\d{5}", r"\d-\d", r"ED\*"])
+        for _ in range(3000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 40)))
+            assert engine._redact_string(text, is_sensitive_context) == self._sequential(
+                engine, text, is_sensitive_context
+            ), repr(text)
+
+    def test_overlapping_number_patterns_apply_in_order(self) -> None:
+        """A card match takes precedence over an earlier-starting phone match."""
+        engine = RedactionEngine()
+        text = "3-18-808545-1448 51038333-5561"
+        assert engine._redact_string(text) == self._sequential(engine, text, True)
+        assert engine._redact_string(text) == "3-18-808545-***REDACTED***"
+
+    def test_redaction_count_once_per_string(self) -> None:
+        """A string with several matches counts as one redaction."""
+        engine = RedactionEngine()
+        engine._redact_string("a@example.com, b@example.com and 123-45-6789")
+        engine._redact_string("nothing to see here")
+        assert engine.get_redaction_count() == 1
+
+    def test_custom_patterns_with_groups_and_inline_flags(self) -> None:
+        """Custom patterns with groups and inline flags are applied."""
+        engine = RedactionEngine(
+            custom_patterns=[r"(ACCT)-(\d+)-\2", r"(?i)project-x", r"EMP-\d{5}"]
+        )
+        result = engine.redact_value("ACCT-42-42 PROJECT-X EMP-12345 ACCT-42-43")
+        assert result == "***REDACTED*** ***REDACTED*** ***REDACTED*** ACCT-42-43"
+
+    def test_sensitive_key_decisions_are_cached(self) -> None:
+        """Repeated attribute keys are classified once."""
+        from strands_cli.telemetry.redaction import _is_sensitive_key_name
+
+        engine = RedactionEngine()
+        _is_sensitive_key_name.cache_clear()
+        for _ in range(3):
+            engine.redact_span_attributes({"api_token": "x", "agent.id": "y"})
+
+        info = _is_sensitive_key_name.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
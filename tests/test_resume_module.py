@@ -7,7 +7,7 @@ and dispatch to pattern executors.
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -123,7 +123,8 @@ async def test_load_and_validate_session_verbose(mocker: Any, capsys: Any) -> No
     mock_repo.load.assert_awaited_once()
 
 
-def test_load_spec_from_snapshot_success(tmp_path: Path, mocker: Any) -> None:
+@pytest.mark.asyncio
+async def test_load_spec_from_snapshot_success(tmp_path: Path, mocker: Any) -> None:
     """Test loading spec from snapshot file."""
     session_dir = tmp_path / "sessions" / "test-123"
     session_dir.mkdir(parents=True)
@@ -153,7 +154,7 @@ outputs:
     )
 
     mock_repo = mocker.Mock(spec=FileSessionRepository)
-    mock_repo._session_dir = MagicMock(return_value=session_dir)
+    mock_repo.get_spec_snapshot_path = AsyncMock(return_value=session_dir / "spec_snapshot.yaml")
 
     session_state = _create_session_state()
 
@@ -165,26 +166,28 @@ outputs:
     # Mock compute_spec_hash
     mocker.patch("strands_cli.session.resume.compute_spec_hash", return_value="abc123")
 
-    result = _load_spec_from_snapshot("test-123", mock_repo, session_state)
+    result = await _load_spec_from_snapshot("test-123", mock_repo, session_state)
 
     assert result == mock_spec
 
 
-def test_load_spec_from_snapshot_not_found(tmp_path: Path, mocker: Any) -> None:
+@pytest.mark.asyncio
+async def test_load_spec_from_snapshot_not_found(tmp_path: Path, mocker: Any) -> None:
     """Test loading spec when snapshot doesn't exist."""
     session_dir = tmp_path / "sessions" / "test-123"
     session_dir.mkdir(parents=True)
 
     mock_repo = mocker.Mock(spec=FileSessionRepository)
-    mock_repo._session_dir = MagicMock(return_value=session_dir)
+    mock_repo.get_spec_snapshot_path = AsyncMock(return_value=session_dir / "spec_snapshot.yaml")
 
     session_state = _create_session_state()
 
     with pytest.raises(SessionNotFoundError, match="Spec snapshot not found"):
-        _load_spec_from_snapshot("test-123", mock_repo, session_state)
+        await _load_spec_from_snapshot("test-123", mock_repo, session_state)
 
 
-def test_load_spec_from_snapshot_hash_mismatch(tmp_path: Path, mocker: Any) -> None:
+@pytest.mark.asyncio
+async def test_load_spec_from_snapshot_hash_mismatch(tmp_path: Path, mocker: Any) -> None:
     """Test loading spec when hash doesn't match (should warn but continue)."""
     session_dir = tmp_path / "sessions" / "test-123"
     session_dir.mkdir(parents=True)
@@ -193,7 +196,7 @@ def test_load_spec_from_snapshot_hash_mismatch(tmp_path: Path, mocker: Any) -> N
     spec_snapshot.write_text("version: 0\nname: test\n")
 
     mock_repo = mocker.Mock(spec=FileSessionRepository)
-    mock_repo._session_dir = MagicMock(return_value=session_dir)
+    mock_repo.get_spec_snapshot_path = AsyncMock(return_value=session_dir / "spec_snapshot.yaml")
 
     session_state = _create_session_state()
     session_state.metadata.spec_hash = "original_hash"
@@ -206,7 +209,7 @@ def test_load_spec_from_snapshot_hash_mismatch(tmp_path: Path, mocker: Any) -> N
     mock_logger = mocker.patch("strands_cli.session.resume.logger")
     mocker.patch("strands_cli.session.resume.console")
 
-    result = _load_spec_from_snapshot("test-123", mock_repo, session_state)
+    result = await _load_spec_from_snapshot("test-123", mock_repo, session_state)
 
     # Should still return spec despite hash mismatch
     assert result == mock_spec
@@ -414,8 +417,8 @@ outputs:
 """
     )
 
-    # Mock FileSessionRepository
-    mock_repo_class = mocker.patch("strands_cli.session.resume.FileSessionRepository")
+    # Mock the session repository
+    mock_repo_class = mocker.patch("strands_cli.session.resume.create_session_repository")
     mock_repo_instance = mocker.Mock()
     mock_repo_class.return_value = mock_repo_instance
 
@@ -423,7 +426,9 @@ outputs:
     session_state.variables = {"key": "value"}
 
     mock_repo_instance.load = AsyncMock(return_value=session_state)
-    mock_repo_instance._session_dir = MagicMock(return_value=session_dir)
+    mock_repo_instance.get_spec_snapshot_path = AsyncMock(
+        return_value=session_dir / "spec_snapshot.yaml"
+    )
 
     # Mock load_spec
     mock_spec = mocker.Mock()
@@ -458,14 +463,16 @@ async def test_run_resume_with_hitl_response(tmp_path: Path, mocker: Any) -> Non
     spec_snapshot = session_dir / "spec_snapshot.yaml"
     spec_snapshot.write_text("version: 0\nname: test\n")
 
-    mock_repo_class = mocker.patch("strands_cli.session.resume.FileSessionRepository")
+    mock_repo_class = mocker.patch("strands_cli.session.resume.create_session_repository")
     mock_repo_instance = mocker.Mock()
     mock_repo_class.return_value = mock_repo_instance
 
     session_state = _create_session_state()
 
     mock_repo_instance.load = AsyncMock(return_value=session_state)
-    mock_repo_instance._session_dir = MagicMock(return_value=session_dir)
+    mock_repo_instance.get_spec_snapshot_path = AsyncMock(
+        return_value=session_dir / "spec_snapshot.yaml"
+    )
 
     mock_spec = mocker.Mock()
     mock_spec.name = "test-workflow"
@@ -496,7 +503,7 @@ async def test_run_resume_merges_variables(tmp_path: Path, mocker: Any) -> None:
     spec_snapshot = session_dir / "spec_snapshot.yaml"
     spec_snapshot.write_text("version: 0\nname: test\n")
 
-    mock_repo_class = mocker.patch("strands_cli.session.resume.FileSessionRepository")
+    mock_repo_class = mocker.patch("strands_cli.session.resume.create_session_repository")
     mock_repo_instance = mocker.Mock()
     mock_repo_class.return_value = mock_repo_instance
 
@@ -504,7 +511,9 @@ async def test_run_resume_merges_variables(tmp_path: Path, mocker: Any) -> None:
     session_state.variables = {"session_key": "session_value", "shared": "from_session"}
 
     mock_repo_instance.load = AsyncMock(return_value=session_state)
-    mock_repo_instance._session_dir = MagicMock(return_value=session_dir)
+    mock_repo_instance.get_spec_snapshot_path = AsyncMock(
+        return_value=session_dir / "spec_snapshot.yaml"
+    )
 
     mock_spec = mocker.Mock()
     mock_spec.name = "test-workflow"
@@ -540,14 +549,16 @@ async def test_run_resume_with_telemetry(tmp_path: Path, mocker: Any) -> None:
     spec_snapshot = session_dir / "spec_snapshot.yaml"
     spec_snapshot.write_text("version: 0\nname: test\n")
 
-    mock_repo_class = mocker.patch("strands_cli.session.resume.FileSessionRepository")
+    mock_repo_class = mocker.patch("strands_cli.session.resume.create_session_repository")
     mock_repo_instance = mocker.Mock()
     mock_repo_class.return_value = mock_repo_instance
 
     session_state = _create_session_state()
 
     mock_repo_instance.load = AsyncMock(return_value=session_state)
-    mock_repo_instance._session_dir = MagicMock(return_value=session_dir)
+    mock_repo_instance.get_spec_snapshot_path = AsyncMock(
+        return_value=session_dir / "spec_snapshot.yaml"
+    )
 
     # Spec with telemetry
     mock_spec = mocker.Mock()
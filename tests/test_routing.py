@@ -4,6 +4,7 @@ Tests routing pattern execution including:
 - Valid routing with route selection
 - Invalid route name error handling
 - Malformed JSON retry logic
+- Native structured output constrained to route names
 - Multi-agent configuration
 - Template context injection (router.chosen_route)
 - Budget tracking across router + route execution
@@ -12,6 +13,7 @@ Tests routing pattern execution including:
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from strands_cli.exec.routing import (
     RoutingExecutionError,
@@ -201,6 +203,40 @@ async def test_run_routing_success(
     assert result.execution_context["router_agent"] == "router"
 
 
+@patch("strands_cli.exec.utils.AgentCache.get_or_build_agent")
+@patch("strands_cli.exec.routing.run_chain")
+@pytest.mark.asyncio
+async def test_run_routing_native_structured_output(
+    mock_run_chain, mock_get_agent, minimal_routing_spec, mock_agent
+):
+    """Router decision is requested as a schema restricted to the route names."""
+    schemas = []
+
+    async def invoke(prompt, structured_output_model=None):
+        schemas.append(structured_output_model)
+        decision = structured_output_model(route="escalate")
+        return MagicMock(structured_output=decision, __str__=lambda _: "not json")
+
+    mock_agent.invoke_async = AsyncMock(side_effect=invoke)
+    mock_get_agent.return_value = mock_agent
+    mock_run_chain.return_value = Mock(
+        success=True,
+        last_response="Escalated",
+        duration_seconds=1.0,
+        execution_context={},
+        variables={},
+    )
+
+    result = await run_routing(minimal_routing_spec, variables={"query": "test"})
+
+    assert result.execution_context["chosen_route"] == "escalate"
+    assert mock_agent.invoke_async.call_count == 1
+    (schema,) = schemas
+    assert issubclass(schema, RouterDecision)
+    with pytest.raises(ValidationError):
+        schema(route="unknown_route")
+
+
 @patch("strands_cli.exec.utils.AgentCache.get_or_build_agent")
 @pytest.mark.asyncio
 async def test_run_routing_invalid_route(mock_get_agent, minimal_routing_spec, mock_agent):
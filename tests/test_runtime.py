@@ -18,7 +18,10 @@ from strands_cli.runtime.providers import (
 from strands_cli.runtime.strands_adapter import (
     AdapterError,
     build_agent,
+    build_cacheable_system_prompt,
     build_system_prompt,
+    build_system_prompt_parts,
+    supports_prompt_cache_points,
 )
 from strands_cli.runtime.tools import (
     ToolError,
@@ -1020,6 +1023,98 @@ class TestBuildSystemPrompt:
         assert "- `/forecast?city={city}&days=5`" in result
         assert "**Authentication**: API key required in X-API-Key header." in result
 
+    def test_notes_follow_static_prefix(self, sample_ollama_spec):
+        """Per-step notes come after the runtime banner so the prefix stays cacheable."""
+        agent_config = AgentConfig(prompt="Base prompt")
+        sample_ollama_spec.skills = [Skill(id="web-search", description="Search the web")]
+
+        static_step1, notes_step1 = build_system_prompt_parts(
+            agent_config, sample_ollama_spec, "agent1", injected_notes="## step 1"
+        )
+        static_step2, notes_step2 = build_system_prompt_parts(
+            agent_config, sample_ollama_spec, "agent1", injected_notes="## step 1\n## step 2"
+        )
+        result = build_system_prompt(
+            agent_config, sample_ollama_spec, "agent1", injected_notes="## step 1"
+        )
+
+        assert static_step1 == static_step2
+        assert "Previous Workflow Steps" not in static_step1
+        assert notes_step1 == "# Previous Workflow Steps\n## step 1"
+        assert notes_step2 != notes_step1
+        assert result == f"{static_step1}\n\n{notes_step1}"
+        assert result.index("# Runtime Context") < result.index("# Previous Workflow Steps")
+
+
+class TestPromptCachePoints:
+    """Tests for provider prompt-cache markers."""
+
+    @pytest.mark.parametrize(
+        ("provider", "model_id", "expected"),
+        [
+            ("anthropic", "claude-sonnet-4-20250514", True),
+            ("anthropic", "claude-3-5-haiku-latest", True),
+            ("anthropic", "claude-2.1", False),
+            ("anthropic", None, False),
+            ("bedrock", None, False),  # Default is Claude 3 Sonnet, which has no cache
+            ("bedrock", "", False),
+            ("bedrock", "us.anthropic.claude-3-sonnet-20240229-v1:0", False),
+            ("bedrock", "us.anthropic.claude-3-7-sonnet-20250219-v1:0", True),
+            ("bedrock", "eu.anthropic.claude-sonnet-4-20250514-v1:0", True),
+            ("bedrock", "anthropic.claude-v2:1", False),
+            ("bedrock", "amazon.nova-pro-v1:0", True),
+            ("bedrock", "amazon.titan-text-express-v1", False),
+            ("bedrock", "meta.llama3-70b-instruct-v1:0", False),
+            ("openai", "gpt-4o", False),  # Automatic prefix caching, no marker
+            ("ollama", "llama3", False),
+        ],
+    )
+    def test_supports_prompt_cache_points(self, provider, model_id, expected, monkeypatch):
+        """Cache points are only emitted where the provider accepts them."""
+        monkeypatch.delenv("STRANDS_PROMPT_CACHE", raising=False)
+
+        assert supports_prompt_cache_points(provider, model_id) is expected
+
+    def test_prompt_cache_can_be_disabled(self, monkeypatch):
+        """STRANDS_PROMPT_CACHE=false turns markers off."""
+        monkeypatch.setenv("STRANDS_PROMPT_CACHE", "false")
+
+        assert supports_prompt_cache_points("anthropic", "claude-sonnet-4-20250514") is False
+
+    def test_cache_point_separates_static_prefix_from_notes(self):
+        """The cache point sits between the static prefix and the volatile notes."""
+        blocks = build_cacheable_system_prompt("static", "notes", use_cache_point=True)
+
+        assert blocks == [
+            {"text": "static"},
+            {"cachePoint": {"type": "default"}},
+            {"text": "notes"},
+        ]
+        assert build_cacheable_system_prompt("static", None, use_cache_point=True) == [
+            {"text": "static"},
+            {"cachePoint": {"type": "default"}},
+        ]
+        assert build_cacheable_system_prompt("static", "notes", False) == "static\n\nnotes"
+
+    def test_build_agent_emits_cache_point_for_anthropic(self, sample_ollama_spec, mocker):
+        """Anthropic agents get system content blocks; Ollama agents keep a string."""
+        mocker.patch("strands_cli.runtime.strands_adapter.create_model")
+        mock_agent_cls = mocker.patch("strands_cli.runtime.strands_adapter.Agent")
+        agent_config = AgentConfig(prompt="You are helpful.")
+
+        build_agent(sample_ollama_spec, "assistant", agent_config, injected_notes="## done")
+        assert isinstance(mock_agent_cls.call_args[1]["system_prompt"], str)
+
+        sample_ollama_spec.runtime = Runtime(
+            provider=ProviderType.ANTHROPIC, model_id="claude-sonnet-4-20250514"
+        )
+        build_agent(sample_ollama_spec, "assistant", agent_config, injected_notes="## done")
+        system_prompt = mock_agent_cls.call_args[1]["system_prompt"]
+
+        assert system_prompt[0]["text"].startswith("You are helpful.")
+        assert system_prompt[1] == {"cachePoint": {"type": "default"}}
+        assert system_prompt[2]["text"] == "# Previous Workflow Steps\n## done"
+
 
 class TestBuildAgent:
     """Tests for build_agent."""
@@ -1094,9 +1189,7 @@ class TestBuildAgent:
         mock_load.return_value = mock_callable
 
         # Add Python tool to spec
-        sample_ollama_spec.tools = Tools(
-            python=[PythonTool(callable="http_request")]
-        )
+        sample_ollama_spec.tools = Tools(python=[PythonTool(callable="http_request")])
 
         agent_config = AgentConfig(prompt="Base prompt")
 
@@ -1162,7 +1255,6 @@ class TestBuildAgent:
 class TestLoadPythonCallable:
     """Tests for load_python_callable."""
 
-
     def test_raises_error_for_disallowed_callable(self):
         """Should raise ToolError if callable not in allowlist."""
         with pytest.raises(ToolError, match="not in allowlist"):
@@ -1172,7 +1264,10 @@ class TestLoadPythonCallable:
         """Should raise ToolError if module import fails."""
         # Mock registry to include the tool in allowlist
         mock_registry = Mock()
-        mock_registry.get_allowlist.return_value = {"http_request", "strands_cli.tools.http_request"}
+        mock_registry.get_allowlist.return_value = {
+            "http_request",
+            "strands_cli.tools.http_request",
+        }
         mock_registry.resolve.return_value = "strands_cli.tools.http_request"
         mocker.patch("strands_cli.tools.get_registry", return_value=mock_registry)
 
@@ -1185,7 +1280,6 @@ class TestLoadPythonCallable:
         with pytest.raises(ToolError, match="Failed to load tool"):
             load_python_callable("http_request")
 
-
     def test_loads_module_based_tool_with_tool_spec(self, mocker):
         """Should return module itself if it has TOOL_SPEC attribute (module-based tool)."""
         # Mock the import
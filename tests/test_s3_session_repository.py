@@ -0,0 +1,302 @@
+"""Tests for the S3 session repository against a local fake S3 server."""
+
+import hashlib
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+import pytest
+
+from strands_cli.session import (
+    SessionConflictError,
+    SessionMetadata,
+    SessionState,
+    SessionStatus,
+    TokenUsage,
+)
+from strands_cli.session.repository import SessionRepository, create_session_repository
+from strands_cli.session.s3_repository import S3SessionRepository
+
+BUCKET = "sessions-bucket"
+
+
+class _S3Handler(BaseHTTPRequestHandler):
+    """Request handler serving a FakeS3Server's state."""
+
+    server: "_FakeS3HTTPServer"
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b"", etag: str | None = None) -> None:
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _parse(self) -> tuple[str, dict[str, str], bytes]:
+        if not self.headers.get("Authorization", "").startswith("AWS4-HMAC-SHA256"):
+            self.server.fake.unsigned_requests += 1
+        url = urlsplit(self.path)
+        key = unquote(url.path).removeprefix(f"/{BUCKET}/")
+        query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        return key, query, body
+
+    def do_GET(self) -> None:
+        key, query, _ = self._parse()
+        if query.get("list-type") == "2":
+            self._send(200, self.server.fake.list_xml(query))
+            return
+        with self.server.fake.lock:
+            found = self.server.fake.objects.get(key)
+        self._send(200, *found) if found else self._send(404)
+
+    def do_HEAD(self) -> None:
+        key, _, _ = self._parse()
+        self._send(200 if key in self.server.fake.objects else 404)
+
+    def do_PUT(self) -> None:
+        key, query, body = self._parse()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self.server.fake.lock:
+            if "uploadId" in query:
+                self.server.fake.uploads[query["uploadId"]][int(query["partNumber"])] = body
+                self._send(200, etag=etag)
+                return
+            current = self.server.fake.objects.get(key)
+            if_match = self.headers.get("If-Match")
+            if (self.headers.get("If-None-Match") == "*" and current) or (
+                if_match and (not current or current[1] != if_match)
+            ):
+                self._send(412)
+                return
+            self.server.fake.objects[key] = (body, etag)
+        self._send(200, etag=etag)
+
+    def do_POST(self) -> None:
+        key, query, _ = self._parse()
+        with self.server.fake.lock:
+            if "uploads" in query:
+                upload_id = uuid.uuid4().hex
+                self.server.fake.uploads[upload_id] = {}
+                xml = f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId>"
+                self._send(200, f"{xml}</InitiateMultipartUploadResult>".encode())
+                return
+            parts = self.server.fake.uploads.pop(query["uploadId"])
+            body = b"".join(parts[number] for number in sorted(parts))
+            self.server.fake.completed_parts.append(len(parts))
+            self.server.fake.objects[key] = (body, f'"{uuid.uuid4().hex}-{len(parts)}"')
+        self._send(
+            200,
+            b"<CompleteMultipartUploadResult><ETag>x</ETag></CompleteMultipartUploadResult>",
+        )
+
+    def do_DELETE(self) -> None:
+        key, query, _ = self._parse()
+        with self.server.fake.lock:
+            if "uploadId" in query:
+                self.server.fake.uploads.pop(query["uploadId"], None)
+            else:
+                self.server.fake.objects.pop(key, None)
+        self._send(204)
+
+
+class _FakeS3HTTPServer(ThreadingHTTPServer):
+    fake: "FakeS3Server"
+
+
+class FakeS3Server:
+    """Path-style S3 subset: objects, conditional PUT, ListObjectsV2, multipart upload."""
+
+    def __init__(self, page_size: int = 1000) -> None:
+        self.objects: dict[str, tuple[bytes, str]] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.completed_parts: list[int] = []
+        self.unsigned_requests = 0
+        self.page_size = page_size
+        self.lock = threading.Lock()
+        self.httpd = _FakeS3HTTPServer(("127.0.0.1", 0), _S3Handler)
+        self.httpd.fake = self
+        self.endpoint_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def list_xml(self, query: dict[str, str]) -> bytes:
+        with self.lock:
+            keys = sorted(k for k in self.objects if k.startswith(query.get("prefix", "")))
+        start = int(query.get("continuation-token", "0"))
+        page = keys[start : start + self.page_size]
+        more = start + self.page_size < len(keys)
+        contents = "".join(f"<Contents><Key>{escape(k)}</Key></Contents>" for k in page)
+        token = f"<NextContinuationToken>{start + self.page_size}</NextContinuationToken>"
+        return (
+            '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            f"{contents}<IsTruncated>{str(more).lower()}</IsTruncated>"
+            f"{token if more else ''}</ListBucketResult>"
+        ).encode()
+
+    def keys(self, session_id: str) -> list[str]:
+        prefix = f"sessions/session_{session_id}/"
+        return sorted(k.removeprefix(prefix) for k in self.objects if k.startswith(prefix))
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeS3Server]:
+    """Fake S3 server running in a background thread, with static credentials."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "minioadmin")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "minioadmin")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    server = FakeS3Server(page_size=2)
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def _worker(s3: FakeS3Server, cache_dir: Path, **kwargs: Any) -> S3SessionRepository:
+    return S3SessionRepository(BUCKET, endpoint_url=s3.endpoint_url, cache_dir=cache_dir, **kwargs)
+
+
+def _state(session_id: str = "s1", step: int = 0) -> SessionState:
+    return SessionState(
+        metadata=SessionMetadata(
+            session_id=session_id,
+            workflow_name="wf",
+            spec_hash="hash",
+            pattern_type="chain",
+            status=SessionStatus.RUNNING,
+            created_at="2026-01-01T00:00:00+00:00",
+            updated_at="2026-01-01T00:00:00+00:00",
+        ),
+        variables={"topic": "AI"},
+        runtime_config={"provider": "ollama"},
+        pattern_state={"current_step": step},
+        token_usage=TokenUsage(total_input_tokens=10),
+    )
+
+
+def _write_agent_file(repo: S3SessionRepository, session_id: str, data: bytes) -> Path:
+    path = repo.get_agents_dir(session_id) / "session_agent" / "message_0.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestS3SessionRepository:
+    """Tests for S3SessionRepository."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_between_workers(self, s3: FakeS3Server, tmp_path: Path) -> None:
+        """A session saved by one worker is listed and loaded by another."""
+        first = _worker(s3, tmp_path / "a", session_format="compact")
+        await first.save(_state(), "name: wf\n")
+        for session_id in ("s2", "s3"):
+            await first.save(_state(session_id), "")
+
+        second = _worker(s3, tmp_path / "b")
+        loaded = await second.load("s1")
+
+        assert loaded is not None
+        assert loaded.variables == {"topic": "AI"}
+        assert loaded.pattern_state == {"current_step": 0}
+        assert await second.exists("s1")
+        assert not await second.exists("missing")
+        assert await second.load("missing") is None
+        spec_path = await second.get_spec_snapshot_path("s1")
+        assert spec_path.read_text() == "name: wf\n"
+        # Listing pages through ListObjectsV2 continuation tokens
+        assert sorted(m.session_id for m in await second.list_sessions()) == ["s1", "s2", "s3"]
+        assert s3.unsigned_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_resume_hands_agent_histories_over(
+        self, s3: FakeS3Server, tmp_path: Path
+    ) -> None:
+        """Agent histories follow the session; a stale worker's save is rejected."""
+        first = _worker(s3, tmp_path / "a")
+        await first.save(_state(), "name: wf\n")
+        _write_agent_file(first, "s1", b'{"role": "user"}')
+        await first.save(_state(step=1), "")
+
+        second = _worker(s3, tmp_path / "b")
+        await second.load("s1")
+        restored = second.get_agents_dir("s1") / "session_agent" / "message_0.json"
+        assert restored.read_bytes() == b'{"role": "user"}'
+        await second.save(_state(step=2), "")
+
+        with pytest.raises(SessionConflictError):
+            await first.save(_state(step=99), "")
+
+        assert (await _worker(s3, tmp_path / "c").load("s1")).pattern_state == {"current_step": 2}
+        await first.load("s1")
+        await first.save(_state(step=3), "")
+        # Superseded and rejected objects are cleaned up
+        keys = s3.keys("s1")
+        assert len([k for k in keys if k.startswith("pattern_state-")]) == 1
+        assert len([k for k in keys if k.startswith("agents-")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_session_created_once(self, s3: FakeS3Server, tmp_path: Path) -> None:
+        """Only one worker can create a given session ID."""
+        await _worker(s3, tmp_path / "a").save(_state(), "")
+
+        with pytest.raises(SessionConflictError):
+            await _worker(s3, tmp_path / "b").save(_state(), "")
+
+    @pytest.mark.asyncio
+    async def test_large_agent_archive_uses_multipart(
+        self, s3: FakeS3Server, tmp_path: Path
+    ) -> None:
+        """Archives above the threshold are uploaded in parts and restored intact."""
+        first = _worker(s3, tmp_path / "a", multipart_threshold=4096, part_size=4096)
+        await first.save(_state(), "")
+        payload = os.urandom(20_000)
+        _write_agent_file(first, "s1", payload)
+        await first.save(_state(step=1), "")
+
+        assert s3.completed_parts and s3.completed_parts[0] > 1
+        assert not s3.uploads
+        second = _worker(s3, tmp_path / "b")
+        await second.load("s1")
+        restored = second.get_agents_dir("s1") / "session_agent" / "message_0.json"
+        assert restored.read_bytes() == payload
+
+    @pytest.mark.asyncio
+    async def test_delete(self, s3: FakeS3Server, tmp_path: Path) -> None:
+        """Deleting removes every object and the local working copy."""
+        repo = _worker(s3, tmp_path / "a")
+        await repo.save(_state(), "name: wf\n")
+        _write_agent_file(repo, "s1", b"{}")
+        await repo.save(_state(step=1), "")
+
+        await repo.delete("s1")
+
+        assert s3.keys("s1") == []
+        assert not repo.get_agents_dir("s1").exists()
+        with pytest.raises(FileNotFoundError):
+            await repo.delete("s1")
+
+
+def test_create_session_repository(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The factory selects the backend from STRANDS_SESSION_BACKEND."""
+    monkeypatch.setenv("STRANDS_SESSION_BACKEND", "s3")
+    monkeypatch.delenv("STRANDS_SESSION_S3_BUCKET", raising=False)
+    with pytest.raises(ValueError, match="STRANDS_SESSION_S3_BUCKET"):
+        create_session_repository()
+
+    monkeypatch.setenv("STRANDS_SESSION_S3_BUCKET", BUCKET)
+    repo = create_session_repository()
+    assert isinstance(repo, S3SessionRepository)
+    assert isinstance(repo, SessionRepository)
+    assert not isinstance(create_session_repository(tmp_path), S3SessionRepository)
@@ -455,6 +455,7 @@ async def test_resume_delegates_to_run_resume(session_manager: SessionManager, m
         debug=True,
         verbose=True,
         trace=False,
+        session_repo=session_manager.repo,
     )
     assert result.success is True
     assert result.last_response == "test response"
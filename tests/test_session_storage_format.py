@@ -0,0 +1,134 @@
+"""Tests for compact session storage and format conversion."""
+
+import json
+from pathlib import Path
+
+import pytest
+from strands.session.file_session_manager import FileSessionManager
+from strands.types.session import SessionMessage
+
+from strands_cli.session import (
+    SessionMetadata,
+    SessionState,
+    SessionStatus,
+    TokenUsage,
+    storage_format,
+)
+from strands_cli.session.file_repository import FileSessionRepository
+from strands_cli.session.storage_format import (
+    CompactFileSessionManager,
+    compress,
+    compressed_suffix,
+    load_json,
+)
+
+
+def _state(session_id: str = "s1") -> SessionState:
+    return SessionState(
+        metadata=SessionMetadata(
+            session_id=session_id,
+            workflow_name="wf",
+            spec_hash="hash",
+            pattern_type="chain",
+            status=SessionStatus.RUNNING,
+            created_at="2026-01-01T00:00:00+00:00",
+            updated_at="2026-01-01T00:00:00+00:00",
+        ),
+        variables={"topic": "AI"},
+        runtime_config={"provider": "ollama"},
+        pattern_state={"step_history": [{"index": 0, "response": "é" + "answer " * 200}]},
+        token_usage=TokenUsage(total_input_tokens=10),
+    )
+
+
+def _write_history(storage_dir: Path, compact: bool, texts: list[str]) -> None:
+    manager = CompactFileSessionManager("agent-session", str(storage_dir), compact=compact)
+    for index, text in enumerate(texts):
+        message = SessionMessage.from_message({"role": "user", "content": [{"text": text}]}, index)
+        manager.create_message("agent-session", "default", message)
+
+
+class TestCodec:
+    """Tests for encoding helpers."""
+
+    def test_load_json_detects_format(self) -> None:
+        """Plain, compact and compressed payloads all decode to the same data."""
+        data = {"a": [1, 2, {"b": "ü"}]}
+
+        assert load_json(json.dumps(data, indent=2).encode()) == data
+        assert load_json(compress(json.dumps(data).encode())) == data
+
+    def test_zstd_payload_without_zstandard(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """zstd data is reported with an install hint when zstandard is missing."""
+        monkeypatch.setattr(storage_format, "ZSTD_AVAILABLE", False)
+
+        with pytest.raises(ValueError, match="install zstandard"):
+            load_json(storage_format.ZSTD_MAGIC + b"payload")
+
+
+class TestCompactRepository:
+    """Tests for FileSessionRepository in the compact format."""
+
+    @pytest.mark.asyncio
+    async def test_compact_round_trip(self, tmp_path: Path) -> None:
+        """Compact sessions are minified, compressed, listed and loaded."""
+        repo = FileSessionRepository(storage_dir=tmp_path, session_format="compact")
+        await repo.save(_state(), "")
+
+        session_dir = repo._session_dir("s1")
+        assert b"\n" not in (session_dir / "session.json").read_bytes()
+        assert (session_dir / f"pattern_state.json{compressed_suffix()}").exists()
+        assert not (session_dir / "pattern_state.json").exists()
+
+        loaded = await repo.load("s1")
+        assert loaded is not None
+        assert loaded.pattern_state == _state().pattern_state
+        assert [m.session_id for m in await repo.list_sessions()] == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_switching_formats_keeps_one_pattern_state(self, tmp_path: Path) -> None:
+        """Sessions written in either format load, and saving replaces the other variant."""
+        await FileSessionRepository(storage_dir=tmp_path).save(_state(), "")
+        compact = FileSessionRepository(storage_dir=tmp_path, session_format="compact")
+
+        assert (await compact.load("s1")) is not None
+        await compact.save(_state(), "")
+
+        files = sorted(p.name for p in compact._session_dir("s1").glob("pattern_state*"))
+        assert files == [f"pattern_state.json{compressed_suffix()}"]
+
+    @pytest.mark.asyncio
+    async def test_convert_rewrites_agent_histories(self, tmp_path: Path) -> None:
+        """Conversion compresses agent files and converting back restores SDK JSON."""
+        await FileSessionRepository(storage_dir=tmp_path).save(_state(), "")
+        agents_dir = FileSessionRepository(storage_dir=tmp_path).get_agents_dir("s1")
+        texts = ["hello " * 300, "world"]
+        _write_history(agents_dir, compact=False, texts=texts)
+
+        before, after = await FileSessionRepository(
+            storage_dir=tmp_path, session_format="compact"
+        ).convert("s1")
+
+        assert after < before
+        restored = CompactFileSessionManager("agent-session", str(agents_dir))
+        messages = restored.list_messages("agent-session", "default")
+        assert [m.message["content"][0]["text"] for m in messages] == texts
+
+        await FileSessionRepository(storage_dir=tmp_path).convert("s1")
+        plain = FileSessionManager(session_id="agent-session", storage_dir=str(agents_dir))
+        assert len(plain.list_messages("agent-session", "default")) == 2
+        loaded = await FileSessionRepository(storage_dir=tmp_path).load("s1")
+        assert loaded is not None
+        assert loaded.variables == {"topic": "AI"}
+
+
+def test_compact_session_manager_round_trip(tmp_path: Path) -> None:
+    """Compressed message files keep SDK names and read back in order."""
+    _write_history(tmp_path, compact=True, texts=["one", "two", "three"])
+
+    manager = CompactFileSessionManager("agent-session", str(tmp_path), compact=True)
+    messages = manager.list_messages("agent-session", "default", offset=1)
+
+    assert [m.message["content"][0]["text"] for m in messages] == ["two", "three"]
+    message_file = next(tmp_path.rglob("message_0.json"))
+    assert message_file.read_bytes()[:2] in (storage_format.GZIP_MAGIC, b"\x28\xb5")
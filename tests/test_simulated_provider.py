@@ -0,0 +1,185 @@
+"""Tests for the simulated provider and the load-test driver."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from strands_cli.exec.chain import run_chain
+from strands_cli.loadtest import run_load_test
+from strands_cli.runtime.providers import _create_model_cached, create_model
+from strands_cli.runtime.simulated import SimulatedModel, SimulatedThrottlingError
+from strands_cli.telemetry.metrics import get_metrics
+from strands_cli.types import SimulationConfig, Spec
+
+
+def _spec(**simulation: Any) -> Spec:
+    return Spec.model_validate(
+        {
+            "version": 0,
+            "name": "simulated-chain",
+            "runtime": {
+                "provider": "simulated",
+                "model_id": "sim-large",
+                "simulation": {"latency_ms": 1, "latency_stddev_ms": 0, **simulation},
+            },
+            "agents": {"writer": {"prompt": "You write."}},
+            "pattern": {
+                "type": "chain",
+                "config": {
+                    "steps": [
+                        {"agent": "writer", "input": "Draft"},
+                        {"agent": "writer", "input": "Refine {{ steps[0].response }}"},
+                    ]
+                },
+            },
+        }
+    )
+
+
+async def _collect(model: SimulatedModel) -> list[dict[str, Any]]:
+    messages = [{"role": "user", "content": [{"text": "hello there"}]}]
+    return [event async for event in model.stream(messages, system_prompt="You write.")]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state() -> Any:
+    """Clear the model client cache and metrics around each test."""
+    _create_model_cached.cache_clear()
+    get_metrics().reset()
+    yield
+    _create_model_cached.cache_clear()
+    get_metrics().reset()
+
+
+class TestSimulatedModel:
+    """Tests for SimulatedModel behaviour."""
+
+    @pytest.mark.parametrize("distribution", ["fixed", "uniform", "normal", "lognormal"])
+    def test_latency_is_seeded_and_centred(self, distribution: str) -> None:
+        """Seeded samples are reproducible and average near latency_ms."""
+        config = SimulationConfig(
+            latency_distribution=distribution, latency_ms=100, latency_stddev_ms=20, seed=7
+        )
+        first = [SimulatedModel(config).sample_latency() for _ in range(3)]
+        model = SimulatedModel(config)
+        samples = [model.sample_latency() for _ in range(2000)]
+
+        assert first[0] == samples[0]
+        assert min(samples) >= 0
+        assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.05)
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_scripted_text_and_usage(self) -> None:
+        """Responses cycle in order and are streamed token by token with usage."""
+        model = SimulatedModel(
+            SimulationConfig(latency_ms=0, tokens_per_second=1000, responses=["one two", "three"])
+        )
+
+        events = await _collect(model)
+        second = await _collect(model)
+
+        deltas = [
+            e["contentBlockDelta"]["delta"]["text"] for e in events if "contentBlockDelta" in e
+        ]
+        assert deltas == ["one", " two"]
+        usage = events[-1]["metadata"]["usage"]
+        assert usage["outputTokens"] == 2
+        assert usage["inputTokens"] > 0
+        assert usage["totalTokens"] == usage["inputTokens"] + 2
+        delta = next(e["contentBlockDelta"]["delta"] for e in second if "contentBlockDelta" in e)
+        assert delta == {"text": "three"}
+
+    @pytest.mark.asyncio
+    async def test_filler_text_has_output_tokens_words(self) -> None:
+        """Without scripted responses the output is output_tokens words long."""
+        model = SimulatedModel(SimulationConfig(latency_ms=0, output_tokens=40))
+
+        events = await _collect(model)
+
+        assert events[-1]["metadata"]["usage"]["outputTokens"] == 40
+
+    @pytest.mark.asyncio
+    async def test_error_and_throttle_rates(self) -> None:
+        """error_rate raises ConnectionError; throttle_rate raises with Retry-After."""
+        failing = SimulatedModel(SimulationConfig(latency_ms=0, error_rate=1.0))
+        with pytest.raises(ConnectionError):
+            await _collect(failing)
+
+        throttled = SimulatedModel(
+            SimulationConfig(latency_ms=0, throttle_rate=1.0, retry_after_s=2)
+        )
+        with pytest.raises(SimulatedThrottlingError) as excinfo:
+            await _collect(throttled)
+        assert excinfo.value.retry_after == 2
+
+        metrics = get_metrics()
+        assert metrics.value("strands_simulated_calls_total", outcome="error") == 1
+        assert metrics.value("strands_simulated_calls_total", outcome="throttled") == 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_throttles_excess_calls(self) -> None:
+        """Calls beyond max_concurrency in flight are throttled."""
+        model = SimulatedModel(
+            SimulationConfig(latency_ms=50, latency_stddev_ms=0, max_concurrency=2)
+        )
+
+        results = await asyncio.gather(*(_collect(model) for _ in range(3)), return_exceptions=True)
+
+        assert sum(isinstance(r, SimulatedThrottlingError) for r in results) == 1
+        assert model.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_structured_output_parses_scripted_json(self) -> None:
+        """Structured output validates the scripted response against the model."""
+
+        class Answer(BaseModel):
+            value: int
+
+        model = SimulatedModel(SimulationConfig(latency_ms=0, responses=[json.dumps({"value": 3})]))
+        events = [e async for e in model.structured_output(Answer, [])]
+
+        assert events[-1]["output"] == Answer(value=3)
+
+
+class TestSimulatedProvider:
+    """Tests for provider wiring and end-to-end runs."""
+
+    def test_create_model_is_cached_per_simulation(self) -> None:
+        """Identical simulation settings share one cached model."""
+        spec = _spec(seed=1)
+        first = create_model(spec.runtime)
+
+        assert isinstance(first, SimulatedModel)
+        assert first.simulation.seed == 1
+        assert create_model(spec.runtime) is first
+        assert create_model(_spec(seed=2).runtime) is not first
+
+    @pytest.mark.asyncio
+    async def test_chain_runs_on_simulated_provider(self) -> None:
+        """A chain runs end to end with scripted responses and reported tokens."""
+        result = await run_chain(_spec(responses=["first answer", "second answer"]))
+
+        assert result.success
+        assert [s["response"].strip() for s in result.execution_context["steps"]] == [
+            "first answer",
+            "second answer",
+        ]
+        assert get_metrics().value("strands_simulated_calls_total", outcome="ok") == 2
+
+
+@pytest.mark.asyncio
+async def test_load_test_report(tmp_path: Path) -> None:
+    """The load driver runs every workflow and reports counters and percentiles."""
+    report = await run_load_test(_spec(), runs=6, concurrency=3, session_dir=tmp_path)
+    summary = report.to_dict()
+
+    assert (report.succeeded, report.failed) == (6, 0)
+    assert len(report.latencies) == 6
+    assert summary["latency_seconds"]["p50"] <= summary["latency_seconds"]["max"]
+    assert summary["counters"]["simulated_ok"] == 12
+    assert summary["counters"]["session_saves"] >= 12
+    assert len(await asyncio.to_thread(lambda: list(tmp_path.iterdir()))) == 6
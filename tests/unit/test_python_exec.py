@@ -1,7 +1,7 @@
 """Unit tests for python_exec native tool.
 
-Tests the MVP implementation of the python_exec tool which executes
-Python code with restricted builtins and stdout capture.
+Tests the python_exec tool which executes Python code with restricted
+builtins and stdout capture in a pool of warm worker processes.
 """
 
 
@@ -359,6 +359,63 @@ print(f'Type: {type(x).__name__}')
         assert "Error" in result["content"][0]["text"]
 
 
+class TestPythonExecWorkerPool:
+    """Test the warm worker-process pool behind python_exec."""
+
+    def test_timeout_kills_and_respawns_worker(self) -> None:
+        """Runaway code times out and the pool keeps serving calls."""
+        from strands_cli.tools.python_exec_pool import PythonExecPool
+
+        pool = PythonExecPool(size=1)
+        try:
+            result = pool.run("while True:\n    pass", timeout=0.5)
+            follow_up = pool.run("print(6 * 7)")
+        finally:
+            pool.shutdown()
+
+        assert not result.success
+        assert "TimeoutError" in result.output
+        assert pool.respawns == 1
+        assert follow_up.success
+        assert follow_up.output == "42\n"
+
+    def test_code_runs_outside_caller_process(self, capsys) -> None:
+        """Output is captured in the worker; the caller's stdout is untouched."""
+        from strands_cli.tools.python_exec import python_exec
+
+        result = python_exec({"toolUseId": "isolated", "input": {"code": "print('hi')"}})
+
+        assert result["content"][0]["text"] == "hi\n"
+        assert capsys.readouterr().out == ""
+
+    def test_globals_do_not_leak_between_calls(self) -> None:
+        """Each call gets a fresh namespace even on a reused worker."""
+        from strands_cli.tools.python_exec_pool import PythonExecPool
+
+        pool = PythonExecPool(size=1)
+        try:
+            pool.run("leaked = 1")
+            result = pool.run("print(leaked)")
+        finally:
+            pool.shutdown()
+
+        assert not result.success
+        assert "NameError" in result.output
+
+    def test_submit_runs_calls_concurrently(self) -> None:
+        """submit() dispatches to separate workers without blocking the caller."""
+        from strands_cli.tools.python_exec_pool import PythonExecPool
+
+        pool = PythonExecPool(size=2)
+        try:
+            futures = [pool.submit(f"print({i} ** 2)") for i in range(4)]
+            outputs = sorted(future.result(timeout=30).output for future in futures)
+        finally:
+            pool.shutdown()
+
+        assert outputs == ["0\n", "1\n", "4\n", "9\n"]
+
+
 class TestPythonExecToolIntegration:
     """Test python_exec tool integration with registry."""
 
@@ -394,7 +451,6 @@ class TestPythonExecToolIntegration:
 
         assert resolved == "strands_cli.tools.python_exec"
 
-
     def test_load_python_callable_with_short_id(self) -> None:
         """Test that load_python_callable can load python_exec with short ID."""
         from strands_cli.runtime.tools import load_python_callable
@@ -414,4 +470,3 @@ class TestPythonExecToolIntegration:
 
         assert hasattr(tool_module, "TOOL_SPEC")
         assert hasattr(tool_module, "python_exec")
-
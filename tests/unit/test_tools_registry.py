@@ -1,9 +1,16 @@
 """Tests for the native tools registry."""
 
+import json
 from types import ModuleType
 from unittest.mock import Mock
 
-from strands_cli.tools.registry import ToolInfo, ToolRegistry, get_registry
+from strands_cli.tools.registry import (
+    MANIFEST_PATH,
+    ToolInfo,
+    ToolRegistry,
+    build_manifest,
+    get_registry,
+)
 
 
 class TestToolInfo:
@@ -434,3 +441,42 @@ class TestToolRegistryReset:
         # Reset should rediscover
         registry._reset()
         assert len(registry.list_all()) == 1
+
+
+class TestToolManifest:
+    """Tests for the generated tool manifest."""
+
+    def test_committed_manifest_matches_sources(self):
+        """The committed manifest must be regenerated when tools change."""
+        committed = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+        assert committed == build_manifest(), (
+            "Tool manifest is out of date; run: python scripts/generate_tool_manifest.py"
+        )
+
+    def test_load_manifest_does_not_import_tool_modules(self, mocker):
+        """Lookups and allowlists are answered without importing any tool module."""
+        import_module = mocker.patch("strands_cli.tools.registry.importlib.import_module")
+
+        registry = ToolRegistry()
+        registry._tools.clear()
+        assert registry._load_manifest() is True
+
+        web_fetch = registry.get("web_fetch")
+        assert web_fetch is not None
+        assert web_fetch.module_path == "strands_cli.tools.web_fetch"
+        assert web_fetch.spec["name"] == "web_fetch"
+        assert "strands_cli.tools.web_fetch" in registry.get_allowlist()
+        import_module.assert_not_called()
+
+    def test_stale_manifest_is_rejected(self, tmp_path, mocker):
+        """A manifest whose module list differs from disk falls back to discovery."""
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        manifest["modules"] = manifest["modules"][:-1]
+        stale_path = tmp_path / "manifest.json"
+        stale_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        registry = ToolRegistry()
+        assert registry._load_manifest(stale_path) is False
+        assert registry._load_manifest(tmp_path / "missing.json") is False
+        registry._reset()